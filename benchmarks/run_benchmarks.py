@@ -0,0 +1,385 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table, box
+
+# Le script peut être lancé directement (python benchmarks/run_benchmarks.py) depuis la racine du projet
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from controllers.player_controller import PlayerController  # noqa: E402
+from controllers.report_controller import ReportController  # noqa: E402
+from controllers.tournament_controller import TournamentController  # noqa: E402
+from models.match import Match  # noqa: E402
+from models.round import Round  # noqa: E402
+from models.tournament import Tournament  # noqa: E402
+from utils.data_manager import PlayerDataManager, TournamentDataManager  # noqa: E402
+from utils.migrations import SCHEMA_VERSIONS, set_schema_version  # noqa: E402
+from utils.player_lookup import resolve_players  # noqa: E402
+from utils.player_stats import PlayerStats  # noqa: E402
+from utils.synthetic_data import generate_dataset  # noqa: E402
+from utils.tournament_index import TournamentIndex  # noqa: E402
+from utils.tournament_simulator import build_benchmark_tournament  # noqa: E402
+from utils.utils import get_tournament_status  # noqa: E402
+
+# Échelles des données : joueurs et tournois des fichiers JSON, joueurs du tournoi utilisé pour les appariements
+SCALES = {
+    "small": {"players": 200, "tournaments": 20, "tournament_players": 16},
+    "medium": {"players": 10_000, "tournaments": 500, "tournament_players": 64},
+    "large": {"players": 100_000, "tournaments": 2_000, "tournament_players": 256},
+}
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.2
+
+
+class ScriptedReportView:
+    """
+    Vue des rapports sans affichage ni question : choisit un tournoi et exporte le rapport au format CSV.
+    """
+
+    def __init__(self, tournament_index=0, format_choice="CSV"):
+        self.tournament_index = tournament_index
+        self.format_choice = format_choice
+
+    def select_tournament(self, tournament_choices):
+        return self.tournament_index
+
+    def ask_export_choice(self):
+        return "Exporter"
+
+    def ask_export_format(self):
+        return self.format_choice
+
+    def __getattr__(self, name):
+        # Les méthodes d'affichage (list_players, show_message...) ne font rien
+        return lambda *args, **kwargs: None
+
+
+def write_dataset(scale, data_dir, seed=0):
+    """
+    Écrit un jeu de données fictif de l'échelle donnée dans <data_dir>/players.json et tournaments.json.
+    """
+    players_df, tournaments = generate_dataset(scale["players"], scale["tournaments"], seed)
+    os.makedirs(data_dir, exist_ok=True)
+    players_df.to_json(os.path.join(data_dir, "players.json"), orient="records", indent=4, force_ascii=False)
+    with open(os.path.join(data_dir, "tournaments.json"), "w", encoding="utf-8") as f:
+        json.dump(tournaments, f, indent=4, ensure_ascii=False)
+    for schema in SCHEMA_VERSIONS:
+        set_schema_version(os.path.join(data_dir, f"{schema}.json"), SCHEMA_VERSIONS[schema])
+
+
+def build_played_tournament(players_count, seed=0):
+    """
+    Construit un tournoi de players_count joueurs dont la moitié des rounds ont été joués.
+    """
+    rng = np.random.default_rng(seed)
+    rounds_count = max(4, int(np.log2(players_count)) + 1)
+    tournament = build_benchmark_tournament(players_count, rounds_count, seed)
+    for round_number in range(1, rounds_count // 2 + 1):
+        round_ = Round(f"Round {round_number}")
+        tournament.add_round(round_)
+        tournament.current_round = round_number
+        for player1, player2 in tournament.generate_round_pairs():
+            score = float(rng.choice([0.0, 0.5, 1.0]))
+            match = Match(player1.national_id, player2.national_id)
+            match.set_scores(score, 1.0 - score)
+            round_.add_match(match)
+            player1.career_score += score
+            player2.career_score += 1.0 - score
+        round_.close_round()
+    return tournament
+
+
+def report_scenario(controller, method_name, tournament_index=0):
+    def run():
+        controller.view = ScriptedReportView(tournament_index)
+        getattr(controller, method_name)()
+
+    return run
+
+
+def save_scenario(data_manager, column):
+    # Une sauvegarde de données inchangées n'écrit rien : on modifie une valeur avant chaque sauvegarde
+    def run():
+        data_manager.data_df.at[0, column] += 1
+        data_manager.save_data()
+
+    return run
+
+
+def update_tournament_scenario(tournament_controller, tournament):
+    def run():
+        tournament.rounds_count += 1
+        tournament_controller.update_tournament(tournament)
+
+    return run
+
+
+def player_stats_scenario(report_controller, tournament_index):
+    # Un seul tournoi enregistré depuis la dernière mise à jour des statistiques
+    report_controller.get_player_stats()
+    tournaments_df = report_controller.tournaments_df
+
+    def run():
+        tournaments_df.at[tournaments_df.index[tournament_index], "version"] += 1
+        report_controller.get_player_stats()
+
+    return run
+
+
+def find_tournament_index(tournaments_df, status):
+    # Tournoi le plus grand ayant le statut demandé (ou le premier tournoi)
+    candidates = [
+        (len(tournament.players), i)
+        for i, tournament in enumerate(tournaments_df.itertuples(index=False))
+        if get_tournament_status(tournament.current_round, tournament.rounds_count, tournament.rounds) == status
+    ]
+    return max(candidates)[1] if candidates else 0
+
+
+def build_scenarios(scale, work_dir):
+    """
+    Prépare les scénarios mesurés dans work_dir (qui doit être le dossier courant, les contrôleurs utilisant
+    les chemins datas/ et reports/ relatifs).
+
+    Returns:
+        dict: Dictionnaire {nom du scénario: fonction à mesurer}.
+    """
+    players_path = os.path.join(work_dir, "datas", "players.json")
+    tournaments_path = os.path.join(work_dir, "datas", "tournaments.json")
+    player_data_manager = PlayerDataManager(players_path, use_snapshot=False)
+    tournament_data_manager = TournamentDataManager(tournaments_path, use_snapshot=False)
+    # Le premier chargement écrit l'instantané binaire, relu par les chargements mesurés
+    player_snapshot_manager = PlayerDataManager(players_path, use_snapshot=True)
+    tournament_snapshot_manager = TournamentDataManager(tournaments_path, use_snapshot=True)
+
+    tournament = build_played_tournament(scale["tournament_players"])
+    players = tournament.players
+
+    player_controller = PlayerController()
+    tournament_controller = TournamentController(player_controller)
+    tournaments_df = tournament_controller.tournaments_df
+    finished_index = find_tournament_index(tournaments_df, "finished")
+    updated_tournament = Tournament.from_dict(tournaments_df.iloc[finished_index].to_dict())
+    report_controller = ReportController(player_controller.players_df, tournaments_df, player_controller)
+    # Les versions des tournois de ce contrôleur sont modifiées par le scénario player_stats.refresh
+    stats_controller = ReportController(player_controller.players_df, tournaments_df.copy(), player_controller)
+    # Joueurs recherchés par identifiant national (autant que dans le tournoi des appariements)
+    players_df = player_controller.players_df
+    lookup_ids = players_df["national_id"].iloc[:: max(1, len(players_df) // scale["tournament_players"])].tolist()
+    tournament_index = TournamentIndex(tournaments_df)
+    # Recherche des tournois d'un lieu sur une année, celle du tournoi terminé utilisé par les rapports
+    finished_tournament = tournaments_df.iloc[finished_index]
+    query_year = finished_tournament["start_date"].year
+    query = {
+        "start": f"{query_year}-01-01",
+        "end": f"{query_year}-12-31",
+        "location": str(finished_tournament["location"]),
+        "status": "finished",
+    }
+    ongoing_count = sum(
+        get_tournament_status(row.current_round, row.rounds_count, row.rounds) != "finished" and len(row.players) >= 2
+        for row in tournaments_df.itertuples(index=False)
+    )
+
+    scenarios = {
+        "load_data.players": player_data_manager.load_data,
+        "load_data.tournaments": tournament_data_manager.load_data,
+        "load_data.players.snapshot": player_snapshot_manager.load_data,
+        "load_data.tournaments.snapshot": tournament_snapshot_manager.load_data,
+        "save_data.players": save_scenario(player_data_manager, "career_score"),
+        "save_data.players.unchanged": player_data_manager.save_data,
+        "save_data.tournaments": save_scenario(tournament_data_manager, "version"),
+        "resolve_players": lambda: resolve_players(lookup_ids, players_df),
+        "resolve_players.registry": lambda: resolve_players(lookup_ids, players_df, player_controller.registry),
+        "generate_pairs": tournament.generate_pairs,
+        "has_played_against_each_other": lambda: [
+            tournament.has_played_against_each_other(player1, player2) for player1 in players for player2 in players
+        ],
+        "load_tournament": lambda: Tournament.from_dict(tournaments_df.iloc[finished_index].to_dict()),
+        "load_tournament.cached": lambda: tournament_controller.load_tournament(
+            tournament_controller.tournaments_df.iloc[finished_index]
+        ),
+        "update_tournament": update_tournament_scenario(tournament_controller, updated_tournament),
+        "tournament_index": lambda: TournamentIndex(tournaments_df),
+        "tournament_index.query": lambda: tournament_index.query(**query),
+        "player_stats": lambda: PlayerStats(tournaments_df.to_dict(orient="records")),
+        "player_stats.refresh": player_stats_scenario(stats_controller, finished_index),
+        "report.players": report_scenario(report_controller, "list_players_alphabetically"),
+        "report.tournaments": report_scenario(report_controller, "list_tournaments"),
+        "report.tournament_details": report_scenario(report_controller, "show_tournament_details", finished_index),
+        "report.tournament_players": report_scenario(
+            report_controller, "list_tournament_players_alphabetically", finished_index
+        ),
+        "report.rounds_and_matches": report_scenario(
+            report_controller, "list_tournament_rounds_and_matches", finished_index
+        ),
+        "cold_start": lambda: subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from controllers.main_controller import MainController; MainController().writer.close()",
+            ],
+            cwd=work_dir,
+            env={**os.environ, "PYTHONPATH": ROOT_DIR},
+            check=True,
+            stdout=subprocess.DEVNULL,
+        ),
+    }
+    if ongoing_count:
+        scenarios["report.podium_probabilities"] = report_scenario(report_controller, "show_podium_probabilities")
+    return scenarios
+
+
+def measure(function, repeat=3, min_time=0.2):
+    """
+    Mesure la durée d'un appel avec timeit : le nombre d'appels par mesure est choisi pour durer au moins
+    min_time secondes, et on garde la meilleure des repeat mesures.
+
+    Returns:
+        dict: {"seconds": durée d'un appel, "number": nombre d'appels par mesure}.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1000:
+            break
+        number *= 2 if elapsed * 10 >= min_time else 10
+    timings = [elapsed] + timer.repeat(repeat=repeat - 1, number=number)
+    return {"seconds": min(timings) / number, "number": number}
+
+
+def run_benchmarks(scales, selected=None, repeat=3, min_time=0.2, seed=0):
+    """
+    Lance les scénarios pour chaque échelle, chacune dans un dossier temporaire avec ses propres données.
+
+    Args:
+        scales (dict): Dictionnaire {nom de l'échelle: paramètres} (voir SCALES).
+        selected (list): Préfixes des scénarios à lancer (tous par défaut).
+
+    Returns:
+        dict: Résultats {échelle: {scénario: {"seconds", "number"}}}.
+    """
+    results = {}
+    current_dir = os.getcwd()
+    for scale_name, scale in scales.items():
+        with tempfile.TemporaryDirectory() as work_dir:
+            write_dataset(scale, os.path.join(work_dir, "datas"), seed)
+            os.chdir(work_dir)
+            try:
+                # Les rapports effacent la console et affichent des messages : on les rend silencieux
+                with mock.patch("controllers.report_controller.clear_console"), contextlib.redirect_stdout(
+                    io.StringIO()
+                ):
+                    scenarios = build_scenarios(scale, work_dir)
+                    results[scale_name] = {
+                        name: measure(function, repeat, min_time)
+                        for name, function in scenarios.items()
+                        if not selected or any(name.startswith(prefix) for prefix in selected)
+                    }
+            finally:
+                os.chdir(current_dir)
+    return results
+
+
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare les résultats à la référence.
+
+    Returns:
+        list: Liste de tuples (échelle, scénario, durée, durée de référence ou None, ratio ou None, régression).
+    """
+    rows = []
+    for scale_name, scenarios in results.items():
+        for name, result in scenarios.items():
+            reference = baseline.get("results", {}).get(scale_name, {}).get(name)
+            if reference is None:
+                rows.append((scale_name, name, result["seconds"], None, None, False))
+                continue
+            ratio = result["seconds"] / reference["seconds"]
+            rows.append((scale_name, name, result["seconds"], reference["seconds"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def load_baseline(file_path):
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(results, file_path):
+    # Les échelles non relancées gardent leur référence précédente
+    baseline = load_baseline(file_path)
+    baseline.setdefault("results", {}).update(results)
+    baseline["recorded_at"] = datetime.now().isoformat(timespec="seconds")
+    baseline["python"] = platform.python_version()
+    baseline["machine"] = platform.platform()
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4)
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def display_comparison(rows, threshold):
+    table = Table(title="Benchmarks", box=box.SQUARE)
+    for column in ("Échelle", "Scénario", "Durée", "Référence", "Écart"):
+        table.add_column(column, header_style="bold cyan")
+    for scale_name, name, seconds, reference, ratio, regression in rows:
+        if ratio is None:
+            difference = "[dim]nouveau[/dim]"
+        else:
+            color = "red" if regression else "green" if ratio < 1 - threshold else "white"
+            difference = f"[{color}]{(ratio - 1) * 100:+.0f} %[/{color}]"
+        table.add_row(scale_name, name, format_duration(seconds), format_duration(reference), difference)
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mesure les performances de l'application et les compare à une référence."
+    )
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small", "medium"])
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="Préfixes des scénarios à lancer.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Fichier JSON des résultats de référence.")
+    parser.add_argument("--save", action="store_true", help="Enregistre les résultats comme nouvelle référence.")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="Ralentissement toléré (0.2 pour 20 %%)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Nombre de mesures par scénario (on garde la meilleure)."
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks({name: SCALES[name] for name in args.scales}, args.only, args.repeat)
+    rows = compare_results(results, load_baseline(args.baseline), args.threshold)
+    display_comparison(rows, args.threshold)
+
+    regressions = [row for row in rows if row[5]]
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Référence enregistrée dans '{args.baseline}'.")
+    elif regressions:
+        print(f"{len(regressions)} scénario(s) plus lent(s) de plus de {args.threshold:.0%} que la référence.")
+        sys.exit(1)
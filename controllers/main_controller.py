@@ -1,6 +1,8 @@
 from controllers.player_controller import PlayerController
 from controllers.report_controller import ReportController
 from controllers.tournament_controller import TournamentController
+from utils.background_writer import BackgroundWriter
+from utils.metrics import metrics
 from utils.utils import capitalize_name, clear_console, get_username
 from views.main_view import MainView
 
@@ -17,6 +19,11 @@ class MainController:
 
         self.player_controller = PlayerController()
         self.tournament_controller = TournamentController(self.player_controller)
+
+        # Les sauvegardes sont écrites en arrière-plan : la saisie suivante n'attend pas l'écriture du JSON
+        self.writer = BackgroundWriter()
+        self.player_controller.data_manager.set_writer(self.writer)
+        self.tournament_controller.data_manager.set_writer(self.writer)
         self.report_controller = ReportController(
             self.player_controller.players_df, self.tournament_controller.tournaments_df, self.player_controller
         )
@@ -49,7 +56,29 @@ class MainController:
                 self.report_controller.tournaments_df = self.tournament_controller.tournaments_df
                 self.report_controller.run()
 
+            elif choice == "metrics":
+                clear_console()
+                self.show_metrics()
+
             elif choice == "quit":
                 clear_console()
                 self.main_view.show_message(f"Au revoir {capitalize_name(get_username())}, à très vite ! 👋 \n")
                 break
+
+    def show_metrics(self):
+        # Menu caché (touche "m" du menu principal) : lectures, écritures et parcours de tables depuis le lancement
+        self.main_view.display_metrics(metrics.snapshot())
+        export_choice = self.main_view.ask_metrics_export()
+        if export_choice == "Retour":
+            clear_console()
+            return
+
+        file_path = "reports/metrics/metrics.json" if export_choice == "JSON" else "reports/metrics/metrics.prom"
+        if export_choice == "JSON":
+            metrics.write_json(file_path)
+        else:
+            metrics.write_prometheus(file_path)
+        clear_console()
+        self.main_view.show_message(
+            f"\n🎉 Métriques exportées avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
+        )
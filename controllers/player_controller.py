@@ -3,6 +3,9 @@ import pandas as pd
 from exceptions import PlayerExistsError
 from models.player import Player
 from utils.data_manager import PlayerDataManager
+from utils.metrics import count_scan
+from utils.profiling import profiled_action
+from utils.search_index import PlayerSearchIndex
 from utils.utils import clear_console
 from views.player_view import PlayerView
 
@@ -11,14 +14,41 @@ class PlayerController:
     def __init__(self):
         self.data_manager = PlayerDataManager()
         self.players_df = self.load_players()
+        self._search_index = None
         self.view = PlayerView()
 
+    @property
+    def search_index(self):
+        # Index de recherche construit une seule fois par session (à la première utilisation),
+        # puis mis à jour à chaque ajout ou suppression de joueur
+        if self._search_index is None:
+            self._search_index = PlayerSearchIndex.from_dataframe(self.players_df)
+        return self._search_index
+
+    @property
+    def registry(self):
+        # Registre des joueurs projeté en mémoire (voir utils/player_registry.py), seulement s'il correspond à
+        # players_df : un joueur ajouté mais pas encore enregistré n'y est pas
+        if self.players_df is not self.data_manager.get_data():
+            return None
+        return self.data_manager.get_registry()
+
     def load_players(self):
         self.players_df = self.data_manager.get_data()
         return self.players_df
 
     def save_players(self):
         self.data_manager.set_data(self.players_df)
+        # Les données enregistrées peuvent inclure les modifications d'un autre terminal
+        self.players_df = self.data_manager.get_data()
+
+    def refresh_players(self):
+        # Récupère les joueurs ajoutés ou modifiés depuis un autre terminal
+        if self.data_manager.refresh():
+            self.load_players()
+            # Seuls les joueurs ajoutés, supprimés ou renommés sont mis à jour dans l'index de recherche
+            if self._search_index is not None:
+                self._search_index.update_from_dataframe(self.players_df)
 
     # Cette méthode permet de lancer le menu principal de gestion des joueurs
     def run(self):
@@ -40,15 +70,16 @@ class PlayerController:
             elif choice == "search_player":
                 clear_console()
                 self.search_player_by_id()
-            # Si le choix est "Liste des joueurs", on clean le terminal et on appelle la méthode list_players()
+            # Si le choix est "Liste des joueurs", on clean le terminal et on appelle la méthode browse_players()
             elif choice == "player_list":
                 clear_console()
-                self.list_players()
+                self.browse_players()
             # Si le choix est "Retour au menu principal", on clean le terminal et on sort du boucle
             elif choice == "back_to_main_menu":
                 clear_console()
                 break
 
+    @profiled_action
     def create_new_player(self):
         """
         Crée un nouveau joueur et l'ajoute à la base de données.
@@ -82,6 +113,7 @@ class PlayerController:
                 player = Player(first_name, last_name, birth_date, national_id)
 
                 # Vérifie si un joueur avec le même identifiant national existe déjà
+                count_scan("players", len(self.players_df), "create_new_player")
                 existing_player = self.players_df[
                     self.players_df["national_id"] == player.national_id
                 ]
@@ -98,6 +130,7 @@ class PlayerController:
 
                 # Sauvegarde les modifications dans le fichier JSON (datas/players.json)
                 self.save_players()
+                self.search_index.add(player.national_id, player.first_name, player.last_name)
 
                 # On recharge les données du joueur
                 self.load_players()
@@ -138,6 +171,7 @@ class PlayerController:
                     # Met à jour seulement l'identifiant national si l'utilisateur en a entré un nouveau
                     player_info = (last_name, first_name, birth_date, national_id)
 
+    @profiled_action
     def delete_player_by_id(self):
         """
         Permet de supprimer un joueur de la base de données en utilisant son identifiant national.
@@ -195,6 +229,7 @@ class PlayerController:
                 return
 
             # Recherche le joueur correspondant à l'identifiant national saisi
+            count_scan("players", len(self.players_df), "delete_player_by_id")
             player = self.players_df[self.players_df["national_id"] == national_id]
 
             # Si un joueur avec cet identifiant national est trouvé
@@ -246,6 +281,7 @@ class PlayerController:
                     # filtre le DataFrame, et conserve uniquement les lignes où le résultat est True
                     # Ça veut dire que la ligne où "national_id" est égale à "TD2612" (qui retourne False) sera exclue.
 
+                    count_scan("players", len(self.players_df), "delete_player_by_id")
                     self.players_df = self.players_df[self.players_df["national_id"] != national_id]
 
                     # DataFrame après suppression
@@ -258,6 +294,7 @@ class PlayerController:
 
                     # Sauvegarde les modifications dans le fichier JSON (datas/players.json)
                     self.save_players()
+                    self.search_index.remove(national_id)
 
                     # Afficher un message de confirmation en utilisant les informations du joueur supprimé
                     self.view.show_message(
@@ -284,6 +321,7 @@ class PlayerController:
                 # Stocker le message d'erreur pour l'afficher sous le tableau des joueurs lors de la future itération
                 error_message = national_id
 
+    @profiled_action
     def search_player_by_id(self):
         """
         Permet de rechercher un joueur dans la base de données en utilisant son identifiant national.
@@ -336,6 +374,7 @@ class PlayerController:
                 return
 
             # Recherche le joueur correspondant à l'identifiant national saisi
+            count_scan("players", len(self.players_df), "search_player_by_id")
             player = self.players_df[self.players_df["national_id"] == national_id]
 
             # Si un joueur avec cet identifiant national est trouvé
@@ -364,10 +403,25 @@ class PlayerController:
         else:
             self.view.list_players(self.players_df)
 
+    @profiled_action
+    def browse_players(self):
+        if self.players_df.empty:
+            self.list_players()
+        else:
+            self.view.browse_players(self.players_df)
+
     def get_player_by_national_id(self, national_id):
-        player_data = self.players_df[self.players_df["national_id"].str.strip() == national_id.strip()]
-        if not player_data.empty:
-            return Player.from_dict(player_data.iloc[0].to_dict())
+        national_id = national_id.strip()
+        registry = self.registry
+        if registry is not None:
+            # Lecture d'une seule fiche dans le registre à jour, sans parcourir players_df
+            player_data = registry.get(national_id)
+        else:
+            count_scan("players", len(self.players_df), "get_player_by_national_id")
+            rows = self.players_df[self.players_df["national_id"].str.strip() == national_id]
+            player_data = rows.iloc[0].to_dict() if not rows.empty else None
+        if player_data is not None:
+            return Player.from_dict(player_data)
         else:
             print(f"Erreur : Le joueur {national_id} n'a pas été trouvé dans players_df.")
             return None
@@ -1,18 +1,43 @@
 import os
+from datetime import datetime, timedelta
 
 import pandas as pd
 
-from models.player import Player
 from models.round import Round
-from utils.utils import clear_console, sanitize
+from models.tournament import Tournament
+from utils.head_to_head import HeadToHeadIndex
+from utils.player_lookup import UNKNOWN_PLAYER, get_player_names_map, join_matches_with_players, resolve_players
+from utils.player_stats import PlayerStats
+from utils.profiling import profiled_action
+from utils.round_index import RoundTimeIndex
+from utils.search_index import PlayerCompleter
+from utils.tournament_archive import TournamentArchive, get_tournament_headers
+from utils.tournament_index import TournamentIndex, get_tournament_statuses
+from utils.tournament_simulator import simulate_tournament
+from utils.utils import clear_console, format_timestamp, sanitize
 from views.report_view import ReportView
 
 
 class ReportController:
-    def __init__(self, players_df, tournaments_df, player_controller):
+    # Nombre de simulations de la fin d'un tournoi pour estimer les probabilités de podium
+    PODIUM_SIMULATIONS = 10_000
+
+    def __init__(self, players_df, tournaments_df, player_controller, archive=None):
         self.players_df = players_df
         self.tournaments_df = tournaments_df
         self.player_controller = player_controller
+        # Les tournois terminés et archivés restent consultables dans les rapports
+        self.archive = archive if archive is not None else TournamentArchive()
+        # Index des rounds par heure, reconstruit seulement lorsque les tournois ou les archives changent
+        self.round_index = None
+        self.round_index_sources = None
+        # Index du catalogue des tournois par dates, lieu et statut, reconstruit de la même façon
+        self.catalog_index = None
+        self.catalog_index_sources = None
+        # Index des rencontres entre joueurs, seuls les tournois modifiés depuis sa dernière mise à jour sont relus
+        self.head_to_head = HeadToHeadIndex()
+        # Statistiques des joueurs, mises à jour de la même façon
+        self.player_stats = PlayerStats()
 
         self.view = ReportView()
 
@@ -40,6 +65,21 @@ class ReportController:
                 clear_console()
                 self.list_tournament_rounds_and_matches()
             elif choice == "6":
+                clear_console()
+                self.show_podium_probabilities()
+            elif choice == "7":
+                clear_console()
+                self.show_rounds_by_period()
+            elif choice == "8":
+                clear_console()
+                self.show_head_to_head()
+            elif choice == "9":
+                clear_console()
+                self.show_player_profile()
+            elif choice == "10":
+                clear_console()
+                self.search_tournaments()
+            elif choice == "11":
                 clear_console()
                 break
 
@@ -48,6 +88,7 @@ class ReportController:
         self.player_controller.load_players()
         self.players_df = self.player_controller.players_df
 
+    @profiled_action
     def list_players_alphabetically(self):
         self.reload_players_data()
 
@@ -84,22 +125,107 @@ class ReportController:
             f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
         )
 
+    def get_catalog(self):
+        """
+        Retourne les en-têtes de tous les tournois : ceux du fichier des tournois puis ceux des archives.
+
+        Returns:
+            pd.DataFrame: Une ligne par tournoi (voir get_tournament_headers), la colonne archive indiquant
+            l'archive contenant un tournoi archivé.
+        """
+        headers_df = get_tournament_headers(self.tournaments_df)
+        archived_df = self.archive.get_headers()
+        # Un tournoi présent dans les deux (archivage interrompu) est lu depuis le fichier des tournois
+        archived_df = archived_df[~archived_df["name"].isin(headers_df["name"])]
+        if archived_df.empty:
+            return headers_df
+        return pd.concat([headers_df, archived_df], ignore_index=True)
+
+    def get_catalog_index(self):
+        """
+        Retourne l'index du catalogue des tournois par dates, lieu et statut (voir utils/tournament_index.py).
+
+        Les tournois du fichier des tournois sont en premier dans le catalogue, dans le même ordre : une position
+        de l'index inférieure à len(tournaments_df) est aussi leur position dans tournaments_df.
+        """
+        sources = (self.tournaments_df, self.archive.load_index())
+        if self.catalog_index_sources is None or any(
+            source is not previous for source, previous in zip(sources, self.catalog_index_sources)
+        ):
+            catalog_df = self.get_catalog()
+            # Seuls les tournois terminés sont archivés
+            statuses = get_tournament_statuses(self.tournaments_df)
+            statuses += ["finished"] * (len(catalog_df) - len(statuses))
+            self.catalog_index = TournamentIndex(catalog_df, statuses)
+            self.catalog_index_sources = sources
+        return self.catalog_index
+
+    def get_tournament_data(self, header):
+        """
+        Retourne le contenu complet d'un tournoi du catalogue, décompressé depuis son archive si besoin.
+        """
+        if header["archive"] is None or pd.isna(header["archive"]):
+            return self.tournaments_df[self.tournaments_df["name"] == header["name"]].iloc[0].to_dict()
+        return self.archive.load_tournament(header["name"])
+
+    def select_catalog_tournament(self):
+        """
+        Demande de choisir un tournoi du catalogue.
+
+        Returns:
+            dict: Le tournoi complet choisi, ou None si aucun tournoi n'existe ou si l'utilisateur annule.
+        """
+        catalog_df = self.get_catalog_index().tournaments_df
+        if catalog_df.empty:
+            self.view.show_message("Aucun tournoi trouvé.")
+            return None
+
+        tournament_choices = [(name, i) for i, name in enumerate(catalog_df["name"])]
+        choice = self.view.select_tournament(tournament_choices)
+        if choice is None:
+            return None
+        return self.get_tournament_data(catalog_df.iloc[choice])
+
+    @profiled_action
     def list_tournaments(self):
+        catalog_df = self.get_catalog_index().tournaments_df
         # Si aucun tournoi n'a été trouvé, afficher le message : Aucun tournoi trouvé.
-        if self.tournaments_df.empty:
+        if catalog_df.empty:
             self.view.show_message("Aucun tournoi trouvé.")
         # Sinon, afficher les tournois dans un tableau
         else:
-            self.view.list_tournaments(self.tournaments_df)
+            self.view.list_tournaments(catalog_df)
 
             export_choice = self.view.ask_export_choice()
             if export_choice == "Exporter":
                 format_choice = self.view.ask_export_format()
                 if format_choice != "Annuler":
-                    self.export_tournaments(self.tournaments_df, format_choice)
+                    self.export_tournaments(catalog_df, format_choice)
 
-    def export_tournaments(self, tournaments_df, format_choice):
-        file_name = "tournaments_list"
+    @profiled_action
+    def search_tournaments(self):
+        catalog_index = self.get_catalog_index()
+        if not len(catalog_index):
+            self.view.show_message("Aucun tournoi trouvé.")
+            return
+        criteria = self.view.ask_tournament_filters(catalog_index.location_names)
+        if criteria is None:
+            return
+
+        tournaments_df = catalog_index.filter(**criteria)
+        if tournaments_df.empty:
+            self.view.show_message("Aucun tournoi ne correspond à ces critères.")
+            return
+        clear_console()
+        self.view.list_tournaments(tournaments_df)
+
+        export_choice = self.view.ask_export_choice()
+        if export_choice == "Exporter":
+            format_choice = self.view.ask_export_format()
+            if format_choice != "Annuler":
+                self.export_tournaments(tournaments_df, format_choice, "tournaments_search")
+
+    def export_tournaments(self, tournaments_df, format_choice, file_name="tournaments_list"):
         file_path = f"reports/tournaments/{format_choice.lower()}/{file_name}.{format_choice.lower()}"
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
@@ -117,21 +243,17 @@ class ReportController:
             f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
         )
 
+    @profiled_action
     def show_tournament_details(self):
-        if self.tournaments_df.empty:
-            self.view.show_message("Aucun tournoi trouvé.")
-        else:
-            tournament_choices = [(tournament["name"], i) for i, tournament in self.tournaments_df.iterrows()]
-            choice = self.view.select_tournament(tournament_choices)
-            if choice is not None:
-                tournament_data = self.tournaments_df.iloc[choice].to_dict()
-                self.view.show_tournament_details(tournament_data)
-
-                export_choice = self.view.ask_export_choice()
-                if export_choice == "Exporter":
-                    format_choice = self.view.ask_export_format()
-                    if format_choice != "Annuler":
-                        self.export_tournament_details(tournament_data, format_choice)
+        tournament_data = self.select_catalog_tournament()
+        if tournament_data is not None:
+            self.view.show_tournament_details(tournament_data)
+
+            export_choice = self.view.ask_export_choice()
+            if export_choice == "Exporter":
+                format_choice = self.view.ask_export_format()
+                if format_choice != "Annuler":
+                    self.export_tournament_details(tournament_data, format_choice)
 
     def export_tournament_details(self, tournament_data, format_choice):
         tournament_name = sanitize(
@@ -159,39 +281,30 @@ class ReportController:
 
         # Afficher la liste des joueurs (A-Z) d'un tournoi sélectionné
 
+    @profiled_action
     def list_tournament_players_alphabetically(self):
         self.reload_players_data()
 
-        if self.tournaments_df.empty:
-            self.view.show_message("Aucun tournoi trouvé.")
-            return
-
-        tournament_choices = [(tournament["name"], i) for i, tournament in self.tournaments_df.iterrows()]
-        choice = self.view.select_tournament(tournament_choices)
-
-        if choice is None:
+        tournament_data = self.select_catalog_tournament()
+        if tournament_data is None:
             return
 
-        tournament_data = self.tournaments_df.iloc[choice].to_dict()
         clear_console()
         if not tournament_data["players"]:
             self.view.show_message("Aucun joueur n'est inscrit dans ce tournoi.")
             return
 
-        # Récupération des données complètes des joueurs depuis players_df
-        players = []
-        for player_data in tournament_data["players"]:
-            national_id_stripped = player_data["national_id"].strip()
-            player_info = self.players_df[
-                self.players_df["national_id"].str.strip() == national_id_stripped
-            ].iloc[0]
-            player = Player.from_dict(player_info.to_dict())
-            # Mettre à jour le score du joueur avec le score actuel du tournoi
-            player.career_score = player_data["career_score"]
-            players.append(player)
-
-        players_sorted = sorted(players, key=lambda x: (x.first_name, x.last_name))
-        self.view.list_players(pd.DataFrame([player.to_dict() for player in players_sorted]))
+        # Récupération en une seule passe des données complètes des joueurs (registre ou players_df)
+        tournament_scores = {
+            player_data["national_id"].strip(): player_data["career_score"]
+            for player_data in tournament_data["players"]
+        }
+        players_sorted = resolve_players(list(tournament_scores), self.players_df, self.player_controller.registry)
+        # Mettre à jour le score des joueurs avec le score actuel du tournoi
+        players_sorted["career_score"] = players_sorted["national_id"].map(tournament_scores)
+        # Les clés de tri sont calculées une seule fois par sort_values
+        players_sorted = players_sorted.sort_values(by=["first_name", "last_name"])
+        self.view.list_players(players_sorted)
 
         export_choice = self.view.ask_export_choice()
         if export_choice == "Exporter":
@@ -206,11 +319,11 @@ class ReportController:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
         if format_choice == "TXT":
-            content = pd.DataFrame(players_sorted).to_string(index=False)
+            content = players_sorted.to_string(index=False)
         elif format_choice == "CSV":
-            content = pd.DataFrame(players_sorted).to_csv(index=False)
+            content = players_sorted.to_csv(index=False)
         elif format_choice == "HTML":
-            content = pd.DataFrame(players_sorted).to_html(index=False)
+            content = players_sorted.to_html(index=False)
 
         with open(file_path, "w") as file:
             file.write(content)
@@ -219,54 +332,38 @@ class ReportController:
             f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
         )
 
+    @profiled_action
     def list_tournament_rounds_and_matches(self):
         self.reload_players_data()
 
-        if self.tournaments_df.empty:
-            self.view.show_message("Aucun tournoi trouvé.")
-        else:
-            tournament_choices = [(tournament["name"], i) for i, tournament in self.tournaments_df.iterrows()]
-            choice = self.view.select_tournament(tournament_choices)
+        tournament_data = self.select_catalog_tournament()
+        if tournament_data is None:
+            return
 
-            if choice is None:
-                return
+        rounds = [Round.from_dict(round) for round in tournament_data["rounds"]]
 
-            tournament_data = self.tournaments_df.iloc[choice].to_dict()
-            rounds = [Round.from_dict(round) for round in tournament_data["rounds"]]
+        if not rounds:
+            self.view.show_message(f"Le tournoi '{tournament_data['name']}' n'a pas encore de rounds.")
+            return
 
-            if not rounds:
-                self.view.show_message(f"Le tournoi '{tournament_data['name']}' n'a pas encore de rounds.")
-                return
+        # On joint une seule fois les matchs avec les joueurs, la table sert à l'affichage et à l'export
+        matches_df = join_matches_with_players(rounds, self.players_df, self.player_controller.registry)
 
-            # Appel de la fonction pour afficher les matchs
-            self.view.display_rounds_and_matches(tournament_data["name"], rounds, self.players_df)
+        # Appel de la fonction pour afficher les matchs
+        self.view.display_rounds_and_matches(tournament_data["name"], rounds, matches_df)
 
-            export_choice = self.view.ask_export_choice()
-            if export_choice == "Exporter":
-                format_choice = self.view.ask_export_format()
-                if format_choice != "Annuler":
-                    self.export_tournament_rounds_and_matches(rounds, tournament_data["name"], format_choice)
+        export_choice = self.view.ask_export_choice()
+        if export_choice == "Exporter":
+            format_choice = self.view.ask_export_format()
+            if format_choice != "Annuler":
+                self.export_tournament_rounds_and_matches(matches_df, tournament_data["name"], format_choice)
 
-    def export_tournament_rounds_and_matches(self, rounds, tournament_name, format_choice):
+    def export_tournament_rounds_and_matches(self, rounds_df, tournament_name, format_choice):
         tournament_name = sanitize(tournament_name)
         file_name = f"tournament_{tournament_name}_rounds_and_matches"
         file_path = f"reports/tournaments/{format_choice.lower()}/{file_name}.{format_choice.lower()}"
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        rounds_data = []
-        for round_ in rounds:
-            for match in round_.matches:
-                match_data = {
-                    "round": round_.name,
-                    "player1_id": match.player1_id,
-                    "player2_id": match.player2_id,
-                    "score_player1": match.score_player1,
-                    "score_player2": match.score_player2,
-                }
-                rounds_data.append(match_data)
-
-        rounds_df = pd.DataFrame(rounds_data)
-
         if format_choice == "TXT":
             content = rounds_df.to_string(index=False)
         elif format_choice == "CSV":
@@ -279,3 +376,285 @@ class ReportController:
         self.view.show_message(
             f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
         )
+
+    @profiled_action
+    def show_podium_probabilities(self):
+        self.reload_players_data()
+
+        # Seuls les tournois non terminés (jamais archivés) avec au moins deux joueurs peuvent être simulés
+        positions = self.get_catalog_index().query(status=["not_started", "ongoing"])
+        ongoing_tournaments = self.tournaments_df.iloc[positions]
+        ongoing_tournaments = ongoing_tournaments[ongoing_tournaments["players"].map(len) >= 2]
+        if ongoing_tournaments.empty:
+            self.view.show_message("Aucun tournoi en cours avec au moins deux joueurs.")
+            return
+
+        tournament_choices = [(name, i) for i, name in enumerate(ongoing_tournaments["name"])]
+        choice = self.view.select_tournament(tournament_choices)
+        if choice is None:
+            return
+
+        tournament = Tournament.from_dict(ongoing_tournaments.iloc[choice].to_dict())
+        self.view.show_message(f"Simulation de la fin du tournoi '{tournament.name}'...")
+        probabilities_df = simulate_tournament(tournament, simulations=self.PODIUM_SIMULATIONS)
+        names = get_player_names_map(
+            self.players_df, probabilities_df["national_id"].tolist(), self.player_controller.registry
+        )
+        probabilities_df.insert(0, "name", probabilities_df["national_id"].map(names).fillna(UNKNOWN_PLAYER))
+
+        clear_console()
+        self.view.display_podium_probabilities(tournament.name, probabilities_df, self.PODIUM_SIMULATIONS)
+
+        export_choice = self.view.ask_export_choice()
+        if export_choice == "Exporter":
+            format_choice = self.view.ask_export_format()
+            if format_choice != "Annuler":
+                self.export_podium_probabilities(probabilities_df, tournament.name, format_choice)
+
+    def get_round_index(self):
+        """
+        Retourne l'index des rounds de tous les tournois, archivés compris (voir utils/round_index.py).
+        """
+        archived_headers = self.archive.load_index()
+        sources = (self.tournaments_df, archived_headers)
+        if self.round_index_sources is None or any(
+            source is not previous for source, previous in zip(sources, self.round_index_sources)
+        ):
+            hot_tournaments = self.tournaments_df.to_dict(orient="records")
+            hot_names = {tournament["name"] for tournament in hot_tournaments}
+            archived_tournaments = (
+                tournament for tournament in self.archive.iter_tournaments() if tournament["name"] not in hot_names
+            )
+            self.round_index = RoundTimeIndex([*hot_tournaments, *archived_tournaments])
+            self.round_index_sources = sources
+        return self.round_index
+
+    @profiled_action
+    def show_rounds_by_period(self):
+        period = self.view.ask_period()
+        if period is None:
+            return
+        start_date, end_date = sorted(period)
+
+        # Période en heure locale, date de fin incluse
+        start = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+        end = int((datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).timestamp())
+        round_index = self.get_round_index()
+        rounds_df = round_index.rounds_started_between(start, end)
+        if rounds_df.empty:
+            self.view.show_message(f"Aucun round joué du {start_date} au {end_date}.")
+            return
+
+        clear_console()
+        average_duration = round_index.average_duration(start, end)
+        self.view.display_rounds_by_period(start_date, end_date, rounds_df, average_duration)
+
+        export_choice = self.view.ask_export_choice()
+        if export_choice == "Exporter":
+            format_choice = self.view.ask_export_format()
+            if format_choice != "Annuler":
+                self.export_rounds_by_period(rounds_df, start_date, end_date, format_choice)
+
+    def export_rounds_by_period(self, rounds_df, start_date, end_date, format_choice):
+        file_name = f"rounds_{start_date}_{end_date}"
+        file_path = f"reports/tournaments/{format_choice.lower()}/{file_name}.{format_choice.lower()}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # Les heures sont exportées en heure locale, la durée en minutes
+        export_df = rounds_df.assign(
+            start_time=rounds_df["start_time"].map(format_timestamp),
+            end_time=[format_timestamp(None if pd.isna(end) else end) for end in rounds_df["end_time"]],
+            duration=rounds_df["duration"] // 60,
+        ).rename(columns={"duration": "duration_minutes"})
+
+        if format_choice == "TXT":
+            content = export_df.to_string(index=False)
+        elif format_choice == "CSV":
+            content = export_df.to_csv(index=False)
+        elif format_choice == "HTML":
+            content = export_df.to_html(index=False)
+
+        with open(file_path, "w") as file:
+            file.write(content)
+        clear_console()
+        self.view.show_message(
+            f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
+        )
+
+    def get_tournament_versions(self):
+        """
+        Retourne la version de tous les tournois, archivés compris, et de quoi charger chacun d'eux.
+
+        Returns:
+            tuple: (dictionnaire {nom du tournoi: version}, fonction retournant le tournoi complet à partir de son
+            nom), voir HeadToHeadIndex.refresh et PlayerStats.refresh.
+        """
+        hot_tournaments = {
+            tournament["name"]: tournament
+            for tournament in self.tournaments_df[["name", "version", "rounds"]].to_dict(orient="records")
+        }
+        tournament_versions = {name: tournament["version"] for name, tournament in hot_tournaments.items()}
+        for header in self.archive.load_index():
+            # Un tournoi présent dans les deux (archivage interrompu) est lu depuis le fichier des tournois
+            tournament_versions.setdefault(header["name"], header.get("version", 0))
+
+        def load_tournament(name):
+            if name in hot_tournaments:
+                return hot_tournaments[name]
+            return self.archive.load_tournament(name)
+
+        return tournament_versions, load_tournament
+
+    def get_head_to_head_index(self):
+        """
+        Retourne l'index des rencontres entre joueurs de tous les tournois, archivés compris
+        (voir utils/head_to_head.py).
+        """
+        self.head_to_head.refresh(*self.get_tournament_versions())
+        return self.head_to_head
+
+    def get_player_stats(self):
+        """
+        Retourne les statistiques des joueurs sur tous les tournois, archivés compris (voir utils/player_stats.py).
+        """
+        self.player_stats.refresh(*self.get_tournament_versions())
+        return self.player_stats
+
+    def find_player_id(self, choice):
+        """
+        Retourne l'identifiant national du joueur saisi (identifiant ou nom désignant un seul joueur), ou None.
+        """
+        search_index = self.player_controller.search_index
+        national_id = choice.upper().strip()
+        if national_id in search_index:
+            return national_id
+        # Si un nom a été saisi sans choisir de suggestion, on l'accepte s'il désigne un seul joueur
+        matches = search_index.search(choice, limit=2)
+        return matches[0] if len(matches) == 1 else None
+
+    @profiled_action
+    def show_head_to_head(self):
+        self.reload_players_data()
+        choices = self.view.ask_players(
+            ["Premier joueur (identifiant ou nom) :", "Second joueur (identifiant ou nom) :"],
+            PlayerCompleter(self.player_controller.search_index),
+        )
+        if choices is None:
+            return
+        player_ids = [self.find_player_id(choice) for choice in choices]
+        if None in player_ids:
+            self.view.show_message("Identifiant national invalide ou joueur non trouvé.")
+            return
+        player1_id, player2_id = player_ids
+        if player1_id == player2_id:
+            self.view.show_message("Veuillez choisir deux joueurs différents.")
+            return
+
+        head_to_head = self.get_head_to_head_index()
+        meetings_df = head_to_head.get_meetings(player1_id, player2_id)
+        names = get_player_names_map(self.players_df, player_ids, self.player_controller.registry)
+        player_names = [names.get(national_id, UNKNOWN_PLAYER) for national_id in player_ids]
+        if meetings_df.empty:
+            self.view.show_message(f"{player_names[0]} et {player_names[1]} ne se sont jamais rencontrés.")
+            return
+
+        clear_console()
+        summary = head_to_head.get_summary(player1_id, player2_id)
+        self.view.display_head_to_head(player_names, player_ids, meetings_df, summary)
+
+        export_choice = self.view.ask_export_choice()
+        if export_choice == "Exporter":
+            format_choice = self.view.ask_export_format()
+            if format_choice != "Annuler":
+                self.export_head_to_head(meetings_df, player1_id, player2_id, format_choice)
+
+    @profiled_action
+    def show_player_profile(self):
+        self.reload_players_data()
+        choices = self.view.ask_players(
+            ["Joueur (identifiant ou nom) :"], PlayerCompleter(self.player_controller.search_index)
+        )
+        if choices is None:
+            return
+        national_id = self.find_player_id(choices[0])
+        if national_id is None:
+            self.view.show_message("Identifiant national invalide ou joueur non trouvé.")
+            return
+
+        player_stats = self.get_player_stats()
+        profile = player_stats.get_profile(national_id)
+        opponents_df = player_stats.get_opponents(national_id)
+        tournaments_df = player_stats.get_tournaments(national_id)
+        names = get_player_names_map(
+            self.players_df, [national_id, *opponents_df["opponent"]], self.player_controller.registry
+        )
+        opponents_df.insert(0, "name", opponents_df["opponent"].map(names).fillna(UNKNOWN_PLAYER))
+        player_name = names.get(national_id, UNKNOWN_PLAYER)
+
+        clear_console()
+        self.view.display_player_profile(player_name, national_id, profile, opponents_df, tournaments_df)
+
+        export_choice = self.view.ask_export_choice()
+        if export_choice == "Exporter":
+            format_choice = self.view.ask_export_format()
+            if format_choice != "Annuler":
+                self.export_player_profile(opponents_df, national_id, format_choice)
+
+    def export_player_profile(self, opponents_df, national_id, format_choice):
+        file_name = f"player_{sanitize(national_id)}_profile"
+        file_path = f"reports/players/{format_choice.lower()}/{file_name}.{format_choice.lower()}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # Le bilan du joueur contre chacun de ses adversaires
+        if format_choice == "TXT":
+            content = opponents_df.to_string(index=False)
+        elif format_choice == "CSV":
+            content = opponents_df.to_csv(index=False)
+        elif format_choice == "HTML":
+            content = opponents_df.to_html(index=False)
+        with open(file_path, "w") as file:
+            file.write(content)
+        clear_console()
+        self.view.show_message(
+            f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
+        )
+
+    def export_head_to_head(self, meetings_df, player1_id, player2_id, format_choice):
+        file_name = f"head_to_head_{sanitize(player1_id)}_{sanitize(player2_id)}"
+        file_path = f"reports/players/{format_choice.lower()}/{file_name}.{format_choice.lower()}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        export_df = meetings_df.rename(
+            columns={"player1_score": f"score_{player1_id}", "player2_score": f"score_{player2_id}"}
+        )
+        if format_choice == "TXT":
+            content = export_df.to_string(index=False)
+        elif format_choice == "CSV":
+            content = export_df.to_csv(index=False)
+        elif format_choice == "HTML":
+            content = export_df.to_html(index=False)
+        with open(file_path, "w") as file:
+            file.write(content)
+        clear_console()
+        self.view.show_message(
+            f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
+        )
+
+    def export_podium_probabilities(self, probabilities_df, tournament_name, format_choice):
+        tournament_name = sanitize(tournament_name)
+        file_name = f"tournament_{tournament_name}_podium_probabilities"
+        file_path = f"reports/tournaments/{format_choice.lower()}/{file_name}.{format_choice.lower()}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        if format_choice == "TXT":
+            content = probabilities_df.to_string(index=False)
+        elif format_choice == "CSV":
+            content = probabilities_df.to_csv(index=False)
+        elif format_choice == "HTML":
+            content = probabilities_df.to_html(index=False)
+        with open(file_path, "w") as file:
+            file.write(content)
+        clear_console()
+        self.view.show_message(
+            f"\n🎉 Rapport exporté avec succès !\n" f"\nFichier exporté à cet endroit : {file_path}\n"
+        )
@@ -0,0 +1,186 @@
+from exceptions import ConcurrentModificationError, InvalidResultsError
+from models.match import Match
+from models.round import Round
+from models.tournament import Tournament
+from utils.metrics import count_scan
+from utils.results_file import group_rows_by_round, load_results_file, parse_scores
+
+
+class ResultImportController:
+    """
+    Contrôleur permettant d'importer les résultats d'un ou plusieurs rounds depuis un fichier, sans interface.
+
+    Tous les résultats sont d'abord appliqués sur une copie du tournoi puis vérifiés : si une seule ligne est
+    invalide, rien n'est enregistré. Sinon, les fichiers des joueurs et des tournois sont sauvegardés une seule fois.
+    """
+
+    def __init__(self, tournament_controller, player_controller):
+        self.tournament_controller = tournament_controller
+        self.player_controller = player_controller
+
+    def import_results(self, tournament_name, file_path):
+        """
+        Importe les résultats d'un fichier dans le tournoi donné.
+
+        Args:
+            tournament_name (str): Le nom du tournoi.
+            file_path (str): Chemin vers le fichier de résultats (.csv, .jsonl ou .json).
+
+        Returns:
+            dict: Résumé de l'import (nombre de rounds et de matchs importés, round actuel).
+
+        Raises:
+            InvalidResultsError: Si le tournoi est introuvable ou si les résultats ne correspondent pas
+                aux appariements.
+        """
+        rows = load_results_file(file_path)
+        tournament = self.get_tournament(tournament_name)
+
+        if tournament.current_round == 0:
+            if not tournament.is_valid_player_count_for_rounds():
+                raise InvalidResultsError(
+                    f"le tournoi '{tournament.name}' nécessite au minimum "
+                    f"{tournament.minimum_players_required()} joueurs."
+                )
+            self.open_next_round(tournament)
+
+        score_deltas = {}
+        imported_matches = 0
+        imported_rounds = 0
+        for round_number, round_rows in group_rows_by_round(rows, tournament.current_round):
+            if self.is_finished(tournament):
+                raise InvalidResultsError(f"le tournoi '{tournament.name}' est déjà terminé.")
+            if round_number != tournament.current_round:
+                raise InvalidResultsError(
+                    f"des résultats du round {round_number} sont fournis alors que le round en cours est le "
+                    f"round {tournament.current_round}."
+                )
+            imported_matches += self.apply_round_results(tournament, round_rows, score_deltas)
+            imported_rounds += 1
+
+        # Tous les rounds sont valides : on enregistre le tournoi puis les joueurs en une seule fois
+        self.commit(tournament, score_deltas)
+
+        return {
+            "tournament": tournament.name,
+            "rounds": imported_rounds,
+            "matches": imported_matches,
+            "current_round": tournament.current_round,
+            "finished": self.is_finished(tournament),
+        }
+
+    def get_tournament(self, tournament_name):
+        tournaments_df = self.tournament_controller.tournaments_df
+        count_scan("tournaments", len(tournaments_df), "result_import")
+        matching_df = tournaments_df[tournaments_df["name"] == tournament_name]
+        if matching_df.empty:
+            raise InvalidResultsError(f"aucun tournoi nommé '{tournament_name}'.")
+        # On travaille sur une copie indépendante du tournoi stocké
+        return Tournament.from_dict(matching_df.iloc[0].to_dict())
+
+    def is_finished(self, tournament):
+        return (
+            tournament.current_round >= tournament.rounds_count
+            and bool(tournament.rounds)
+            and tournament.rounds[-1].end_time is not None
+        )
+
+    def open_next_round(self, tournament):
+        # Équivalent de TournamentController.initialize_round, sans sauvegarde
+        tournament.add_round(Round(f"Round {tournament.current_round + 1}"))
+        tournament.current_round += 1
+
+    def apply_round_results(self, tournament, rows, score_deltas):
+        """
+        Vérifie puis applique les résultats du round en cours.
+
+        Les numéros d'échiquier correspondent à l'ordre des paires générées par Tournament.generate_round_pairs
+        (le même que celui affiché pendant la saisie interactive).
+
+        Args:
+            tournament (Tournament): Le tournoi (copie de travail).
+            rows (list): Les lignes de résultats du round.
+            score_deltas (dict): Points gagnés par joueur, complété par cette méthode.
+
+        Returns:
+            int: Le nombre de matchs importés.
+
+        Raises:
+            InvalidResultsError: Si un résultat est invalide, en double, inconnu ou manquant.
+        """
+        round_ = tournament.rounds[-1]
+        already_played = {match.player1_id for match in round_.matches}
+        pairs = tournament.generate_round_pairs()
+        boards = {
+            number: pair for number, pair in enumerate(pairs, start=1) if pair[0].national_id not in already_played
+        }
+        boards_by_players = {
+            frozenset((player1.national_id, player2.national_id)): number
+            for number, (player1, player2) in boards.items()
+        }
+
+        results = {}
+        for row in rows:
+            scores = parse_scores(row)
+            if row.get("board") not in (None, ""):
+                try:
+                    board = int(row["board"])
+                except (TypeError, ValueError):
+                    raise InvalidResultsError(f"ligne {row['line']} : échiquier '{row['board']}' invalide.")
+                if board not in boards:
+                    raise InvalidResultsError(
+                        f"ligne {row['line']} : aucun match à saisir sur l'échiquier {board} au {round_.name}."
+                    )
+            else:
+                player1_id = str(row.get("player1", "")).strip().upper()
+                player2_id = str(row.get("player2", "")).strip().upper()
+                board = boards_by_players.get(frozenset((player1_id, player2_id)))
+                if board is None:
+                    raise InvalidResultsError(
+                        f"ligne {row['line']} : {player1_id} et {player2_id} ne sont pas appariés au {round_.name}."
+                    )
+                # Si les joueurs sont donnés dans l'ordre inverse de l'appariement, on inverse les scores
+                if player1_id != boards[board][0].national_id:
+                    scores = (scores[1], scores[0])
+
+            if board in results:
+                raise InvalidResultsError(f"ligne {row['line']} : résultat en double pour l'échiquier {board}.")
+            results[board] = scores
+
+        missing_boards = sorted(set(boards) - set(results))
+        if missing_boards:
+            raise InvalidResultsError(
+                f"résultats manquants au {round_.name} pour les échiquiers {', '.join(map(str, missing_boards))}."
+            )
+
+        for board in sorted(results):
+            player1, player2 = boards[board]
+            score1, score2 = results[board]
+            match = Match(player1.national_id, player2.national_id)
+            match.set_scores(score1, score2)
+            round_.add_match(match)
+            player1.career_score = float(player1.career_score + score1)
+            player2.career_score = float(player2.career_score + score2)
+            score_deltas[player1.national_id] = score_deltas.get(player1.national_id, 0.0) + score1
+            score_deltas[player2.national_id] = score_deltas.get(player2.national_id, 0.0) + score2
+
+        round_.close_round()
+        if tournament.current_round < tournament.rounds_count:
+            self.open_next_round(tournament)
+        return len(results)
+
+    def commit(self, tournament, score_deltas):
+        # Le tournoi est enregistré en premier : en cas de saisie concurrente des mêmes matchs depuis un autre
+        # terminal, rien n'est enregistré
+        try:
+            self.tournament_controller.save_tournament(tournament)
+        except ConcurrentModificationError as e:
+            raise InvalidResultsError(f"{e.reason} Relancez l'import.")
+
+        players_df = self.player_controller.players_df.copy()
+        if score_deltas and not players_df.empty:
+            players_df["career_score"] = (
+                players_df["career_score"] + players_df["national_id"].map(score_deltas).fillna(0.0)
+            )
+            self.player_controller.players_df = players_df
+            self.player_controller.save_players()
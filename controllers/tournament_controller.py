@@ -1,10 +1,17 @@
 import pandas as pd
 
+from exceptions import ConcurrentModificationError
 from models.match import Match
 from models.player import Player
 from models.round import Round
 from models.tournament import Tournament
 from utils.data_manager import TournamentDataManager
+from utils.metrics import count_scan, metrics
+from utils.player_lookup import UNKNOWN_PLAYER, get_player_records_map
+from utils.profiling import profiled_action
+from utils.search_index import PlayerCompleter
+from utils.tournament_cache import TournamentCache
+from utils.tournament_index import TournamentIndex
 from utils.utils import clear_console
 from views.player_view import PlayerView
 from views.tournament_view import TournamentView
@@ -18,6 +25,10 @@ class TournamentController:
         self.tournament_view = TournamentView()
         self.player_view = PlayerView()
         self.players_df = self.player_controller.players_df
+        # Tournois déjà chargés (objets Tournament), repris tant que leur enregistrement n'a pas changé
+        self.tournament_cache = TournamentCache()
+        # Index des tournois par dates, lieu et statut, reconstruit seulement lorsque les tournois changent
+        self.tournament_index = None
 
     def run(self):
         while True:
@@ -53,9 +64,68 @@ class TournamentController:
 
     # Méthode pour sauvegarder les données des tournois
     def save_tournaments(self):
-        self.data_manager.set_data(self.tournaments_df)
+        try:
+            self.data_manager.set_data(self.tournaments_df)
+        finally:
+            # Les données enregistrées peuvent inclure les modifications d'un autre terminal
+            self.tournaments_df = self.data_manager.get_data()
+
+    def refresh_tournament(self, tournament):
+        """
+        Récupère les résultats saisis depuis un autre terminal et met à jour le tournoi en cours.
+
+        Args:
+            tournament (Tournament): Le tournoi en cours.
+        """
+        self.player_controller.refresh_players()
+        try:
+            refreshed = self.data_manager.refresh()
+        except ConcurrentModificationError as e:
+            self.tournament_view.show_message(str(e))
+            refreshed = True
+        if refreshed:
+            self.tournaments_df = self.data_manager.get_data()
+            self.sync_tournament(tournament)
+
+    def sync_tournament(self, tournament):
+        # On recopie dans l'objet Tournament la version enregistrée (éventuellement fusionnée) du tournoi
+        count_scan("tournaments", len(self.tournaments_df), "sync_tournament")
+        matching_df = self.tournaments_df[self.tournaments_df["name"] == tournament.name]
+        if matching_df.empty:
+            return
+        stored_tournament = Tournament.from_dict(matching_df.iloc[0].to_dict())
+        tournament.current_round = stored_tournament.current_round
+        tournament.rounds = stored_tournament.rounds
+        tournament.players = stored_tournament.players
+        tournament.version = stored_tournament.version
+        # Le tournoi correspond maintenant à son enregistrement : il peut être repris tel quel
+        self.tournament_cache.put(tournament, self.data_manager.get_record_hash(tournament.name))
+
+    def get_tournament_index(self):
+        """
+        Retourne l'index des tournois par dates, lieu et statut (voir utils/tournament_index.py).
+        """
+        if self.tournament_index is None or self.tournament_index.tournaments_df is not self.tournaments_df:
+            self.tournament_index = TournamentIndex(self.tournaments_df)
+        return self.tournament_index
+
+    def load_tournament(self, tournament_row):
+        """
+        Retourne le tournoi d'une ligne des tournois, repris du cache s'il n'a pas changé depuis son chargement.
+
+        Args:
+            tournament_row (pd.Series): La ligne du tournoi dans tournaments_df.
+
+        Returns:
+            Tournament: Le tournoi.
+        """
+        name = tournament_row["name"]
+        return self.tournament_cache.get(
+            name, self.data_manager.get_record_hash(name), lambda: Tournament.from_dict(tournament_row.to_dict())
+        )
 
     # Méthode pour créer un nouveau tournoi
+    @profiled_action
     def create_new_tournament(self):
         # Récupère les informations du tournoi via la vue
         tournament_info = self.tournament_view.get_tournament_info()
@@ -76,13 +146,14 @@ class TournamentController:
         self.tournament_view.show_message(f"🎉 - Le tournoi '{tournament.name}' a été ajouté avec succès.")
         self.save_tournaments()
 
+    @profiled_action
     def list_tournaments(self):
         clear_console()
         if self.tournaments_df.empty:
             self.tournament_view.show_message("Oh-oh ! La base de données des tournois est actuellement vide.\n"
                                               "\nCommencez par ajouter au moins un tournoi 👇\n")
         else:
-            self.tournament_view.list_tournaments(self.tournaments_df)
+            self.tournament_view.browse_tournaments(self.tournaments_df)
 
     def initialize_round(self, tournament):
         round_name = f"Round {tournament.current_round + 1}"
@@ -92,15 +163,16 @@ class TournamentController:
         self.update_tournament(tournament)
 
     def add_players_to_tournament(self, tournament, return_to_menu=False):
-        while True:
-            # Recharger la liste des joueurs pour obtenir les mises à jour
-            self.player_controller.load_players()
+        search_index = self.player_controller.search_index
+        completer = PlayerCompleter(search_index)
 
+        while True:
+            # Seule la 1re page du registre est affichée, la saisie propose une autocomplétion sur tous les joueurs
             self.player_view.list_players(self.player_controller.players_df)
             player_in_tournament_df = [player.to_dict() for player in tournament.players]
             self.tournament_view.list_players_in_tournament(player_in_tournament_df, self.player_controller.players_df)
 
-            choice = self.tournament_view.get_player_add_choice()
+            choice = self.tournament_view.get_player_add_choice(completer)
 
             if choice.lower() == "done":
                 if return_to_menu:
@@ -122,19 +194,21 @@ class TournamentController:
                     )
                     self.player_controller.save_players()
                     self.player_controller.load_players()
+                    search_index.add(player.national_id, player.first_name, player.last_name)
 
                     tournament.add_player(player)
 
                 except ValueError as e:
                     self.player_view.show_message(str(e))
             else:
-                self.player_controller.load_players()
-                player_data = self.player_controller.players_df.loc[
-                    self.player_controller.players_df["national_id"] == choice.upper()
-                ]
-
-                if not player_data.empty:
-                    player = Player.from_dict(player_data.iloc[0].to_dict())
+                national_id = choice.upper().strip()
+                if national_id not in search_index:
+                    # Si un nom a été saisi sans choisir de suggestion, on l'accepte s'il désigne un seul joueur
+                    matches = search_index.search(choice, limit=2)
+                    national_id = matches[0] if len(matches) == 1 else None
+
+                if national_id is not None:
+                    player = self.player_controller.get_player_by_national_id(national_id)
                     tournament.add_player(player)
                 else:
                     self.player_view.show_message("Identifiant national invalide ou joueur non trouvé.")
@@ -155,13 +229,14 @@ class TournamentController:
                 elif choice == "main_menu":
                     return "main_menu"
             else:
+                players_records = get_player_records_map(
+                    [player.national_id for player in tournament.players],
+                    self.player_controller.players_df,
+                    self.player_controller.registry,
+                )
                 player_data = [
                     {
-                        **self.player_controller.players_df.loc[
-                            self.player_controller.players_df["national_id"] == player.national_id
-                        ]
-                        .iloc[0]
-                        .to_dict(),
+                        **players_records[player.national_id],
                         "national_id": player.national_id,
                         "career_score": player.career_score,
                     }
@@ -182,46 +257,57 @@ class TournamentController:
                     )
                 self.update_tournament(tournament)
 
+    @profiled_action
     def run_tournament(self, tournament):
         try:
             while tournament.current_round <= tournament.rounds_count:
-                round_name = f"Round {tournament.current_round}"
                 if len(tournament.rounds) < tournament.current_round:
                     self.initialize_round(tournament)
-                round_ = tournament.rounds[-1]
-                pairs = tournament.generate_pairs()
-                already_played_matches = [match.player1_id for match in round_.matches]
-                match_number = 1
-
-                for player1, player2 in pairs:
-                    if player1.national_id in already_played_matches:
-                        match_number += 1
+                # Les paires sont calculées à partir des derniers résultats enregistrés, y compris ceux des
+                # autres terminaux
+                self.refresh_tournament(tournament)
+                round_name = f"Round {tournament.current_round}"
+                round_index = len(tournament.rounds) - 1
+                pairs = tournament.generate_round_pairs()
+                # Les joueurs sont résolus une seule fois par round, et l'écran est construit une seule fois
+                players_records = get_player_records_map(
+                    [player.national_id for pair in pairs for player in pair],
+                    self.player_controller.players_df,
+                    self.player_controller.registry,
+                )
+                boards = [
+                    tuple(self.get_player_record(players_records, player.national_id) for player in pair)
+                    for pair in pairs
+                ]
+                screen = self.tournament_view.create_round_screen(tournament, round_name, boards)
+
+                while True:
+                    # Un autre terminal a pu saisir des résultats de ce round entre-temps
+                    self.refresh_tournament(tournament)
+                    pending_boards = self.update_round_screen(screen, pairs, boards, tournament.rounds[round_index])
+                    if not pending_boards:
+                        break
+
+                    board, score1, score2 = self.tournament_view.ask_board_result(screen, pending_boards)
+                    player1, player2 = pairs[board - 1]
+                    # Le résultat a pu être saisi sur un autre terminal pendant la saisie
+                    self.refresh_tournament(tournament)
+                    if self.has_played_in_round(tournament.rounds[round_index], player1, player2):
                         continue
-
                     match = Match(player1.national_id, player2.national_id)
-                    player1_data = self.player_controller.players_df.loc[
-                        self.player_controller.players_df["national_id"] == match.player1_id
-                    ].iloc[0]
-                    player2_data = self.player_controller.players_df.loc[
-                        self.player_controller.players_df["national_id"] == match.player2_id
-                    ].iloc[0]
-                    player1_info = f"{player1_data['first_name']} {player1_data['last_name']} ({match.player1_id})"
-                    player2_info = f"{player2_data['first_name']} {player2_data['last_name']} ({match.player2_id})"
-                    clear_console()
-                    self.tournament_view.create_tournament_tables(
-                        tournament, pairs, round_name, match_number, player1_info, player2_info
-                    )
-
-                    score1, score2 = self.get_match_result(match, player1_data, player2_data)
-                    if score1 is not None and score2 is not None:
-                        match.set_scores(score1, score2)
-                        self.update_player_scores(match, tournament)
-                        round_.add_match(match)
-                        self.update_tournament(tournament)
-                    match_number += 1
-
-                round_.close_round()
-                self.update_tournament(tournament)
+                    match.set_scores(score1, score2)
+                    # Le match et les scores du tournoi sont enregistrés ensemble
+                    tournament.rounds[round_index].add_match(match)
+                    self.update_player_scores(match, tournament)
+
+                self.refresh_tournament(tournament)
+                round_ = tournament.rounds[round_index]
+                if round_.end_time is None:
+                    round_.close_round()
+                    self.update_tournament(tournament)
+                if tournament.current_round > round_index + 1:
+                    # Le round suivant a déjà été ouvert depuis un autre terminal
+                    continue
                 if tournament.current_round < tournament.rounds_count:
                     self.initialize_round(tournament)
                     self.tournament_view.show_message(f"{round_name} terminé")
@@ -230,21 +316,62 @@ class TournamentController:
                     break
 
             self.update_tournament(tournament)
-            self.save_tournaments()
         except InterruptedError:
             self.update_tournament(tournament)
-            self.tournament_view.show_message("\nTournoi interrompu. Vous pouvez reprendre plus tard.\n")
+            self.flush_saves()
+            self.tournament_view.show_message(
+                "\nTournoi interrompu. Vous pouvez reprendre plus tard.\n"
+                f"💾 Dernière sauvegarde sur le disque : {self.data_manager.last_persisted_at:%H:%M:%S}\n"
+            )
+        except KeyboardInterrupt:
+            # Ctrl+C : on enregistre le tournoi et on attend l'écriture sur le disque avant de quitter
+            self.update_tournament(tournament)
+            self.flush_saves()
+            raise
+
+    def flush_saves(self):
+        # Attend l'écriture des sauvegardes en attente des joueurs et des tournois
+        for data_manager in (self.player_controller.data_manager, self.data_manager):
+            try:
+                data_manager.flush()
+            except ConcurrentModificationError as e:
+                self.tournament_view.show_message(str(e))
+
+    def get_player_record(self, players_records, national_id):
+        # Un joueur supprimé de la base reste affiché avec son identifiant
+        return players_records.get(
+            national_id, {"first_name": UNKNOWN_PLAYER, "last_name": "", "national_id": national_id}
+        )
 
-    def get_match_result(self, match, player1, player2):
-        return self.tournament_view.get_match_result(player1, player2)
+    def has_played_in_round(self, round_, player1, player2):
+        played_players = {player_id for match in round_.matches for player_id in (match.player1_id, match.player2_id)}
+        return player1.national_id in played_players or player2.national_id in played_players
+
+    def update_round_screen(self, screen, pairs, boards, round_):
+        """
+        Reporte sur l'écran du round les résultats enregistrés (depuis ce terminal ou un autre).
+
+        Returns:
+            list: Les échiquiers restant à saisir, sous forme de tuples (numéro, joueur 1, joueur 2).
+        """
+        results = {(match.player1_id, match.player2_id): match for match in round_.matches}
+        played_players = {player_id for pair in results for player_id in pair}
+        pending_boards = []
+        for board, ((player1, player2), (player1_data, player2_data)) in enumerate(zip(pairs, boards), start=1):
+            match = results.get((player1.national_id, player2.national_id))
+            if match is not None:
+                screen.set_result(board, match.score_player1, match.score_player2)
+            elif player1.national_id in played_players or player2.national_id in played_players:
+                screen.set_skipped(board)
+            else:
+                pending_boards.append((board, player1_data, player2_data))
+        return pending_boards
 
     def update_player_scores_in_players_df(self, match):
-        self.player_controller.players_df["career_score"] = self.player_controller.players_df["career_score"].astype(
-            float
-        )
-
+        # La colonne career_score est déjà de type float64 (voir PlayerDataManager.dtypes)
         player1 = self.player_controller.get_player_by_national_id(match.player1_id)
         if player1:
+            count_scan("players", len(self.player_controller.players_df), "update_player_scores_in_players_df")
             player1_filter = self.player_controller.players_df["national_id"] == match.player1_id
             player1_row = self.player_controller.players_df[player1_filter]
             new_career_score_player1 = player1_row.iloc[0]["career_score"] + match.score_player1
@@ -252,6 +379,7 @@ class TournamentController:
 
         player2 = self.player_controller.get_player_by_national_id(match.player2_id)
         if player2:
+            count_scan("players", len(self.player_controller.players_df), "update_player_scores_in_players_df")
             player2_filter = self.player_controller.players_df["national_id"] == match.player2_id
             player2_row = self.player_controller.players_df[player2_filter]
             new_career_score_player2 = player2_row.iloc[0]["career_score"] + match.score_player2
@@ -268,9 +396,36 @@ class TournamentController:
                 new_career_score_player2 = player.career_score + match.score_player2
                 player.career_score = float(new_career_score_player2)
 
-        self.update_tournament(tournament)
+        return self.update_tournament(tournament)
 
     def update_tournament(self, tournament):
+        """
+        Enregistre le tournoi puis le met à jour avec la version enregistrée (fusionnée avec les modifications
+        faites depuis un autre terminal).
+
+        Args:
+            tournament (Tournament): Le tournoi à enregistrer.
+
+        Returns:
+            bool: False si nos modifications étaient en conflit avec celles d'un autre terminal et ont été
+            remplacées par la version du fichier, sinon True.
+        """
+        try:
+            self.save_tournament(tournament)
+        except ConcurrentModificationError as e:
+            self.tournament_view.show_message(str(e))
+            return False
+        finally:
+            self.sync_tournament(tournament)
+        return True
+
+    def save_tournament(self, tournament):
+        if not self.data_manager.has_record_changed(tournament.to_dict()):
+            # Tournoi inchangé (ex : saisie annulée) : ni nouvelle version ni écriture
+            metrics.increment("data_saves_skipped_total", file=self.data_manager.file_name)
+            return
+        # Chaque enregistrement incrémente le compteur de version, comparé par les autres terminaux
+        tournament.version += 1
         tournament_data = pd.DataFrame([tournament.to_dict()])
         for i in range(len(self.tournaments_df)):
             if self.tournaments_df.at[i, "name"] == tournament.name:
@@ -285,25 +440,32 @@ class TournamentController:
         self.save_tournaments()
 
     def update_player_scores(self, match, tournament):
-        self.update_player_scores_in_players_df(match)
-        self.update_player_scores_in_tournaments_df(match, tournament)
+        # Le tournoi est enregistré en premier : si le match a déjà été saisi sur un autre terminal,
+        # les scores de carrière ne sont pas comptés une deuxième fois
+        if self.update_player_scores_in_tournaments_df(match, tournament):
+            self.update_player_scores_in_players_df(match)
 
+    @profiled_action
     def start_tournament(self):
         clear_console()
-        tournament_choices = self.tournaments_df.to_dict(orient="records")
         if self.tournaments_df.empty:
             self.tournament_view.show_message("Oh-oh ! La base de données des tournois est actuellement vide.\n"
                                               "\nCommencez par ajouter au moins un tournoi 👇\n")
             return
-        else:
-            choice = self.tournament_view.select_tournament("démarrer", tournament_choices)
+        # Seuls les tournois pas encore commencés peuvent être démarrés
+        not_started_tournaments = self.tournaments_df.iloc[self.get_tournament_index().query(status="not_started")]
+        if not_started_tournaments.empty:
+            self.tournament_view.show_message("Oh-oh ! Tous les tournois ont déjà commencé.\n"
+                                              "\nCommencez par ajouter un nouveau tournoi 👇\n")
+            return
+        tournament_choices = not_started_tournaments.to_dict(orient="records")
+        choice = self.tournament_view.select_tournament("démarrer", tournament_choices)
 
         if choice == "main_menu":
             clear_console()
             return
         if choice is not None:
-            tournament_data = self.tournaments_df.iloc[choice].to_dict()
-            tournament = Tournament.from_dict(tournament_data)
+            tournament = self.load_tournament(not_started_tournaments.iloc[choice])
             while True:
                 clear_console()
                 action = self.tournament_view.show_tournament_actions()
@@ -348,12 +510,11 @@ class TournamentController:
 
             clear_console()
 
+    @profiled_action
     def resume_tournament(self):
         clear_console()
-        ongoing_tournaments = self.tournaments_df[
-            (self.tournaments_df["current_round"] > 0)
-            & (self.tournaments_df["current_round"] < self.tournaments_df["rounds_count"])
-        ]
+        # Un tournoi dont le dernier round n'est pas terminé est aussi en cours
+        ongoing_tournaments = self.tournaments_df.iloc[self.get_tournament_index().query(status="ongoing")]
 
         if ongoing_tournaments.empty:
             self.tournament_view.show_message("Oh-oh ! Actuellement, il n'y a aucun tournoi en cours.\n")
@@ -366,8 +527,7 @@ class TournamentController:
             return
 
         if choice is not None:
-            tournament_data = ongoing_tournaments.iloc[choice].to_dict()
-            tournament = Tournament.from_dict(tournament_data)
+            tournament = self.load_tournament(ongoing_tournaments.iloc[choice])
             self.run_tournament(tournament)
 
             clear_console()
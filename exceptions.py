@@ -79,3 +79,58 @@ class DataSavingError(Exception):
 
     def __str__(self):
         return f"Erreur lors de l'enregistrement des données dans le fichier : {self.file_path}"
+
+
+class DataSchemaError(DataLoadingError):
+    """
+    Exception levée lorsque le schéma d'un fichier de données ne peut pas être lu par l'application (colonnes
+    manquantes, version plus récente, contenu illisible) : le fichier est laissé intact.
+
+    Attributs:
+        file_path (str): Le chemin vers le fichier concerné.
+        reason (str): L'explication de l'erreur.
+    """
+
+    def __init__(self, file_path, reason):
+        super().__init__(file_path)
+        self.reason = reason
+
+    def __str__(self):
+        return f"Schéma du fichier {self.file_path} incompatible : {self.reason}."
+
+
+class InvalidResultsError(ValueError):
+    """
+    Exception levée lorsque des résultats importés depuis un fichier ne correspondent pas aux appariements du round.
+
+    Attributs:
+        reason (str): L'explication de l'erreur.
+    """
+
+    def __init__(self, reason):
+        self.reason = reason
+
+    def __str__(self):
+        return f"Import des résultats [bold red]refusé[/bold red] : {self.reason}\n"
+
+
+class ConcurrentModificationError(DataSavingError):
+    """
+    Exception levée lorsqu'un enregistrement a été modifié en même temps par un autre terminal, de façon incompatible.
+
+    Attributs:
+        file_path (str): Le chemin vers le fichier concerné.
+        key (str): La clé de l'enregistrement en conflit (ex : le nom du tournoi).
+        reason (str): L'explication du conflit.
+    """
+
+    def __init__(self, file_path, key, reason):
+        super().__init__(file_path)
+        self.key = key
+        self.reason = reason
+
+    def __str__(self):
+        return (
+            f"[bold red]Conflit[/bold red] sur [bold blue]{self.key}[/bold blue] : {self.reason} "
+            f"Les données ont été rechargées depuis le fichier : {self.file_path}\n"
+        )
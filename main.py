@@ -1,7 +1,195 @@
+import argparse
+import os
+import sys
+
 from controllers.main_controller import MainController
 from utils.utils import capitalize_name, clear_console, get_username
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Gestion de tournois d'échecs")
+    parser.add_argument(
+        "--import-results",
+        nargs=2,
+        metavar=("TOURNOI", "FICHIER"),
+        help="Importe sans interface les résultats d'un fichier CSV ou JSON lines dans le tournoi donné.",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        metavar="PORT",
+        help="Démarre en arrière-plan une API HTTP locale (lecture seule) pour les écrans de tableaux de scores.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        metavar="MODES",
+        help="Mesure la durée de chaque action des menus (modes : time, cprofile, tracemalloc, séparés par des "
+        "virgules, ou all). Remplace la variable d'environnement CHESS_PROFILE.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        metavar="DOSSIER",
+        help="Dossier des histogrammes de latence et des profils (par défaut : profiles, ou CHESS_PROFILE_DIR).",
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Charge les données depuis un instantané binaire écrit à côté de chaque fichier JSON (datas/*.snapshot), "
+        "bien plus rapide à lire. Remplace la variable d'environnement CHESS_SNAPSHOT.",
+    )
+    parser.add_argument(
+        "--registry",
+        action="store_true",
+        help="Réécrit le registre des joueurs (datas/players.registry) à chaque sauvegarde, pour les programmes qui "
+        "le lisent sans le reconstruire. Remplace la variable d'environnement CHESS_REGISTRY.",
+    )
+    parser.add_argument(
+        "--tournament-cache-mb",
+        type=float,
+        metavar="MO",
+        help="Budget mémoire du cache des tournois chargés, en mégaoctets (par défaut : 64). Remplace la variable "
+        "d'environnement CHESS_TOURNAMENT_CACHE_MB.",
+    )
+    parser.add_argument(
+        "--archive-tournaments",
+        action="store_true",
+        help="Déplace sans interface les tournois terminés vers des archives compressées (une par saison) "
+        "dans datas/archives.",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=("gzip", "lzma"),
+        default="gzip",
+        help="Format des nouvelles archives (par défaut : gzip ; lzma est plus compact mais plus lent).",
+    )
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Met les fichiers de datas/ (archives comprises) à la version actuelle de leur schéma, sans interface.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Avec --migrate : affiche ce que la migration changerait, sans rien écrire.",
+    )
+    args = parser.parse_args()
+    if args.dry_run and not args.migrate:
+        parser.error("--dry-run s'utilise avec --migrate.")
+    if args.snapshot:
+        from utils.data_manager import DataManager
+
+        DataManager.use_snapshot = True
+    if args.registry:
+        from utils.data_manager import PlayerDataManager
+
+        PlayerDataManager.use_registry = True
+    if args.tournament_cache_mb is not None:
+        if args.tournament_cache_mb < 0:
+            parser.error("--tournament-cache-mb doit être positif.")
+        from utils.tournament_cache import TournamentCache
+
+        TournamentCache.max_bytes = int(args.tournament_cache_mb * 1024 * 1024)
+    if args.profile is not None or args.profile_dir is not None:
+        from utils.profiling import parse_modes, profiler
+
+        modes = parse_modes(args.profile) if args.profile is not None else profiler.modes
+        try:
+            profiler.configure(modes, args.profile_dir)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+def import_results(tournament_name, file_path):
+    # Import des contrôleurs ici pour ne pas ralentir le démarrage du mode interactif
+    from controllers.player_controller import PlayerController
+    from controllers.result_import_controller import ResultImportController
+    from controllers.tournament_controller import TournamentController
+    from exceptions import InvalidResultsError
+
+    player_controller = PlayerController()
+    tournament_controller = TournamentController(player_controller)
+    try:
+        summary = ResultImportController(tournament_controller, player_controller).import_results(
+            tournament_name, file_path
+        )
+    except InvalidResultsError as e:
+        player_controller.view.show_message(str(e))
+        return 1
+
+    status = "terminé" if summary["finished"] else f"round en cours : {summary['current_round']}"
+    player_controller.view.show_message(
+        f"💾 - {summary['matches']} résultats importés sur {summary['rounds']} round(s) "
+        f"dans le tournoi '{summary['tournament']}' ({status})."
+    )
+    return 0
+
+
+def archive_tournaments(compression):
+    from utils.data_manager import TournamentDataManager
+    from utils.tournament_archive import TournamentArchive, archive_finished_tournaments
+
+    tournament_data_manager = TournamentDataManager()
+    archive = TournamentArchive(compression=compression)
+    archived_names = archive_finished_tournaments(tournament_data_manager, archive)
+    if not archived_names:
+        print("Aucun tournoi terminé à archiver.")
+        return 0
+
+    seasons = sorted({header["season"] for header in archive.load_index() if header["name"] in archived_names})
+    print(
+        f"📦 - {len(archived_names)} tournoi(s) terminé(s) archivé(s) dans {archive.directory} "
+        f"(saison(s) : {', '.join(seasons)})."
+    )
+    return 0
+
+
+def migrate(dry_run):
+    import glob
+
+    from exceptions import DataSchemaError
+    from utils.migrations import migrate_file
+
+    data_files = [("datas/players.json", "players"), ("datas/tournaments.json", "tournaments")]
+    # Archives de saison des tournois terminés (les fichiers de verrou .lock sont ignorés)
+    archives = sorted(
+        glob.glob("datas/archives/tournaments_*.json.gz") + glob.glob("datas/archives/tournaments_*.json.xz")
+    )
+    data_files += [(file_path, "tournaments") for file_path in archives]
+    for file_path, schema in data_files:
+        if not os.path.exists(file_path):
+            continue
+        try:
+            report = migrate_file(file_path, schema, dry_run=dry_run)
+        except DataSchemaError as e:
+            print(f"❌ - {e}")
+            return 1
+        if report["from_version"] == report["to_version"]:
+            print(f"{file_path} : déjà à la version {report['to_version']} du schéma.")
+            continue
+        action = "seraient modifiés" if dry_run else "modifiés"
+        print(
+            f"{'🔎' if dry_run else '💾'} - {file_path} : version {report['from_version']} → {report['to_version']}, "
+            f"{report['changed']} enregistrement(s) sur {report['records']} {action}."
+        )
+        for step_name, count in report["steps"].items():
+            print(f"    - {step_name} : {count}")
+        for key, step_names in report["examples"]:
+            print(f"    exemple : {key} ({', '.join(step_names)})")
+    return 0
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.import_results:
+        sys.exit(import_results(*args.import_results))
+    if args.archive_tournaments:
+        sys.exit(archive_tournaments(args.compression))
+    if args.migrate:
+        sys.exit(migrate(args.dry_run))
+
     clear_console()
     print(
         f"Bonjour {capitalize_name(get_username())} ! Bienvenue dans l'application de gestion de tournois d'échecs !"
@@ -12,4 +200,17 @@ if __name__ == "__main__":
     )
 
     main_controller = MainController()
-    main_controller.run()
+    if args.serve is not None:
+        from utils.scoreboard_server import start_scoreboard_server
+
+        server = start_scoreboard_server(
+            main_controller.player_controller.data_manager,
+            main_controller.tournament_controller.data_manager,
+            port=args.serve,
+        )
+        print(f"📡 API des tableaux de scores disponible sur http://127.0.0.1:{server.server_address[1]}/tournaments\n")
+    try:
+        main_controller.run()
+    finally:
+        # On attend l'écriture des dernières sauvegardes avant de quitter (y compris après un Ctrl+C)
+        main_controller.writer.close()
@@ -6,7 +6,7 @@ from utils.utils import capitalize_name, normalize_national_id, parse_birth_date
 
 
 class Player:
-    def __init__(self, first_name: str, last_name: str, birth_date: str, national_id: str, career_score: int = 0):
+    def __init__(self, first_name: str, last_name: str, birth_date: str, national_id: str, career_score: float = 0.0):
         """
         Initialise un nouveau joueur avec les informations fournies.
 
@@ -15,7 +15,7 @@ class Player:
             last_name (str): Nom de famille du joueur.
             birth_date (str): Date de naissance du joueur au format 'JJ-MM-AAAA' ou 'JJ/MM/AAAA'.
             national_id (str): Identifiant national du joueur.
-            career_score (int): Score de carrière du joueur (par défaut 0).
+            career_score (float): Score de carrière du joueur (par défaut 0).
         """
         self.first_name: str = capitalize_name(first_name)
         self.last_name: str = capitalize_name(last_name)
@@ -30,7 +30,7 @@ class Player:
         except ValueError:
             raise InvalidNationalIdError(national_id)
 
-        self.career_score: int = career_score
+        self.career_score: float = career_score
 
     def to_dict(self) -> Dict[str, str]:
         """
@@ -44,7 +44,7 @@ class Player:
             "last_name": self.last_name,
             "birth_date": self.birth_date.strftime("%d-%m-%Y"),
             "national_id": self.national_id,
-            "career_score": str(self.career_score),
+            "career_score": float(self.career_score),
         }
 
     @classmethod
@@ -63,7 +63,7 @@ class Player:
             data["last_name"],
             data["birth_date"],
             data["national_id"],
-            int(data.get("career_score", 0)),
+            float(data.get("career_score", 0)),
         )
 
     @classmethod
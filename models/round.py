@@ -1,5 +1,5 @@
 from models.match import Match
-from utils.utils import get_timestamp
+from utils.utils import get_timestamp, parse_timestamp
 
 
 class Round:
@@ -12,7 +12,7 @@ class Round:
         """
         self.name = name  # Nom du round
         self.matches = []  # Liste des matchs du round
-        self.start_time = get_timestamp()  # Heure de début du round
+        self.start_time = get_timestamp()  # Heure de début du round (timestamp UTC, voir get_timestamp)
         self.end_time = None  # Heure de fin du round (initialisé à None car pas encore terminé)
 
     def add_match(self, match):
@@ -29,7 +29,17 @@ class Round:
         """
         Marque le round comme terminé en enregistrant le timestamp de fin.
         """
-        self.end_time = get_timestamp()
+        # L'horloge peut reculer (synchronisation NTP) : la fin d'un round n'est jamais avant son début
+        self.end_time = max(get_timestamp(), self.start_time)
+
+    @property
+    def duration(self):
+        """
+        Durée du round en secondes, ou None s'il n'est pas terminé.
+        """
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
 
     def to_dict(self):
         """
@@ -64,8 +74,9 @@ class Round:
             round_ = cls(data["name"])
             # On convertit les données de matchs en objets Match pour chaque match
             round_.matches = [Match.from_dict(match_data) for match_data in data.get("matches", [])]
-            round_.start_time = data.get("start_time")
-            round_.end_time = data.get("end_time")
+            # Les fichiers enregistrés avant le passage aux timestamps contiennent des chaînes "JJ-MM-AAAA-HH-MM"
+            round_.start_time = parse_timestamp(data.get("start_time"))
+            round_.end_time = parse_timestamp(data.get("end_time"))
             return round_
         # Si mes datas ne sont pas un dictionnaire, je renvoie une erreur
         else:
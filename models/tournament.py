@@ -2,6 +2,8 @@ import datetime
 
 from models.player import Player
 from models.round import Round
+from utils.head_to_head import HeadToHeadIndex
+from utils.metrics import metrics
 
 
 class Tournament:
@@ -14,8 +16,8 @@ class Tournament:
         Args:
             name (str): Nom du tournoi.
             location (str): Lieu du tournoi.
-            start_date (str): Date de début du tournoi au format 'YYYY-MM-DD'.
-            end_date (str): Date de fin du tournoi au format 'YYYY-MM-DD'.
+            start_date (str): Date de début du tournoi au format 'YYYY-MM-DD' (ou datetime).
+            end_date (str): Date de fin du tournoi au format 'YYYY-MM-DD' (ou datetime).
             description (str): Description du tournoi.
             rounds_count (int): Nombre total de rounds du tournoi (par défaut 4).
         """
@@ -23,13 +25,24 @@ class Tournament:
         # On initialise les attributs de la classe
         self.name = name
         self.location = location
-        self.start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        self.end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d")
+        self.start_date = self.parse_date(start_date)
+        self.end_date = self.parse_date(end_date)
         self.description = description
         self.rounds_count = rounds_count
         self.current_round = 0  # Round actuel du tournoi (initialisé à 0)
         self.rounds = []  # Liste des rounds du tournoi
         self.players = []  # Liste des joueurs du tournoi
+        self.version = 0  # Compteur incrémenté à chaque enregistrement (détection des modifications concurrentes)
+        self.pairing_checks = 0  # Nombre d'appels à has_played_against_each_other (métriques des appariements)
+        self.head_to_head = None  # Index des rencontres du tournoi (voir get_head_to_head)
+        self.indexed_matches = []  # Listes de matchs de chaque round déjà indexées, avec leur nombre de matchs
+
+    @staticmethod
+    def parse_date(date):
+        # Les dates lues dans les données chargées sont déjà des dates (colonnes datetime64, voir DataManager)
+        if isinstance(date, datetime.datetime):
+            return datetime.datetime(date.year, date.month, date.day)
+        return datetime.datetime.strptime(date, "%Y-%m-%d")
 
     def to_dict(self):
         """
@@ -51,6 +64,7 @@ class Tournament:
             "players": [
                 {"national_id": player.national_id, "career_score": player.career_score} for player in self.players
             ],  # Voir à la fin du fichier pour plus de détails
+            "version": int(self.version),
         }
 
     @classmethod
@@ -82,6 +96,9 @@ class Tournament:
         # On convertit les données de joueurs en objets Player à partir de l'ID national (voir le model Player.py)
         tournament.players = [Player.from_tournament_dict(player_data) for player_data in data["players"]]
 
+        # Les tournois enregistrés avant l'ajout du compteur de version commencent à 0
+        tournament.version = int(data.get("version", 0))
+
         return tournament
 
     def add_player(self, player):
@@ -104,6 +121,7 @@ class Tournament:
         # La méthode append() ici me permet d’ajouter un nouveau round à la fin de la liste des rounds
         self.rounds.append(round_)
 
+    @metrics.timed("pairing_seconds")
     def generate_pairs(self):
         """
         Génère les paires de joueurs pour les matchs en fonction des scores de carrière.
@@ -115,6 +133,7 @@ class Tournament:
         self.players.sort(key=lambda p: p.career_score, reverse=True)
         # On initialise une liste vide pour stocker les paires de joueurs
         pairs = []
+        pairing_checks = self.pairing_checks
         # On initialise un ensemble pour suivre les joueurs déjà utilisés dans les paires
         used_players = set()
 
@@ -152,9 +171,42 @@ class Tournament:
                             used_players.add(potential_player2.national_id)
                             # On sort de la boucle pour passer au prochain joueur
                             break
+        # Chaque vérification est une recherche dans l'index des rencontres du tournoi
+        metrics.increment("pairing_checks_total", self.pairing_checks - pairing_checks)
         # Voilà notre liste des paires de joueurs prête pour le match
         return pairs
 
+    def generate_round_pairs(self):
+        """
+        Génère les paires du round en cours, en tenant compte des matchs déjà saisis pour ce round.
+
+        Les matchs déjà joués du round restent tels quels (en premier) et seuls les joueurs qui n'ont pas encore
+        joué sont appariés entre eux. Deux terminaux qui saisissent les résultats d'un même round obtiennent
+        ainsi les mêmes paires restantes, et un joueur ne peut pas jouer deux fois dans le même round.
+
+        Returns:
+            list: Liste des paires de joueurs du round.
+        """
+        if not self.rounds or not self.rounds[-1].matches:
+            return self.generate_pairs()
+
+        players_by_id = {player.national_id: player for player in self.players}
+        played_pairs = [
+            (players_by_id[match.player1_id], players_by_id[match.player2_id])
+            for match in self.rounds[-1].matches
+            if match.player1_id in players_by_id and match.player2_id in players_by_id
+        ]
+        played_ids = {player.national_id for pair in played_pairs for player in pair}
+
+        # On apparie uniquement les joueurs restants, puis on remet la liste complète des joueurs
+        all_players = self.players
+        self.players = [player for player in all_players if player.national_id not in played_ids]
+        try:
+            remaining_pairs = self.generate_pairs()
+        finally:
+            self.players = all_players
+        return played_pairs + remaining_pairs
+
     def has_played_against_each_other(self, player1, player2):
         """
         Vérifie si deux joueurs ont déjà joué l'un contre l'autre.
@@ -166,18 +218,42 @@ class Tournament:
         Returns:
             bool: True s'ils ont déjà joué l'un contre l'autre, sinon False.
         """
-        # Pour chaque round dans la liste des rounds du tournoi
-        for round_ in self.rounds:
-            # Pour chaque match de chaque round
-            for match in round_.matches:
-                # On vérifie si le match a été joué entre player1 et player2
-                if (match.player1_id == player1.national_id and match.player2_id == player2.national_id) or (
-                    match.player1_id == player2.national_id and match.player2_id == player1.national_id
-                ):
-                    # Si c'est le cas, on renvoie True
-                    return True
-        # Si aucun match trouvé entre player1 et player2, je renvoie False
-        return False
+        self.pairing_checks += 1
+        return self.get_head_to_head().has_played(player1.national_id, player2.national_id)
+
+    def get_head_to_head(self):
+        """
+        Retourne l'index des rencontres du tournoi (voir utils/head_to_head.py), complété avec les matchs ajoutés
+        depuis le dernier appel.
+
+        L'index est reconstruit si des rounds ou des matchs ont été remplacés (ex : tournoi mis à jour avec la
+        version enregistrée par un autre terminal).
+
+        Returns:
+            HeadToHeadIndex: L'index des rencontres du tournoi.
+        """
+        indexed = self.indexed_matches
+        # Les matchs déjà indexés doivent être le début des matchs actuels de chaque round
+        is_outdated = self.head_to_head is None or len(indexed) > len(self.rounds)
+        for (matches, count), round_ in zip(indexed, self.rounds):
+            is_outdated = is_outdated or matches is not round_.matches or count > len(matches)
+        if is_outdated:
+            self.head_to_head = HeadToHeadIndex()
+            indexed = []
+
+        added = 0
+        for position, round_ in enumerate(self.rounds):
+            start = indexed[position][1] if position < len(indexed) else 0
+            for match in round_.matches[start:]:
+                self.head_to_head.add_match(
+                    self.name, round_.name, match.player1_id, match.player2_id, match.score_player1,
+                    match.score_player2,
+                )
+                added += 1
+        self.indexed_matches = [(round_.matches, len(round_.matches)) for round_ in self.rounds]
+        if added:
+            metrics.increment("pairing_matches_scanned_total", added)
+        return self.head_to_head
 
     def minimum_players_required(self):
         """
@@ -223,8 +299,8 @@ Exemple output pour "rounds" :
         {
             "name": "Round 1",
             "matches": [],
-            "start_time": "2024-07-25-09-14",
-            "end_time": "2024-07-25-09-15"
+            "start_time": 1721891640,
+            "end_time": 1721891700
         }
     ]
 
@@ -1,37 +1,34 @@
+import argparse
 import json
 import os
+import sys
 
-from faker import Faker
+# Le script peut être lancé directement (python seeds/generate_initial_players.py) depuis la racine du projet
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-fake = Faker()
+from utils.synthetic_data import generate_players  # noqa: E402
 
 
-def generate_initial_players():
-    players = []
-    for _ in range(num_players):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        birth_date = fake.date_of_birth(minimum_age=10, maximum_age=90).strftime("%d-%m-%Y")
-        national_id = fake.bothify(text="??####", letters="ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-        player = {
-            "first_name": first_name,
-            "last_name": last_name,
-            "birth_date": birth_date,
-            "national_id": national_id,
-            "career_score": 0,  # Score par défaut à 0 pour chaque joueur
-        }
-        players.append(player)
-    return players
+def generate_initial_players(num_players, seed=0, existing_ids=()):
+    """
+    Génère des joueurs fictifs avec des identifiants nationaux uniques (même graine, mêmes joueurs).
+    """
+    return generate_players(num_players, seed, existing_ids).to_dict(orient="records")
 
 
 def save_players_to_json(players, filename):
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     with open(filename, "w") as f:
-        json.dump(players, f, indent=4)
+        json.dump(players, f, indent=4, ensure_ascii=False)
 
 
 if __name__ == "__main__":
-    num_players = 100
-    players = generate_initial_players()
-    save_players_to_json(players, "datas/players.json")
-    print(f"{num_players} joueurs fictifs générés et sauvegardés dans 'datas/players.json'.")
+    parser = argparse.ArgumentParser(description="Génère des joueurs fictifs dans datas/players.json.")
+    parser.add_argument("--players", type=int, default=100, help="Nombre de joueurs à générer.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur aléatoire.")
+    parser.add_argument("--output", default="datas/players.json", help="Fichier JSON de sortie.")
+    args = parser.parse_args()
+
+    players = generate_initial_players(args.players, args.seed)
+    save_players_to_json(players, args.output)
+    print(f"{args.players} joueurs fictifs générés et sauvegardés dans '{args.output}'.")
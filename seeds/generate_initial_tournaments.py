@@ -1,86 +1,22 @@
+import argparse
 import os
-import random
-from datetime import timedelta
+import sys
 
 import pandas as pd
-from faker import Faker
-from faker.providers import BaseProvider
 from rich.console import Console
 from rich.table import Table, box
 
-fake = Faker("fr_FR")
-
-
-# Création d'un fournisseur personnalisé pour les noms de tournois d'échecs
-class ChessTournamentProvider(BaseProvider):
-    def __init__(self, generator):
-        super().__init__(generator)
-        self.used_names = set()
-        self.used_descriptions = set()
-
-    def chess_tournament_name(self):
-        names = [
-            "Tournoi des Maîtres",
-            "Championnat des Échecs",
-            "Open d'Échecs",
-            "Coupe des Stratèges",
-            "Grand Prix des Échecs",
-            "Festival des Échecs",
-            "Rencontre des Grands Maîtres",
-            "Tournoi International d'Échecs",
-            "Challenge des Échecs",
-            "Olympiade des Échecs",
-        ]
-        name = random.choice(names)
-        while name in self.used_names:
-            name = random.choice(names)
-        self.used_names.add(name)
-        return name
-
-    def chess_tournament_description(self):
-        descriptions = [
-            "Un tournoi prestigieux pour les meilleurs joueurs d'échecs.",
-            "Une compétition intense réunissant des passionnés d'échecs du monde entier.",
-            "Un événement annuel où se confrontent les stratèges les plus talentueux.",
-            "Un tournoi international d'échecs avec des participants de haut niveau.",
-            "Un rendez-vous incontournable pour les amateurs et professionnels des échecs.",
-            "Un défi épique pour couronner le meilleur joueur d'échecs.",
-            "Une compétition féroce avec des prix prestigieux à gagner.",
-            "Un tournoi d'échecs où l'intelligence et la stratégie priment.",
-            "Une rencontre d'échecs avec des parties captivantes et intenses.",
-            "Un événement majeur dans le monde des échecs, attirant des talents de tous horizons.",
-        ]
-        description = random.choice(descriptions)
-        while description in self.used_descriptions:
-            description = random.choice(descriptions)
-        self.used_descriptions.add(description)
-        return description
-
-
-fake.add_provider(ChessTournamentProvider(fake))
-
-
-def generate_initial_tournaments(num_tournaments):
-    tournaments = []
-    for _ in range(num_tournaments):
-        name = fake.chess_tournament_name()
-        location = fake.city()
-        start_date = fake.date_between(start_date="-1y", end_date="today")
-        end_date = start_date + timedelta(days=random.randint(1, 7))
-        description = fake.chess_tournament_description()
-        rounds_count = random.randint(4, 7)  # Le nombre de rounds est au minimum 4 et peut aller jusqu'à 7
-        tournament = {
-            "name": name,
-            "location": location,
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d"),
-            "description": description,
-            "rounds_count": rounds_count,
-            "current_round": 0,
-            "rounds": [],
-            "players": [],
-        }
-        tournaments.append(tournament)
+# Le script peut être lancé directement (python seeds/generate_initial_tournaments.py) depuis la racine du projet
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.synthetic_data import generate_tournaments  # noqa: E402
+
+
+def generate_initial_tournaments(num_tournaments, seed=0, existing_names=()):
+    """
+    Génère des tournois fictifs non commencés, aux noms uniques (même graine, mêmes tournois).
+    """
+    tournaments, _ = generate_tournaments(pd.DataFrame(columns=["national_id"]), num_tournaments, seed, existing_names)
     return tournaments
 
 
@@ -131,8 +67,14 @@ def display_tournaments_table(tournaments):
 
 
 if __name__ == "__main__":
-    num_tournaments = 10
-    tournaments = generate_initial_tournaments(num_tournaments)
-    save_tournaments_to_json(tournaments, "datas/tournaments.json")
+    parser = argparse.ArgumentParser(description="Ajoute des tournois fictifs à datas/tournaments.json.")
+    parser.add_argument("--tournaments", type=int, default=10, help="Nombre de tournois à générer.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur aléatoire.")
+    parser.add_argument("--output", default="datas/tournaments.json", help="Fichier JSON de sortie.")
+    args = parser.parse_args()
+
+    existing_names = pd.read_json(args.output).get("name", []) if os.path.exists(args.output) else []
+    tournaments = generate_initial_tournaments(args.tournaments, args.seed, existing_names)
+    save_tournaments_to_json(tournaments, args.output)
     display_tournaments_table(tournaments)
-    print(f"{num_tournaments} tournois fictifs générés et sauvegardés dans 'datas/tournaments.json'.")
+    print(f"{args.tournaments} tournois fictifs générés et sauvegardés dans '{args.output}'.")
@@ -0,0 +1,47 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Le script peut être lancé directement (python seeds/generate_synthetic_data.py) depuis la racine du projet
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.migrations import SCHEMA_VERSIONS, set_schema_version  # noqa: E402
+from utils.synthetic_data import generate_dataset  # noqa: E402
+
+
+def save_dataset(players_df, tournaments, output_dir):
+    """
+    Écrit les joueurs et les tournois dans <output_dir>/players.json et <output_dir>/tournaments.json.
+
+    Les fichiers existants sont remplacés : les identifiants des joueurs générés ne correspondent à aucun joueur
+    déjà enregistré.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    players_df.to_json(os.path.join(output_dir, "players.json"), orient="records", indent=4, force_ascii=False)
+    with open(os.path.join(output_dir, "tournaments.json"), "w", encoding="utf-8") as f:
+        json.dump(tournaments, f, indent=4, ensure_ascii=False)
+    # Les fichiers générés sont déjà au format actuel : aucune migration au premier chargement
+    for schema in SCHEMA_VERSIONS:
+        set_schema_version(os.path.join(output_dir, f"{schema}.json"), SCHEMA_VERSIONS[schema])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Génère un jeu de données fictif complet (joueurs et tournois joués) pour les tests de charge."
+    )
+    parser.add_argument("--players", type=int, default=10_000, help="Nombre de joueurs à générer.")
+    parser.add_argument("--tournaments", type=int, default=500, help="Nombre de tournois à générer.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur aléatoire.")
+    parser.add_argument("--output", default="datas", help="Dossier de sortie (remplace ses fichiers JSON).")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    players_df, tournaments = generate_dataset(args.players, args.tournaments, args.seed)
+    generated = time.perf_counter()
+    save_dataset(players_df, tournaments, args.output)
+    print(
+        f"{args.players} joueurs et {args.tournaments} tournois générés en {generated - start:.1f} s "
+        f"et sauvegardés dans '{args.output}' en {time.perf_counter() - generated:.1f} s."
+    )
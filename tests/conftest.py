@@ -0,0 +1,125 @@
+import copy
+import json
+
+import pytest
+
+# Joueurs et tournoi de test partagés : chaque test en reçoit une copie (voir les fixtures players et tournament)
+PLAYERS = [
+    {"first_name": "Thomas", "last_name": "Dupré", "birth_date": "26-12-1999", "national_id": "TD2612",
+     "career_score": 0.0},
+    {"first_name": "Jane", "last_name": "Smith", "birth_date": "05-05-1985", "national_id": "JS1985",
+     "career_score": 0.0},
+    {"first_name": "Ève", "last_name": "Lefèvre", "birth_date": "01-01-1990", "national_id": "EL1990",
+     "career_score": 0.0},
+    {"first_name": "Ada", "last_name": "Lovelace", "birth_date": "10-12-1815", "national_id": "AL1815",
+     "career_score": 0.0},
+]
+
+# Heure de début du premier round des tournois de test (1er janvier 2024 à 10 h UTC), puis un round par heure
+ROUND_START_TIME = 1704103200
+ROUND_INTERVAL = 3600
+
+
+def build_tournament(name, location="Paris", start_date="2024-05-01", end_date=None, players=(), rounds=(),
+                     rounds_count=None, finished=True, start_time=ROUND_START_TIME, version=1):
+    """
+    Construit un tournoi au format de datas/tournaments.json.
+
+    Args:
+        name (str): Le nom du tournoi.
+        location (str): Le lieu.
+        start_date (str): La date de début ('AAAA-MM-JJ').
+        end_date (str): La date de fin (par défaut : la date de début).
+        players (iterable): Les identifiants nationaux des joueurs inscrits (score de tournoi à 0).
+        rounds (iterable): Les rounds joués, chacun étant une liste de matchs (joueur 1, joueur 2, score 1,
+            score 2). Le tournoi en est au dernier de ces rounds.
+        rounds_count (int): Le nombre de rounds prévus (par défaut : le nombre de rounds joués).
+        finished (bool): False pour laisser le dernier round en cours (sans heure de fin).
+        start_time (int): L'heure de début du premier round (un round par heure ensuite).
+        version (int): Le compteur d'enregistrements du tournoi.
+
+    Returns:
+        dict: Le tournoi.
+    """
+    rounds = list(rounds)
+    return {
+        "name": name, "location": location, "start_date": start_date,
+        "end_date": start_date if end_date is None else end_date, "description": "Test",
+        "rounds_count": len(rounds) if rounds_count is None else rounds_count, "current_round": len(rounds),
+        "rounds": [
+            {
+                "name": f"Round {number}",
+                "start_time": start_time + (number - 1) * ROUND_INTERVAL,
+                "end_time": (
+                    None if not finished and number == len(rounds) else start_time + number * ROUND_INTERVAL
+                ),
+                "matches": [
+                    {"player1": {"id": player1, "score_match": score1},
+                     "player2": {"id": player2, "score_match": score2}}
+                    for player1, player2, score1, score2 in matches
+                ],
+            }
+            for number, matches in enumerate(rounds, start=1)
+        ],
+        "players": [{"national_id": national_id, "career_score": 0.0} for national_id in players],
+        "version": version,
+    }
+
+
+TOURNAMENT = build_tournament(
+    "Open 2024", players=["TD2612", "JS1985"], rounds=[[("TD2612", "JS1985", 1.0, 0.0)]], rounds_count=3,
+    finished=False, start_time=1714550400, version=3,
+)
+
+
+@pytest.fixture
+def players():
+    return copy.deepcopy(PLAYERS)
+
+
+@pytest.fixture
+def tournament():
+    return copy.deepcopy(TOURNAMENT)
+
+
+@pytest.fixture
+def make_tournament():
+    """
+    Fabrique de tournois au format de datas/tournaments.json (voir build_tournament).
+    """
+    return build_tournament
+
+
+@pytest.fixture
+def players_file(tmp_path, players):
+    """
+    Fichier JSON des joueurs de test, dans un dossier temporaire.
+    """
+    file_path = tmp_path / "players.json"
+    file_path.write_text(json.dumps(players))
+    return file_path
+
+
+@pytest.fixture
+def tournaments_file(tmp_path, tournament):
+    """
+    Fichier JSON contenant le tournoi de test, dans un dossier temporaire.
+    """
+    file_path = tmp_path / "tournaments.json"
+    file_path.write_text(json.dumps([tournament]))
+    return file_path
+
+
+@pytest.fixture
+def datas_dir(tmp_path, monkeypatch, players, tournament):
+    """
+    Dossier datas/ temporaire (joueurs et tournoi de test), pour les contrôleurs qui lisent leurs fichiers par
+    défaut.
+    """
+    # On travaille dans un dossier temporaire pour ne pas modifier les données du dossier datas/
+    monkeypatch.chdir(tmp_path)
+    datas_path = tmp_path / "datas"
+    datas_path.mkdir()
+    (datas_path / "players.json").write_text(json.dumps(players))
+    (datas_path / "tournaments.json").write_text(json.dumps([tournament]))
+    return datas_path
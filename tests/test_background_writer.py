@@ -0,0 +1,37 @@
+import json
+
+import pandas as pd
+
+from utils.background_writer import BackgroundWriter
+from utils.data_manager import PlayerDataManager
+from utils.file_lock import file_lock
+
+
+# Test du regroupement des sauvegardes en attente et de l'écriture de la dernière version
+def test_background_writer_coalesces_pending_saves(tmp_path, players):
+    file_path = str(tmp_path / "players.json")
+    data_manager = PlayerDataManager(file_path)
+    writes = []
+    data_manager.add_save_listener(
+        lambda manager, data_df, file_version: writes.append(manager.persisted_sequence)
+    )
+    writer = BackgroundWriter()
+    data_manager.set_writer(writer)
+
+    # Le verrou du fichier bloque le thread d'écriture pendant que l'on enregistre plusieurs fois
+    with file_lock(file_path):
+        for score in range(1, 6):
+            data_manager.set_data(pd.DataFrame([{**players[0], "career_score": score}]))
+        # Vérifie que set_data rend la main sans attendre l'écriture
+        assert not data_manager.is_persisted()
+    data_manager.flush()
+    writer.close()
+
+    with open(file_path) as file:
+        stored = json.load(file)
+    # Vérifie que la dernière version est écrite, sans écrire chaque version intermédiaire
+    assert stored[0]["career_score"] == 5
+    assert data_manager.is_persisted()
+    assert data_manager.last_persisted_at is not None
+    assert writes == sorted(writes)
+    assert len(writes) <= 2
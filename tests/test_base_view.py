@@ -0,0 +1,34 @@
+import pandas as pd
+
+from views.base_view import BaseView
+
+
+def make_df(size):
+    return pd.DataFrame(
+        {"name": [f"Joueur {i}" for i in range(size)], "national_id": [f"AB{i:04d}" for i in range(size)]}
+    )
+
+
+# Test de la méthode get_page
+def test_get_page():
+    view = BaseView()
+    page_df, page, page_count = view.get_page(make_df(45), 1, page_size=20)
+    # Vérifie que seule la page demandée est renvoyée
+    assert page == 1
+    assert page_count == 3
+    assert list(page_df["name"])[0] == "Joueur 20"
+    assert len(page_df) == 20
+    # Vérifie qu'un numéro de page trop grand est ramené à la dernière page
+    page_df, page, _ = view.get_page(make_df(45), 10, page_size=20)
+    assert page == 2
+    assert len(page_df) == 5
+    # Vérifie qu'une liste vide compte une page
+    assert view.get_page(make_df(0), 0)[2] == 1
+
+
+# Test de la méthode filter_rows
+def test_filter_rows():
+    view = BaseView()
+    # Vérifie que la recherche ne tient pas compte de la casse et porte sur plusieurs colonnes
+    assert list(view.filter_rows(make_df(30), ["name", "national_id"], "ab0012")["name"]) == ["Joueur 12"]
+    assert len(view.filter_rows(make_df(30), ["name", "national_id"], "joueur 2")) == 11
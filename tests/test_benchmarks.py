@@ -0,0 +1,36 @@
+import os
+
+from benchmarks.run_benchmarks import compare_results, load_baseline, run_benchmarks, save_baseline
+
+
+# Test d'une exécution rapide de tous les scénarios (sauf le démarrage à froid, qui lance un processus)
+def test_run_benchmarks_small_scale():
+    current_dir = os.getcwd()
+    results = run_benchmarks(
+        {"tiny": {"players": 60, "tournaments": 8, "tournament_players": 8}},
+        selected=["load_data", "save_data", "generate_pairs", "has_played", "update_tournament", "report"],
+        repeat=1,
+        min_time=0,
+    )
+    assert os.getcwd() == current_dir
+    scenarios = results["tiny"]
+    assert {"load_data.players", "update_tournament", "report.rounds_and_matches"} <= set(scenarios)
+    assert "cold_start" not in scenarios
+    assert all(result["seconds"] > 0 and result["number"] >= 1 for result in scenarios.values())
+
+
+# Test de la détection des régressions par rapport à la référence enregistrée
+def test_compare_results_with_baseline(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    save_baseline({"small": {"generate_pairs": {"seconds": 1.0, "number": 1}}}, baseline_path)
+    save_baseline({"medium": {"generate_pairs": {"seconds": 2.0, "number": 1}}}, baseline_path)
+
+    baseline = load_baseline(baseline_path)
+    results = {
+        "small": {"generate_pairs": {"seconds": 1.5, "number": 1}, "cold_start": {"seconds": 1.0, "number": 1}},
+        "medium": {"generate_pairs": {"seconds": 2.1, "number": 1}},
+    }
+    rows = {(scale, name): row for scale, name, *row in compare_results(results, baseline, threshold=0.2)}
+    assert rows[("small", "generate_pairs")][-1] is True
+    assert rows[("small", "cold_start")][1] is None
+    assert rows[("medium", "generate_pairs")][-1] is False
@@ -0,0 +1,45 @@
+import json
+
+from controllers.player_controller import PlayerController
+from controllers.tournament_controller import TournamentController
+from models.tournament import Tournament
+from utils.data_manager import PlayerDataManager
+from utils.metrics import metrics
+
+
+# Test des sauvegardes sans modification : aucune écriture, mais un compteur de sauvegardes ignorées
+def test_unchanged_data_is_not_written(players, players_file):
+    metrics.reset()
+    data_manager = PlayerDataManager(str(players_file))
+
+    data_manager.save_data()
+    data_manager.set_data(data_manager.get_data().copy())
+    counters = metrics.snapshot()["counters"]
+    assert counters['data_saves_skipped_total{file="players.json"}'] == 2
+    assert 'data_writes_total{file="players.json"}' not in counters
+    assert players_file.read_text() == json.dumps(players)
+
+    # Une modification en place, un ajout ou une suppression sont bien enregistrés
+    data_manager.get_data().loc[1, "career_score"] = 1.0
+    data_manager.save_data()
+    data_manager.set_data(data_manager.get_data().iloc[:1])
+    data_manager.save_data()
+    counters = metrics.snapshot()["counters"]
+    assert counters['data_writes_total{file="players.json"}'] == 2
+    assert counters['data_saves_skipped_total{file="players.json"}'] == 3
+    assert [player["national_id"] for player in json.loads(players_file.read_text())] == ["TD2612"]
+
+
+# Test de l'enregistrement d'un tournoi inchangé : ni nouvelle version ni écriture
+def test_unchanged_tournament_keeps_its_version(datas_dir):
+    tournament_controller = TournamentController(PlayerController())
+    tournament = Tournament.from_dict(tournament_controller.tournaments_df.iloc[0].to_dict())
+
+    tournament_controller.update_tournament(tournament)
+    assert tournament.version == 3
+    assert json.loads((datas_dir / "tournaments.json").read_text())[0]["version"] == 3
+
+    tournament.description = "Open d'été"
+    tournament_controller.update_tournament(tournament)
+    assert tournament.version == 4
+    assert json.loads((datas_dir / "tournaments.json").read_text())[0]["description"] == "Open d'été"
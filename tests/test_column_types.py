@@ -0,0 +1,50 @@
+import json
+
+import pandas as pd
+
+from models.player import Player
+from models.tournament import Tournament
+from utils.data_manager import PlayerDataManager, TournamentDataManager
+
+
+# Test des types déclarés : appliqués au chargement, conservés après une modification, absents du fichier JSON
+def test_tournament_columns_are_typed_and_saved_as_text(tournament, tournaments_file):
+    data_manager = TournamentDataManager(str(tournaments_file))
+
+    tournaments_df = data_manager.get_data()
+    assert tournaments_df["start_date"].dtype == "datetime64[ns]"
+    assert isinstance(tournaments_df["location"].dtype, pd.CategoricalDtype)
+    assert tournaments_df["current_round"].dtype == "int64"
+    # Un tournoi relu depuis les données typées est inchangé
+    loaded = Tournament.from_dict(tournaments_df.iloc[0].to_dict())
+    assert not data_manager.has_record_changed(loaded.to_dict())
+
+    loaded.location = "Lyon"
+    updated_df = pd.DataFrame([loaded.to_dict(), dict(tournament, name="Open 2025", start_date="2025-05-01")])
+    data_manager.set_data(updated_df)
+    # Mêmes types (les catégories de la colonne location comprennent le nouveau lieu)
+    assert data_manager.get_data().dtypes.astype(str).equals(tournaments_df.dtypes.astype(str))
+    saved = json.loads(tournaments_file.read_text())
+    assert [(record["location"], record["start_date"]) for record in saved] == [
+        ("Lyon", "2024-05-01"), ("Paris", "2025-05-01")
+    ]
+
+
+# Test des scores de carrière en flottants et d'une date illisible (fichier modifié à la main) gardée telle quelle
+def test_player_scores_are_floats_and_unparsable_dates_are_kept(tmp_path, tournament):
+    file_path = tmp_path / "players.json"
+    players = [{"first_name": "Thomas", "last_name": "Dupré", "birth_date": "26-12-1999", "national_id": "TD2612",
+                "career_score": 2}]
+    file_path.write_text(json.dumps(players))
+    data_manager = PlayerDataManager(str(file_path))
+    assert data_manager.get_data()["career_score"].dtype == "float64"
+    assert Player.from_dict(data_manager.get_data().iloc[0].to_dict()).to_dict()["career_score"] == 2.0
+
+    tournaments_file = tmp_path / "tournaments.json"
+    tournaments_file.write_text(json.dumps([dict(tournament, end_date="bientôt")]))
+    tournament_data_manager = TournamentDataManager(str(tournaments_file))
+    assert tournament_data_manager.get_data()["end_date"].tolist() == ["bientôt"]
+    assert tournament_data_manager.get_data()["start_date"].dtype == "datetime64[ns]"
+    tournament_data_manager.get_data().loc[0, "description"] = "Modifié"
+    tournament_data_manager.save_data()
+    assert json.loads(tournaments_file.read_text())[0]["end_date"] == "bientôt"
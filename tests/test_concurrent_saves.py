@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from exceptions import ConcurrentModificationError
+from models.match import Match
+from models.tournament import Tournament
+from utils.data_manager import PlayerDataManager, TournamentDataManager
+
+
+@pytest.fixture
+def legacy_tournaments_file(tmp_path, players, make_tournament):
+    """
+    Fichier des tournois à l'ancien format, sans compteur de version, avec un premier round en cours.
+    """
+    tournament = make_tournament(
+        "Open Test", players=[player["national_id"] for player in players], rounds=[[]], rounds_count=3,
+        finished=False,
+    )
+    del tournament["version"]
+    file_path = tmp_path / "tournaments.json"
+    file_path.write_text(json.dumps([tournament]))
+    return str(file_path)
+
+
+def save_match(data_manager, player1_id, player2_id, score1, score2):
+    # Reproduit l'enregistrement d'un résultat par TournamentController (tournoi + compteur de version)
+    tournament = Tournament.from_dict(data_manager.get_data().iloc[0].to_dict())
+    match = Match(player1_id, player2_id)
+    match.set_scores(score1, score2)
+    tournament.rounds[-1].add_match(match)
+    for player in tournament.players:
+        if player.national_id == player1_id:
+            player.career_score = float(player.career_score + score1)
+        elif player.national_id == player2_id:
+            player.career_score = float(player.career_score + score2)
+    tournament.version += 1
+    data_manager.set_data(data_manager.get_data().assign(**{
+        key: [value] for key, value in tournament.to_dict().items()
+    }))
+
+
+# Test de la fusion des résultats saisis sur deux échiquiers différents depuis deux terminaux
+def test_concurrent_results_on_different_boards_are_merged(legacy_tournaments_file):
+    terminal_a = TournamentDataManager(legacy_tournaments_file)
+    terminal_b = TournamentDataManager(legacy_tournaments_file)
+
+    save_match(terminal_a, "TD2612", "JS1985", 1, 0)
+    save_match(terminal_b, "EL1990", "AL1815", 0.5, 0.5)
+
+    with open(legacy_tournaments_file) as file:
+        stored = json.load(file)[0]
+    # Vérifie que les deux matchs et tous les points sont conservés
+    assert len(stored["rounds"][0]["matches"]) == 2
+    scores = {player["national_id"]: player["career_score"] for player in stored["players"]}
+    assert scores == {"TD2612": 1.0, "JS1985": 0.0, "EL1990": 0.5, "AL1815": 0.5}
+    assert stored["version"] == 2
+
+    # Vérifie que le premier terminal récupère le résultat saisi par le second
+    assert terminal_a.refresh() is True
+    assert len(terminal_a.get_data().iloc[0]["rounds"][0]["matches"]) == 2
+    assert terminal_a.refresh() is False
+
+
+# Test d'un même match saisi sur deux terminaux : le second enregistrement est refusé
+def test_concurrent_results_on_same_board_conflict(legacy_tournaments_file):
+    terminal_a = TournamentDataManager(legacy_tournaments_file)
+    terminal_b = TournamentDataManager(legacy_tournaments_file)
+
+    save_match(terminal_a, "TD2612", "JS1985", 1, 0)
+    with pytest.raises(ConcurrentModificationError):
+        save_match(terminal_b, "TD2612", "JS1985", 0, 1)
+
+    # Vérifie que le résultat du premier terminal est conservé, y compris dans la mémoire du second
+    with open(legacy_tournaments_file) as file:
+        stored = json.load(file)[0]
+    assert stored["rounds"][0]["matches"][0]["player1"]["score_match"] == 1
+    assert terminal_b.get_data().iloc[0]["rounds"][0]["matches"][0]["player1"]["score_match"] == 1
+
+
+# Test de la fusion des joueurs : ajouts des deux côtés et points de carrière cumulés
+def test_concurrent_player_changes_are_merged(players_file):
+    terminal_a = PlayerDataManager(str(players_file))
+    terminal_b = PlayerDataManager(str(players_file))
+
+    players_a = terminal_a.get_data().astype({"career_score": float})
+    players_a.loc[players_a["national_id"] == "TD2612", "career_score"] = 1.0
+    terminal_a.set_data(players_a)
+
+    players_b = terminal_b.get_data().astype({"career_score": float})
+    players_b.loc[players_b["national_id"] == "TD2612", "career_score"] = 0.5
+    new_player = {"first_name": "Bobby", "last_name": "Fischer", "birth_date": "09-03-1943",
+                  "national_id": "BF1943", "career_score": 0}
+    players_b.loc[len(players_b)] = new_player
+    terminal_b.set_data(players_b)
+
+    with open(players_file) as file:
+        stored = {player["national_id"]: player for player in json.load(file)}
+    # Vérifie que le nouveau joueur est ajouté et que les points des deux terminaux s'additionnent
+    assert "BF1943" in stored
+    assert stored["TD2612"]["career_score"] == 1.5
@@ -0,0 +1,55 @@
+from models.match import Match
+from models.round import Round
+from utils.head_to_head import HeadToHeadIndex
+from utils.tournament_simulator import build_benchmark_tournament
+
+
+# Test de l'index : bilan entre deux joueurs, paires répétées et mise à jour des seuls tournois modifiés
+def test_index_summarizes_meetings_and_refreshes_changed_tournaments(make_tournament):
+    tournaments = {
+        "Open": make_tournament("Open", rounds=[[("AB1", "CD2", 1, 0)], [("CD2", "AB1", 0.5, 0.5)]]),
+        "Blitz": make_tournament("Blitz", rounds=[[("EF3", "AB1", 1, 0), ("CD2", "GH4", 0, 1)]]),
+    }
+    loaded = []
+
+    def load_tournament(name):
+        loaded.append(name)
+        return tournaments[name]
+
+    index = HeadToHeadIndex()
+    index.refresh({"Open": 1, "Blitz": 1}, load_tournament)
+    assert index.has_played("CD2", "AB1") and index.has_played("AB1", "EF3", tournament="Blitz")
+    assert not index.has_played("AB1", "EF3", tournament="Open")
+    assert index.get_meetings("CD2", "AB1")["player1_score"].tolist() == [0, 0.5]
+    assert index.get_summary("AB1", "CD2") == {
+        "matches": 2, "wins": 1, "draws": 1, "losses": 0, "player1_points": 1.5, "player2_points": 0.5,
+    }
+    assert index.get_repeated_pairs() == [("Open", "AB1", "CD2", 2)]
+
+    # Seul le tournoi enregistré depuis (version incrémentée) est relu, le tournoi disparu est retiré
+    tournaments["Open"] = make_tournament("Open", rounds=[[("AB1", "CD2", 1, 0)]])
+    loaded.clear()
+    index.refresh({"Open": 2}, load_tournament)
+    assert loaded == ["Open"]
+    assert index.count_meetings("AB1", "CD2") == 1 and not index.has_played("AB1", "EF3")
+    assert index.get_repeated_pairs() == []
+
+
+# Test du tournoi : l'index des rencontres suit les rounds ajoutés ou remplacés
+def test_tournament_pairing_checks_follow_its_rounds():
+    tournament = build_benchmark_tournament(8, 3, seed=3)
+    for number in (1, 2):
+        round_ = Round(f"Round {number}")
+        tournament.add_round(round_)
+        for player1, player2 in tournament.generate_pairs():
+            # Les paires générées ne se sont pas encore rencontrées, le match est pris en compte dès son ajout
+            assert not tournament.has_played_against_each_other(player1, player2)
+            round_.add_match(Match(player1.national_id, player2.national_id))
+            assert tournament.has_played_against_each_other(player2, player1)
+
+    # Rounds remplacés (ex : tournoi relu après l'enregistrement d'un autre terminal) : l'index est reconstruit
+    first_match = tournament.rounds[0].matches[0]
+    players = {player.national_id: player for player in tournament.players}
+    tournament.rounds = tournament.rounds[1:]
+    assert not tournament.has_played_against_each_other(players[first_match.player1_id],
+                                                        players[first_match.player2_id])
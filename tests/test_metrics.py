@@ -0,0 +1,53 @@
+import json
+import os
+import threading
+
+from utils.data_manager import PlayerDataManager
+from utils.metrics import MetricsRegistry, metrics
+from utils.player_lookup import get_player_names_map
+
+
+# Test des compteurs attribués à une action et de leur export Prometheus
+def test_registry_attributes_counters_to_actions():
+    registry = MetricsRegistry()
+    for _ in range(2):
+        with registry.action("PlayerController.browse_players"):
+            registry.increment("table_scans_total", table="players", site="browse")
+            with registry.timer("data_load_seconds", file="players.json"):
+                pass
+    # Un autre thread (ex : le thread d'écriture) n'est pas attribué à l'action en cours
+    with registry.action("ReportController.list_tournaments"):
+        thread = threading.Thread(target=registry.increment, args=("data_writes_total",), kwargs={"file": "a.json"})
+        thread.start()
+        thread.join()
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"]['table_scans_total{site="browse",table="players"}'] == 2
+    assert snapshot["timers"]['data_load_seconds{file="players.json"}']["count"] == 2
+    browse = snapshot["actions"]["PlayerController.browse_players"]
+    assert browse["runs"] == 2
+    assert browse["per_run"]['table_scans_total{site="browse",table="players"}'] == 1
+    assert snapshot["actions"]["ReportController.list_tournaments"]["counters"] == {}
+
+    text = registry.to_prometheus()
+    assert "# TYPE table_scans_total counter" in text
+    assert 'action_table_scans_total{action="PlayerController.browse_players",site="browse",table="players"} 2' in text
+    assert 'data_load_seconds_count{file="players.json"} 2' in text
+
+
+# Test de l'instrumentation du DataManager et des recherches de joueurs
+def test_data_manager_metrics(players, players_file):
+    metrics.reset()
+
+    data_manager = PlayerDataManager(str(players_file))
+    with metrics.action("test"):
+        data_manager.get_data().loc[0, "career_score"] += 1
+        data_manager.save_data()
+        get_player_names_map(data_manager.get_data())
+
+    counters = metrics.snapshot()["counters"]
+    assert counters['data_loads_total{file="players.json"}'] == 1
+    assert counters['data_read_bytes_total{file="players.json"}'] == len(json.dumps(players).encode())
+    assert counters['data_written_bytes_total{file="players.json"}'] == os.path.getsize(players_file)
+    assert counters['table_rows_scanned_total{table="players"}'] == len(players)
+    assert metrics.snapshot()["actions"]["test"]["counters"]['data_writes_total{file="players.json"}'] == 1
@@ -0,0 +1,81 @@
+import gzip
+import json
+
+import pytest
+
+from exceptions import DataSchemaError
+from utils.data_manager import PlayerDataManager, TournamentDataManager
+from utils.migrations import SCHEMA_VERSIONS, get_schema_version, iter_json_array, migrate_file
+from utils.utils import parse_timestamp
+
+# Tournoi enregistré avant le compteur de version et les heures en timestamps
+LEGACY_TOURNAMENT = {
+    "name": "Open 2023", "location": "Paris", "start_date": "2023-05-01", "end_date": "2023-05-01",
+    "description": "Test", "rounds_count": 1, "current_round": 1,
+    "rounds": [{"name": "Round 1", "start_time": "01-05-2023-10-00", "end_time": "01-05-2023-12-00",
+                "matches": [[["TD2612", 1.0], ["JS1985", 0.0]]]}],
+    "players": [{"national_id": "TD2612", "career_score": 1.0}, {"national_id": "JS1985", "career_score": 0.0}],
+}
+
+
+@pytest.fixture
+def legacy_file(tmp_path):
+    file_path = tmp_path / "tournaments.json"
+    file_path.write_text(json.dumps([LEGACY_TOURNAMENT]))
+    return file_path
+
+
+# Test de la migration d'un fichier sans version de schéma au chargement
+def test_legacy_file_is_migrated_on_load(legacy_file):
+    data_manager = TournamentDataManager(str(legacy_file))
+
+    tournament = data_manager.get_data().iloc[0]
+    assert tournament["version"] == 0
+    assert tournament["rounds"][0]["start_time"] == parse_timestamp("01-05-2023-10-00")
+    assert get_schema_version(str(legacy_file)) == SCHEMA_VERSIONS["tournaments"]
+    assert json.loads(legacy_file.read_text())[0]["rounds"][0]["end_time"] == parse_timestamp("01-05-2023-12-00")
+
+
+# Test du mode --dry-run : le rapport liste les modifications sans rien écrire
+def test_dry_run_reports_without_writing(legacy_file):
+    content = legacy_file.read_text()
+
+    report = migrate_file(str(legacy_file), "tournaments", dry_run=True)
+    assert (report["from_version"], report["to_version"]) == (0, 2)
+    assert (report["records"], report["changed"]) == (1, 1)
+    assert report["steps"] == {"add_tournament_version": 1, "convert_round_times": 1}
+    assert report["examples"] == [("Open 2023", ["add_tournament_version", "convert_round_times"])]
+    assert legacy_file.read_text() == content
+    assert get_schema_version(str(legacy_file)) == 0
+
+
+# Test des fichiers incompatibles : refusés avec une erreur, jamais vidés
+def test_incompatible_files_are_rejected(tmp_path, legacy_file):
+    players_file = tmp_path / "players.json"
+    players_file.write_text(json.dumps([{"first_name": "Thomas", "national_id": "TD2612"}]))
+    with pytest.raises(DataSchemaError, match="last_name"):
+        PlayerDataManager(str(players_file))
+    assert [player["national_id"] for player in json.loads(players_file.read_text())] == ["TD2612"]
+
+    (tmp_path / "schema.json").write_text(json.dumps({"tournaments.json": 99}))
+    with pytest.raises(DataSchemaError, match="version 99"):
+        TournamentDataManager(str(legacy_file))
+    assert json.loads(legacy_file.read_text()) == [LEGACY_TOURNAMENT]
+
+
+# Test de la lecture au fil de l'eau d'une archive compressée, par petits morceaux
+def test_compressed_archive_is_streamed(tmp_path):
+    file_path = tmp_path / "tournaments_2023.json.gz"
+    tournaments = [dict(LEGACY_TOURNAMENT, name=f"Open {number}") for number in range(20)]
+    with gzip.open(file_path, "wt", encoding="utf-8") as file:
+        json.dump(tournaments, file)
+
+    with gzip.open(file_path, "rt", encoding="utf-8") as file:
+        assert list(iter_json_array(file, chunk_size=16)) == tournaments
+
+    report = migrate_file(str(file_path), "tournaments")
+    assert report["changed"] == 20
+    with gzip.open(file_path, "rt", encoding="utf-8") as file:
+        migrated = json.load(file)
+    assert [tournament["version"] for tournament in migrated] == [0] * 20
+    assert migrate_file(str(file_path), "tournaments")["from_version"] == 2
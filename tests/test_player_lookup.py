@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from models.match import Match
+from models.round import Round
+from utils.player_lookup import (
+    UNKNOWN_PLAYER,
+    get_player_names_map,
+    get_player_records_map,
+    join_matches_with_players,
+    resolve_players,
+)
+
+
+@pytest.fixture
+def players_df(players):
+    # Identifiant entouré d'espaces, comme dans certaines anciennes saisies
+    players[1]["national_id"] = " JS1985 "
+    return pd.DataFrame(players)
+
+
+# Test de la fonction get_player_names_map
+def test_get_player_names_map(players_df):
+    # Vérifie que les identifiants sont nettoyés et associés au nom complet
+    names = get_player_names_map(players_df)
+    assert names == {
+        "TD2612": "Thomas Dupré", "JS1985": "Jane Smith", "EL1990": "Ève Lefèvre", "AL1815": "Ada Lovelace"
+    }
+    # Vérifie qu'un DataFrame vide renvoie un dictionnaire vide
+    assert get_player_names_map(pd.DataFrame()) == {}
+
+
+# Test de la fonction join_matches_with_players
+def test_join_matches_with_players(players_df):
+    round_ = Round("Round 1")
+    match = Match("TD2612", "JS1985")
+    match.set_scores(1.0, 0.0)
+    round_.add_match(match)
+    round_.add_match(Match("TD2612", "ZZ0000"))
+
+    matches_df = join_matches_with_players([round_], players_df)
+
+    # Vérifie qu'il y a une ligne par match et que les noms sont bien joints
+    assert len(matches_df) == 2
+    assert matches_df.iloc[0]["player1_name"] == "Thomas Dupré"
+    assert matches_df.iloc[0]["player2_name"] == "Jane Smith"
+    assert matches_df.iloc[0]["score_player1"] == 1.0
+    # Vérifie qu'un joueur absent de la base est signalé comme introuvable
+    assert matches_df.iloc[1]["player2_name"] == UNKNOWN_PLAYER
+    # Vérifie qu'un tournoi sans match renvoie une table vide avec les bonnes colonnes
+    assert list(join_matches_with_players([], players_df).columns) == list(matches_df.columns)
+
+
+# Test de la fonction resolve_players
+def test_resolve_players(players_df):
+    # Vérifie que les joueurs sont renvoyés dans l'ordre demandé et que les inconnus sont ignorés
+    resolved_df = resolve_players(["JS1985", "ZZ0000", "TD2612"], players_df)
+    assert list(resolved_df["national_id"]) == ["JS1985", "TD2612"]
+    assert list(resolved_df.columns) == list(players_df.columns)
+    # Vérifie qu'une liste vide renvoie un DataFrame vide
+    assert resolve_players([], players_df).empty
+
+
+# Test de la fonction get_player_records_map
+def test_get_player_records_map(players_df):
+    records = get_player_records_map(["TD2612"], players_df)
+    assert records["TD2612"]["last_name"] == "Dupré"
@@ -0,0 +1,89 @@
+import json
+
+import pandas as pd
+
+from controllers.player_controller import PlayerController
+from models.match import Match
+from models.round import Round
+from utils.data_manager import PlayerDataManager
+from utils.metrics import metrics
+from utils.player_lookup import join_matches_with_players, resolve_players
+from utils.player_registry import PlayerRegistry
+
+
+# Test des recherches par identifiant national dans le registre projeté en mémoire
+def test_registry_lookups(players, players_file):
+    data_manager = PlayerDataManager(str(players_file))
+
+    registry = data_manager.get_registry()
+    assert len(registry) == len(players)
+    assert registry.get(" EL1990 ") == players[2]
+    assert "JS1985" in registry
+    assert "ZZ0000" not in registry and "TD26120" not in registry
+    assert registry.get_names_map(["TD2612", "ZZ0000"]) == {"TD2612": "Thomas Dupré"}
+    # Le registre est partagé : un autre programme l'ouvre sans relire le fichier JSON
+    assert PlayerRegistry.open(str(players_file)).get("TD2612") == players[0]
+
+    # Mêmes résultats qu'avec le DataFrame
+    players_df = data_manager.get_data()
+    assert resolve_players(["EL1990", "TD2612", "ZZ0000"], players_df, registry).to_dict(orient="records") == (
+        resolve_players(["EL1990", "TD2612", "ZZ0000"], players_df).to_dict(orient="records")
+    )
+    round_ = Round("Round 1")
+    round_.add_match(Match("TD2612", "ZZ0000"))
+    assert join_matches_with_players([round_], players_df, registry).equals(
+        join_matches_with_players([round_], players_df)
+    )
+
+
+# Test de la mise à jour du registre après une sauvegarde ou une modification par un autre terminal
+def test_registry_follows_the_json_file(players, players_file):
+    data_manager = PlayerDataManager(str(players_file))
+    data_manager.get_registry()
+
+    data_manager.get_data().loc[0, "career_score"] = 2.5
+    data_manager.save_data()
+    assert data_manager.get_registry().get("TD2612")["career_score"] == 2.5
+
+    # Fichier réécrit par un autre programme : l'ancien registre n'est plus utilisé
+    players_file.write_text(json.dumps(players[1:]))
+    assert PlayerRegistry.open(str(players_file)) is None
+    data_manager.refresh()
+    assert "TD2612" not in data_manager.get_registry()
+
+
+# Test du contrôleur : un joueur choisi est lu dans le registre, sans parcourir players_df
+def test_controller_resolves_players_from_registry(datas_dir, players):
+    player_controller = PlayerController()
+
+    metrics.reset()
+    player = player_controller.get_player_by_national_id(" EL1990 ")
+    assert (player.last_name, player.career_score) == ("Lefèvre", players[2]["career_score"])
+    assert not [key for key in metrics.counters if key[0] == "table_scans_total"]
+
+    # Joueur ajouté mais pas encore enregistré : il est cherché dans players_df
+    player_controller.players_df = pd.concat([player_controller.players_df, pd.DataFrame([{
+        "first_name": "Émile", "last_name": "Zola", "birth_date": "02-04-1840", "national_id": "EZ1840",
+        "career_score": 0.0,
+    }])], ignore_index=True)
+    assert player_controller.get_player_by_national_id("EZ1840").last_name == "Zola"
+    assert player_controller.get_player_by_national_id("ZZ0000") is None
+
+
+# Test des sauvegardes : le registre n'est réécrit qu'à la demande, ou à chaque sauvegarde avec use_registry
+def test_registry_is_rebuilt_on_demand(players_file):
+    metrics.reset()
+    data_manager = PlayerDataManager(str(players_file))
+    for score in (1.0, 2.0, 3.0):
+        data_manager.get_data().loc[0, "career_score"] = score
+        data_manager.save_data()
+    assert ("registry_writes_total", (("file", "players.json"),)) not in metrics.counters
+    assert data_manager.get_registry().get("TD2612")["career_score"] == 3.0
+    assert metrics.counters[("registry_writes_total", (("file", "players.json"),))] == 1
+
+    metrics.reset()
+    data_manager = PlayerDataManager(str(players_file), use_registry=True)
+    data_manager.get_data().loc[0, "career_score"] = 4.0
+    data_manager.save_data()
+    assert PlayerRegistry.open(str(players_file)).get("TD2612")["career_score"] == 4.0
+    assert metrics.counters[("registry_writes_total", (("file", "players.json"),))] == 1
@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from controllers.report_controller import ReportController
+from utils.player_stats import PlayerStats
+from utils.tournament_archive import TournamentArchive
+
+
+# Test des statistiques agrégées : bilan, performance, adversaires et tournois d'un joueur
+def test_profile_aggregates_all_tournaments(make_tournament):
+    player_stats = PlayerStats([
+        make_tournament("Open", rounds=[[("AB1", "CD2", 1, 0)], [("CD2", "AB1", 0.5, 0.5)]], start_time=100),
+        # Le Blitz est joué après les deux rounds de l'Open
+        make_tournament("Blitz", players=["AB1", "EF3", "GH4"], rounds=[[("EF3", "AB1", 1, 0)]], start_time=7300),
+    ])
+
+    assert player_stats.get_profile("AB1") == {
+        "games": 3, "wins": 1, "draws": 1, "losses": 1, "points": 1.5, "performance": 0.5, "tournaments": 2,
+        "last_played": 7300,
+    }
+    opponents_df = player_stats.get_opponents("AB1")
+    assert opponents_df["opponent"].tolist() == ["CD2", "EF3"]
+    assert opponents_df[["games", "wins", "draws", "losses"]].values.tolist() == [[2, 1, 1, 0], [1, 0, 0, 1]]
+    assert player_stats.get_tournaments("AB1")["tournament"].tolist() == ["Blitz", "Open"]
+    # Un joueur inscrit qui n'a pas encore joué
+    assert player_stats.get_profile("GH4")["games"] == 0 and player_stats.get_profile("GH4")["tournaments"] == 1
+    assert player_stats.get_profile("GH4")["performance"] is None
+
+
+# Test du contrôleur : seuls les tournois modifiés sont agrégés à nouveau, archives comprises
+def test_report_controller_refreshes_changed_tournaments(tmp_path, make_tournament):
+    archive = TournamentArchive(str(tmp_path / "archives"))
+    archive.archive_tournaments([
+        make_tournament("Open 2023", start_date="2023-05-01", rounds=[[("AB1", "CD2", 1, 0)]], start_time=100)
+    ])
+    tournaments_df = pd.DataFrame([make_tournament("Open 2024", rounds=[[("AB1", "CD2", 0, 1)]], start_time=200)])
+    report_controller = ReportController(MagicMock(), tournaments_df, MagicMock(), archive=archive)
+    assert report_controller.get_player_stats().get_profile("CD2")["wins"] == 1
+
+    # Un résultat enregistré depuis : la version du tournoi a changé
+    tournaments_df = pd.DataFrame([
+        make_tournament("Open 2024", rounds=[[("AB1", "CD2", 0, 1)], [("CD2", "AB1", 1, 0)]], start_time=200,
+                        version=2)
+    ])
+    report_controller.tournaments_df = tournaments_df
+    player_stats = report_controller.get_player_stats()
+    assert player_stats.get_profile("CD2")["wins"] == 2
+    assert player_stats.get_profile("AB1") == PlayerStats([
+        *archive.iter_tournaments(), *tournaments_df.to_dict(orient="records")
+    ]).get_profile("AB1")
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from utils import profiling
+from utils.profiling import ActionProfiler, parse_modes, profiled_action
+
+
+# Test des fichiers écrits pour une action profilée avec cProfile et tracemalloc
+def test_profile_writes_histogram_and_dumps(tmp_path):
+    profiler = ActionProfiler(parse_modes("all"), tmp_path)
+    for _ in range(3):
+        with profiler.profile("Controller.outer"):
+            with profiler.profile("Controller.inner"):
+                sorted(range(10_000), reverse=True)
+
+    report = json.loads((tmp_path / "latency.json").read_text())
+    assert report["Controller.outer"]["count"] == 3
+    assert sum(report["Controller.inner"]["buckets"].values()) == 3
+    assert report["Controller.inner"]["p95"] <= report["Controller.outer"]["max"]
+    # Seule l'action la plus externe est profilée
+    assert len(list(tmp_path.glob("Controller.outer-*.prof"))) == 3
+    assert len(list(tmp_path.glob("Controller.outer-*.tracemalloc.txt"))) == 3
+    assert not list(tmp_path.glob("Controller.inner-*"))
+
+
+# Test du décorateur, sans effet tant que le profilage n'est pas activé
+def test_profiled_action_uses_shared_profiler(tmp_path, monkeypatch):
+    class FakeController:
+        @profiled_action
+        def show_report(self, value):
+            return value * 2
+
+    profiler = ActionProfiler((), tmp_path)
+    monkeypatch.setattr(profiling, "profiler", profiler)
+    assert FakeController().show_report(2) == 4
+    assert profiler.durations == {}
+
+    profiler.configure({"time"})
+    assert FakeController().show_report(3) == 6
+    assert list(profiler.durations) == ["FakeController.show_report"]
+    assert not list(tmp_path.glob("*.prof"))
+
+    with pytest.raises(ValueError):
+        profiler.configure({"flamegraph"})
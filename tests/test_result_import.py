@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from controllers.player_controller import PlayerController
+from controllers.result_import_controller import ResultImportController
+from controllers.tournament_controller import TournamentController
+from exceptions import InvalidResultsError
+
+
+@pytest.fixture
+def tournament(players, make_tournament):
+    # Tournoi pas encore commencé, avec les quatre joueurs de test
+    return make_tournament("Open Test", players=[player["national_id"] for player in players], rounds_count=3)
+
+
+@pytest.fixture
+def controller(datas_dir):
+    player_controller = PlayerController()
+    tournament_controller = TournamentController(player_controller)
+    return ResultImportController(tournament_controller, player_controller)
+
+
+# Test de l'import d'un round complet par numéro d'échiquier
+def test_import_results_by_board(controller, tmp_path):
+    results_file = tmp_path / "round1.csv"
+    results_file.write_text("board,result\n1,1-0\n2,0.5-0.5\n")
+
+    summary = controller.import_results("Open Test", str(results_file))
+
+    assert summary["matches"] == 2
+    assert summary["current_round"] == 2
+    tournament_df = controller.tournament_controller.tournaments_df
+    rounds = tournament_df.iloc[0]["rounds"]
+    assert len(rounds) == 2
+    assert rounds[0]["end_time"] is not None
+    assert controller.player_controller.players_df["career_score"].sum() == 2.0
+
+
+# Test de l'import refusé si un résultat manque : rien ne doit être enregistré
+def test_import_results_is_atomic(controller, tmp_path):
+    results_file = tmp_path / "round1.jsonl"
+    results_file.write_text(json.dumps({"board": 1, "result": "1-0"}) + "\n")
+
+    with pytest.raises(InvalidResultsError):
+        controller.import_results("Open Test", str(results_file))
+
+    assert controller.tournament_controller.tournaments_df.iloc[0]["current_round"] == 0
+    assert controller.player_controller.players_df["career_score"].sum() == 0
+
+
+# Test de l'import par identifiants nationaux, y compris dans l'ordre inverse de l'appariement
+def test_import_results_by_national_ids(controller, tmp_path):
+    first_round = tmp_path / "round1.csv"
+    first_round.write_text("board,result\n1,1-0\n2,1-0\n")
+    controller.import_results("Open Test", str(first_round))
+
+    tournament = controller.get_tournament("Open Test")
+    pairs = tournament.generate_pairs()
+    lines = [
+        json.dumps({"player1": player2.national_id, "player2": player1.national_id, "result": "0-1"})
+        for player1, player2 in pairs
+    ]
+    second_round = tmp_path / "round2.jsonl"
+    second_round.write_text("\n".join(lines))
+
+    summary = controller.import_results("Open Test", str(second_round))
+    assert summary["matches"] == 2
+    # Le joueur 1 de chaque paire gagne : les scores ont été inversés correctement
+    rounds = controller.tournament_controller.tournaments_df.iloc[0]["rounds"]
+    assert all(match["player1"]["score_match"] == 1.0 for match in rounds[1]["matches"])
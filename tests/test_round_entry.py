@@ -0,0 +1,45 @@
+import pytest
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+import views.tournament_view
+from controllers.player_controller import PlayerController
+from controllers.tournament_controller import TournamentController
+from models.tournament import Tournament
+
+
+@pytest.fixture
+def tournament(players, make_tournament):
+    # Premier et unique round en cours, sans aucun résultat saisi
+    return make_tournament(
+        "Open Test", players=[player["national_id"] for player in players], rounds=[[]], finished=False,
+    )
+
+
+@pytest.fixture
+def tournament_controller(datas_dir, monkeypatch):
+    monkeypatch.setattr(views.tournament_view, "clear_console", lambda: None)
+    return TournamentController(PlayerController())
+
+
+# Test de la saisie des résultats d'un round entier, une touche par échiquier et dans n'importe quel ordre
+def test_round_results_are_entered_from_the_round_screen(tournament_controller):
+    tournament = Tournament.from_dict(tournament_controller.tournaments_df.iloc[0].to_dict())
+    first_board, second_board = tournament.generate_round_pairs()
+
+    with create_pipe_input() as pipe_input, create_app_session(input=pipe_input, output=DummyOutput()):
+        # Échiquier 2 d'abord (flèche bas puis "2" : le joueur 2 gagne), puis égalité sur l'échiquier 1
+        pipe_input.send_text("\x1b[B2")
+        pipe_input.send_text("=")
+        tournament_controller.run_tournament(tournament)
+
+    round_ = tournament.rounds[0]
+    assert round_.end_time is not None
+    results = {(match.player1_id, match.player2_id): (match.score_player1, match.score_player2)
+               for match in round_.matches}
+    assert results == {
+        (second_board[0].national_id, second_board[1].national_id): (0.0, 1.0),
+        (first_board[0].national_id, first_board[1].national_id): (0.5, 0.5),
+    }
+    assert tournament_controller.player_controller.players_df["career_score"].sum() == 2.0
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from models.round import Round
+from utils.round_index import RoundTimeIndex
+
+
+def make_round(name, start_time, end_time):
+    return {"name": name, "matches": [], "start_time": start_time, "end_time": end_time}
+
+
+# Test de la lecture des rounds enregistrés avec l'ancien format d'heure
+def test_round_reads_legacy_times_and_writes_timestamps():
+    round_ = Round.from_dict(make_round("Round 1", "25-07-2024-09-14", "25-07-2024-10-44"))
+    assert round_.start_time == int(datetime(2024, 7, 25, 9, 14).timestamp())
+    assert round_.duration == 90 * 60
+    assert Round.from_dict(round_.to_dict()).start_time == round_.start_time
+
+    new_round = Round("Round 2")
+    assert new_round.duration is None
+    new_round.close_round()
+    assert new_round.end_time >= new_round.start_time
+
+
+# Test des recherches par période et de la durée moyenne des rounds
+def test_round_index_queries_by_period():
+    saturday = int(datetime(2024, 7, 27).timestamp())
+    hour = 3600
+    tournaments = [
+        {"name": "Open A", "rounds": [
+            make_round("Round 1", saturday - 24 * hour, saturday - 22 * hour),
+            make_round("Round 2", saturday + 9 * hour, saturday + 11 * hour),
+        ]},
+        {"name": "Open B", "rounds": [
+            # Ancien format : samedi 14 h (heure locale)
+            make_round("Round 1", "27-07-2024-14-00", "27-07-2024-15-00"),
+            make_round("Round 2", saturday + 30 * hour, None),
+        ]},
+    ]
+    index = RoundTimeIndex(tournaments)
+    assert len(index) == 4
+
+    weekend = index.rounds_started_between(saturday, saturday + 48 * hour)
+    assert weekend[["tournament", "round"]].values.tolist() == [
+        ["Open A", "Round 2"], ["Open B", "Round 1"], ["Open B", "Round 2"]
+    ]
+    assert weekend["duration"].tolist()[:2] == [2 * hour, hour]
+    assert weekend["end_time"].isna().tolist() == [False, False, True]
+
+    # Seuls les rounds terminés comptent dans la durée moyenne
+    assert index.average_duration(saturday, saturday + 48 * hour) == 1.5 * hour
+    assert index.average_duration() == (2 * hour + 2 * hour + hour) / 3
+    assert index.average_duration(saturday + 48 * hour, saturday + 72 * hour) is None
+    assert index.rounds_started_between(0, saturday - 48 * hour).empty
+
+
+# Test de la durée moyenne : elle porte sur les rounds commencés sur la période, même s'ils finissent après
+def test_average_duration_uses_rounds_started_in_period():
+    saturday = int(datetime(2024, 7, 27).timestamp())
+    hour = 3600
+    index = RoundTimeIndex([
+        {"name": "Open A", "rounds": [
+            # Commencé vendredi, terminé samedi : hors de la période
+            make_round("Round 1", saturday - 2 * hour, saturday + hour),
+            # Commencé dimanche soir, terminé lundi : dans la période
+            make_round("Round 2", saturday + 47 * hour, saturday + 51 * hour),
+            make_round("Round 3", saturday + 10 * hour, saturday + 12 * hour),
+        ]},
+    ])
+
+    weekend = index.rounds_started_between(saturday, saturday + 48 * hour)
+    assert weekend["round"].tolist() == ["Round 3", "Round 2"]
+    assert index.average_duration(saturday, saturday + 48 * hour) == weekend["duration"].mean() == 3 * hour
+    assert index.average_duration(saturday + 48 * hour, saturday) is None
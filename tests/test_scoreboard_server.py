@@ -0,0 +1,118 @@
+import json
+import os
+import urllib.error
+import urllib.request
+
+import pytest
+
+from utils.background_writer import BackgroundWriter
+from utils.data_manager import PlayerDataManager, TournamentDataManager
+from utils.file_lock import file_lock
+from utils.player_registry import get_registry_path
+from utils.scoreboard_server import start_scoreboard_server
+
+
+@pytest.fixture
+def tournament(make_tournament):
+    # Premier et unique round en cours, sans appariement enregistré
+    return make_tournament("Open Test", players=["TD2612", "JS1985"], rounds=[[]], finished=False)
+
+
+@pytest.fixture
+def server(players_file, tournaments_file):
+    player_data_manager = PlayerDataManager(str(players_file))
+    tournament_data_manager = TournamentDataManager(str(tournaments_file))
+    server = start_scoreboard_server(player_data_manager, tournament_data_manager, port=0)
+    server.tournament_data_manager = tournament_data_manager
+    yield server
+    server.shutdown()
+
+
+def get(server, path, etag=None):
+    request = urllib.request.Request(f"http://127.0.0.1:{server.server_address[1]}{path}")
+    if etag:
+        request.add_header("If-None-Match", etag)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers.get("ETag"), json.loads(response.read() or "null")
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("ETag"), None
+
+
+# Test des routes de l'API
+def test_routes(server):
+    status, _, tournaments = get(server, "/tournaments")
+    assert status == 200
+    assert tournaments[0]["status"] == "ongoing"
+
+    _, _, pairings = get(server, "/tournaments/Open%20Test/pairings")
+    assert pairings["pending"][0]["player1"]["name"] in ("Thomas Dupré", "Jane Smith")
+
+    _, _, player = get(server, "/players/td2612")
+    assert player["last_name"] == "Dupré"
+
+    assert get(server, "/tournaments/Inconnu")[0] == 404
+
+
+# Test des réponses conditionnelles (ETag) et du rafraîchissement après une sauvegarde
+def test_etag_and_refresh(server):
+    status, etag, _ = get(server, "/tournaments/Open%20Test/standings")
+    assert status == 200
+    # Même contenu : 304 sans corps
+    assert get(server, "/tournaments/Open%20Test/standings", etag)[0] == 304
+
+    data_manager = server.tournament_data_manager
+    data_df = data_manager.get_data().copy()
+    data_df.at[0, "players"] = [{"national_id": "TD2612", "career_score": 1.0},
+                                {"national_id": "JS1985", "career_score": 0.0}]
+    data_manager.set_data(data_df)
+
+    status, new_etag, standings = get(server, "/tournaments/Open%20Test/standings", etag)
+    assert status == 200
+    assert new_etag != etag
+    assert standings[0]["national_id"] == "TD2612"
+
+
+# Test de l'isolement : l'API sert sa copie des données et n'écrit rien sur le disque
+def test_serves_copy_without_writing(server, players_file):
+    data_manager = server.tournament_data_manager
+    # Modification en cours dans l'interface, pas encore enregistrée
+    data_manager.get_data().at[0, "description"] = "Modifié"
+
+    _, _, tournament = get(server, "/tournaments/Open%20Test")
+    assert tournament["description"] == "Test"
+    _, _, player = get(server, "/players/JS1985")
+    assert player["first_name"] == "Jane"
+    assert not os.path.exists(get_registry_path(str(players_file)))
+
+
+# Test du thread d'écriture : l'API garde les données écrites, pas le DataFrame modifié ensuite par l'interface
+def test_keeps_written_data_with_background_writer(server):
+    data_manager = server.tournament_data_manager
+    writer = BackgroundWriter()
+    data_manager.set_writer(writer)
+    try:
+        data_df = data_manager.get_data().copy()
+        data_df.at[0, "description"] = "Enregistré"
+        # Le verrou du fichier bloque le thread d'écriture : l'interface modifie ses données avant l'écriture
+        with file_lock(data_manager.file_path):
+            data_manager.set_data(data_df)
+            data_manager.get_data().at[0, "description"] = "Pas encore enregistré"
+        data_manager.flush()
+
+        _, _, tournament = get(server, "/tournaments/Open%20Test")
+        assert tournament["description"] == "Enregistré"
+    finally:
+        writer.close()
+
+
+# Test d'un fichier illisible (écriture en cours par un autre programme) : les dernières données valides sont servies
+def test_invalid_file_keeps_last_snapshot(server, tournaments_file):
+    text = tournaments_file.read_text()
+    tournaments_file.write_text(text[:20])
+
+    status, _, tournaments = get(server, "/tournaments")
+    assert status == 200 and tournaments[0]["name"] == "Open Test"
+
+    tournaments_file.write_text(text.replace("Open Test", "Open Relu"))
+    assert get(server, "/tournaments")[2][0]["name"] == "Open Relu"
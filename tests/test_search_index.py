@@ -0,0 +1,70 @@
+import pandas as pd
+
+from utils.search_index import PlayerSearchIndex, normalize_search_key
+
+
+def make_index():
+    players_df = pd.DataFrame(
+        [
+            {"first_name": "Thomas", "last_name": "Dupré", "national_id": "TD2612"},
+            {"first_name": "Jean-Pierre", "last_name": "Durand", "national_id": "JP1234"},
+            {"first_name": "Jane", "last_name": "Smith", "national_id": "JS1985"},
+        ]
+    )
+    return PlayerSearchIndex.from_dataframe(players_df)
+
+
+# Test de la fonction normalize_search_key
+def test_normalize_search_key():
+    assert normalize_search_key("Jean-Pierre Dupré") == "jeanpierre dupre"
+    assert normalize_search_key("  AB-1234 ") == "ab1234"
+
+
+# Test de la recherche par préfixe
+def test_search():
+    index = make_index()
+    # Vérifie la recherche sur l'identifiant national, sans tenir compte de la casse
+    assert index.search("td26") == ["TD2612"]
+    # Vérifie la recherche sur le nom sans accent et sur "prénom nom"
+    assert index.search("dupre") == ["TD2612"]
+    assert index.search("jane sm") == ["JS1985"]
+    # Vérifie qu'un préfixe commun renvoie plusieurs joueurs, dans la limite demandée
+    assert sorted(index.search("j")) == ["JP1234", "JS1985"]
+    assert len(index.search("j", limit=1)) == 1
+    # Vérifie qu'une recherche sans correspondance ou vide ne renvoie rien
+    assert index.search("zz") == []
+    assert index.search("") == []
+
+
+# Test de la mise à jour incrémentale de l'index
+def test_add_and_remove():
+    index = make_index()
+    index.add("AB0001", "Émile", "Zola")
+    assert index.search("emile") == ["AB0001"]
+    assert "AB0001" in index
+    index.remove("AB0001")
+    assert index.search("emile") == []
+    assert "AB0001" not in index
+    assert len(index) == 3
+
+
+# Test de la mise à jour depuis le DataFrame rechargé : seuls les joueurs modifiés sont réindexés
+def test_update_from_dataframe():
+    index = make_index()
+    root = index.root
+    players_df = pd.DataFrame(
+        [
+            {"first_name": "Thomas", "last_name": "Dupré", "national_id": "TD2612", "career_score": 3.0},
+            {"first_name": "Jane", "last_name": "Doe", "national_id": "JS1985", "career_score": 0.0},
+            {"first_name": "Émile", "last_name": "Zola", "national_id": "EZ1840", "career_score": 0.0},
+        ]
+    )
+
+    # Un joueur supprimé, un renommé, un ajouté ; le score ne compte pas
+    assert index.update_from_dataframe(players_df) == 3
+    assert index.root is root
+    assert index.search("durand") == [] and "JP1234" not in index
+    assert index.search("smith") == [] and index.search("jane doe") == ["JS1985"]
+    assert index.search("zola") == ["EZ1840"]
+    assert index.update_from_dataframe(players_df) == 0
+    assert index.update_from_dataframe(players_df.iloc[:0]) == 3 and len(index) == 0
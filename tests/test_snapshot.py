@@ -0,0 +1,48 @@
+import json
+
+import pandas as pd
+
+from utils.data_manager import PlayerDataManager, TournamentDataManager
+from utils.metrics import metrics
+from utils.snapshot import get_snapshot_path
+
+
+# Test du chargement depuis l'instantané binaire : mêmes données et mêmes types que depuis le JSON
+def test_snapshot_loads_same_data_as_json(tournament, players_file, tournaments_file):
+    data_files = [(PlayerDataManager, players_file), (TournamentDataManager, tournaments_file)]
+    for data_manager_class, file_path in data_files:
+        from_json = data_manager_class(str(file_path), use_snapshot=False)
+        data_manager_class(str(file_path), use_snapshot=True)
+        metrics.reset()
+        from_snapshot = data_manager_class(str(file_path), use_snapshot=True)
+
+        counters = metrics.snapshot()["counters"]
+        assert counters[f'data_snapshot_loads_total{{file="{file_path.name}"}}'] == 1
+        assert f'data_reads_total{{file="{file_path.name}"}}' not in counters
+        pd.testing.assert_frame_equal(from_snapshot.get_data(), from_json.get_data())
+        assert from_snapshot.record_hashes.equals(from_json.record_hashes)
+    assert from_snapshot.get_data().iloc[0]["rounds"] == tournament["rounds"]
+
+
+# Test d'un instantané périmé (JSON modifié par un autre terminal) et de la fusion qui prend l'instantané pour base
+def test_outdated_snapshot_is_ignored_and_merge_still_works(tmp_path, players_file):
+    PlayerDataManager(str(players_file), use_snapshot=True)
+    terminal_a = PlayerDataManager(str(players_file), use_snapshot=True)
+    terminal_b = PlayerDataManager(str(players_file), use_snapshot=False)
+    assert terminal_a.synced_text is None
+
+    terminal_b.get_data().loc[1, "first_name"] = "Janet"
+    terminal_b.save_data()
+    assert PlayerDataManager(str(players_file), use_snapshot=True).get_data().loc[1, "first_name"] == "Janet"
+
+    terminal_a.get_data().loc[0, "career_score"] = 2.5
+    terminal_a.save_data()
+    saved = json.loads(players_file.read_text())
+    assert [(player["first_name"], player["career_score"]) for player in saved] == [
+        ("Thomas", 2.5), ("Janet", 0.0), ("Ève", 0.0), ("Ada", 0.0)
+    ]
+    # L'instantané réécrit après la fusion correspond au nouveau fichier JSON
+    assert get_snapshot_path(str(players_file)) == str(tmp_path / "players.snapshot")
+    reloaded = PlayerDataManager(str(players_file), use_snapshot=True).get_data()
+    assert reloaded["first_name"].tolist() == ["Thomas", "Janet", "Ève", "Ada"]
+    assert reloaded["career_score"].tolist() == [2.5, 0.0, 0.0, 0.0]
@@ -0,0 +1,63 @@
+from collections import Counter
+
+import pandas as pd
+
+from models.tournament import Tournament
+from utils.synthetic_data import generate_dataset, generate_players, generate_tournaments
+from utils.utils import get_tournament_status
+
+
+# Test de l'unicité des identifiants et du déterminisme du générateur
+def test_generate_players_unique_and_seeded():
+    players_df = generate_players(50_000, seed=3)
+    assert players_df["national_id"].is_unique
+    assert players_df["national_id"].str.fullmatch(r"[A-Z]{2}\d{4}").all()
+    pd.testing.assert_frame_equal(players_df, generate_players(50_000, seed=3))
+    assert not players_df.equals(generate_players(50_000, seed=4))
+
+    existing_ids = players_df["national_id"].head(1000).tolist()
+    new_players_df = generate_players(1000, seed=3, existing_ids=existing_ids)
+    assert not new_players_df["national_id"].isin(existing_ids).any()
+
+
+# Test de la cohérence des tournois joués générés
+def test_generate_dataset_consistent_tournaments():
+    players_df, tournaments = generate_dataset(500, 200, seed=1)
+    assert len({tournament["name"] for tournament in tournaments}) == 200
+
+    points = Counter()
+    statuses = Counter()
+    for tournament_data in tournaments:
+        tournament = Tournament.from_dict(tournament_data)
+        status = get_tournament_status(tournament.current_round, tournament.rounds_count, tournament_data["rounds"])
+        statuses[status] += 1
+        assert len(tournament.rounds) == tournament.current_round
+
+        scores = Counter()
+        for round_ in tournament.rounds:
+            round_players = [
+                player_id for match in round_.matches for player_id in (match.player1_id, match.player2_id)
+            ]
+            # Un joueur ne joue qu'une fois par round
+            assert len(round_players) == len(set(round_players))
+            for match in round_.matches:
+                assert match.score_player1 + match.score_player2 == 1.0
+                scores[match.player1_id] += match.score_player1
+                scores[match.player2_id] += match.score_player2
+
+        for player in tournament.players:
+            assert player.career_score == scores[player.national_id]
+            points[player.national_id] += player.career_score
+
+    assert statuses["finished"] > statuses["ongoing"] > 0
+    assert statuses["not_started"] > 0
+    career_scores = players_df.set_index("national_id")["career_score"]
+    assert all(career_scores[national_id] == score for national_id, score in points.items())
+    assert career_scores.sum() == sum(points.values())
+
+
+# Test des tournois générés sans joueur (ancien script de seed)
+def test_generate_tournaments_without_players():
+    tournaments, _ = generate_tournaments(pd.DataFrame(columns=["national_id"]), 25, seed=0)
+    assert len({tournament["name"] for tournament in tournaments}) == 25
+    assert all(not tournament["players"] and not tournament["rounds"] for tournament in tournaments)
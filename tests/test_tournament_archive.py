@@ -0,0 +1,74 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from controllers.report_controller import ReportController
+from utils.data_manager import TournamentDataManager
+from utils.tournament_archive import TournamentArchive, archive_finished_tournaments
+
+
+@pytest.fixture
+def tournaments(make_tournament):
+    return [
+        make_tournament("Open 2023", start_date="2023-05-01", players=["TD2612", "JS1985"],
+                        rounds=[[("TD2612", "JS1985", 1.0, 0.0)]], version=2),
+        make_tournament("Open 2024", start_date="2024-05-01", players=["TD2612", "JS1985"],
+                        rounds=[[("TD2612", "JS1985", 1.0, 0.0)]], version=2),
+        make_tournament("Open en cours", start_date="2024-06-01", players=["TD2612", "JS1985"], rounds=[[]],
+                        finished=False, version=2),
+    ]
+
+
+@pytest.fixture
+def seasons_file(tmp_path, tournaments):
+    """
+    Fichier des tournois de plusieurs saisons, terminés ou en cours.
+    """
+    file_path = tmp_path / "tournaments.json"
+    file_path.write_text(json.dumps(tournaments))
+    return str(file_path)
+
+
+# Test du déplacement des tournois terminés vers une archive compressée par saison
+@pytest.mark.parametrize("compression, extension", [("gzip", ".json.gz"), ("lzma", ".json.xz")])
+def test_finished_tournaments_are_moved_to_season_archives(tmp_path, tournaments, seasons_file, compression,
+                                                           extension):
+    data_manager = TournamentDataManager(seasons_file)
+    archive = TournamentArchive(str(tmp_path / "archives"), compression=compression)
+
+    assert archive_finished_tournaments(data_manager, archive) == ["Open 2023", "Open 2024"]
+
+    # Le fichier des tournois ne garde que le tournoi en cours
+    with open(seasons_file, encoding="utf-8") as file:
+        assert [tournament["name"] for tournament in json.load(file)] == ["Open en cours"]
+    assert sorted(path.name for path in (tmp_path / "archives").glob("tournaments_*")) == [
+        f"tournaments_2023{extension}", f"tournaments_2024{extension}"
+    ]
+    headers = archive.get_headers()
+    assert headers[["name", "season", "rounds_played", "players_count"]].values.tolist() == [
+        ["Open 2023", "2023", 1, 2], ["Open 2024", "2024", 1, 2]
+    ]
+
+    # Le contenu complet n'est décompressé qu'à la demande, depuis une nouvelle instance
+    tournament = TournamentArchive(str(tmp_path / "archives")).load_tournament("Open 2024")
+    assert tournament == tournaments[1]
+    # Rien de plus à archiver au deuxième passage
+    assert archive_finished_tournaments(data_manager, archive) == []
+
+
+# Test de la consultation des tournois archivés depuis les rapports
+def test_report_catalog_includes_archived_tournaments(tmp_path, tournaments, seasons_file):
+    data_manager = TournamentDataManager(seasons_file)
+    archive = TournamentArchive(str(tmp_path / "archives"))
+    archive_finished_tournaments(data_manager, archive)
+
+    report_controller = ReportController(MagicMock(), data_manager.get_data(), MagicMock(), archive=archive)
+    catalog_df = report_controller.get_catalog()
+    assert catalog_df["name"].tolist() == ["Open en cours", "Open 2023", "Open 2024"]
+    assert catalog_df["archive"].isna().tolist() == [True, False, False]
+
+    archived = report_controller.get_tournament_data(catalog_df.iloc[1])
+    assert archived["rounds"][0]["matches"] == tournaments[0]["rounds"][0]["matches"]
+    hot = report_controller.get_tournament_data(catalog_df.iloc[0])
+    assert hot["name"] == "Open en cours"
@@ -0,0 +1,59 @@
+import json
+
+from controllers.player_controller import PlayerController
+from controllers.tournament_controller import TournamentController
+from models.tournament import Tournament
+from utils.tournament_cache import TournamentCache, estimate_size
+from utils.tournament_simulator import build_benchmark_tournament
+
+
+# Test de l'éviction des tournois utilisés le moins récemment au-delà du budget mémoire
+def test_least_recently_used_tournaments_are_evicted():
+    tournaments = {}
+    for index, name in enumerate(["A", "B", "C"]):
+        tournament = build_benchmark_tournament(8, 3, seed=index)
+        tournament.name = name
+        tournaments[name] = tournament
+    cache = TournamentCache(max_bytes=2 * estimate_size(tournaments["A"]))
+
+    def get(name, record_hash=1):
+        return cache.get(name, record_hash, lambda: tournaments[name])
+
+    get("A")
+    get("B")
+    assert get("A") is tournaments["A"]
+    get("C")
+    # B était le moins récemment utilisé
+    assert "B" not in cache and "A" in cache and "C" in cache
+    assert cache.size <= cache.max_bytes
+
+    # Enregistrement modifié depuis : le tournoi est reconstruit
+    rebuilt = Tournament.from_dict(tournaments["A"].to_dict())
+    assert cache.get("A", 2, lambda: rebuilt) is rebuilt
+    assert TournamentCache(max_bytes=0).get("A", 1, lambda: tournaments["A"]) is tournaments["A"]
+
+
+# Test du contrôleur : un tournoi inchangé est repris du cache, même après son enregistrement
+def test_controller_reuses_tournaments_until_their_record_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "datas").mkdir()
+    (tmp_path / "datas" / "players.json").write_text(json.dumps([]))
+    tournament_data = build_benchmark_tournament(4, 1).to_dict()
+    (tmp_path / "datas" / "tournaments.json").write_text(json.dumps([tournament_data]))
+    controller = TournamentController(PlayerController())
+
+    tournament = controller.load_tournament(controller.tournaments_df.iloc[0])
+    assert controller.load_tournament(controller.tournaments_df.iloc[0]) is tournament
+
+    tournament.description = "Modifié"
+    controller.update_tournament(tournament)
+    assert controller.load_tournament(controller.tournaments_df.iloc[0]) is tournament
+
+    # Tournoi modifié par un autre terminal : il est relu depuis le fichier
+    saved = json.loads((tmp_path / "datas" / "tournaments.json").read_text())
+    saved[0].update(description="Autre terminal", version=saved[0]["version"] + 1)
+    (tmp_path / "datas" / "tournaments.json").write_text(json.dumps(saved))
+    controller.data_manager.refresh()
+    controller.load_tournaments()
+    reloaded = controller.load_tournament(controller.tournaments_df.iloc[0])
+    assert reloaded is not tournament and reloaded.description == "Autre terminal"
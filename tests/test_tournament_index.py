@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from controllers.report_controller import ReportController
+from utils.tournament_archive import TournamentArchive
+from utils.tournament_index import TournamentIndex
+
+
+@pytest.fixture
+def tournaments(make_tournament):
+    return [
+        make_tournament("Open de Paris", start_date="2024-03-01", end_date="2024-03-03", rounds=[[], []]),
+        make_tournament("Blitz de Lyon", "Lyon", "2024-01-10", rounds=[[]], rounds_count=2, finished=False),
+        # Dernier round commencé mais pas terminé : le tournoi est toujours en cours
+        make_tournament("Rapide de Paris", " paris", "2024-02-01", "2024-02-02", rounds=[[], []], finished=False),
+        make_tournament("Open de Nice", "Nice", "2024-06-01", "bientôt", rounds_count=2),
+    ]
+
+
+# Test des recherches par période, lieu et statut
+def test_queries_combine_dates_location_and_status(tournaments):
+    tournaments_df = pd.DataFrame(tournaments).astype({"start_date": "datetime64[ns]"})
+    index = TournamentIndex(tournaments_df)
+
+    def names(**criteria):
+        return index.filter(**criteria)["name"].tolist()
+
+    # Sans critère : tous les tournois, par date de début
+    assert names() == ["Blitz de Lyon", "Rapide de Paris", "Open de Paris", "Open de Nice"]
+    assert names(location="PARIS") == ["Rapide de Paris", "Open de Paris"]
+    assert names(status="ongoing") == ["Blitz de Lyon", "Rapide de Paris"]
+    assert names(status=["finished", "not_started"]) == ["Open de Paris", "Open de Nice"]
+    # Tournois en cours pendant la période (bornes incluses) ; une date de fin illisible n'est pas indexée
+    assert names(start="2024-01-10", end="2024-03-01") == ["Blitz de Lyon", "Rapide de Paris", "Open de Paris"]
+    assert names(start="2024-02-03") == ["Open de Paris"]
+    assert names(end="2024-01-31", location="paris") == []
+    assert index.location_names == ["Lyon", "Nice", "Paris"]
+    assert index.filter(location="Lyon")["status"].tolist() == ["ongoing"]
+
+
+# Test du catalogue des rapports : tournois archivés (terminés) compris, index reconstruit quand les tournois changent
+def test_report_catalog_index_includes_archives(tmp_path, tournaments, make_tournament):
+    archive = TournamentArchive(str(tmp_path / "archives"))
+    archive.archive_tournaments([
+        make_tournament("Open 2023", start_date="2023-05-01", end_date="2023-05-02", rounds=[[], []])
+    ])
+    tournaments_df = pd.DataFrame(tournaments)
+    report_controller = ReportController(MagicMock(), tournaments_df, MagicMock(), archive=archive)
+
+    catalog_index = report_controller.get_catalog_index()
+    assert report_controller.get_catalog_index() is catalog_index
+    assert catalog_index.filter(location="Paris", status="finished")["name"].tolist() == [
+        "Open 2023", "Open de Paris"
+    ]
+    # Les tournois non terminés ont la même position dans le catalogue et dans tournaments_df
+    positions = catalog_index.query(status=["not_started", "ongoing"])
+    assert tournaments_df.iloc[positions]["name"].tolist() == ["Blitz de Lyon", "Rapide de Paris", "Open de Nice"]
+
+    report_controller.tournaments_df = tournaments_df.iloc[:1]
+    assert report_controller.get_catalog_index().filter(status="ongoing").empty
@@ -0,0 +1,121 @@
+import numpy as np
+
+from models.match import Match
+from models.round import Round
+from models.tournament import Tournament
+from utils.tournament_simulator import (
+    build_benchmark_tournament,
+    build_simulation_state,
+    generate_pairs_batch,
+    simulate_tournament,
+)
+
+
+def play_round(tournament, rng):
+    # Joue un round complet avec la logique d'appariement du modèle
+    round_ = Round(f"Round {tournament.current_round + 1}")
+    tournament.add_round(round_)
+    tournament.current_round += 1
+    for player1, player2 in tournament.generate_pairs():
+        match = Match(player1.national_id, player2.national_id)
+        score1 = float(rng.choice([0.0, 0.5, 1.0]))
+        match.set_scores(score1, 1.0 - score1)
+        round_.add_match(match)
+        player1.career_score += score1
+        player2.career_score += 1.0 - score1
+    round_.close_round()
+
+
+# Test de la reproduction vectorisée de Tournament.generate_pairs
+def test_generate_pairs_batch_matches_model():
+    rng = np.random.default_rng(1)
+    for players_count in (6, 9, 12):
+        tournament = build_benchmark_tournament(players_count, 5, seed=players_count)
+        for _ in range(3):
+            play_round(tournament, rng)
+
+        state = build_simulation_state(tournament)
+        order, first_players, second_players, valid = generate_pairs_batch(
+            np.arange(players_count)[None, :], state["scores"][None, :], state["played"][None, :, :]
+        )
+        batch_pairs = [
+            (state["national_ids"][first], state["national_ids"][second])
+            for first, second, is_valid in zip(first_players[0], second_players[0], valid[0])
+            if is_valid
+        ]
+        model_pairs = [(player1.national_id, player2.national_id) for player1, player2 in tournament.generate_pairs()]
+
+        # Vérifie que les paires sont identiques, dans le même ordre
+        assert batch_pairs == model_pairs
+
+
+# Test des probabilités de podium d'un tournoi en cours
+def test_simulate_tournament_probabilities():
+    tournament = build_benchmark_tournament(8, 4, seed=3)
+    play_round(tournament, np.random.default_rng(0))
+    scores_before = [player.career_score for player in tournament.players]
+
+    summary_df = simulate_tournament(tournament, simulations=2000, seed=42, workers=1)
+
+    # Vérifie que le tournoi n'est pas modifié et que les probabilités sont cohérentes
+    assert [player.career_score for player in tournament.players] == scores_before
+    assert len(summary_df) == 8
+    assert summary_df["p_top3"].between(0, 1).all()
+    assert summary_df["p_top3"].sum() >= 3 - 1e-9
+    assert summary_df["p_top3"].is_monotonic_decreasing
+    # Vérifie que chaque joueur gagne entre 0 et 3 points sur les 3 rounds restants
+    gained = summary_df["expected_score"] - summary_df["current_score"]
+    assert gained.between(0, 3).all()
+    assert summary_df.attrs["placements"].shape == (8, 8)
+
+    # Vérifie que les résultats sont reproductibles avec la même graine
+    assert simulate_tournament(tournament, simulations=2000, seed=42, workers=1).equals(summary_df)
+
+
+# Test d'un tournoi terminé : le classement est connu avec certitude
+def test_simulate_finished_tournament():
+    tournament = build_benchmark_tournament(6, 2, seed=5)
+    rng = np.random.default_rng(2)
+    play_round(tournament, rng)
+    play_round(tournament, rng)
+
+    summary_df = simulate_tournament(tournament, simulations=100, seed=1, workers=1)
+
+    assert (summary_df["expected_score"] == summary_df["current_score"]).all()
+    leader = max(tournament.players, key=lambda player: player.career_score)
+    assert summary_df.iloc[0]["national_id"] == leader.national_id
+    assert set(summary_df["p_top3"].unique()) <= {0.0, 1.0}
+
+
+# Test d'un échiquier répété (joueur déjà choisi comme adversaire de remplacement) : sauté comme dans run_tournament
+def test_repeated_boards_are_skipped_like_run_tournament():
+    tournament = build_benchmark_tournament(4, 2)
+    for player, score in zip(tournament.players, (3.0, 2.0, 1.0, 0.0)):
+        player.career_score = score
+    first, second, third, fourth = tournament.players
+    # Seuls les deux premiers se sont déjà rencontrés : le premier joue le troisième, qui est ensuite proposé
+    # une seconde fois contre le quatrième
+    round_ = Round("Round 1")
+    round_.add_match(Match(first.national_id, second.national_id))
+    round_.close_round()
+    tournament.add_round(round_)
+    tournament.current_round = 1
+
+    # Copie : generate_pairs trie la liste des joueurs du tournoi
+    pairs = Tournament.from_dict(tournament.to_dict()).generate_pairs()
+    assert [(p1.national_id, p2.national_id) for p1, p2 in pairs] == [
+        (first.national_id, third.national_id), (third.national_id, fourth.national_id)
+    ]
+    # run_tournament ne garde que les échiquiers dont aucun joueur n'a déjà joué dans le round
+    played_ids, boards = set(), []
+    for player1, player2 in pairs:
+        if player1.national_id not in played_ids and player2.national_id not in played_ids:
+            boards.append((player1.national_id, player2.national_id))
+            played_ids.update((player1.national_id, player2.national_id))
+
+    summary_df = simulate_tournament(tournament, simulations=500, seed=0, workers=1).set_index("national_id")
+    # Un seul point distribué par échiquier joué, et le quatrième joueur ne joue pas
+    gained = summary_df["expected_score"] - summary_df["current_score"]
+    assert np.isclose(gained.sum(), len(boards)) and len(boards) == 1
+    assert gained[fourth.national_id] == 0
+    assert (summary_df.attrs["placements"].sum(axis=1) == 1).all()
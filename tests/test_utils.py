@@ -6,10 +6,12 @@ import pytest
 from exceptions import InvalidDateFormatError, InvalidNationalIdError
 from utils.utils import (
     capitalize_name,
+    format_timestamp,
     get_timestamp,
     get_username,
     normalize_national_id,
     parse_birth_date,
+    parse_timestamp,
     sanitize,
     validate_date_format,
 )
@@ -99,8 +101,21 @@ def test_get_username():
 
 # Test de la fonction get_timestamp
 def test_get_timestamp():
-    # Vérifie que la fonction renvoie une chaîne de caractères de la forme "JJ-MM-AAAA-HH-MM-SS"
-    # On utilise la fonction datetime.now() pour obtenir la date et l'heure actuelles
-    # On utilise la méthode strftime() pour formater la date et l'heure en "JJ-MM-AAAA-HH-MM-SS"
-    # On supprime la dernière partie ("SS") pour obtenir la chaîne de caractères de la forme "JJ-MM-AAAA-HH-MM"
-    assert get_timestamp() == datetime.now().strftime("%d-%m-%Y-%H-%M-%S")[:-3]
+    # Vérifie que la fonction renvoie le nombre de secondes depuis le 1er janvier 1970 (UTC)
+    before = int(datetime.now().timestamp())
+    timestamp = get_timestamp()
+    assert isinstance(timestamp, int)
+    assert before <= timestamp <= int(datetime.now().timestamp())
+
+
+# Test de la lecture des heures de rounds (timestamps et ancien format "JJ-MM-AAAA-HH-MM")
+def test_parse_timestamp():
+    legacy = "25-07-2024-09-14"
+    timestamp = int(datetime(2024, 7, 25, 9, 14).timestamp())
+    assert parse_timestamp(legacy) == timestamp
+    assert parse_timestamp(timestamp) == timestamp
+    assert parse_timestamp(float(timestamp)) == timestamp
+    assert parse_timestamp(None) is None
+    assert format_timestamp(timestamp) == "25-07-2024 09:14"
+    with pytest.raises(ValueError):
+        parse_timestamp("2024-07-25")
@@ -0,0 +1,99 @@
+import atexit
+import threading
+from collections import OrderedDict
+
+
+class BackgroundWriter:
+    """
+    Thread d'écriture en arrière-plan des fichiers de données.
+
+    Les sauvegardes demandées par les DataManager sont placées dans une file d'attente bornée : une seule
+    sauvegarde en attente par fichier, une nouvelle demande remplaçant la précédente (seule la dernière version
+    des données compte). Les fichiers sont écrits dans l'ordre des demandes et une version plus ancienne n'est
+    jamais écrite après une plus récente. L'interface n'attend donc plus l'écriture du JSON avant la question
+    suivante.
+
+    Attributs:
+        max_pending (int): Nombre maximum de fichiers en attente d'écriture (au-delà, submit attend).
+        pending (OrderedDict): Dictionnaire {DataManager: (copie des données, numéro de sauvegarde)}.
+    """
+
+    def __init__(self, max_pending=8):
+        self.max_pending = max_pending
+        self.pending = OrderedDict()
+        self.in_progress = None
+        self.condition = threading.Condition()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="background-writer", daemon=True)
+        self.thread.start()
+        # Les sauvegardes en attente sont écrites avant la fin du programme
+        atexit.register(self.close)
+
+    def submit(self, data_manager, data_df, sequence):
+        """
+        Place une sauvegarde dans la file d'attente.
+
+        Args:
+            data_manager (DataManager): Le gestionnaire dont les données doivent être écrites.
+            data_df (pd.DataFrame): Copie des données à écrire.
+            sequence (int): Numéro de la sauvegarde (croissant pour un même DataManager).
+        """
+        with self.condition:
+            while data_manager not in self.pending and len(self.pending) >= self.max_pending:
+                self.condition.wait()
+            # Une sauvegarde déjà en attente est remplacée mais garde sa place dans la file
+            self.pending[data_manager] = (data_df, sequence)
+            self.condition.notify_all()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                data_manager, (data_df, sequence) = self.pending.popitem(last=False)
+                self.in_progress = data_manager
+                self.condition.notify_all()
+            try:
+                data_manager.write_queued(data_df, sequence)
+            finally:
+                with self.condition:
+                    self.in_progress = None
+                    self.condition.notify_all()
+
+    def is_idle(self, data_manager=None):
+        """
+        Indique si aucune sauvegarde n'est en attente ou en cours (pour un DataManager ou pour tous).
+        """
+        with self.condition:
+            return self.is_idle_locked(data_manager)
+
+    def is_idle_locked(self, data_manager):
+        if data_manager is None:
+            return not self.pending and self.in_progress is None
+        return data_manager not in self.pending and self.in_progress is not data_manager
+
+    def flush(self, data_manager=None, timeout=None):
+        """
+        Attend que les sauvegardes en attente (d'un DataManager ou de tous) soient écrites.
+
+        Args:
+            data_manager (DataManager): Le gestionnaire concerné, ou None pour tous.
+            timeout (float): Durée maximale d'attente en secondes (None pour attendre sans limite).
+
+        Returns:
+            bool: True si tout a été écrit, False si le délai a expiré.
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: self.is_idle_locked(data_manager), timeout)
+
+    def close(self):
+        """
+        Écrit les sauvegardes en attente puis arrête le thread.
+        """
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join()
@@ -1,66 +1,627 @@
+import datetime
+import json
 import os
+import tempfile
+from io import StringIO
 
 import pandas as pd
 
-from exceptions import DataLoadingError, DataSavingError
+from exceptions import ConcurrentModificationError, DataLoadingError, DataSavingError, DataSchemaError
+from utils.file_lock import file_lock
+from utils.metrics import metrics
+from utils.migrations import SCHEMA_VERSIONS, get_schema_version, migrate_file, set_schema_version
+from utils.player_registry import PlayerRegistry, write_registry
+from utils.snapshot import open_snapshot, read_snapshot, write_snapshot
+from utils.utils import format_date
 
 
 class DataManager:
     """
     Gestionnaire de données de base pour charger, sauvegarder et manipuler les données stockées dans des fichiers JSON.
 
+    Plusieurs terminaux peuvent travailler sur le même dossier datas/ : chaque écriture se fait sous verrou, et si
+    le fichier a été modifié par un autre terminal depuis la dernière lecture, ses changements sont fusionnés
+    enregistrement par enregistrement (clé key_column) avec les nôtres au lieu d'être écrasés.
+
     Attributs:
         file_path (str): Chemin vers le fichier JSON contenant les données.
         columns (list): Liste des colonnes de la structure des données.
         data_df (pd.DataFrame): DataFrame contenant les données chargées depuis le fichier JSON.
+        synced_text (str): Contenu du fichier lors de la dernière lecture ou écriture (base de la fusion), None si
+            les données ont été chargées depuis l'instantané binaire.
+        synced_snapshot (mmap.mmap): Instantané binaire chargé en dernier, base de la fusion à la place de
+            synced_text.
+        synced_version (tuple): Version du fichier (voir get_file_version) lors de la dernière lecture ou écriture.
+        writer (BackgroundWriter): Thread d'écriture en arrière-plan, None pour des sauvegardes immédiates.
+        use_snapshot (bool): True pour charger les données depuis un instantané binaire (voir utils/snapshot.py),
+            écrit à côté du fichier JSON après chaque lecture ou écriture de celui-ci.
+        record_hashes (pd.Series): Empreinte du contenu de chaque enregistrement (indexée par key_column) lors de
+            la dernière lecture ou sauvegarde, pour ne pas réécrire des données inchangées.
+        saved_sequence (int): Numéro de la dernière sauvegarde demandée.
+        persisted_sequence (int): Numéro de la dernière sauvegarde écrite sur le disque.
+        last_persisted_at (datetime): Date de la dernière écriture sur le disque.
     """
 
-    def __init__(self, file_path, columns):
+    # Colonne identifiant un enregistrement, utilisée pour fusionner les modifications concurrentes
+    key_column = None
+    # Colonnes numériques cumulées lors d'une fusion (les points gagnés des deux côtés s'additionnent)
+    additive_columns = ()
+    # Colonnes facultatives ajoutées avec une valeur par défaut aux fichiers plus anciens
+    optional_columns = {}
+    # Colonnes contenant des listes ou des dictionnaires, converties en JSON pour calculer les empreintes
+    nested_columns = ()
+    # Type de fichier dont le schéma est versionné (voir utils/migrations.py)
+    schema = None
+    # Types des colonnes, appliqués une fois au chargement (voir apply_dtypes) et conservés à la sauvegarde
+    dtypes = {}
+    # Colonnes de dates (datetime64) et leur format dans le fichier JSON
+    date_columns = {}
+    # Instantanés binaires activés par la variable d'environnement CHESS_SNAPSHOT ou l'option --snapshot de main.py
+    use_snapshot = os.environ.get("CHESS_SNAPSHOT", "") not in ("", "0")
+
+    def __init__(self, file_path, columns, use_snapshot=None):
         self.file_path = file_path
         self.columns = columns
+        if use_snapshot is not None:
+            self.use_snapshot = use_snapshot
+        self.save_listeners = []
+        self.synced_text = None
+        self.synced_snapshot = None
+        self.synced_version = None
+        self.writer = None
+        self.pending_error = None
+        self.saved_sequence = 0
+        self.persisted_sequence = 0
+        self.last_persisted_at = None
+        self.record_hashes = None
         self.data_df = self.load_data()
 
+    def add_save_listener(self, listener):
+        """
+        Enregistre une fonction appelée après chaque sauvegarde réussie (ex : rafraîchir un cache).
+
+        La fonction est appelée par le thread qui a écrit le fichier (le thread d'écriture s'il est activé) : elle
+        reçoit les données effectivement écrites et ne doit pas lire get_data(), modifié par l'interface.
+
+        Args:
+            listener (callable): Fonction recevant le DataManager, les données écrites (pd.DataFrame, à ne pas
+                modifier) et la version du fichier qui les contient.
+        """
+        self.save_listeners.append(listener)
+
     def load_data(self):
         """
         Charge les données depuis le JSON. S'il n'existe pas, il est créé avec les colonnes spécifiées.
 
+        Un fichier enregistré avec une version plus ancienne du schéma est d'abord migré (voir
+        utils/migrations.py). Avec use_snapshot, les données sont lues depuis l'instantané binaire s'il correspond
+        à la version actuelle du fichier JSON ; sinon le JSON est lu et l'instantané réécrit.
+
         Returns:
             pd.DataFrame: DataFrame contenant les données chargées.
 
         Raises:
             DataLoadingError: Si le fichier JSON ne peut pas être chargé.
+            DataSchemaError: Si le schéma du fichier ne peut pas être lu par l'application.
         """
         # Si le fichier n'existe pas, créer un DataFrame vide avec les colonnes spécifiées
         if not os.path.exists(self.file_path):
-            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
             pd.DataFrame(columns=self.columns).to_json(self.file_path, orient="records", indent=4, force_ascii=False)
-        # On tente de charger les données depuis le fichier JSON
+            if self.schema is not None:
+                set_schema_version(self.file_path, SCHEMA_VERSIONS[self.schema])
+        elif self.schema is not None and get_schema_version(self.file_path) != SCHEMA_VERSIONS[self.schema]:
+            migrate_file(self.file_path, self.schema)
+        # On tente de charger les données depuis l'instantané binaire, puis depuis le fichier JSON
         try:
-
-            data = pd.read_json(self.file_path)
-
-            if data.empty:
-                data = pd.DataFrame(columns=self.columns)
-            elif not all(col in data.columns for col in self.columns):
-                # Si les colonnes du DataFrame ne correspondent pas aux colonnes attendues, on les réinitialise
-                data = pd.DataFrame(columns=self.columns)
-            return data
+            with metrics.timer("data_load_seconds", file=self.file_name):
+                with file_lock(self.file_path):
+                    self.synced_version = self.get_file_version()
+                    snapshot = (
+                        open_snapshot(self.file_path, self.synced_version, self.schema_version)
+                        if self.use_snapshot
+                        else None
+                    )
+                    text = self.read_file() if snapshot is None else None
+                    self.synced_text, self.synced_snapshot = text, snapshot
+                if snapshot is not None:
+                    metrics.increment("data_snapshot_loads_total", file=self.file_name)
+                    data, record_hashes = read_snapshot(snapshot)
+                    # Les colonnes catégorielles sont enregistrées comme du texte dans l'instantané
+                    data = self.apply_dtypes(data)
+                    self.record_hashes = self.index_hashes(record_hashes, data)
+                else:
+                    data = self.parse_data(text)
+                    self.record_hashes = self.hash_records(data)
+                    self.save_snapshot(data, self.synced_version, self.record_hashes)
         # Sinon, on génère une exception DataLoadingError
         except ValueError:
             raise DataLoadingError(self.file_path)
+        metrics.increment("data_loads_total", file=self.file_name)
+        metrics.set_gauge("data_rows", len(data), file=self.file_name)
+        return data
+
+    @property
+    def schema_version(self):
+        # Un instantané binaire n'est valable que pour une version du fichier JSON et de son schéma
+        return SCHEMA_VERSIONS[self.schema] if self.schema is not None else 0
+
+    def save_snapshot(self, data_df, file_version, record_hashes=None):
+        """
+        Écrit l'instantané binaire des données, copie du fichier JSON dans sa version file_version, avec les
+        empreintes des enregistrements (calculées si record_hashes vaut None).
+
+        Un instantané qui ne peut pas être écrit est simplement ignoré : le fichier JSON sera relu au prochain
+        chargement.
+        """
+        if not self.use_snapshot or file_version is None:
+            return
+        if record_hashes is None:
+            record_hashes = self.hash_records(data_df)
+        try:
+            write_snapshot(self.file_path, data_df, file_version, self.schema_version, record_hashes)
+        except (OSError, ValueError, TypeError):
+            return
+        metrics.increment("data_snapshot_writes_total", file=self.file_name)
+
+    def write_derived_files(self, data_df, file_version, record_hashes=None):
+        """
+        Met à jour les fichiers dérivés du fichier JSON (instantané binaire) après l'écriture de celui-ci.
+        """
+        self.save_snapshot(data_df, file_version, record_hashes)
+
+    def get_synced_records(self):
+        # Base de la fusion : le contenu lu ou écrit en dernier (JSON ou instantané binaire)
+        if self.synced_text is None and self.synced_snapshot is not None:
+            return self.load_records(self.to_text(read_snapshot(self.synced_snapshot)[0]))
+        return self.load_records(self.synced_text)
+
+    def hash_records(self, data_df):
+        """
+        Calcule une empreinte (entier de 64 bits) du contenu de chaque enregistrement.
+
+        Args:
+            data_df (pd.DataFrame): Les données.
+
+        Returns:
+            pd.Series: Les empreintes, dans l'ordre des lignes, indexées par la colonne key_column.
+        """
+        content_df = data_df.copy(deep=False)
+        for column in self.nested_columns:
+            if column in content_df.columns:
+                content_df[column] = [
+                    json.dumps(value, sort_keys=True, ensure_ascii=False, default=str) for value in content_df[column]
+                ]
+        return self.index_hashes(pd.util.hash_pandas_object(content_df, index=False).to_numpy(), data_df)
+
+    def index_hashes(self, hashes, data_df):
+        """
+        Indexe les empreintes des enregistrements par la colonne key_column (recalculées si hashes vaut None).
+        """
+        if hashes is None:
+            return self.hash_records(data_df)
+        index = data_df[self.key_column].to_numpy() if self.key_column in data_df.columns else data_df.index
+        return pd.Series(hashes, index=index, dtype="uint64")
+
+    def get_record_hash(self, key):
+        """
+        Retourne l'empreinte d'un enregistrement lors de la dernière lecture ou sauvegarde.
+
+        Args:
+            key: La valeur de la colonne key_column de l'enregistrement.
+
+        Returns:
+            int: L'empreinte, ou None si l'enregistrement est inconnu (ou sa clé présente plusieurs fois).
+        """
+        if self.record_hashes is None or key not in self.record_hashes.index:
+            return None
+        record_hash = self.record_hashes[key]
+        return None if isinstance(record_hash, pd.Series) else int(record_hash)
+
+    def has_record_changed(self, record):
+        """
+        Indique si un enregistrement diffère de sa version lue ou sauvegardée en dernier.
+
+        Args:
+            record (dict): L'enregistrement (avec la colonne key_column).
+
+        Returns:
+            bool: True si l'enregistrement est nouveau ou modifié, sinon False.
+        """
+        key = record[self.key_column]
+        if self.record_hashes is None or key not in self.record_hashes.index:
+            return True
+        record_df = pd.DataFrame([record], columns=self.data_df.columns)
+        # Mêmes types que les données chargées : un entier et un flottant égaux n'ont pas la même empreinte
+        declared_columns = set(self.dtypes) | set(self.date_columns)
+        other_dtypes = {
+            column: dtype for column, dtype in self.data_df.dtypes.items() if column not in declared_columns
+        }
+        record_df = self.apply_dtypes(record_df.astype(other_dtypes, errors="ignore"))
+        return self.hash_records(record_df).iloc[0] != self.record_hashes[key]
+
+    @property
+    def file_name(self):
+        # Étiquette des métriques de ce fichier
+        return os.path.basename(self.file_path)
+
+    def read_file(self):
+        with open(self.file_path, encoding="utf-8") as file:
+            metrics.increment("data_reads_total", file=self.file_name)
+            metrics.increment("data_read_bytes_total", os.fstat(file.fileno()).st_size, file=self.file_name)
+            return file.read()
+
+    def get_file_version(self):
+        """
+        Retourne la version du fichier sur le disque (date de modification, taille et inode, chaque écriture
+        remplaçant le fichier), None s'il n'existe pas.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def parse_data(self, text):
+        """
+        Convertit le contenu JSON du fichier en DataFrame.
+
+        Args:
+            text (str): Le contenu du fichier.
+
+        Returns:
+            pd.DataFrame: DataFrame contenant les données.
+        """
+        data = pd.read_json(StringIO(text)) if text.strip() else pd.DataFrame()
+
+        if data.empty:
+            data = pd.DataFrame(columns=self.columns + list(self.optional_columns))
+        elif not all(col in data.columns for col in self.columns):
+            # On ne remplace jamais des données par un tableau vide : une sauvegarde effacerait le fichier
+            missing_columns = [column for column in self.columns if column not in data.columns]
+            raise DataSchemaError(self.file_path, f"colonne(s) manquante(s) : {', '.join(missing_columns)}")
+        else:
+            for column, default in self.optional_columns.items():
+                data[column] = data[column].fillna(default) if column in data.columns else default
+        return self.apply_dtypes(data)
+
+    def apply_dtypes(self, data_df):
+        """
+        Applique les types déclarés (dtypes et date_columns) aux colonnes qui ne les ont pas déjà.
+
+        Une colonne dont une valeur ne peut pas être convertie (fichier modifié à la main) garde ses valeurs telles
+        quelles : elles sont réécrites sans changement à la sauvegarde.
+
+        Args:
+            data_df (pd.DataFrame): Les données.
+
+        Returns:
+            pd.DataFrame: Les données typées (data_df lui-même si toutes les colonnes ont déjà leur type).
+        """
+        converted = {}
+        for column, dtype in self.dtypes.items():
+            if column in data_df.columns and data_df[column].dtype != dtype:
+                try:
+                    converted[column] = data_df[column].astype(dtype)
+                except (ValueError, TypeError):
+                    metrics.increment("data_dtype_fallbacks_total", file=self.file_name, column=column)
+        for column, date_format in self.date_columns.items():
+            if column in data_df.columns and data_df[column].dtype.kind != "M":
+                try:
+                    values = pd.to_datetime(data_df[column], format=date_format, errors="coerce")
+                except TypeError:
+                    values = None
+                if values is None or (values.isna() & data_df[column].notna()).any():
+                    metrics.increment("data_dtype_fallbacks_total", file=self.file_name, column=column)
+                else:
+                    converted[column] = values
+        return data_df.assign(**converted) if converted else data_df
+
+    def set_writer(self, writer):
+        """
+        Confie les sauvegardes suivantes à un thread d'écriture en arrière-plan (voir BackgroundWriter).
+
+        Args:
+            writer (BackgroundWriter): Le thread d'écriture, ou None pour revenir aux sauvegardes immédiates.
+        """
+        self.writer = writer
 
     def save_data(self):
         """
         Sauvegarde les données dans le fichier JSON.
 
+        Si un autre terminal a modifié le fichier depuis notre dernière lecture, ses modifications sont d'abord
+        fusionnées avec les nôtres. Les enregistrements en conflit gardent la version du disque, les autres
+        modifications sont tout de même enregistrées, puis l'erreur de conflit est levée.
+
+        Si aucun enregistrement n'a changé depuis la dernière lecture ou sauvegarde, rien n'est écrit.
+
+        Avec un thread d'écriture, une copie des données est mise en file d'attente et la méthode rend la main
+        aussitôt ; une erreur d'écriture ou un conflit est alors levé lors de la sauvegarde suivante.
+
         Raises:
+            ConcurrentModificationError: Si un enregistrement a été modifié de façon incompatible des deux côtés.
             DataSavingError: Si les données ne peuvent pas être sauvegardées.
         """
+        metrics.increment("data_saves_total", file=self.file_name)
+        record_hashes = self.hash_records(self.data_df)
+        if self.record_hashes is not None and record_hashes.equals(self.record_hashes):
+            # Rien n'a changé depuis la dernière lecture ou sauvegarde : aucune écriture
+            metrics.increment("data_saves_skipped_total", file=self.file_name)
+            self.raise_pending_error()
+            return
+        self.record_hashes = record_hashes
+
+        self.saved_sequence += 1
+        if self.writer is not None:
+            self.writer.submit(self, self.data_df.copy(), self.saved_sequence)
+            self.raise_pending_error()
+            return
+
+        conflicts = self.write_data(self.data_df, self.saved_sequence, adopt=True)
+        if conflicts:
+            raise conflicts[0]
+
+    def write_queued(self, data_df, sequence):
+        # Appelée par le thread d'écriture : les erreurs sont gardées pour être levées dans le thread principal
         try:
-            self.data_df.to_json(self.file_path, orient="records", indent=4, force_ascii=False)
-        except ValueError:
+            conflicts = self.write_data(data_df, sequence, adopt=False)
+        except DataSavingError as error:
+            conflicts = [error]
+        if conflicts:
+            self.pending_error = conflicts[0]
+
+    def write_data(self, data_df, sequence, adopt):
+        """
+        Écrit les données sous verrou, après fusion avec le fichier s'il a été modifié par un autre terminal.
+
+        Args:
+            data_df (pd.DataFrame): Les données à écrire.
+            sequence (int): Le numéro de la sauvegarde.
+            adopt (bool): True pour remplacer les données en mémoire par le résultat de la fusion. Le thread
+                d'écriture ne le fait pas (les données ont pu changer depuis) : la fusion est alors récupérée
+                par le prochain appel à refresh.
+
+        Returns:
+            list: Les ConcurrentModificationError rencontrées.
+        """
+        conflicts = []
+        try:
+            with metrics.timer("data_write_seconds", file=self.file_name), file_lock(self.file_path):
+                text = self.to_text(data_df)
+                if self.key_column is not None and self.get_file_version() != self.synced_version:
+                    metrics.increment("data_merges_total", file=self.file_name)
+                    merged_df = self.merge_with_file(data_df, text, conflicts)
+                    merged_text = self.to_text(merged_df)
+                    self.write_file(merged_text)
+                    written_df, file_version = merged_df, self.get_file_version()
+                    if adopt:
+                        self.data_df = merged_df
+                        self.record_hashes = self.hash_records(merged_df)
+                        self.synced_text = merged_text
+                        self.synced_version = file_version
+                        self.write_derived_files(merged_df, self.synced_version, self.record_hashes)
+                    else:
+                        # Nos données suivantes découlent de data_df et non du résultat de la fusion
+                        self.synced_text = text
+                        self.synced_version = None
+                else:
+                    self.write_file(text)
+                    written_df, file_version = data_df, self.get_file_version()
+                    self.synced_text = text
+                    self.synced_version = file_version
+                    # Les empreintes calculées par save_data ne correspondent à data_df que sans thread d'écriture
+                    # (elles sont alors recalculées dans le thread d'écriture)
+                    self.write_derived_files(data_df, self.synced_version, self.record_hashes if adopt else None)
+                self.synced_snapshot = None
+        except (ValueError, OSError):
             raise DataSavingError(self.file_path)
 
+        if conflicts:
+            metrics.increment("data_conflicts_total", len(conflicts), file=self.file_name)
+        metrics.set_gauge("data_rows", len(data_df), file=self.file_name)
+        self.persisted_sequence = sequence
+        self.last_persisted_at = datetime.datetime.now()
+        for listener in self.save_listeners:
+            listener(self, written_df, file_version)
+        return conflicts
+
+    def to_text(self, data_df):
+        return self.format_dates(data_df).to_json(orient="records", indent=4, force_ascii=False)
+
+    def to_records(self, data_df):
+        """
+        Convertit les données en liste de dictionnaires, avec les mêmes valeurs que dans le fichier JSON (dates au
+        format du fichier, types JSON natifs).
+        """
+        return json.loads(self.format_dates(data_df).to_json(orient="records", force_ascii=False))
+
+    def format_dates(self, data_df):
+        # to_json écrirait les dates en millisecondes depuis 1970 : on les remet au format du fichier
+        formatted = {}
+        for column, date_format in self.date_columns.items():
+            if column in data_df.columns:
+                values = data_df[column]
+                formatted[column] = (
+                    values.dt.strftime(date_format)
+                    if values.dtype.kind == "M"
+                    else values.map(lambda value: format_date(value, date_format))
+                )
+        return data_df.assign(**formatted) if formatted else data_df
+
+    def raise_pending_error(self):
+        error, self.pending_error = self.pending_error, None
+        if error is not None:
+            raise error
+
+    def flush(self):
+        """
+        Attend que les sauvegardes en attente dans le thread d'écriture soient sur le disque.
+
+        Raises:
+            ConcurrentModificationError: Si une sauvegarde en attente était en conflit.
+            DataSavingError: Si une sauvegarde en attente a échoué.
+        """
+        if self.writer is not None:
+            self.writer.flush(self)
+        self.raise_pending_error()
+
+    def is_persisted(self):
+        """
+        Indique si la dernière sauvegarde demandée est écrite sur le disque.
+
+        Returns:
+            bool: True si toutes les sauvegardes demandées sont écrites, sinon False.
+        """
+        return self.persisted_sequence == self.saved_sequence
+
+    def write_file(self, text):
+        # On écrit dans un fichier temporaire puis on le renomme : un lecteur ne voit jamais un fichier à moitié écrit
+        directory = os.path.dirname(self.file_path) or "."
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(text)
+                file.flush()
+                written_bytes = os.fstat(file.fileno()).st_size
+            os.replace(temp_path, self.file_path)
+            metrics.increment("data_writes_total", file=self.file_name)
+            metrics.increment("data_written_bytes_total", written_bytes, file=self.file_name)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def refresh(self):
+        """
+        Recharge les données si le fichier a été modifié par un autre terminal (ou fusionné en arrière-plan)
+        depuis la dernière lecture ou écriture.
+
+        Un simple os.stat suffit lorsque rien n'a changé. Les contrôleurs enregistrant chaque modification
+        aussitôt, les données en mémoire n'ont rien à perdre au rechargement. Tant que nos propres sauvegardes
+        sont en attente dans le thread d'écriture, rien n'est rechargé (ce sera fait au prochain appel).
+
+        Returns:
+            bool: True si les données ont été rechargées depuis le fichier, sinon False.
+
+        Raises:
+            ConcurrentModificationError: Si une sauvegarde en arrière-plan était en conflit.
+        """
+        metrics.increment("data_refreshes_total", file=self.file_name)
+        if self.writer is not None and not self.writer.is_idle(self):
+            return False
+        self.raise_pending_error()
+        if self.get_file_version() == self.synced_version:
+            return False
+
+        self.data_df = self.load_data()
+        return True
+
+    def merge_with_file(self, data_df, our_text, conflicts):
+        """
+        Fusionne nos données avec celles du fichier (modifié par un autre terminal) en prenant pour base le contenu
+        lu ou écrit en dernier.
+
+        Args:
+            data_df (pd.DataFrame): Nos données.
+            our_text (str): Nos données au format JSON.
+            conflicts (list): Liste complétée avec les ConcurrentModificationError rencontrées.
+
+        Returns:
+            pd.DataFrame: Les données fusionnées.
+        """
+        base = self.get_synced_records()
+        theirs = self.load_records(self.read_file())
+        ours = self.load_records(our_text)
+        columns = list(data_df.columns)
+
+        merged = self.merge_records(base, ours, theirs, conflicts)
+        merged_df = pd.DataFrame(merged)
+        for column in columns:
+            if column not in merged_df.columns:
+                merged_df[column] = self.optional_columns.get(column)
+        merged_df = merged_df[columns + [column for column in merged_df.columns if column not in columns]]
+        return self.apply_dtypes(merged_df)
+
+    def load_records(self, text):
+        if not text or not text.strip():
+            return []
+        return json.loads(text)
+
+    def merge_records(self, base, ours, theirs, conflicts):
+        """
+        Fusion à trois voies des enregistrements, identifiés par la colonne key_column.
+
+        Un enregistrement modifié d'un seul côté garde cette modification ; modifié des deux côtés, il est fusionné
+        champ par champ (voir merge_record). Les enregistrements ajoutés de notre côté sont placés à la fin.
+
+        Args:
+            base (list): Les enregistrements de la dernière synchronisation.
+            ours (list): Nos enregistrements.
+            theirs (list): Les enregistrements actuellement sur le disque.
+            conflicts (list): Liste complétée avec les ConcurrentModificationError rencontrées.
+
+        Returns:
+            list: Les enregistrements fusionnés.
+        """
+        base_map = {record[self.key_column]: record for record in base}
+        our_map = {record[self.key_column]: record for record in ours}
+        their_map = {record[self.key_column]: record for record in theirs}
+        keys = list(their_map) + [key for key in our_map if key not in their_map]
+
+        merged = []
+        for key in keys:
+            base_record, our_record, their_record = base_map.get(key), our_map.get(key), their_map.get(key)
+            if not self.has_changed(base_record, our_record):
+                record = their_record
+            elif not self.has_changed(base_record, their_record):
+                record = our_record
+            else:
+                try:
+                    record = self.merge_record(base_record, our_record, their_record)
+                except ConcurrentModificationError as error:
+                    conflicts.append(error)
+                    record = their_record
+            if record is not None:
+                merged.append(record)
+        return merged
+
+    def has_changed(self, base_record, record):
+        return base_record != record
+
+    def merge_record(self, base_record, our_record, their_record):
+        """
+        Fusionne un enregistrement modifié des deux côtés, champ par champ.
+
+        Raises:
+            ConcurrentModificationError: Si un même champ a reçu deux valeurs différentes, ou si l'enregistrement
+                a été supprimé d'un côté et modifié de l'autre.
+        """
+        if our_record == their_record:
+            return our_record
+        key = (our_record or their_record)[self.key_column]
+        if base_record is None:
+            raise ConcurrentModificationError(self.file_path, key, "ajouté deux fois avec des valeurs différentes.")
+        if our_record is None or their_record is None:
+            raise ConcurrentModificationError(self.file_path, key, "supprimé d'un côté et modifié de l'autre.")
+
+        merged = {}
+        for field in list(their_record) + [field for field in our_record if field not in their_record]:
+            merged[field] = self.merge_field(
+                key, field, base_record.get(field), our_record.get(field), their_record.get(field)
+            )
+        return merged
+
+    def merge_field(self, key, field, base_value, our_value, their_value):
+        if field in self.additive_columns:
+            # On garde les points gagnés des deux côtés
+            return float(their_value or 0) + float(our_value or 0) - float(base_value or 0)
+        if our_value == base_value:
+            return their_value
+        if their_value == base_value or their_value == our_value:
+            return our_value
+        raise ConcurrentModificationError(self.file_path, key, f"le champ '{field}' a été modifié des deux côtés.")
+
     def get_data(self):
         """
         Retourne les données actuellement chargées.
@@ -77,7 +638,8 @@ class DataManager:
         Args:
             data_df (pd.DataFrame): DataFrame contenant les nouvelles données.
         """
-        self.data_df = data_df
+        # Les lignes ajoutées depuis un dictionnaire (ex : Tournament.to_dict) reprennent les types déclarés
+        self.data_df = self.apply_dtypes(data_df)
         self.save_data()
 
 
@@ -87,11 +649,66 @@ class PlayerDataManager(DataManager):
 
     Args:
         file_path (str): Chemin vers le fichier JSON des joueurs. Par défaut "datas/players.json".
+        use_snapshot (bool): Voir DataManager (par défaut : variable d'environnement CHESS_SNAPSHOT).
+        use_registry (bool): True pour réécrire le registre des joueurs à chaque sauvegarde, pour les programmes
+            qui l'ouvrent sans le reconstruire (par défaut : variable d'environnement CHESS_REGISTRY).
     """
 
-    def __init__(self, file_path="datas/players.json"):
+    key_column = "national_id"
+    additive_columns = ("career_score",)
+    schema = "players"
+    # La date de naissance garde son format de saisie (JJ-MM-AAAA) : elle n'est qu'affichée
+    dtypes = {"career_score": "float64"}
+
+    # Registre réécrit à chaque sauvegarde, activé par la variable d'environnement CHESS_REGISTRY ou l'option
+    # --registry de main.py (sinon il n'est reconstruit qu'à la demande, voir get_registry)
+    use_registry = os.environ.get("CHESS_REGISTRY", "") not in ("", "0")
+
+    def __init__(self, file_path="datas/players.json", use_snapshot=None, use_registry=None):
         columns = ["first_name", "last_name", "birth_date", "national_id", "career_score"]
-        super().__init__(file_path, columns)
+        self.registry = None
+        if use_registry is not None:
+            self.use_registry = use_registry
+        super().__init__(file_path, columns, use_snapshot)
+
+    def write_derived_files(self, data_df, file_version, record_hashes=None):
+        super().write_derived_files(data_df, file_version, record_hashes)
+        if self.use_registry:
+            self.save_registry(data_df, file_version)
+
+    def save_registry(self, data_df, file_version):
+        """
+        Écrit le registre des joueurs (voir utils/player_registry.py), copie du fichier JSON dans sa version
+        file_version. Comme l'instantané, un registre qui ne peut pas être écrit est simplement ignoré.
+        """
+        if file_version is None:
+            return
+        try:
+            write_registry(self.file_path, data_df, file_version)
+        except (OSError, ValueError, KeyError):
+            return
+        metrics.increment("registry_writes_total", file=self.file_name)
+
+    def get_registry(self):
+        """
+        Retourne le registre des joueurs s'il correspond aux données en mémoire, en l'écrivant au besoin (il n'est
+        réécrit à chaque sauvegarde qu'avec use_registry : une sauvegarde ne reconstruit pas un registre inutilisé).
+
+        Les contrôleurs enregistrant chaque modification aussitôt, les données en mémoire sont celles du fichier
+        tant qu'aucune sauvegarde n'est en attente.
+
+        Returns:
+            PlayerRegistry: Le registre, ou None si des sauvegardes sont en attente ou si les données ont été
+            fusionnées en arrière-plan (les recherches se font alors dans le DataFrame).
+        """
+        if not self.is_persisted() or self.synced_version is None:
+            return None
+        if self.registry is None or self.registry.source_version != self.synced_version:
+            self.registry = PlayerRegistry.open(self.file_path, self.synced_version)
+            if self.registry is None:
+                self.save_registry(self.data_df, self.synced_version)
+                self.registry = PlayerRegistry.open(self.file_path, self.synced_version)
+        return self.registry
 
 
 class TournamentDataManager(DataManager):
@@ -100,9 +717,19 @@ class TournamentDataManager(DataManager):
 
     Args:
         file_path (str): Chemin vers le fichier JSON des tournois. Par défaut "datas/tournaments.json".
+        use_snapshot (bool): Voir DataManager (par défaut : variable d'environnement CHESS_SNAPSHOT).
     """
 
-    def __init__(self, file_path="datas/tournaments.json"):
+    key_column = "name"
+    # Compteur incrémenté à chaque enregistrement d'un tournoi (voir TournamentController.update_tournament)
+    optional_columns = {"version": 0}
+    nested_columns = ("rounds", "players")
+    schema = "tournaments"
+    # Peu de lieux différents : une colonne catégorielle ne garde chaque lieu qu'une fois en mémoire
+    dtypes = {"location": "category", "rounds_count": "int64", "current_round": "int64", "version": "int64"}
+    date_columns = {"start_date": "%Y-%m-%d", "end_date": "%Y-%m-%d"}
+
+    def __init__(self, file_path="datas/tournaments.json", use_snapshot=None):
         columns = [
             "name",
             "location",
@@ -114,4 +741,90 @@ class TournamentDataManager(DataManager):
             "rounds",
             "players",
         ]
-        super().__init__(file_path, columns)
+        super().__init__(file_path, columns, use_snapshot)
+
+    def has_changed(self, base_record, record):
+        # Le compteur de version suffit à savoir si un tournoi a été modifié depuis la dernière synchronisation
+        if base_record is None or record is None:
+            return base_record is not record
+        return record.get("version", 0) != base_record.get("version", 0)
+
+    def merge_field(self, key, field, base_value, our_value, their_value):
+        if field == "version":
+            return max(our_value or 0, their_value or 0) + 1
+        if field == "current_round":
+            return max(our_value or 0, their_value or 0)
+        if field == "players":
+            return self.merge_players(key, base_value or [], our_value or [], their_value or [])
+        if field == "rounds":
+            return self.merge_rounds(key, base_value or [], our_value or [], their_value or [])
+        return super().merge_field(key, field, base_value, our_value, their_value)
+
+    def merge_players(self, key, base_players, our_players, their_players):
+        """
+        Fusionne les joueurs inscrits : inscriptions et retraits des deux côtés, points cumulés.
+        """
+        base_map = {player["national_id"]: player for player in base_players}
+        our_map = {player["national_id"]: player for player in our_players}
+        their_map = {player["national_id"]: player for player in their_players}
+
+        merged = []
+        for national_id in list(their_map) + [national_id for national_id in our_map if national_id not in their_map]:
+            base_player = base_map.get(national_id)
+            our_player, their_player = our_map.get(national_id), their_map.get(national_id)
+            if base_player is None:
+                # Joueur inscrit d'un côté (ou des deux)
+                merged.append(their_player or our_player)
+            elif our_player is not None and their_player is not None:
+                # Les points gagnés des deux côtés s'additionnent
+                score = (
+                    float(their_player["career_score"])
+                    + float(our_player["career_score"])
+                    - float(base_player["career_score"])
+                )
+                merged.append({**their_player, "career_score": score})
+            # Sinon le joueur a été retiré du tournoi d'un côté
+        return merged
+
+    def merge_rounds(self, key, base_rounds, our_rounds, their_rounds):
+        """
+        Fusionne les rounds un à un : les matchs saisis sur des échiquiers différents sont réunis.
+
+        Raises:
+            ConcurrentModificationError: Si le résultat d'un même match a été saisi des deux côtés.
+        """
+        merged = []
+        for index in range(max(len(our_rounds), len(their_rounds))):
+            if index >= len(their_rounds):
+                merged.append(our_rounds[index])
+                continue
+            if index >= len(our_rounds):
+                merged.append(their_rounds[index])
+                continue
+
+            our_round, their_round = our_rounds[index], their_rounds[index]
+            base_round = base_rounds[index] if index < len(base_rounds) else {"matches": []}
+            base_keys = {self.get_match_key(match) for match in base_round.get("matches", [])}
+            their_keys = {self.get_match_key(match) for match in their_round.get("matches", [])}
+            our_new_matches = [
+                match for match in our_round.get("matches", []) if self.get_match_key(match) not in base_keys
+            ]
+            for match in our_new_matches:
+                if self.get_match_key(match) in their_keys:
+                    raise ConcurrentModificationError(
+                        self.file_path,
+                        key,
+                        f"le résultat du match {match['player1']['id']} - {match['player2']['id']} "
+                        f"({their_round['name']}) a déjà été saisi sur un autre terminal.",
+                    )
+            merged.append(
+                {
+                    **their_round,
+                    "matches": their_round.get("matches", []) + our_new_matches,
+                    "end_time": their_round.get("end_time") or our_round.get("end_time"),
+                }
+            )
+        return merged
+
+    def get_match_key(self, match):
+        return match["player1"]["id"], match["player2"]["id"]
@@ -0,0 +1,45 @@
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(file_path):
+    """
+    Verrou consultatif (advisory lock) exclusif autour d'un fichier de données.
+
+    Le verrou est posé sur un fichier voisin "<fichier>.lock" pour que le fichier de données puisse être remplacé
+    pendant que le verrou est tenu. Tous les terminaux lancés sur le même dossier datas/ passent par ce verrou
+    avant de lire puis d'écrire un fichier, leurs écritures ne peuvent donc pas s'entremêler.
+
+    Args:
+        file_path (str): Chemin vers le fichier de données à protéger.
+
+    Exemple:
+        >>> with file_lock("datas/tournaments.json"):
+        ...     pass  # lecture, fusion puis écriture du fichier
+    """
+    lock_path = f"{file_path}.lock"
+    directory = os.path.dirname(lock_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(lock_path, "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,182 @@
+import pandas as pd
+
+MEETING_COLUMNS = ["tournament", "round", "player1_score", "player2_score"]
+
+
+def get_pair_key(player1_id, player2_id):
+    # Une même clé pour les deux ordres des joueurs
+    return (player1_id, player2_id) if player1_id <= player2_id else (player2_id, player1_id)
+
+
+class HeadToHeadIndex:
+    """
+    Index des rencontres entre joueurs : pour chaque paire de joueurs, la liste des matchs joués l'un contre
+    l'autre (tournoi, round, résultat), tous tournois confondus.
+
+    Savoir si deux joueurs se sont déjà rencontrés (dans un tournoi donné ou ailleurs) est une simple recherche
+    dans un dictionnaire, sans parcourir les rounds. L'index est complété match par match (add_match), et un
+    tournoi modifié est réindexé seul (voir refresh).
+
+    Attributs:
+        meetings (dict): Dictionnaire {(identifiant, identifiant) triés: [(tournoi, round, score du premier,
+            score du second), ...]}.
+        tournament_pairs (dict): Dictionnaire {tournoi: {paire: nombre de rencontres dans ce tournoi}}.
+        versions (dict): Dictionnaire {tournoi: version indexée}, voir refresh.
+    """
+
+    def __init__(self, tournaments=()):
+        """
+        Args:
+            tournaments (iterable): Les tournois à indexer (dictionnaires au format de datas/tournaments.json).
+        """
+        self.meetings = {}
+        self.tournament_pairs = {}
+        self.versions = {}
+        for tournament in tournaments:
+            self.add_tournament(tournament)
+
+    def __len__(self):
+        return len(self.meetings)
+
+    def add_match(self, tournament, round_name, player1_id, player2_id, score1, score2):
+        """
+        Ajoute un match joué à l'index.
+
+        Args:
+            tournament (str): Le nom du tournoi.
+            round_name (str): Le nom du round.
+            player1_id (str): L'identifiant national du premier joueur.
+            player2_id (str): L'identifiant national du deuxième joueur.
+            score1 (float): Le score du premier joueur.
+            score2 (float): Le score du deuxième joueur.
+        """
+        key = get_pair_key(player1_id, player2_id)
+        scores = (score1, score2) if key[0] == player1_id else (score2, score1)
+        self.meetings.setdefault(key, []).append((tournament, round_name, *scores))
+        pairs = self.tournament_pairs.setdefault(tournament, {})
+        pairs[key] = pairs.get(key, 0) + 1
+
+    def add_tournament(self, tournament, version=None):
+        """
+        Ajoute tous les matchs d'un tournoi (dictionnaire au format de datas/tournaments.json) à l'index.
+        """
+        name = tournament["name"]
+        self.tournament_pairs.setdefault(name, {})
+        for round_ in tournament.get("rounds") or []:
+            for match in round_.get("matches", []):
+                self.add_match(
+                    name,
+                    round_["name"],
+                    match["player1"]["id"],
+                    match["player2"]["id"],
+                    match["player1"].get("score_match", 0),
+                    match["player2"].get("score_match", 0),
+                )
+        self.versions[name] = version
+
+    def remove_tournament(self, name):
+        """
+        Retire de l'index tous les matchs d'un tournoi.
+        """
+        for key in self.tournament_pairs.pop(name, {}):
+            remaining = [meeting for meeting in self.meetings[key] if meeting[0] != name]
+            if remaining:
+                self.meetings[key] = remaining
+            else:
+                del self.meetings[key]
+        self.versions.pop(name, None)
+
+    def refresh(self, tournament_versions, load_tournament):
+        """
+        Met l'index à jour : seuls les tournois ajoutés, supprimés ou dont la version a changé sont réindexés.
+
+        Args:
+            tournament_versions (dict): Dictionnaire {nom du tournoi: version}, pour tous les tournois à indexer
+                (le compteur version est incrémenté à chaque enregistrement d'un tournoi).
+            load_tournament (callable): Fonction retournant le tournoi complet (dictionnaire) à partir de son nom.
+        """
+        for name in [name for name in self.versions if name not in tournament_versions]:
+            self.remove_tournament(name)
+        for name, version in tournament_versions.items():
+            if name in self.versions and self.versions[name] == version:
+                continue
+            self.remove_tournament(name)
+            self.add_tournament(load_tournament(name), version)
+
+    def has_played(self, player1_id, player2_id, tournament=None):
+        """
+        Indique si deux joueurs se sont déjà rencontrés.
+
+        Args:
+            player1_id (str): L'identifiant national du premier joueur.
+            player2_id (str): L'identifiant national du deuxième joueur.
+            tournament (str): Limite la recherche à ce tournoi (par défaut : tous les tournois).
+
+        Returns:
+            bool: True s'ils ont déjà joué l'un contre l'autre, sinon False.
+        """
+        key = get_pair_key(player1_id, player2_id)
+        if tournament is None:
+            return key in self.meetings
+        return key in self.tournament_pairs.get(tournament, {})
+
+    def count_meetings(self, player1_id, player2_id, tournament=None):
+        """
+        Retourne le nombre de matchs joués entre deux joueurs (dans un tournoi donné ou dans tous les tournois).
+        """
+        key = get_pair_key(player1_id, player2_id)
+        if tournament is None:
+            return len(self.meetings.get(key, []))
+        return self.tournament_pairs.get(tournament, {}).get(key, 0)
+
+    def get_meetings(self, player1_id, player2_id):
+        """
+        Retourne les matchs joués entre deux joueurs, les scores étant donnés dans l'ordre des joueurs demandés.
+
+        Returns:
+            pd.DataFrame: Un match par ligne (colonnes MEETING_COLUMNS), dans l'ordre où ils ont été indexés.
+        """
+        key = get_pair_key(player1_id, player2_id)
+        meetings = self.meetings.get(key, [])
+        if key[0] != player1_id:
+            meetings = [
+                (tournament, round_name, score2, score1) for tournament, round_name, score1, score2 in meetings
+            ]
+        return pd.DataFrame(meetings, columns=MEETING_COLUMNS)
+
+    def get_summary(self, player1_id, player2_id):
+        """
+        Résume les rencontres entre deux joueurs, du point de vue du premier.
+
+        Returns:
+            dict: Nombre de matchs, de victoires, de nuls et de défaites, et points marqués par chaque joueur.
+        """
+        meetings_df = self.get_meetings(player1_id, player2_id)
+        player1_scores = meetings_df["player1_score"].astype(float)
+        player2_scores = meetings_df["player2_score"].astype(float)
+        return {
+            "matches": len(meetings_df),
+            "wins": int((player1_scores > player2_scores).sum()),
+            "draws": int((player1_scores == player2_scores).sum()),
+            "losses": int((player1_scores < player2_scores).sum()),
+            "player1_points": float(player1_scores.sum()),
+            "player2_points": float(player2_scores.sum()),
+        }
+
+    def get_repeated_pairs(self, tournament=None):
+        """
+        Retourne les paires de joueurs qui se sont rencontrées plus d'une fois dans un même tournoi.
+
+        Args:
+            tournament (str): Limite la recherche à ce tournoi (par défaut : tous les tournois).
+
+        Returns:
+            list: Liste de tuples (tournoi, identifiant, identifiant, nombre de rencontres).
+        """
+        names = [tournament] if tournament is not None else list(self.tournament_pairs)
+        return [
+            (name, *key, count)
+            for name in names
+            for key, count in self.tournament_pairs.get(name, {}).items()
+            if count > 1
+        ]
@@ -0,0 +1,245 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Description des métriques (affichée dans le fichier Prometheus)
+METRIC_DESCRIPTIONS = {
+    "data_reads_total": "Lectures complètes d'un fichier de données.",
+    "data_read_bytes_total": "Octets lus dans les fichiers de données.",
+    "data_writes_total": "Écritures complètes d'un fichier de données.",
+    "data_written_bytes_total": "Octets écrits dans les fichiers de données.",
+    "data_loads_total": "Chargements d'un fichier de données en DataFrame.",
+    "data_saves_total": "Sauvegardes demandées par l'application.",
+    "data_saves_skipped_total": "Sauvegardes ignorées car les données n'avaient pas changé.",
+    "data_dtype_fallbacks_total": "Colonnes gardées telles quelles car une valeur n'a pas le type déclaré.",
+    "data_snapshot_loads_total": "Chargements depuis l'instantané binaire d'un fichier de données.",
+    "data_snapshot_writes_total": "Écritures de l'instantané binaire d'un fichier de données.",
+    "registry_writes_total": "Écritures du registre des joueurs (fiches de largeur fixe projetées en mémoire).",
+    "registry_lookups_total": "Identifiants nationaux recherchés dans le registre des joueurs.",
+    "tournament_cache_hits_total": "Tournois repris du cache des tournois chargés.",
+    "tournament_cache_misses_total": "Tournois construits depuis leurs données (absents ou périmés dans le cache).",
+    "tournament_cache_evictions_total": "Tournois retirés du cache pour respecter son budget mémoire.",
+    "tournament_cache_bytes": "Taille estimée des tournois gardés dans le cache.",
+    "data_merges_total": "Fusions avec un fichier modifié par un autre terminal.",
+    "data_conflicts_total": "Conflits détectés lors d'une fusion.",
+    "data_refreshes_total": "Vérifications de modification d'un fichier par un autre terminal.",
+    "data_load_seconds": "Durée du chargement d'un fichier de données.",
+    "data_write_seconds": "Durée de l'écriture (fusion comprise) d'un fichier de données.",
+    "data_rows": "Nombre de lignes chargées ou écrites en dernier.",
+    "table_scans_total": "Parcours complets d'une table en mémoire.",
+    "table_rows_scanned_total": "Lignes lues lors des parcours complets de tables.",
+    "pairing_checks_total": "Vérifications (has_played_against_each_other) faites pendant generate_pairs.",
+    "pairing_matches_scanned_total": "Matchs ajoutés à l'index des rencontres d'un tournoi pour ces vérifications.",
+    "pairing_seconds": "Durée des appels à Tournament.generate_pairs.",
+}
+
+
+class MetricsRegistry:
+    """
+    Registre des compteurs, jauges et chronomètres de l'application (accès depuis plusieurs threads).
+
+    Les métriques sont identifiées par un nom et des étiquettes (ex : data_written_bytes_total{file="players.json"}).
+    Pendant une action utilisateur (voir action), les compteurs sont aussi cumulés pour cette action : on obtient
+    ainsi, par exemple, le nombre d'octets écrits ou de parcours de tables déclenchés par un écran.
+
+    Attributs:
+        counters (dict): Dictionnaire {(nom, étiquettes): valeur}.
+        gauges (dict): Dictionnaire {(nom, étiquettes): valeur}.
+        timers (dict): Dictionnaire {(nom, étiquettes): [nombre, somme des durées, durée maximale]}.
+        actions (dict): Dictionnaire {action: {"runs": nombre d'exécutions, "counters": {métrique: valeur}}}.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counters = {}
+            self.gauges = {}
+            self.timers = {}
+            self.actions = {}
+
+    def current_action(self):
+        # Chaque thread a sa propre pile d'actions : les écritures en arrière-plan ne sont pas attribuées à l'écran
+        # affiché au même moment
+        stack = getattr(self.local, "actions", None)
+        return stack[-1] if stack else None
+
+    def increment(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        action = self.current_action()
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+            if action is not None:
+                action_counters = self.actions[action]["counters"]
+                metric = format_metric(key)
+                action_counters[metric] = action_counters.get(metric, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            count, total, maximum = self.timers.get(key, (0, 0.0, 0.0))
+            self.timers[key] = [count + 1, total + seconds, max(maximum, seconds)]
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """
+        Mesure la durée du bloc with.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name, **labels):
+        """
+        Décorateur mesurant chaque appel de la fonction décorée.
+        """
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @contextmanager
+    def action(self, name):
+        """
+        Attribue à l'action name les compteurs incrémentés dans le bloc with (par le thread courant).
+        """
+        stack = getattr(self.local, "actions", None)
+        if stack is None:
+            stack = self.local.actions = []
+        with self.lock:
+            self.actions.setdefault(name, {"runs": 0, "counters": {}})["runs"] += 1
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def snapshot(self):
+        """
+        Retourne une copie des métriques, sérialisable en JSON.
+
+        Returns:
+            dict: {"counters": {métrique: valeur}, "gauges": {...}, "timers": {métrique: {"count", "sum", "max"}},
+            "actions": {action: {"runs", "counters", "per_run"}}}.
+        """
+        with self.lock:
+            return {
+                "counters": {format_metric(key): value for key, value in sorted(self.counters.items())},
+                "gauges": {format_metric(key): value for key, value in sorted(self.gauges.items())},
+                "timers": {
+                    format_metric(key): {"count": count, "sum": total, "max": maximum}
+                    for key, (count, total, maximum) in sorted(self.timers.items())
+                },
+                "actions": {
+                    action: {
+                        "runs": data["runs"],
+                        "counters": dict(sorted(data["counters"].items())),
+                        # Amplification : moyenne par exécution de l'action
+                        "per_run": {
+                            metric: value / data["runs"] for metric, value in sorted(data["counters"].items())
+                        },
+                    }
+                    for action, data in sorted(self.actions.items())
+                },
+            }
+
+    def to_prometheus(self):
+        """
+        Convertit les métriques au format texte de Prometheus (les chronomètres deviennent des summary).
+        """
+        with self.lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            timers = sorted(self.timers.items())
+            actions = sorted((action, dict(data["counters"])) for action, data in self.actions.items())
+
+        lines = []
+        described = set()
+
+        def describe(name, metric_type):
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {METRIC_DESCRIPTIONS.get(name, name)}")
+                lines.append(f"# TYPE {name} {metric_type}")
+
+        for key, value in counters:
+            describe(key[0], "counter")
+            lines.append(f"{format_metric(key)} {value}")
+        # Les lignes d'une même métrique doivent se suivre : on les regroupe par nom avant de les écrire
+        action_samples = {}
+        for action, action_counters in actions:
+            for metric, value in sorted(action_counters.items()):
+                name = metric.split("{")[0]
+                labels = metric[len(name):].strip("{}")
+                action_labels = f'action="{action}"' + (f",{labels}" if labels else "")
+                action_samples.setdefault(f"action_{name}", []).append(f"action_{name}{{{action_labels}}} {value}")
+        for name, samples in sorted(action_samples.items()):
+            describe(name, "counter")
+            lines.extend(samples)
+        for key, value in gauges:
+            describe(key[0], "gauge")
+            lines.append(f"{format_metric(key)} {value}")
+        for (name, labels), (count, total, maximum) in timers:
+            describe(name, "summary")
+            lines.append(f"{format_metric((name + '_count', labels))} {count}")
+            lines.append(f"{format_metric((name + '_sum', labels))} {total}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, file_path):
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=4, ensure_ascii=False)
+
+    def write_prometheus(self, file_path):
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus())
+
+
+def format_metric(key):
+    """
+    Formate une métrique comme Prometheus.
+
+    Exemple:
+        >>> format_metric(("data_reads_total", (("file", "players.json"),)))
+        'data_reads_total{file="players.json"}'
+    """
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{label}="{value}"' for label, value in labels) + "}"
+
+
+# Registre partagé par toute l'application
+metrics = MetricsRegistry()
+
+
+def count_scan(table, rows, site):
+    """
+    Compte un parcours complet d'une table en mémoire (filtre sur une colonne, construction d'un dictionnaire...).
+
+    Args:
+        table (str): La table parcourue ("players" ou "tournaments").
+        rows (int): Le nombre de lignes parcourues.
+        site (str): L'endroit du code à l'origine du parcours.
+    """
+    metrics.increment("table_scans_total", table=table, site=site)
+    metrics.increment("table_rows_scanned_total", rows, table=table)
@@ -0,0 +1,267 @@
+import gzip
+import json
+import lzma
+import os
+import tempfile
+
+from exceptions import DataSchemaError
+from utils.file_lock import file_lock
+from utils.utils import parse_timestamp
+
+# Version actuelle du schéma de chaque type de fichier de données
+SCHEMA_VERSIONS = {"players": 1, "tournaments": 2}
+# Fichier des versions de schéma, placé dans le dossier des fichiers de données : {nom du fichier: version}
+SCHEMA_FILE = "schema.json"
+# Étapes de migration : {type de fichier: {version de départ: fonction}}
+MIGRATIONS = {schema: {} for schema in SCHEMA_VERSIONS}
+# Nombre d'enregistrements modifiés donnés en exemple dans le rapport d'une migration
+REPORT_EXAMPLES = 5
+
+
+def migration(schema, from_version):
+    """
+    Décorateur enregistrant l'étape de migration d'un enregistrement de from_version à from_version + 1.
+
+    La fonction décorée modifie l'enregistrement (dictionnaire) en place et retourne True si elle l'a changé.
+    Elle doit pouvoir être appliquée à un enregistrement déjà migré sans le modifier : un fichier copié sans
+    son fichier schema.json est considéré comme étant à la version 0.
+    """
+
+    def decorator(function):
+        MIGRATIONS[schema][from_version] = function
+        return function
+
+    return decorator
+
+
+@migration("players", 0)
+def add_career_score(record):
+    # Les premiers fichiers de joueurs n'avaient pas de score de carrière
+    if record.get("career_score") is None:
+        record["career_score"] = 0.0
+        return True
+    return False
+
+
+@migration("tournaments", 0)
+def add_tournament_version(record):
+    # Compteur de version utilisé pour fusionner les saisies faites depuis plusieurs terminaux
+    if record.get("version") is None:
+        record["version"] = 0
+        return True
+    return False
+
+
+@migration("tournaments", 1)
+def convert_round_times(record):
+    # Heures des rounds : chaînes "JJ-MM-AAAA-HH-MM" (heure locale) remplacées par des timestamps UTC
+    changed = False
+    for round_ in record.get("rounds") or []:
+        for field in ("start_time", "end_time"):
+            if isinstance(round_.get(field), str):
+                round_[field] = parse_timestamp(round_[field])
+                changed = True
+    return changed
+
+
+def get_schema_path(file_path):
+    return os.path.join(os.path.dirname(file_path) or ".", SCHEMA_FILE)
+
+
+def get_schema_version(file_path):
+    """
+    Retourne la version du schéma d'un fichier de données (0 si elle n'a jamais été enregistrée).
+    """
+    try:
+        with open(get_schema_path(file_path), encoding="utf-8") as file:
+            versions = json.load(file)
+    except FileNotFoundError:
+        return 0
+    return versions.get(os.path.basename(file_path), 0)
+
+
+def set_schema_version(file_path, version):
+    schema_path = get_schema_path(file_path)
+    with file_lock(schema_path):
+        try:
+            with open(schema_path, encoding="utf-8") as file:
+                versions = json.load(file)
+        except FileNotFoundError:
+            versions = {}
+        versions[os.path.basename(file_path)] = version
+        write_text(schema_path, json.dumps(versions, indent=4, sort_keys=True) + "\n")
+
+
+def write_text(file_path, text):
+    # Fichier temporaire puis renommage : un lecteur ne voit jamais un fichier à moitié écrit
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.replace(temp_path, file_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def open_data_file(file_path, mode):
+    """
+    Ouvre un fichier de données en mode texte, décompressé à la volée pour les archives (.gz, .xz).
+    """
+    if file_path.endswith(".gz"):
+        return gzip.open(file_path, mode + "t", encoding="utf-8")
+    if file_path.endswith(".xz"):
+        return lzma.open(file_path, mode + "t", encoding="utf-8")
+    return open(file_path, mode, encoding="utf-8")
+
+
+def iter_json_array(file, chunk_size=1 << 20):
+    """
+    Lit un à un les éléments d'un tableau JSON, sans charger tout le fichier en mémoire.
+
+    Args:
+        file: Le fichier ouvert en mode texte.
+        chunk_size (int): Nombre de caractères lus à la fois.
+
+    Yields:
+        Les éléments du tableau (un fichier vide est lu comme un tableau vide).
+
+    Raises:
+        ValueError: Si le fichier n'est pas un tableau JSON valide.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, started, end_of_file = "", 0, False, False
+    while True:
+        # On passe les espaces et les virgules, en lisant la suite du fichier si besoin
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer) or end_of_file:
+                break
+            chunk = file.read(chunk_size)
+            end_of_file = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+
+        if position >= len(buffer):
+            if not started:
+                return
+            raise ValueError("Tableau JSON incomplet.")
+        if not started:
+            if buffer[position] != "[":
+                raise ValueError("Le fichier ne contient pas un tableau JSON.")
+            started = True
+            position += 1
+            continue
+        if buffer[position] == "]":
+            return
+
+        try:
+            element, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # Élément coupé par la fin du morceau lu : on lit la suite avant de réessayer
+            if end_of_file:
+                raise
+            chunk = file.read(chunk_size)
+            end_of_file = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield element
+
+
+def get_record_key(record):
+    return record.get("national_id") or record.get("name")
+
+
+def migrate_file(file_path, schema, dry_run=False):
+    """
+    Met le fichier de données à la version actuelle de son schéma, enregistrement par enregistrement.
+
+    Le fichier est lu et réécrit au fil de l'eau (fichier temporaire puis renommage, sous verrou) : la mémoire
+    utilisée ne dépend pas de la taille du fichier. Il n'est réécrit que si un enregistrement a changé ; la
+    nouvelle version est alors notée dans le fichier schema.json du même dossier.
+
+    Args:
+        file_path (str): Le fichier de données (tableau JSON, éventuellement compressé en .gz ou .xz).
+        schema (str): Le type de fichier ("players" ou "tournaments").
+        dry_run (bool): True pour seulement calculer ce que la migration changerait.
+
+    Returns:
+        dict: Le rapport de la migration : file, from_version, to_version, records (nombre d'enregistrements),
+        changed (nombre d'enregistrements modifiés), steps ({étape: enregistrements modifiés}) et examples
+        (clés des premiers enregistrements modifiés avec leurs étapes).
+
+    Raises:
+        DataSchemaError: Si le fichier a été écrit par une version plus récente de l'application, ou s'il n'est
+            pas un tableau JSON valide.
+    """
+    target_version = SCHEMA_VERSIONS[schema]
+    with file_lock(file_path):
+        version = get_schema_version(file_path)
+        report = {
+            "file": file_path,
+            "from_version": version,
+            "to_version": target_version,
+            "records": 0,
+            "changed": 0,
+            "steps": {},
+            "examples": [],
+        }
+        if version > target_version:
+            raise DataSchemaError(
+                file_path, f"version {version} du schéma, plus récente que celle de l'application ({target_version})"
+            )
+        if version == target_version:
+            return report
+
+        steps = [MIGRATIONS[schema][step_version] for step_version in range(version, target_version)]
+        report["steps"] = {step.__name__: 0 for step in steps}
+        try:
+            with open_data_file(file_path, "r") as source:
+                records = migrate_records(iter_json_array(source), steps, report)
+                if dry_run:
+                    for _ in records:
+                        pass
+                else:
+                    write_records(file_path, records, report)
+        except ValueError as e:
+            raise DataSchemaError(file_path, f"contenu illisible ({e})")
+
+        if not dry_run:
+            set_schema_version(file_path, target_version)
+    return report
+
+
+def migrate_records(records, steps, report):
+    # Applique les étapes à chaque enregistrement et complète le rapport au fur et à mesure
+    for record in records:
+        applied = [step.__name__ for step in steps if step(record)]
+        for step_name in applied:
+            report["steps"][step_name] += 1
+        if applied:
+            report["changed"] += 1
+            if len(report["examples"]) < REPORT_EXAMPLES:
+                report["examples"].append((get_record_key(record), applied))
+        report["records"] += 1
+        yield record
+
+
+def write_records(file_path, records, report):
+    # Les enregistrements sont écrits un par un dans un fichier temporaire, qui ne remplace le fichier de données
+    # que si un enregistrement a changé
+    suffix = os.path.basename(file_path).partition(".")[2]
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".", suffix=f".tmp.{suffix}")
+    os.close(file_descriptor)
+    # Archives compressées écrites de façon compacte, fichiers de l'application indentés
+    indent = None if file_path.endswith((".gz", ".xz")) else 4
+    try:
+        with open_data_file(temp_path, "w") as target:
+            target.write("[")
+            for position, record in enumerate(records):
+                target.write(("," if position else "") + "\n" + json.dumps(record, indent=indent, ensure_ascii=False))
+            target.write("\n]")
+        if report["changed"]:
+            os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
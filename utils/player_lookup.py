@@ -0,0 +1,132 @@
+import pandas as pd
+
+from utils.metrics import count_scan
+
+# Libellé affiché lorsqu'un identifiant national d'un match n'existe plus dans la base de données des joueurs
+UNKNOWN_PLAYER = "[Joueur introuvable]"
+
+
+def get_player_names_map(players_df, national_ids=None, registry=None):
+    """
+    Construit en une seule passe un dictionnaire {identifiant national: "Prénom Nom"}.
+
+    Args:
+        players_df (pd.DataFrame): Le DataFrame contenant tous les joueurs.
+        national_ids (list): Les identifiants utiles, pour les chercher dans le registre sans parcourir la table.
+        registry (PlayerRegistry): Le registre des joueurs à jour (voir utils/player_registry.py), ou None.
+
+    Returns:
+        dict: Dictionnaire associant chaque identifiant national au nom complet du joueur.
+    """
+    if registry is not None and national_ids is not None:
+        return registry.get_names_map(national_ids)
+    if players_df is None or players_df.empty:
+        return {}
+
+    count_scan("players", len(players_df), "get_player_names_map")
+    # On nettoie la colonne une seule fois au lieu de le faire pour chaque match
+    national_ids = players_df["national_id"].astype(str).str.strip()
+    full_names = players_df["first_name"].astype(str) + " " + players_df["last_name"].astype(str)
+    return dict(zip(national_ids, full_names))
+
+
+def join_matches_with_players(rounds, players_df, registry=None):
+    """
+    Joint les matchs de tous les rounds d'un tournoi avec les noms des joueurs.
+
+    La jointure se fait via un dictionnaire construit une seule fois : le coût dépend donc du nombre
+    de matchs + du nombre de joueurs, et non plus du produit des deux.
+
+    Args:
+        rounds (list): La liste des objets Round du tournoi.
+        players_df (pd.DataFrame): Le DataFrame contenant tous les joueurs.
+        registry (PlayerRegistry): Le registre des joueurs à jour, ou None pour construire la jointure depuis
+            players_df.
+
+    Returns:
+        pd.DataFrame: Une ligne par match avec les colonnes round, player1_name, player1_id,
+        player2_name, player2_id, score_player1 et score_player2.
+    """
+    columns = ["round", "player1_name", "player1_id", "player2_name", "player2_id", "score_player1", "score_player2"]
+    national_ids = {
+        player_id.strip()
+        for round_ in rounds
+        for match in round_.matches
+        for player_id in (match.player1_id, match.player2_id)
+    }
+    names = get_player_names_map(players_df, list(national_ids), registry)
+
+    rows = []
+    for round_ in rounds:
+        for match in round_.matches:
+            player1_id = match.player1_id.strip()
+            player2_id = match.player2_id.strip()
+            rows.append(
+                {
+                    "round": round_.name,
+                    "player1_name": names.get(player1_id, UNKNOWN_PLAYER),
+                    "player1_id": player1_id,
+                    "player2_name": names.get(player2_id, UNKNOWN_PLAYER),
+                    "player2_id": player2_id,
+                    "score_player1": match.score_player1,
+                    "score_player2": match.score_player2,
+                }
+            )
+
+    return pd.DataFrame(rows, columns=columns)
+
+
+def resolve_players(national_ids, players_df, registry=None):
+    """
+    Récupère en une seule passe les informations complètes d'une liste de joueurs.
+
+    Au lieu de filtrer tout le DataFrame pour chaque joueur (O(n·N)), on indexe une seule fois
+    les joueurs par identifiant national puis on sélectionne tous les identifiants demandés (O(n + N)).
+
+    Args:
+        national_ids (list): La liste des identifiants nationaux à résoudre.
+        players_df (pd.DataFrame): Le DataFrame contenant tous les joueurs.
+        registry (PlayerRegistry): Le registre des joueurs à jour : seuls les joueurs demandés sont lus, sans
+            parcourir players_df.
+
+    Returns:
+        pd.DataFrame: Les joueurs trouvés, dans l'ordre de national_ids. Les identifiants introuvables sont ignorés.
+    """
+    national_ids = [str(national_id).strip() for national_id in national_ids]
+    if players_df is None or players_df.empty or not national_ids:
+        columns = players_df.columns if players_df is not None else []
+        return pd.DataFrame(columns=columns)
+
+    if registry is not None:
+        records = registry.get_records_map(national_ids)
+        rows = [records[national_id] for national_id in national_ids if national_id in records]
+        return pd.DataFrame(rows, columns=list(players_df.columns))
+
+    count_scan("players", len(players_df), "resolve_players")
+    indexed_df = (
+        players_df.assign(national_id=players_df["national_id"].astype(str).str.strip())
+        .drop_duplicates(subset="national_id")
+        .set_index("national_id")
+    )
+    # On écarte les identifiants inconnus puis reindex() sélectionne tous les joueurs restants d'un coup
+    found_ids = [national_id for national_id in national_ids if national_id in indexed_df.index]
+    resolved_df = indexed_df.reindex(found_ids).reset_index()
+    return resolved_df[list(players_df.columns)]
+
+
+def get_player_records_map(national_ids, players_df, registry=None):
+    """
+    Retourne un dictionnaire {identifiant national: informations du joueur} pour une liste de joueurs.
+
+    Args:
+        national_ids (list): La liste des identifiants nationaux à résoudre.
+        players_df (pd.DataFrame): Le DataFrame contenant tous les joueurs.
+        registry (PlayerRegistry): Le registre des joueurs à jour, ou None.
+
+    Returns:
+        dict: Dictionnaire associant chaque identifiant national trouvé au dictionnaire des informations du joueur.
+    """
+    if registry is not None:
+        return registry.get_records_map(national_ids)
+    records = resolve_players(national_ids, players_df).to_dict(orient="records")
+    return {record["national_id"]: record for record in records}
@@ -0,0 +1,209 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from utils.metrics import metrics
+
+# Début de chaque fichier : signature, version du format et longueur de l'en-tête JSON
+MAGIC = b"CHESSREG"
+REGISTRY_FORMAT = 1
+PREAMBLE = struct.Struct("<8sII")
+ALIGNMENT = 8
+# Champs texte des fiches, encodés en UTF-8 sur une largeur fixe (celle du plus long dans le fichier)
+TEXT_FIELDS = ("first_name", "last_name", "birth_date", "national_id")
+
+
+def get_registry_path(file_path):
+    """
+    Retourne le chemin du registre d'un fichier de joueurs (datas/players.json → datas/players.registry).
+    """
+    return os.path.splitext(file_path)[0] + ".registry"
+
+
+def get_file_version(file_path):
+    # Même version que DataManager.get_file_version
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def encode_text(values):
+    text = values.astype(str).to_numpy(dtype=str)
+    try:
+        # Texte ASCII (identifiants, dates, la plupart des noms) : conversion faite par NumPy
+        return text.astype("S")
+    except UnicodeEncodeError:
+        return np.array([value.encode("utf-8") for value in text.tolist()], dtype="S")
+
+
+def write_registry(file_path, players_df, source_version):
+    """
+    Écrit le registre des joueurs : fiches de largeur fixe triées par identifiant national.
+
+    Le fichier contient la liste triée des identifiants (pour la recherche dichotomique) puis les fiches dans le
+    même ordre. Comme l'instantané binaire (voir utils/snapshot.py), il note la version du fichier JSON dont il
+    est la copie.
+
+    Args:
+        file_path (str): Le fichier JSON des joueurs.
+        players_df (pd.DataFrame): Les joueurs du fichier JSON.
+        source_version (tuple): Version du fichier JSON (voir DataManager.get_file_version).
+    """
+    players_df = players_df.assign(national_id=players_df["national_id"].astype(str).str.strip())
+    # Un identifiant en double garde sa première fiche, comme resolve_players
+    players_df = players_df.drop_duplicates(subset="national_id").sort_values("national_id", kind="stable")
+    columns = {field: encode_text(players_df[field]) for field in TEXT_FIELDS}
+    columns["career_score"] = players_df["career_score"].astype("float64").to_numpy()
+    dtype = np.dtype([(field, columns[field].dtype.str) for field in (*TEXT_FIELDS, "career_score")])
+    records = np.empty(len(players_df), dtype=dtype)
+    for field, values in columns.items():
+        records[field] = values
+    keys = columns["national_id"]
+
+    header = json.dumps(
+        {
+            "source_version": list(source_version),
+            "count": len(records),
+            "key_dtype": keys.dtype.str,
+            "record_dtype": [[field, dtype.fields[field][0].str] for field in dtype.names],
+        }
+    ).encode("utf-8")
+    header += b" " * (-(PREAMBLE.size + len(header)) % ALIGNMENT)
+    keys_content = keys.tobytes()
+
+    registry_path = get_registry_path(file_path)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(registry_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(PREAMBLE.pack(MAGIC, REGISTRY_FORMAT, len(header)))
+            file.write(header)
+            file.write(keys_content + b"\0" * (-len(keys_content) % ALIGNMENT))
+            file.write(records.tobytes())
+        os.replace(temp_path, registry_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class PlayerRegistry:
+    """
+    Registre des joueurs projeté en mémoire, pour retrouver des joueurs par identifiant national sans charger
+    toute la table.
+
+    Une recherche est une recherche dichotomique dans la liste triée des identifiants : seules les pages lues
+    (une vingtaine d'identifiants et la fiche trouvée) sont chargées depuis le disque. Le fichier est ouvert en
+    lecture seule : plusieurs programmes (interface, API des tableaux de scores) partagent les mêmes pages en
+    mémoire.
+
+    Attributs:
+        source_version (tuple): Version du fichier JSON des joueurs dont le registre est la copie.
+        keys (np.ndarray): Les identifiants nationaux triés (encodés en UTF-8), lus dans le fichier.
+        records (np.ndarray): Les fiches (tableau structuré), dans l'ordre de keys.
+    """
+
+    def __init__(self, buffer):
+        header_length = PREAMBLE.unpack_from(buffer, 0)[2]
+        header = json.loads(buffer[PREAMBLE.size:PREAMBLE.size + header_length])
+        self.buffer = buffer
+        self.source_version = tuple(header["source_version"])
+        count = header["count"]
+        key_dtype = np.dtype(header["key_dtype"])
+        record_dtype = np.dtype([tuple(field) for field in header["record_dtype"]])
+        keys_offset = PREAMBLE.size + header_length
+        keys_length = count * key_dtype.itemsize
+        # Vues sur le fichier projeté en mémoire : aucune copie des données
+        self.keys = np.frombuffer(buffer, dtype=key_dtype, count=count, offset=keys_offset)
+        self.records = np.frombuffer(
+            buffer, dtype=record_dtype, count=count, offset=keys_offset + keys_length + -keys_length % ALIGNMENT
+        )
+
+    @classmethod
+    def open(cls, file_path, source_version=None):
+        """
+        Ouvre le registre d'un fichier de joueurs s'il correspond à la version actuelle de ce fichier.
+
+        Args:
+            file_path (str): Le fichier JSON des joueurs.
+            source_version (tuple): Version attendue du fichier JSON (par défaut : sa version sur le disque).
+
+        Returns:
+            PlayerRegistry: Le registre, ou None s'il est absent, d'un autre format ou plus ancien que le fichier.
+        """
+        if source_version is None:
+            source_version = get_file_version(file_path)
+        try:
+            with open(get_registry_path(file_path), "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(buffer) < PREAMBLE.size or PREAMBLE.unpack_from(buffer, 0)[:2] != (MAGIC, REGISTRY_FORMAT):
+            return None
+        registry = cls(buffer)
+        if source_version is None or registry.source_version != tuple(source_version):
+            return None
+        return registry
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, national_id):
+        return self.find([national_id])[0] >= 0
+
+    def find(self, national_ids):
+        """
+        Retourne la position de chaque identifiant dans le registre.
+
+        Args:
+            national_ids (list): Les identifiants nationaux.
+
+        Returns:
+            np.ndarray: Les positions (-1 pour un identifiant introuvable).
+        """
+        metrics.increment("registry_lookups_total", len(national_ids))
+        encoded = [str(national_id).strip().encode("utf-8") for national_id in national_ids]
+        # Un identifiant plus long que la largeur du registre ne peut pas y être (et serait tronqué)
+        fits = np.array([len(key) <= self.keys.dtype.itemsize for key in encoded], dtype=bool)
+        queries = np.array([key if fit else b"" for key, fit in zip(encoded, fits)], dtype=self.keys.dtype)
+        positions = np.searchsorted(self.keys, queries)
+        found = fits & (positions < len(self.keys))
+        found[found] = self.keys[positions[found]] == queries[found]
+        return np.where(found, positions, -1)
+
+    def get_record(self, position):
+        record = self.records[position]
+        return {
+            **{field: record[field].decode("utf-8") for field in TEXT_FIELDS},
+            "career_score": float(record["career_score"]),
+        }
+
+    def get(self, national_id):
+        """
+        Retourne la fiche d'un joueur (dictionnaire avec les colonnes de datas/players.json), None s'il est absent.
+        """
+        position = self.find([national_id])[0]
+        return self.get_record(position) if position >= 0 else None
+
+    def get_records_map(self, national_ids):
+        """
+        Retourne un dictionnaire {identifiant national: fiche du joueur} pour les joueurs trouvés.
+        """
+        return {
+            record["national_id"]: record
+            for record in (self.get_record(position) for position in self.find(national_ids) if position >= 0)
+        }
+
+    def get_names_map(self, national_ids):
+        """
+        Retourne un dictionnaire {identifiant national: "Prénom Nom"} pour les joueurs trouvés.
+        """
+        return {
+            national_id: f"{record['first_name']} {record['last_name']}"
+            for national_id, record in self.get_records_map(national_ids).items()
+        }
@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+
+from utils.utils import parse_timestamp
+
+MATCH_COLUMNS = ["tournament", "played_at", "player1", "player2", "score1", "score2"]
+RECORD_COLUMNS = ["games", "wins", "draws", "losses", "points"]
+
+
+def get_match_sides(matches):
+    """
+    Retourne chaque match vu par chacun de ses deux joueurs.
+
+    Args:
+        matches (list): Liste de tuples (tournoi, heure du round, joueur 1, joueur 2, score 1, score 2).
+
+    Returns:
+        pd.DataFrame: Deux lignes par match (colonnes tournament, played_at, national_id, opponent, score et
+        opponent_score, plus les colonnes RECORD_COLUMNS du résultat de ce match pour national_id).
+    """
+    matches_df = pd.DataFrame(matches, columns=MATCH_COLUMNS)
+    first_df = matches_df.rename(
+        columns={"player1": "national_id", "player2": "opponent", "score1": "score", "score2": "opponent_score"}
+    )
+    second_df = matches_df.rename(
+        columns={"player2": "national_id", "player1": "opponent", "score2": "score", "score1": "opponent_score"}
+    )
+    sides_df = pd.concat([first_df, second_df], ignore_index=True)
+    scores = sides_df["score"].astype(float)
+    opponent_scores = sides_df["opponent_score"].astype(float)
+    return sides_df.assign(
+        games=1,
+        wins=(scores > opponent_scores).astype(int),
+        draws=(scores == opponent_scores).astype(int),
+        losses=(scores < opponent_scores).astype(int),
+        points=scores,
+    )
+
+
+class PlayerStats:
+    """
+    Statistiques de chaque joueur, tous tournois confondus : matchs joués, victoires, nuls, défaites, points,
+    performance, adversaires rencontrés et tournois disputés.
+
+    Les statistiques sont des totaux tenus à jour : consulter la fiche d'un joueur ne parcourt pas les rounds des
+    tournois. L'historique est agrégé en une seule passe (regroupements pandas sur tous les matchs), puis seuls
+    les tournois modifiés sont retirés et ajoutés à nouveau (voir refresh).
+
+    Attributs:
+        totals (dict): Dictionnaire {identifiant: tableau des totaux RECORD_COLUMNS}.
+        opponents (dict): Dictionnaire {identifiant: {adversaire: tableau des totaux RECORD_COLUMNS}}.
+        tournaments (dict): Dictionnaire {identifiant: {tournoi: heure de son dernier round joué ou None}}.
+        matches (dict): Dictionnaire {tournoi: [(tournoi, heure du round, joueur 1, joueur 2, score 1, score 2)]},
+            pour retirer un tournoi des totaux.
+        tournament_players (dict): Dictionnaire {tournoi: joueurs inscrits ou ayant joué}.
+        versions (dict): Dictionnaire {tournoi: version agrégée}, voir refresh.
+    """
+
+    def __init__(self, tournaments=()):
+        """
+        Args:
+            tournaments (iterable): Les tournois à agréger (dictionnaires au format de datas/tournaments.json).
+        """
+        self.totals = {}
+        self.opponents = {}
+        self.tournaments = {}
+        self.matches = {}
+        self.tournament_players = {}
+        self.versions = {}
+        self.add_tournaments(tournaments)
+
+    def __len__(self):
+        return len(self.totals)
+
+    def add_tournaments(self, tournaments, versions=None):
+        """
+        Ajoute les matchs de plusieurs tournois aux statistiques, agrégés ensemble.
+
+        Args:
+            tournaments (iterable): Les tournois (dictionnaires au format de datas/tournaments.json).
+            versions (dict): Dictionnaire {nom du tournoi: version}, voir refresh.
+        """
+        matches = []
+        for tournament in tournaments:
+            name = tournament["name"]
+            tournament_matches = []
+            for round_ in tournament.get("rounds") or []:
+                played_at = parse_timestamp(round_.get("start_time"))
+                for match in round_.get("matches", []):
+                    tournament_matches.append((
+                        name,
+                        played_at,
+                        match["player1"]["id"],
+                        match["player2"]["id"],
+                        match["player1"].get("score_match", 0),
+                        match["player2"].get("score_match", 0),
+                    ))
+            self.matches[name] = tournament_matches
+            matches.extend(tournament_matches)
+            # Un joueur inscrit a disputé le tournoi même s'il n'a pas encore joué
+            players = {player["national_id"] for player in tournament.get("players") or []}
+            self.tournament_players[name] = players
+            for national_id in players:
+                self.tournaments.setdefault(national_id, {}).setdefault(name, None)
+            self.versions[name] = (versions or {}).get(name)
+
+        if not matches:
+            return
+        sides_df = get_match_sides(matches)
+        self.apply(sides_df)
+        # Heure du dernier round joué par chaque joueur dans chaque tournoi
+        last_played = sides_df.groupby(["national_id", "tournament"], sort=False)["played_at"].max()
+        for (national_id, name), played_at in last_played.items():
+            self.tournaments.setdefault(national_id, {})[name] = None if pd.isna(played_at) else int(played_at)
+            self.tournament_players[name].add(national_id)
+
+    def remove_tournament(self, name):
+        """
+        Retire des statistiques tous les matchs d'un tournoi.
+        """
+        matches = self.matches.pop(name, [])
+        if matches:
+            self.apply(get_match_sides(matches), sign=-1)
+        for national_id in self.tournament_players.pop(name, set()):
+            player_tournaments = self.tournaments.get(national_id, {})
+            player_tournaments.pop(name, None)
+            if not player_tournaments:
+                self.tournaments.pop(national_id, None)
+        self.versions.pop(name, None)
+
+    def apply(self, sides_df, sign=1):
+        """
+        Ajoute (sign=1) ou retire (sign=-1) des matchs des totaux des joueurs et de leurs adversaires.
+
+        Args:
+            sides_df (pd.DataFrame): Les matchs vus par chacun des joueurs (voir get_match_sides).
+            sign (int): 1 pour ajouter les matchs, -1 pour les retirer.
+        """
+        player_totals = sides_df.groupby("national_id", sort=False)[RECORD_COLUMNS].sum()
+        for national_id, values in zip(player_totals.index, player_totals.to_numpy(dtype=float)):
+            record = self.totals.get(national_id, 0) + sign * values
+            if record[0] > 0:
+                self.totals[national_id] = record
+            else:
+                self.totals.pop(national_id, None)
+
+        pair_totals = sides_df.groupby(["national_id", "opponent"], sort=False)[RECORD_COLUMNS].sum()
+        for (national_id, opponent), values in zip(pair_totals.index, pair_totals.to_numpy(dtype=float)):
+            player_opponents = self.opponents.setdefault(national_id, {})
+            record = player_opponents.get(opponent, 0) + sign * values
+            if record[0] > 0:
+                player_opponents[opponent] = record
+            else:
+                player_opponents.pop(opponent, None)
+                if not player_opponents:
+                    del self.opponents[national_id]
+
+    def refresh(self, tournament_versions, load_tournament):
+        """
+        Met les statistiques à jour : seuls les tournois ajoutés, supprimés ou dont la version a changé sont
+        retirés puis agrégés à nouveau.
+
+        Args:
+            tournament_versions (dict): Dictionnaire {nom du tournoi: version}, pour tous les tournois à agréger
+                (le compteur version est incrémenté à chaque enregistrement d'un tournoi).
+            load_tournament (callable): Fonction retournant le tournoi complet (dictionnaire) à partir de son nom.
+        """
+        changed = [
+            name for name, version in tournament_versions.items()
+            if name not in self.versions or self.versions[name] != version
+        ]
+        for name in [name for name in self.versions if name not in tournament_versions] + changed:
+            self.remove_tournament(name)
+        self.add_tournaments((load_tournament(name) for name in changed), tournament_versions)
+
+    def get_profile(self, national_id):
+        """
+        Retourne le bilan d'un joueur.
+
+        Returns:
+            dict: Nombre de matchs, de victoires, de nuls et de défaites, points, performance (part des points
+            possibles, None sans match joué), nombre de tournois disputés et heure du dernier round joué (ou None).
+        """
+        games, wins, draws, losses, points = self.totals.get(national_id, np.zeros(len(RECORD_COLUMNS)))
+        played_at = [value for value in self.tournaments.get(national_id, {}).values() if value is not None]
+        return {
+            "games": int(games),
+            "wins": int(wins),
+            "draws": int(draws),
+            "losses": int(losses),
+            "points": float(points),
+            "performance": float(points / games) if games else None,
+            "tournaments": len(self.tournaments.get(national_id, {})),
+            "last_played": max(played_at) if played_at else None,
+        }
+
+    def get_opponents(self, national_id):
+        """
+        Retourne le bilan d'un joueur contre chacun de ses adversaires.
+
+        Returns:
+            pd.DataFrame: Une ligne par adversaire (colonnes opponent et RECORD_COLUMNS), les adversaires les
+            plus souvent rencontrés en premier.
+        """
+        opponents = self.opponents.get(national_id, {})
+        opponents_df = pd.DataFrame(
+            [values for values in opponents.values()], columns=RECORD_COLUMNS, dtype=float
+        ).astype({column: int for column in RECORD_COLUMNS if column != "points"})
+        opponents_df.insert(0, "opponent", list(opponents))
+        return opponents_df.sort_values(["games", "opponent"], ascending=[False, True], ignore_index=True)
+
+    def get_tournaments(self, national_id):
+        """
+        Retourne les tournois disputés par un joueur, les plus récents en premier.
+
+        Returns:
+            pd.DataFrame: Une ligne par tournoi (colonnes tournament et last_played, heure du dernier round joué
+            en secondes depuis le 1er janvier 1970, manquante si le joueur n'a pas encore joué).
+        """
+        tournaments = self.tournaments.get(national_id, {})
+        tournaments_df = pd.DataFrame(
+            {"tournament": list(tournaments), "last_played": pd.array(list(tournaments.values()), dtype="Int64")}
+        )
+        return tournaments_df.sort_values("last_played", ascending=False, na_position="last", ignore_index=True)
@@ -0,0 +1,206 @@
+import cProfile
+import functools
+import json
+import math
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils.metrics import metrics
+
+# Bornes supérieures (en secondes) des intervalles des histogrammes de latence
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROFILE_MODES = ("time", "cprofile", "tracemalloc")
+TRACEMALLOC_TOP = 25
+
+
+class ActionProfiler:
+    """
+    Mesure, à la demande, la durée des actions des contrôleurs (options des menus, déroulement d'un tournoi).
+
+    Désactivé par défaut : une action non profilée ne coûte qu'un test. Une fois activé (variable d'environnement
+    CHESS_PROFILE ou option --profile de main.py), chaque action alimente un histogramme de latence écrit dans
+    <dossier>/latency.json ; les modes "cprofile" et "tracemalloc" écrivent en plus, pour chaque action, un
+    fichier .prof (lisible avec pstats ou snakeviz) et la liste des lignes ayant alloué le plus de mémoire.
+
+    La durée d'une action comprend le temps passé par l'utilisateur à répondre aux questions ; le fichier .prof
+    permet de séparer ce temps d'attente (prompt_toolkit) du temps de calcul.
+
+    Attributs:
+        modes (set): Modes actifs parmi "time", "cprofile" et "tracemalloc" (vide si désactivé).
+        output_dir (str): Dossier où sont écrits les histogrammes et les profils.
+        durations (dict): Dictionnaire {action: liste des durées en secondes}.
+    """
+
+    def __init__(self, modes=(), output_dir="profiles"):
+        self.modes = set()
+        self.output_dir = output_dir
+        self.durations = {}
+        self.active_actions = []
+        self.configure(modes, output_dir)
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Crée le profileur à partir des variables d'environnement CHESS_PROFILE (ex : "1", "cprofile",
+        "time,tracemalloc" ou "all") et CHESS_PROFILE_DIR.
+        """
+        return cls(parse_modes(os.environ.get("CHESS_PROFILE", "")), os.environ.get("CHESS_PROFILE_DIR", "profiles"))
+
+    def configure(self, modes, output_dir=None):
+        """
+        Active les modes donnés (un ensemble vide désactive le profileur).
+
+        Raises:
+            ValueError: Si un mode est inconnu.
+        """
+        unknown_modes = set(modes) - set(PROFILE_MODES)
+        if unknown_modes:
+            raise ValueError(f"Mode(s) de profilage inconnu(s) : {', '.join(sorted(unknown_modes))}.")
+        # La mesure des durées est toujours faite lorsqu'un mode est actif
+        self.modes = set(modes) | {"time"} if modes else set()
+        if output_dir is not None:
+            self.output_dir = output_dir
+
+    @property
+    def enabled(self):
+        return bool(self.modes)
+
+    @contextmanager
+    def profile(self, action):
+        """
+        Mesure l'action exécutée dans le bloc with.
+
+        Seule l'action la plus externe est passée à cProfile et tracemalloc (un seul profileur peut être actif à
+        la fois) ; les actions imbriquées sont seulement chronométrées.
+
+        Args:
+            action (str): Nom de l'action (ex : "ReportController.list_tournaments").
+        """
+        if not self.enabled:
+            yield
+            return
+
+        outermost = not self.active_actions
+        profiler = cProfile.Profile() if outermost and "cprofile" in self.modes else None
+        trace_memory = outermost and "tracemalloc" in self.modes
+        if trace_memory:
+            tracemalloc.start()
+        self.active_actions.append(action)
+        if profiler is not None:
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+            self.active_actions.pop()
+            self.durations.setdefault(action, []).append(elapsed)
+
+            os.makedirs(self.output_dir, exist_ok=True)
+            file_prefix = os.path.join(self.output_dir, f"{action}-{datetime.now():%Y%m%d-%H%M%S-%f}")
+            if profiler is not None:
+                profiler.dump_stats(f"{file_prefix}.prof")
+            if trace_memory:
+                self.write_memory_report(f"{file_prefix}.tracemalloc.txt", action, elapsed)
+            # Le fichier est réécrit après chaque action : il reste à jour même après un Ctrl+C
+            self.write_latency_report()
+
+    def write_memory_report(self, file_path, action, elapsed):
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        lines = [
+            f"Action : {action}",
+            f"Durée : {elapsed:.3f} s",
+            f"Mémoire allouée restante : {current / 1024:.1f} Kio, pic : {peak / 1024:.1f} Kio",
+            "",
+            f"{TRACEMALLOC_TOP} lignes ayant alloué le plus de mémoire :",
+        ]
+        lines += [str(stat) for stat in snapshot.statistics("lineno")[:TRACEMALLOC_TOP]]
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def get_latency_report(self):
+        """
+        Calcule l'histogramme et les statistiques de latence de chaque action.
+
+        Returns:
+            dict: Dictionnaire {action: {"count", "total", "min", "p50", "p95", "max", "buckets"}}, les durées
+            étant en secondes et "buckets" associant à chaque borne ("<=0.1", ..., "+inf") un nombre d'actions.
+        """
+        report = {}
+        for action, durations in sorted(self.durations.items()):
+            sorted_durations = sorted(durations)
+            buckets = {f"<={bound:g}": 0 for bound in LATENCY_BUCKETS}
+            buckets["+inf"] = 0
+            for duration in durations:
+                bound = next((bound for bound in LATENCY_BUCKETS if duration <= bound), None)
+                buckets["+inf" if bound is None else f"<={bound:g}"] += 1
+            report[action] = {
+                "count": len(durations),
+                "total": sum(durations),
+                "min": sorted_durations[0],
+                "p50": percentile(sorted_durations, 0.5),
+                "p95": percentile(sorted_durations, 0.95),
+                "max": sorted_durations[-1],
+                "buckets": buckets,
+            }
+        return report
+
+    def write_latency_report(self):
+        with open(os.path.join(self.output_dir, "latency.json"), "w", encoding="utf-8") as file:
+            json.dump(self.get_latency_report(), file, indent=4)
+
+
+def parse_modes(value):
+    """
+    Convertit la valeur de CHESS_PROFILE ou de --profile en ensemble de modes.
+
+    Exemple:
+        >>> sorted(parse_modes("cprofile,tracemalloc"))
+        ['cprofile', 'tracemalloc']
+        >>> parse_modes("1"), parse_modes("")
+        ({'time'}, set())
+    """
+    value = value.strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return set()
+    if value in ("1", "true", "yes", "on"):
+        return {"time"}
+    if value == "all":
+        return set(PROFILE_MODES)
+    return {mode.strip() for mode in value.split(",") if mode.strip()}
+
+
+def percentile(sorted_values, fraction):
+    # Percentile par rang le plus proche
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+# Profileur partagé par tous les contrôleurs
+profiler = ActionProfiler.from_environment()
+
+
+def profiled_action(method):
+    """
+    Décorateur mesurant une méthode de contrôleur avec le profileur partagé, sous le nom "<Classe>.<méthode>".
+
+    Même sans profilage, l'action est déclarée au registre des métriques, qui lui attribue les lectures, écritures
+    et parcours de tables qu'elle déclenche.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        action = f"{type(self).__name__}.{method.__name__}"
+        with metrics.action(action):
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            with profiler.profile(action):
+                return method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,103 @@
+import csv
+import json
+import os
+
+from exceptions import InvalidResultsError
+
+# Résultats acceptés dans la colonne "result" et scores correspondants (joueur 1, joueur 2)
+RESULTS = {
+    "1-0": (1.0, 0.0),
+    "0-1": (0.0, 1.0),
+    "0.5-0.5": (0.5, 0.5),
+    "1/2-1/2": (0.5, 0.5),
+    "=": (0.5, 0.5),
+}
+VALID_SCORES = set(RESULTS.values())
+
+
+def load_results_file(file_path):
+    """
+    Charge les lignes de résultats d'un fichier CSV ou JSON lines (un objet JSON par ligne).
+
+    Chaque ligne désigne un match soit par son numéro d'échiquier ("board"), soit par les identifiants
+    nationaux des deux joueurs ("player1" et "player2"). Le résultat est donné soit par la colonne "result"
+    (ex : "1-0", "0-1", "0.5-0.5"), soit par les colonnes "score_player1" et "score_player2".
+    Une colonne "round" optionnelle permet d'importer plusieurs rounds à la suite.
+
+    Args:
+        file_path (str): Chemin vers le fichier (.csv, .jsonl ou .json).
+
+    Returns:
+        list: La liste des lignes (dictionnaires).
+
+    Raises:
+        InvalidResultsError: Si le fichier n'existe pas ou ne peut pas être lu.
+    """
+    if not os.path.exists(file_path):
+        raise InvalidResultsError(f"le fichier {file_path} n'existe pas.")
+
+    try:
+        with open(file_path, encoding="utf-8") as file:
+            if file_path.lower().endswith(".csv"):
+                rows = list(csv.DictReader(file))
+            else:
+                rows = [json.loads(line) for line in file if line.strip()]
+    except (ValueError, csv.Error) as e:
+        raise InvalidResultsError(f"le fichier {file_path} est illisible ({e}).")
+
+    # On numérote les lignes pour pouvoir indiquer précisément la ligne fautive
+    for line_number, row in enumerate(rows, start=1):
+        row["line"] = line_number
+    return rows
+
+
+def parse_scores(row):
+    """
+    Extrait les scores (joueur 1, joueur 2) d'une ligne de résultats.
+
+    Args:
+        row (dict): La ligne de résultats.
+
+    Returns:
+        tuple: Les scores (score_player1, score_player2).
+
+    Raises:
+        InvalidResultsError: Si le résultat est absent ou invalide.
+    """
+    if row.get("result") not in (None, ""):
+        result = str(row["result"]).replace(" ", "")
+        if result not in RESULTS:
+            raise InvalidResultsError(f"ligne {row['line']} : résultat '{row['result']}' invalide.")
+        return RESULTS[result]
+
+    try:
+        scores = (float(row["score_player1"]), float(row["score_player2"]))
+    except (KeyError, TypeError, ValueError):
+        raise InvalidResultsError(f"ligne {row['line']} : aucun résultat valide trouvé.")
+    if scores not in VALID_SCORES:
+        raise InvalidResultsError(f"ligne {row['line']} : scores {scores[0]}-{scores[1]} invalides.")
+    return scores
+
+
+def group_rows_by_round(rows, current_round):
+    """
+    Regroupe les lignes par numéro de round, dans l'ordre croissant des rounds.
+
+    Args:
+        rows (list): Les lignes de résultats.
+        current_round (int): Le round utilisé pour les lignes sans colonne "round".
+
+    Returns:
+        list: Liste de tuples (numéro du round, lignes du round).
+
+    Raises:
+        InvalidResultsError: Si un numéro de round est invalide.
+    """
+    rounds = {}
+    for row in rows:
+        try:
+            round_number = int(row["round"]) if row.get("round") not in (None, "") else current_round
+        except (TypeError, ValueError):
+            raise InvalidResultsError(f"ligne {row['line']} : numéro de round '{row['round']}' invalide.")
+        rounds.setdefault(round_number, []).append(row)
+    return sorted(rounds.items())
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from utils.utils import parse_timestamp
+
+ROUND_COLUMNS = ["tournament", "round", "start_time", "end_time", "duration"]
+
+
+class RoundTimeIndex:
+    """
+    Index des rounds de plusieurs tournois par heure de début.
+
+    Les heures sont converties une seule fois (anciennes chaînes "JJ-MM-AAAA-HH-MM" comprises) puis triées : une
+    recherche par période ("rounds joués ce week-end") est une recherche dichotomique, et la durée moyenne des
+    rounds terminés sur une période se calcule avec des sommes cumulées, sans reparcourir les rounds.
+
+    Attributs:
+        rounds_df (pd.DataFrame): Les rounds triés par heure de début (colonnes ROUND_COLUMNS, heures en secondes
+            depuis le 1er janvier 1970, durée en secondes, heure de fin et durée manquantes si le round est en cours).
+    """
+
+    def __init__(self, tournaments):
+        """
+        Args:
+            tournaments (iterable): Les tournois (dictionnaires au format de datas/tournaments.json).
+        """
+        tournament_names, round_names, start_times, end_times = [], [], [], []
+        for tournament in tournaments:
+            for round_ in tournament["rounds"]:
+                start_time = parse_timestamp(round_.get("start_time"))
+                if start_time is None:
+                    continue
+                end_time = parse_timestamp(round_.get("end_time"))
+                tournament_names.append(tournament["name"])
+                round_names.append(round_["name"])
+                start_times.append(start_time)
+                end_times.append(-1 if end_time is None else end_time)
+
+        start_times = np.array(start_times, dtype=np.int64)
+        end_times = np.array(end_times, dtype=np.int64)
+        order = np.argsort(start_times, kind="stable")
+        self.start_times = start_times[order]
+        # Les rounds en cours ont une heure de fin et une durée manquantes (pd.NA)
+        sorted_end_times = pd.Series(end_times[order], dtype="Int64").mask(end_times[order] < 0)
+        self.rounds_df = pd.DataFrame(
+            {
+                "tournament": np.array(tournament_names, dtype=object)[order],
+                "round": np.array(round_names, dtype=object)[order],
+                "start_time": self.start_times,
+                "end_time": sorted_end_times,
+                "duration": sorted_end_times - self.start_times,
+            },
+            columns=ROUND_COLUMNS,
+        )
+
+        # Sommes cumulées des durées et du nombre de rounds terminés, dans l'ordre des heures de début : la durée
+        # moyenne porte ainsi sur les mêmes rounds que rounds_started_between (les rounds en cours comptent pour 0)
+        finished = end_times[order] >= 0
+        durations = np.where(finished, end_times[order] - self.start_times, 0)
+        self.cumulative_durations = np.concatenate(([0], np.cumsum(durations)))
+        self.cumulative_finished = np.concatenate(([0], np.cumsum(finished)))
+
+    def __len__(self):
+        return len(self.start_times)
+
+    def rounds_started_between(self, start, end):
+        """
+        Retourne les rounds commencés sur la période [start, end[.
+
+        Args:
+            start (int): Début de la période (timestamp).
+            end (int): Fin de la période, exclue (timestamp).
+
+        Returns:
+            pd.DataFrame: Les rounds de la période, triés par heure de début.
+        """
+        first, last = self.get_bounds(start, end)
+        return self.rounds_df.iloc[first:last].reset_index(drop=True)
+
+    def average_duration(self, start=None, end=None):
+        """
+        Calcule la durée moyenne des rounds terminés parmi ceux commencés sur la période [start, end[ (tous les
+        rounds par défaut), soit les rounds retournés par rounds_started_between.
+
+        Returns:
+            float: La durée moyenne en secondes, ou None si aucun de ces rounds n'est terminé.
+        """
+        first, last = self.get_bounds(start, end)
+        finished_count = self.cumulative_finished[last] - self.cumulative_finished[first]
+        if finished_count == 0:
+            return None
+        return float(self.cumulative_durations[last] - self.cumulative_durations[first]) / finished_count
+
+    def get_bounds(self, start=None, end=None):
+        # Positions (dans l'ordre des heures de début) des rounds commencés sur la période [start, end[
+        first = 0 if start is None else int(np.searchsorted(self.start_times, start, side="left"))
+        last = len(self.start_times) if end is None else int(np.searchsorted(self.start_times, end, side="left"))
+        return first, max(first, last)
@@ -0,0 +1,340 @@
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+from exceptions import DataLoadingError
+from models.tournament import Tournament
+from utils.player_lookup import UNKNOWN_PLAYER, get_player_names_map
+from utils.player_registry import PlayerRegistry
+from utils.utils import get_tournament_status
+
+
+class ScoreboardSnapshot:
+    """
+    Instantané en mémoire des joueurs et des tournois, servi en JSON par l'API des tableaux de scores.
+
+    Les réponses sont calculées à la première demande puis gardées en cache avec leur ETag. Le cache est vidé
+    dès qu'un DataManager enregistre ses données, ou lorsqu'un fichier a été modifié par un autre programme.
+
+    Les threads HTTP ne lisent jamais les DataFrame des DataManager, modifiés par l'interface : chaque table est
+    copiée au démarrage, puis remplacée par les données effectivement écrites à chaque sauvegarde (ou relues
+    depuis le fichier), et seule cette copie est servie. L'API ne fait aucune écriture sur le disque.
+
+    Attributs:
+        player_data_manager (PlayerDataManager): Le gestionnaire des données des joueurs.
+        tournament_data_manager (TournamentDataManager): Le gestionnaire des données des tournois.
+        frames (dict): Dictionnaire {fichier: copie des données servies}.
+        source_versions (dict): Dictionnaire {fichier: version du fichier JSON correspondant à la copie, None si
+            la copie contient des modifications pas encore écrites}.
+        records (dict): Dictionnaire {fichier: {clé: enregistrement}}, construit à la première demande pour
+            chaque copie.
+    """
+
+    def __init__(self, player_data_manager, tournament_data_manager):
+        self.player_data_manager = player_data_manager
+        self.tournament_data_manager = tournament_data_manager
+        self.lock = threading.Lock()
+        self.responses = {}
+        self.file_versions = {}
+        self.frames = {}
+        self.source_versions = {}
+        self.records = {}
+        self.registry = None
+
+        player_data_manager.add_save_listener(self.on_save)
+        tournament_data_manager.add_save_listener(self.on_save)
+        for data_manager in (player_data_manager, tournament_data_manager):
+            # Au démarrage (thread de l'interface), les données en mémoire ne correspondent au fichier que si
+            # aucune sauvegarde n'est en attente
+            file_version = self.get_file_version(data_manager.file_path)
+            persisted = data_manager.is_persisted() and data_manager.synced_version == file_version
+            self.set_frame(data_manager, data_manager.get_data().copy(), file_version, persisted)
+
+    def on_save(self, data_manager, data_df, file_version):
+        """
+        Garde une copie des données écrites lors d'une sauvegarde faite par cette application, puis vide le cache.
+
+        Appelée par le thread qui a écrit le fichier : seules les données écrites sont lues, jamais get_data().
+
+        Args:
+            data_manager (DataManager): Le gestionnaire qui a enregistré ses données.
+            data_df (pd.DataFrame): Les données écrites.
+            file_version (tuple): La version du fichier qui les contient.
+        """
+        with self.lock:
+            self.set_frame(data_manager, data_df.copy(), file_version)
+            self.responses.clear()
+
+    def set_frame(self, data_manager, data_df, file_version, persisted=True):
+        """
+        Remplace les données servies pour un fichier.
+
+        Args:
+            data_manager (DataManager): Le gestionnaire du fichier.
+            data_df (pd.DataFrame): Les données servies (copie propre à l'API).
+            file_version (tuple): La version du fichier sur le disque.
+            persisted (bool): True si data_df est le contenu de cette version du fichier (le registre des joueurs
+                de cette version peut alors être utilisé).
+        """
+        self.frames[data_manager.file_path] = data_df
+        self.source_versions[data_manager.file_path] = file_version if persisted else None
+        self.file_versions[data_manager.file_path] = file_version
+        self.records.pop(data_manager.file_path, None)
+        if data_manager is self.player_data_manager:
+            self.registry = None
+
+    def get_file_version(self, file_path):
+        # Même version que DataManager.get_file_version, pour ouvrir le registre correspondant
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def reload_if_stale(self):
+        """
+        Recharge les fichiers modifiés par un autre programme (un simple os.stat par fichier).
+
+        Les données relues sont gardées à part : les DataManager partagés avec l'interface ne sont pas modifiés,
+        leur propre synchronisation avec le fichier (fusion des modifications concurrentes) reste intacte.
+
+        Un fichier illisible (ex : en cours d'écriture par un autre programme) n'est pas pris en compte : les
+        dernières données valides restent servies et la lecture est retentée à la requête suivante.
+        """
+        for data_manager in (self.player_data_manager, self.tournament_data_manager):
+            version = self.get_file_version(data_manager.file_path)
+            if version != self.file_versions.get(data_manager.file_path):
+                try:
+                    data_df = data_manager.parse_data(data_manager.read_file())
+                except (DataLoadingError, OSError, ValueError):
+                    # DataSchemaError (colonnes manquantes) compris
+                    continue
+                self.set_frame(data_manager, data_df, version)
+                self.responses.clear()
+
+    def get_response(self, path):
+        """
+        Retourne la réponse JSON (mise en cache) correspondant au chemin demandé.
+
+        Args:
+            path (str): Le chemin de la requête (ex : "/tournaments/Open/standings").
+
+        Returns:
+            tuple: (corps de la réponse en bytes, ETag) ou None si le chemin n'existe pas.
+        """
+        with self.lock:
+            self.reload_if_stale()
+            if path not in self.responses:
+                payload = self.build_payload(path)
+                if payload is None:
+                    return None
+                body = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                self.responses[path] = (body, etag)
+            return self.responses[path]
+
+    def build_payload(self, path):
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        if parts == ["tournaments"]:
+            return self.list_tournaments()
+        if len(parts) == 2 and parts[0] == "players":
+            return self.get_player(parts[1])
+        if len(parts) in (2, 3) and parts[0] == "tournaments":
+            tournament_data = self.get_tournament_data(parts[1])
+            if tournament_data is None:
+                return None
+            if len(parts) == 2:
+                return tournament_data
+            if parts[2] == "pairings":
+                return self.get_pairings(tournament_data)
+            if parts[2] == "standings":
+                return self.get_standings(tournament_data)
+        return None
+
+    def get_frame(self, data_manager):
+        return self.frames[data_manager.file_path]
+
+    def get_registry(self):
+        """
+        Retourne le registre des joueurs (voir utils/player_registry.py) s'il correspond aux données servies,
+        partagé en mémoire avec l'interface et les autres terminaux.
+
+        Le registre est seulement ouvert, jamais écrit : sans registre à jour, les joueurs sont cherchés dans la
+        copie des données.
+
+        Returns:
+            PlayerRegistry: Le registre, ou None s'il est absent ou ne correspond pas aux données servies.
+        """
+        if self.registry is None:
+            source_version = self.source_versions.get(self.player_data_manager.file_path)
+            if source_version is not None:
+                self.registry = PlayerRegistry.open(self.player_data_manager.file_path, source_version)
+        return self.registry
+
+    def get_player_names(self, national_ids):
+        return get_player_names_map(self.get_frame(self.player_data_manager), national_ids, self.get_registry())
+
+    def get_records(self, data_manager):
+        """
+        Retourne les enregistrements de la copie des données, convertis une seule fois par copie.
+
+        Returns:
+            dict: Dictionnaire {clé (identifiant national ou nom du tournoi): enregistrement}, dans l'ordre du
+            fichier.
+        """
+        if data_manager.file_path not in self.records:
+            data_df = self.get_frame(data_manager)
+            # Types JSON natifs et dates au format du fichier
+            records = data_manager.to_records(data_df) if not data_df.empty else []
+            self.records[data_manager.file_path] = {
+                str(record[data_manager.key_column]).strip(): record for record in records
+            }
+        return self.records[data_manager.file_path]
+
+    def list_tournaments(self):
+        return [
+            {
+                "name": tournament["name"],
+                "location": tournament["location"],
+                "start_date": tournament["start_date"],
+                "end_date": tournament["end_date"],
+                "rounds_count": tournament["rounds_count"],
+                "current_round": tournament["current_round"],
+                "players_count": len(tournament["players"]),
+                "status": get_tournament_status(
+                    tournament["current_round"], tournament["rounds_count"], tournament["rounds"]
+                ),
+            }
+            for tournament in self.get_records(self.tournament_data_manager).values()
+        ]
+
+    def get_tournament_data(self, name):
+        return self.get_records(self.tournament_data_manager).get(name.strip())
+
+    def get_player(self, national_id):
+        national_id = national_id.strip().upper()
+        registry = self.get_registry()
+        if registry is not None:
+            return registry.get(national_id)
+        return self.get_records(self.player_data_manager).get(national_id)
+
+    def get_pairings(self, tournament_data):
+        tournament = Tournament.from_dict(tournament_data)
+        if not tournament.rounds:
+            return {"round": None, "matches": [], "pending": []}
+
+        round_ = tournament.rounds[-1]
+        names = self.get_player_names(
+            [player.national_id for player in tournament.players]
+            + [player_id for match in round_.matches for player_id in (match.player1_id, match.player2_id)]
+        )
+        played = {match.player1_id for match in round_.matches}
+        pending = []
+        if round_.end_time is None:
+            pending = [
+                {
+                    "board": board,
+                    "player1": {"id": player1.national_id, "name": names.get(player1.national_id, UNKNOWN_PLAYER)},
+                    "player2": {"id": player2.national_id, "name": names.get(player2.national_id, UNKNOWN_PLAYER)},
+                }
+                for board, (player1, player2) in enumerate(tournament.generate_round_pairs(), start=1)
+                if player1.national_id not in played
+            ]
+        return {
+            "round": round_.name,
+            "start_time": round_.start_time,
+            "end_time": round_.end_time,
+            "matches": [
+                {
+                    "player1": {"id": match.player1_id, "name": names.get(match.player1_id, UNKNOWN_PLAYER),
+                                "score": match.score_player1},
+                    "player2": {"id": match.player2_id, "name": names.get(match.player2_id, UNKNOWN_PLAYER),
+                                "score": match.score_player2},
+                }
+                for match in round_.matches
+            ],
+            "pending": pending,
+        }
+
+    def get_standings(self, tournament_data):
+        names = self.get_player_names([player["national_id"] for player in tournament_data["players"]])
+        players = sorted(tournament_data["players"], key=lambda player: float(player["career_score"]), reverse=True)
+        return [
+            {
+                "rank": rank,
+                "national_id": player["national_id"],
+                "name": names.get(player["national_id"].strip(), UNKNOWN_PLAYER),
+                "score": float(player["career_score"]),
+            }
+            for rank, player in enumerate(players, start=1)
+        ]
+
+
+class ScoreboardRequestHandler(BaseHTTPRequestHandler):
+    """
+    Gestionnaire des requêtes HTTP (lecture seule) de l'API des tableaux de scores.
+    """
+
+    snapshot = None
+
+    def do_GET(self):
+        response = self.snapshot.get_response(urlparse(self.path).path)
+        if response is None:
+            self.send_json_error(404, "Ressource introuvable")
+            return
+
+        body, etag = response
+        # Si l'écran a déjà la dernière version, on répond 304 sans renvoyer le contenu
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json_error(self, status, message):
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # On ne pollue pas le terminal de l'arbitre avec les requêtes des écrans
+        pass
+
+
+def start_scoreboard_server(player_data_manager, tournament_data_manager, host="127.0.0.1", port=8000):
+    """
+    Démarre l'API des tableaux de scores dans un thread en arrière-plan.
+
+    Routes disponibles (GET uniquement) :
+        /tournaments, /tournaments/<nom>, /tournaments/<nom>/pairings,
+        /tournaments/<nom>/standings, /players/<identifiant national>
+
+    Args:
+        player_data_manager (PlayerDataManager): Le gestionnaire des données des joueurs.
+        tournament_data_manager (TournamentDataManager): Le gestionnaire des données des tournois.
+        host (str): L'adresse d'écoute (locale par défaut).
+        port (int): Le port d'écoute (0 pour un port libre choisi par le système).
+
+    Returns:
+        ThreadingHTTPServer: Le serveur démarré (server.shutdown() pour l'arrêter).
+    """
+    snapshot = ScoreboardSnapshot(player_data_manager, tournament_data_manager)
+    handler = type("BoundScoreboardRequestHandler", (ScoreboardRequestHandler,), {"snapshot": snapshot})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,227 @@
+import re
+
+from prompt_toolkit.completion import Completer, Completion
+from unidecode import unidecode
+
+from utils.metrics import count_scan
+
+# Clé réservée dans les noeuds du trie pour stocker les identifiants des joueurs dont une clé se termine ici
+IDS_KEY = ""
+
+
+def normalize_search_key(text):
+    """
+    Normalise un texte pour la recherche : sans accents, en minuscule et sans ponctuation.
+
+    Args:
+        text (str): Le texte à normaliser.
+
+    Returns:
+        str: Le texte normalisé.
+
+    Exemple:
+        >>> normalize_search_key("Jean-Pierre Dupré")
+        'jeanpierre dupre'
+        >>> normalize_search_key("AB-1234")
+        'ab1234'
+    """
+    text = unidecode(str(text)).lower()
+    text = re.sub(r"[^a-z0-9 ]", "", text)
+    return " ".join(text.split())
+
+
+class PlayerSearchIndex:
+    """
+    Index de recherche par préfixe (trie) sur les identifiants nationaux et les noms des joueurs.
+
+    L'index est construit une seule fois par session puis mis à jour à chaque ajout ou suppression de joueur,
+    une recherche ne parcourt donc que les noeuds correspondant au préfixe saisi.
+
+    Attributs:
+        root (dict): La racine du trie.
+        labels (dict): Dictionnaire {identifiant national: "Prénom Nom (identifiant)"}.
+        keys (dict): Dictionnaire {identifiant national: clés indexées}, utilisé pour la suppression.
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.labels = {}
+        self.keys = {}
+
+    @classmethod
+    def from_dataframe(cls, players_df):
+        """
+        Construit l'index à partir du DataFrame des joueurs.
+
+        Args:
+            players_df (pd.DataFrame): Le DataFrame contenant tous les joueurs.
+
+        Returns:
+            PlayerSearchIndex: L'index construit.
+        """
+        index = cls()
+        if players_df is not None and not players_df.empty:
+            count_scan("players", len(players_df), "search_index")
+            for row in players_df[["national_id", "first_name", "last_name"]].itertuples(index=False):
+                index.add(row.national_id, row.first_name, row.last_name)
+        return index
+
+    def update_from_dataframe(self, players_df):
+        """
+        Met l'index à jour à partir du DataFrame des joueurs rechargé (ex : modifié par un autre terminal).
+
+        Les libellés sont comparés en une passe vectorisée : seuls les joueurs ajoutés, supprimés ou renommés
+        sont retirés ou ajoutés dans le trie, qui n'est pas reconstruit.
+
+        Args:
+            players_df (pd.DataFrame): Le DataFrame contenant tous les joueurs.
+
+        Returns:
+            int: Le nombre de joueurs ajoutés, supprimés ou renommés dans l'index.
+        """
+        if players_df is None or players_df.empty:
+            removed = list(self.labels)
+            for national_id in removed:
+                self.remove(national_id)
+            return len(removed)
+
+        players_df = players_df[["national_id", "first_name", "last_name"]]
+        national_ids = players_df["national_id"].astype(str).str.strip()
+        labels = (
+            players_df["first_name"].astype(str) + " " + players_df["last_name"].astype(str)
+            + " (" + national_ids + ")"
+        )
+        removed = set(self.labels).difference(national_ids)
+        for national_id in removed:
+            self.remove(national_id)
+        changed = labels.to_numpy() != national_ids.map(self.labels).to_numpy()
+        for row in players_df[changed].itertuples(index=False):
+            self.add(row.national_id, row.first_name, row.last_name)
+        return len(removed) + int(changed.sum())
+
+    def add(self, national_id, first_name, last_name):
+        """
+        Ajoute (ou remplace) un joueur dans l'index.
+
+        Args:
+            national_id (str): L'identifiant national du joueur.
+            first_name (str): Le prénom du joueur.
+            last_name (str): Le nom de famille du joueur.
+        """
+        national_id = str(national_id).strip()
+        if national_id in self.keys:
+            self.remove(national_id)
+
+        # On indexe l'identifiant et chaque mot du prénom et du nom
+        keys = {normalize_search_key(national_id)}
+        keys.update(normalize_search_key(first_name).split())
+        keys.update(normalize_search_key(last_name).split())
+        keys.discard("")
+
+        for key in keys:
+            node = self.root
+            for char in key:
+                node = node.setdefault(char, {})
+            node.setdefault(IDS_KEY, set()).add(national_id)
+
+        self.keys[national_id] = keys
+        self.labels[national_id] = f"{first_name} {last_name} ({national_id})"
+
+    def remove(self, national_id):
+        """
+        Retire un joueur de l'index.
+
+        Args:
+            national_id (str): L'identifiant national du joueur à retirer.
+        """
+        national_id = str(national_id).strip()
+        for key in self.keys.pop(national_id, set()):
+            node = self._find_node(key)
+            if node is not None:
+                node.get(IDS_KEY, set()).discard(national_id)
+        self.labels.pop(national_id, None)
+
+    def _find_node(self, prefix):
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _collect(self, node, limit):
+        results = []
+        # Ensemble des identifiants déjà trouvés : un joueur est atteint par plusieurs de ses clés
+        seen = set()
+        # Parcours en profondeur à partir du noeud du préfixe, arrêté dès que limit résultats sont trouvés
+        stack = [node]
+        while stack and len(results) < limit:
+            current = stack.pop()
+            for national_id in sorted(current.get(IDS_KEY, ())):
+                if national_id not in seen:
+                    seen.add(national_id)
+                    results.append(national_id)
+                    if len(results) == limit:
+                        break
+            stack.extend(current[char] for char in sorted(current, reverse=True) if char != IDS_KEY)
+        return results
+
+    def search(self, query, limit=10, candidates_limit=1000):
+        """
+        Recherche les joueurs dont l'identifiant, le prénom ou le nom commence par le texte saisi.
+
+        Si plusieurs mots sont saisis (ex : "jane sm"), chaque mot doit être le début d'un des mots indexés du joueur.
+
+        Args:
+            query (str): Le texte saisi (accents, casse et ponctuation ignorés).
+            limit (int): Le nombre maximum de résultats.
+            candidates_limit (int): Le nombre maximum de candidats examinés pour une recherche à plusieurs mots.
+
+        Returns:
+            list: Les identifiants nationaux trouvés (au plus limit).
+        """
+        words = normalize_search_key(query).split()
+        if not words:
+            return []
+
+        # On part du mot le plus long, le plus sélectif, puis on vérifie les autres mots sur les candidats
+        words.sort(key=len, reverse=True)
+        node = self._find_node(words[0])
+        if node is None:
+            return []
+        if len(words) == 1:
+            return self._collect(node, limit)
+
+        results = []
+        for national_id in self._collect(node, candidates_limit):
+            keys = self.keys[national_id]
+            if all(any(key.startswith(word) for key in keys) for word in words[1:]):
+                results.append(national_id)
+                if len(results) == limit:
+                    break
+        return results
+
+    def __contains__(self, national_id):
+        return str(national_id).strip() in self.labels
+
+    def __len__(self):
+        return len(self.labels)
+
+
+class PlayerCompleter(Completer):
+    """
+    Autocomplétion InquirerPy/prompt_toolkit basée sur un PlayerSearchIndex.
+
+    Chaque suggestion insère l'identifiant national du joueur et affiche son nom complet.
+    """
+
+    def __init__(self, search_index, limit=10):
+        self.search_index = search_index
+        self.limit = limit
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        for national_id in self.search_index.search(text, self.limit):
+            yield Completion(
+                national_id, start_position=-len(text), display=self.search_index.labels[national_id]
+            )
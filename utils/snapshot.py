@@ -0,0 +1,154 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Début de chaque fichier : signature, version du format et longueur de l'en-tête JSON
+MAGIC = b"CHESSNAP"
+SNAPSHOT_FORMAT = 2
+PREAMBLE = struct.Struct("<8sII")
+# Les colonnes sont alignées sur 8 octets pour être lues directement depuis le fichier projeté en mémoire
+ALIGNMENT = 8
+
+
+def get_snapshot_path(file_path):
+    """
+    Retourne le chemin de l'instantané binaire d'un fichier de données (datas/players.json → datas/players.snapshot).
+    """
+    return os.path.splitext(file_path)[0] + ".snapshot"
+
+
+def encode_column(values):
+    """
+    Encode une colonne : tableau NumPy brut pour les nombres et les dates, chaînes de largeur fixe pour le texte
+    (colonnes catégorielles comprises), tableau JSON pour le reste (listes des rounds et des joueurs, valeurs
+    manquantes).
+
+    Returns:
+        tuple: (description de la colonne pour l'en-tête, contenu binaire).
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    if values.dtype.kind in "biufM":
+        array = np.ascontiguousarray(values.to_numpy())
+        return {"kind": "array", "dtype": array.dtype.str}, array.tobytes()
+    if pd.api.types.infer_dtype(values, skipna=False) in ("string", "empty"):
+        array = np.array(values.tolist(), dtype=str) if len(values) else np.array([], dtype="<U1")
+        return {"kind": "string", "dtype": array.dtype.str}, array.tobytes()
+    return {"kind": "json"}, values.to_json(orient="values", force_ascii=False).encode("utf-8")
+
+
+def decode_column(buffer, column, rows):
+    start, end = column["offset"], column["offset"] + column["length"]
+    if column["kind"] == "array":
+        # Copie : les données chargées sont modifiées en place par l'application
+        return np.frombuffer(buffer, dtype=column["dtype"], count=rows, offset=start).copy()
+    if column["kind"] == "string":
+        return np.frombuffer(buffer, dtype=column["dtype"], count=rows, offset=start).astype(object)
+    return pd.Series(json.loads(buffer[start:end]), dtype=object).to_numpy()
+
+
+def write_snapshot(file_path, data_df, source_version, schema_version, record_hashes=None):
+    """
+    Écrit l'instantané binaire (colonne par colonne) des données d'un fichier JSON.
+
+    Le fichier JSON reste la référence (format d'échange et base des fusions entre terminaux) : l'instantané note
+    la version du fichier JSON dont il est la copie et n'est utilisé que tant que ce fichier n'a pas changé.
+
+    Args:
+        file_path (str): Le fichier JSON.
+        data_df (pd.DataFrame): Les données du fichier JSON.
+        source_version (tuple): Version du fichier JSON (voir DataManager.get_file_version).
+        schema_version (int): Version du schéma des données (voir utils/migrations.py).
+        record_hashes (np.ndarray): Empreintes des enregistrements (voir DataManager.hash_records), gardées pour ne
+            pas les recalculer au chargement.
+    """
+    sections = [(name, *encode_column(data_df[name])) for name in data_df.columns]
+    if record_hashes is not None:
+        sections.append((None, {"kind": "array", "dtype": "<u8"}, np.asarray(record_hashes, dtype="<u8").tobytes()))
+
+    columns, offset = [], 0
+    for name, column, content in sections:
+        columns.append({"name": name, **column, "offset": offset, "length": len(content)})
+        offset += len(content) + -len(content) % ALIGNMENT
+    header = json.dumps(
+        {
+            "source_version": list(source_version),
+            "schema_version": schema_version,
+            "rows": len(data_df),
+            # La dernière section sans nom contient les empreintes des enregistrements
+            "columns": columns,
+        }
+    ).encode("utf-8")
+    header += b" " * (-(PREAMBLE.size + len(header)) % ALIGNMENT)
+
+    snapshot_path = get_snapshot_path(file_path)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(snapshot_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(PREAMBLE.pack(MAGIC, SNAPSHOT_FORMAT, len(header)))
+            file.write(header)
+            for _, _, content in sections:
+                file.write(content + b"\0" * (-len(content) % ALIGNMENT))
+        os.replace(temp_path, snapshot_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def open_snapshot(file_path, source_version, schema_version):
+    """
+    Projette en mémoire l'instantané binaire d'un fichier JSON, s'il correspond à la version actuelle du fichier.
+
+    Returns:
+        mmap.mmap: Le contenu de l'instantané (à lire avec read_snapshot), ou None s'il est absent, d'un autre
+        format ou plus ancien que le fichier JSON.
+    """
+    try:
+        with open(get_snapshot_path(file_path), "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Fichier absent ou vide
+        return None
+    if len(buffer) < PREAMBLE.size:
+        return None
+    magic, snapshot_format, _ = PREAMBLE.unpack_from(buffer, 0)
+    if magic != MAGIC or snapshot_format != SNAPSHOT_FORMAT:
+        return None
+    header = get_header(buffer)
+    if header["source_version"] != list(source_version) or header["schema_version"] != schema_version:
+        return None
+    return buffer
+
+
+def get_header(buffer):
+    header_length = PREAMBLE.unpack_from(buffer, 0)[2]
+    return json.loads(buffer[PREAMBLE.size:PREAMBLE.size + header_length])
+
+
+def read_snapshot(buffer):
+    """
+    Reconstruit le DataFrame d'un instantané, sans analyse de texte pour les colonnes numériques et textuelles.
+
+    Args:
+        buffer (mmap.mmap): Le contenu de l'instantané (voir open_snapshot).
+
+    Returns:
+        tuple: (pd.DataFrame avec les mêmes colonnes et les mêmes types que lors de l'écriture, empreintes des
+        enregistrements ou None si elles n'ont pas été écrites).
+    """
+    header = get_header(buffer)
+    data_start = PREAMBLE.size + PREAMBLE.unpack_from(buffer, 0)[2]
+    data, record_hashes = {}, None
+    for column in header["columns"]:
+        values = decode_column(buffer, {**column, "offset": data_start + column["offset"]}, header["rows"])
+        if column["name"] is None:
+            record_hashes = values
+        else:
+            data[column["name"]] = values
+    return pd.DataFrame(data, columns=list(data)), record_hashes
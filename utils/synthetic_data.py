@@ -0,0 +1,315 @@
+import string
+
+import numpy as np
+import pandas as pd
+from faker.providers.person.fr_FR import Provider as PersonProvider
+
+from utils.tournament_simulator import generate_pairs_batch, play_matches, skip_repeated_boards
+
+# Réservoirs de valeurs tirées au hasard (les prénoms et noms viennent de Faker, sans appel par joueur)
+FIRST_NAMES = np.array(PersonProvider.first_names)
+LAST_NAMES = np.array(PersonProvider.last_names)
+CITIES = np.array([
+    "Paris", "Marseille", "Lyon", "Toulouse", "Nice", "Nantes", "Montpellier", "Strasbourg", "Bordeaux", "Lille",
+    "Rennes", "Reims", "Toulon", "Saint-Étienne", "Le Havre", "Grenoble", "Dijon", "Angers", "Nîmes",
+    "Clermont-Ferrand", "Aix-en-Provence", "Brest", "Tours", "Amiens", "Limoges", "Annecy", "Perpignan", "Metz",
+    "Besançon", "Orléans",
+    "Rouen", "Mulhouse", "Caen", "Nancy", "Avignon", "Poitiers", "La Rochelle", "Pau", "Calais", "Ajaccio",
+])
+TOURNAMENT_NAMES = np.array([
+    "Tournoi des Maîtres", "Championnat des Échecs", "Open d'Échecs", "Coupe des Stratèges", "Grand Prix des Échecs",
+    "Festival des Échecs", "Rencontre des Grands Maîtres", "Tournoi International d'Échecs", "Challenge des Échecs",
+    "Olympiade des Échecs",
+])
+DESCRIPTIONS = np.array([
+    "Un tournoi prestigieux pour les meilleurs joueurs d'échecs.",
+    "Une compétition intense réunissant des passionnés d'échecs du monde entier.",
+    "Un événement annuel où se confrontent les stratèges les plus talentueux.",
+    "Un tournoi international d'échecs avec des participants de haut niveau.",
+    "Un rendez-vous incontournable pour les amateurs et professionnels des échecs.",
+    "Un défi épique pour couronner le meilleur joueur d'échecs.",
+    "Une compétition féroce avec des prix prestigieux à gagner.",
+    "Un tournoi d'échecs où l'intelligence et la stratégie priment.",
+    "Une rencontre d'échecs avec des parties captivantes et intenses.",
+    "Un événement majeur dans le monde des échecs, attirant des talents de tous horizons.",
+])
+PLAYER_COLUMNS = ["first_name", "last_name", "birth_date", "national_id", "career_score"]
+# Identifiants au format 'AB1234' : 26 x 26 paires de lettres x 10 000 numéros
+LETTER_PAIRS = np.array([first + second for first in string.ascii_uppercase for second in string.ascii_uppercase])
+NATIONAL_ID_COUNT = len(LETTER_PAIRS) * 10_000
+TOURNAMENT_SIZES = np.array([8, 12, 16, 24, 32])
+DEFAULT_REFERENCE_DATE = "2024-06-01"
+
+
+def generate_national_ids(count, rng, existing_ids=()):
+    """
+    Tire count identifiants nationaux uniques au format 'AB1234', différents des identifiants existants.
+
+    Raises:
+        ValueError: S'il ne reste pas assez d'identifiants libres.
+    """
+    existing_numbers = np.array(
+        [LETTER_PAIRS.searchsorted(national_id[:2]) * 10_000 + int(national_id[2:]) for national_id in existing_ids],
+        dtype=np.int64,
+    )
+    if count > NATIONAL_ID_COUNT - len(existing_numbers):
+        raise ValueError(
+            f"Impossible de générer {count} identifiants nationaux uniques (maximum {NATIONAL_ID_COUNT})."
+        )
+
+    # Tirage sans remise : aucun doublon possible
+    numbers = rng.choice(NATIONAL_ID_COUNT, size=count + len(existing_numbers), replace=False)
+    numbers = numbers[~np.isin(numbers, existing_numbers)][:count]
+    return (
+        pd.Series(LETTER_PAIRS[numbers // 10_000]) + pd.Series(numbers % 10_000).astype(str).str.zfill(4)
+    ).to_numpy()
+
+
+# Position des caractères de 'AAAA-MM-JJ' dans 'JJ-MM-AAAA'
+DAY_FIRST_ORDER = [8, 9, 7, 5, 6, 4, 0, 1, 2, 3]
+
+
+def format_dates(dates, day_first=False):
+    """
+    Formate des dates numpy en 'AAAA-MM-JJ' (ou 'JJ-MM-AAAA'), sans strftime ligne par ligne.
+    """
+    iso_dates = np.asarray(dates, dtype="datetime64[D]").astype("U10")
+    if not day_first:
+        return iso_dates
+    # On réordonne les caractères de chaque date
+    return np.ascontiguousarray(iso_dates.view("U1").reshape(-1, 10)[:, DAY_FIRST_ORDER]).view("U10").ravel()
+
+
+def generate_players(count, seed=0, existing_ids=(), reference_date=DEFAULT_REFERENCE_DATE):
+    """
+    Génère des joueurs fictifs par tirages vectorisés (plusieurs millions en quelques secondes).
+
+    Args:
+        count (int): Le nombre de joueurs.
+        seed (int): Graine du générateur aléatoire : la même graine donne toujours les mêmes joueurs.
+        existing_ids (iterable): Identifiants nationaux déjà utilisés, à ne pas générer.
+        reference_date (str): Date ('AAAA-MM-JJ') à partir de laquelle l'âge des joueurs (10 à 90 ans) est calculé.
+
+    Returns:
+        pd.DataFrame: Les joueurs, avec les colonnes du fichier datas/players.json.
+    """
+    rng = np.random.default_rng(seed)
+    birth_dates = np.datetime64(reference_date) - rng.integers(10 * 365, 90 * 365, count).astype("timedelta64[D]")
+    return pd.DataFrame(
+        {
+            "first_name": FIRST_NAMES[rng.integers(0, len(FIRST_NAMES), count)],
+            "last_name": LAST_NAMES[rng.integers(0, len(LAST_NAMES), count)],
+            "birth_date": format_dates(birth_dates, day_first=True),
+            "national_id": generate_national_ids(count, rng, existing_ids),
+            "career_score": np.zeros(count),
+        },
+        columns=PLAYER_COLUMNS,
+    )
+
+
+def generate_ratings(players_count, seed=0):
+    """
+    Force cachée (type Elo) de chaque joueur, utilisée pour tirer des résultats réalistes.
+    """
+    return np.random.default_rng([seed, 1]).normal(1500, 250, players_count)
+
+
+def sample_participants(rng, players_count, groups, size):
+    """
+    Tire size joueurs distincts pour chacun des groups tournois.
+
+    Returns:
+        np.ndarray: Les indices des joueurs, de forme (groups, size).
+    """
+    participants = rng.integers(0, players_count, (groups, size))
+    sorted_participants = np.sort(participants, axis=1)
+    # Les tournois ayant tiré deux fois le même joueur (rare avec beaucoup de joueurs) sont tirés à nouveau
+    for row in np.flatnonzero((np.diff(sorted_participants, axis=1) == 0).any(axis=1)):
+        participants[row] = rng.choice(players_count, size, replace=False)
+    return participants
+
+
+def unique_names(names, existing_names=()):
+    # On ajoute un numéro aux noms en double (" #2", " #3"...), y compris par rapport aux tournois existants
+    taken = set(existing_names)
+    result = []
+    for name in names:
+        candidate, number = name, 1
+        while candidate in taken:
+            number += 1
+            candidate = f"{name} #{number}"
+        taken.add(candidate)
+        result.append(candidate)
+    return result
+
+
+def generate_tournaments(players_df, count, seed=0, existing_names=(), reference_date=DEFAULT_REFERENCE_DATE,
+                         years=3, ongoing_rate=0.05, not_started_rate=0.05):
+    """
+    Génère des tournois fictifs avec leurs joueurs et leurs rounds déjà joués.
+
+    Les appariements reproduisent Tournament.generate_pairs et les résultats sont tirés à partir d'une force
+    cachée des joueurs ; tous les tournois de même taille sont simulés ensemble avec NumPy.
+
+    Args:
+        players_df (pd.DataFrame): Les joueurs pouvant participer.
+        count (int): Le nombre de tournois.
+        seed (int): Graine du générateur aléatoire.
+        existing_names (iterable): Noms de tournois déjà utilisés.
+        reference_date (str): Date ('AAAA-MM-JJ') de fin de la période couverte par les tournois.
+        years (int): Nombre d'années couvertes par les tournois.
+        ongoing_rate (float): Part des tournois en cours (derniers rounds non joués, dernier round incomplet).
+        not_started_rate (float): Part des tournois non commencés (joueurs inscrits, aucun round).
+
+    Returns:
+        tuple: (liste des tournois au format de datas/tournaments.json, points gagnés par chaque joueur de
+        players_df sous forme de np.ndarray).
+    """
+    rng = np.random.default_rng([seed, 2])
+    players_count = len(players_df)
+    national_ids = players_df["national_id"].to_numpy() if players_count else np.array([], dtype=object)
+    ratings = generate_ratings(players_count, seed)
+    career_points = np.zeros(players_count)
+
+    rounds_counts = rng.integers(4, 8, count)
+    sizes = np.minimum(TOURNAMENT_SIZES[rng.integers(0, len(TOURNAMENT_SIZES), count)], players_count)
+    # Un tournoi nécessite au moins rounds_count + 1 joueurs, sinon il reste sans joueur
+    sizes = np.where(sizes >= rounds_counts + 1, sizes, 0)
+    start_dates = np.datetime64(reference_date) - rng.integers(0, years * 365, count).astype("timedelta64[D]")
+    durations = rng.integers(1, 8, count)
+    status_draws = rng.random(count)
+    played_rounds = np.where(status_draws < not_started_rate, 0, rounds_counts)
+    is_ongoing = (status_draws >= not_started_rate) & (status_draws < not_started_rate + ongoing_rate)
+    played_rounds = np.where(is_ongoing, rng.integers(1, rounds_counts + 1), played_rounds)
+    played_rounds = np.where(sizes > 0, played_rounds, 0)
+
+    names = unique_names(
+        [
+            f"{name} de {city} {year}"
+            for name, city, year in zip(
+                TOURNAMENT_NAMES[rng.integers(0, len(TOURNAMENT_NAMES), count)],
+                CITIES[rng.integers(0, len(CITIES), count)],
+                pd.DatetimeIndex(start_dates).year,
+            )
+        ],
+        existing_names,
+    )
+    locations = CITIES[rng.integers(0, len(CITIES), count)]
+    descriptions = DESCRIPTIONS[rng.integers(0, len(DESCRIPTIONS), count)]
+    start_strings = format_dates(start_dates)
+    end_strings = format_dates(start_dates + durations.astype("timedelta64[D]"))
+
+    tournaments = [
+        {
+            "name": names[i],
+            "location": locations[i],
+            "start_date": start_strings[i],
+            "end_date": end_strings[i],
+            "description": descriptions[i],
+            "rounds_count": int(rounds_counts[i]),
+            "current_round": 0,
+            "rounds": [],
+            "players": [],
+            "version": 0,
+        }
+        for i in range(count)
+    ]
+
+    # Tous les tournois d'une même taille sont simulés ensemble
+    for size in np.unique(sizes[sizes > 0]):
+        indices = np.flatnonzero(sizes == size)
+        participants = sample_participants(rng, players_count, len(indices), size)
+        group_ratings = ratings[participants]
+        scores = np.zeros((len(indices), size))
+        played = np.zeros((len(indices), size, size), dtype=bool)
+        order = np.repeat(np.arange(size)[None, :], len(indices), axis=0)
+        group_rounds = played_rounds[indices]
+        results = []
+
+        for round_number in range(int(group_rounds.max())):
+            active = np.flatnonzero(group_rounds > round_number)
+            round_order, first_players, second_players, valid = generate_pairs_batch(
+                order[active], scores[active], played[active]
+            )
+            valid = skip_repeated_boards(first_players, second_players, valid)
+            # Dernier round d'un tournoi en cours : seuls les premiers échiquiers ont un résultat
+            last_ongoing = is_ongoing[indices[active]] & (group_rounds[active] == round_number + 1)
+            entered_boards = rng.integers(0, valid.sum(axis=1) + 1)
+            valid &= ~last_ongoing[:, None] | (np.arange(valid.shape[1])[None, :] < entered_boards[:, None])
+
+            active_scores, active_played = scores[active], played[active]
+            first_scores = play_matches(
+                first_players, second_players, valid, group_ratings[active], active_scores, active_played, rng,
+                400.0, 0.3,
+            )
+            scores[active], played[active], order[active] = active_scores, active_played, round_order
+            results.append((active, first_players, second_players, valid, first_scores, last_ongoing))
+
+        np.add.at(career_points, participants, scores)
+        build_tournament_rounds(tournaments, indices, participants, national_ids, scores, order, results, rng)
+        for row, tournament_index in enumerate(indices):
+            tournaments[tournament_index]["current_round"] = int(group_rounds[row])
+
+    return tournaments, career_points
+
+
+def build_tournament_rounds(tournaments, indices, participants, national_ids, scores, order, results, rng):
+    """
+    Convertit les tableaux de la simulation en joueurs et rounds au format de datas/tournaments.json.
+    """
+    for row, tournament_index in enumerate(indices):
+        tournament = tournaments[tournament_index]
+        # Ordre des joueurs laissé par le dernier appel à generate_pairs, comme dans l'application
+        tournament["players"] = [
+            {"national_id": national_ids[participants[row, player]], "career_score": float(scores[row, player])}
+            for player in order[row]
+        ]
+
+    round_starts = {}
+    for round_number, (active, first_players, second_players, valid, first_scores, last_ongoing) in enumerate(
+        results
+    ):
+        durations = rng.integers(45, 180, len(active))
+        for position, row in enumerate(active):
+            tournament = tournaments[indices[row]]
+            ids = national_ids[participants[row]]
+            if round_number == 0:
+                # Premier round à 9 h (UTC) le jour du début du tournoi
+                round_starts[row] = int(np.datetime64(tournament["start_date"], "s").astype(np.int64)) + 9 * 3600
+            start_time = round_starts[row]
+            end_time = start_time + int(durations[position]) * 60
+            round_starts[row] = end_time + 30 * 60
+            tournament["rounds"].append(
+                {
+                    "name": f"Round {round_number + 1}",
+                    "matches": [
+                        {
+                            "player1": {"id": ids[first], "score_match": float(score)},
+                            "player2": {"id": ids[second], "score_match": float(1.0 - score)},
+                        }
+                        for first, second, is_valid, score in zip(
+                            first_players[position], second_players[position], valid[position],
+                            first_scores[position],
+                        )
+                        if is_valid
+                    ],
+                    "start_time": start_time,
+                    "end_time": None if last_ongoing[position] else end_time,
+                }
+            )
+
+
+def generate_dataset(players_count, tournaments_count, seed=0, reference_date=DEFAULT_REFERENCE_DATE):
+    """
+    Génère un jeu de données complet et cohérent : le score de carrière de chaque joueur est la somme des points
+    gagnés dans les tournois générés.
+
+    Returns:
+        tuple: (DataFrame des joueurs, liste des tournois).
+    """
+    players_df = generate_players(players_count, seed, reference_date=reference_date)
+    tournaments, career_points = generate_tournaments(
+        players_df, tournaments_count, seed, reference_date=reference_date
+    )
+    players_df["career_score"] = career_points
+    return players_df, tournaments
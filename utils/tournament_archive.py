@@ -0,0 +1,264 @@
+import gzip
+import json
+import lzma
+import os
+import tempfile
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.file_lock import file_lock
+from utils.migrations import SCHEMA_VERSIONS, get_schema_version, migrate_file, set_schema_version
+from utils.utils import format_date, get_tournament_status
+
+# Extension et fonction d'ouverture de chaque format de compression des archives
+COMPRESSIONS = {"gzip": (".json.gz", gzip.open), "lzma": (".json.xz", lzma.open)}
+# Colonnes de l'index : de quoi lister et rechercher les tournois archivés sans ouvrir les archives
+HEADER_COLUMNS = [
+    "name",
+    "location",
+    "start_date",
+    "end_date",
+    "description",
+    "rounds_count",
+    "current_round",
+    "rounds_played",
+    "players_count",
+    "version",
+    "season",
+    "archive",
+]
+
+
+def get_tournament_headers(tournaments_df):
+    """
+    Résume les tournois (sans leurs rounds ni leurs joueurs) avec les colonnes de l'index des archives.
+
+    Args:
+        tournaments_df (pd.DataFrame): Les tournois complets.
+
+    Returns:
+        pd.DataFrame: Une ligne par tournoi, la colonne archive valant None.
+    """
+    headers = [
+        {
+            "name": tournament["name"],
+            "location": tournament["location"],
+            "start_date": format_date(tournament["start_date"]),
+            "end_date": format_date(tournament["end_date"]),
+            "description": tournament["description"],
+            "rounds_count": tournament["rounds_count"],
+            "current_round": tournament["current_round"],
+            "rounds_played": len(tournament["rounds"]),
+            "players_count": len(tournament["players"]),
+            "version": tournament.get("version", 0),
+            "season": get_season(tournament),
+            "archive": None,
+        }
+        for tournament in tournaments_df.to_dict(orient="records")
+    ]
+    return pd.DataFrame(headers, columns=HEADER_COLUMNS)
+
+
+def get_season(tournament):
+    # Une saison par année de début du tournoi
+    return format_date(tournament["start_date"])[:4]
+
+
+class TournamentArchive:
+    """
+    Archives compressées des tournois terminés, une par saison, avec un index de leurs en-têtes.
+
+    Le fichier datas/tournaments.json ne garde que les tournois en cours ou à venir : il reste petit, donc rapide
+    à charger et à sauvegarder. L'index (index.json) permet de lister et de rechercher les tournois archivés ;
+    le contenu complet d'un tournoi (rounds, joueurs) n'est décompressé que lorsqu'un rapport le demande.
+
+    Attributs:
+        directory (str): Dossier des archives.
+        compression (str): Format des nouvelles archives ("gzip" ou "lzma").
+        max_cached_seasons (int): Nombre de saisons décompressées gardées en mémoire.
+    """
+
+    def __init__(self, directory="datas/archives", compression="gzip", max_cached_seasons=4):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Compression inconnue : {compression} (formats : {', '.join(COMPRESSIONS)}).")
+        self.directory = directory
+        self.compression = compression
+        self.max_cached_seasons = max_cached_seasons
+        self.index_path = os.path.join(directory, "index.json")
+        self.index_cache = (None, [])
+        self.season_cache = OrderedDict()
+
+    def get_file_version(self, file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def load_index(self):
+        """
+        Retourne les en-têtes des tournois archivés (relus seulement si l'index a changé sur le disque).
+
+        Returns:
+            list: La liste des en-têtes (dictionnaires avec les colonnes HEADER_COLUMNS).
+        """
+        version = self.get_file_version(self.index_path)
+        if version is None:
+            return []
+        if version != self.index_cache[0]:
+            with open(self.index_path, encoding="utf-8") as file:
+                self.index_cache = (version, json.load(file))
+        return self.index_cache[1]
+
+    def get_headers(self):
+        """
+        Retourne les en-têtes des tournois archivés sous forme de DataFrame.
+        """
+        return pd.DataFrame(self.load_index(), columns=HEADER_COLUMNS)
+
+    def load_season(self, archive_name):
+        """
+        Décompresse une archive de saison (gardée en cache tant que le fichier ne change pas).
+
+        Returns:
+            dict: Dictionnaire {nom du tournoi: tournoi complet}.
+        """
+        file_path = os.path.join(self.directory, archive_name)
+        version = self.get_file_version(file_path)
+        cached = self.season_cache.get(archive_name)
+        if cached is not None and cached[0] == version:
+            self.season_cache.move_to_end(archive_name)
+            return cached[1]
+        if version is None:
+            return {}
+        if get_schema_version(file_path) != SCHEMA_VERSIONS["tournaments"]:
+            # Archive écrite avec une version plus ancienne du schéma des tournois
+            migrate_file(file_path, "tournaments")
+            version = self.get_file_version(file_path)
+
+        open_archive = next(opener for extension, opener in COMPRESSIONS.values() if archive_name.endswith(extension))
+        with open_archive(file_path, "rt", encoding="utf-8") as file:
+            tournaments = {tournament["name"]: tournament for tournament in json.load(file)}
+        self.season_cache[archive_name] = (version, tournaments)
+        while len(self.season_cache) > self.max_cached_seasons:
+            self.season_cache.popitem(last=False)
+        return tournaments
+
+    def load_tournament(self, name):
+        """
+        Charge le contenu complet d'un tournoi archivé.
+
+        Args:
+            name (str): Le nom du tournoi.
+
+        Returns:
+            dict: Le tournoi au format de datas/tournaments.json, ou None s'il n'est pas archivé.
+        """
+        header = next((header for header in self.load_index() if header["name"] == name), None)
+        if header is None:
+            return None
+        return self.load_season(header["archive"]).get(name)
+
+    def iter_tournaments(self):
+        """
+        Parcourt le contenu complet de tous les tournois archivés (toutes les archives sont décompressées).
+        """
+        for archive_name in dict.fromkeys(header["archive"] for header in self.load_index()):
+            yield from self.load_season(archive_name).values()
+
+    def archive_tournaments(self, tournaments):
+        """
+        Ajoute des tournois aux archives de leur saison (un tournoi déjà archivé est remplacé) et met l'index à jour.
+
+        Args:
+            tournaments (list): Les tournois complets (dictionnaires) à archiver.
+        """
+        if not tournaments:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with file_lock(self.index_path):
+            headers = {header["name"]: header for header in self.load_index()}
+            # Une saison déjà archivée garde le format de son fichier
+            season_archives = {header["season"]: header["archive"] for header in headers.values()}
+            by_season = {}
+            for tournament in tournaments:
+                by_season.setdefault(get_season(tournament), []).append(tournament)
+
+            for season, season_tournaments in sorted(by_season.items()):
+                extension = COMPRESSIONS[self.compression][0]
+                archive_name = season_archives.get(season, f"tournaments_{season}{extension}")
+                archived = dict(self.load_season(archive_name))
+                for tournament in season_tournaments:
+                    archived[tournament["name"]] = tournament
+                self.write_season(archive_name, list(archived.values()))
+
+                season_headers = get_tournament_headers(pd.DataFrame(season_tournaments))
+                for header in season_headers.to_dict(orient="records"):
+                    header["archive"] = archive_name
+                    headers[header["name"]] = header
+
+            self.write_file(self.index_path, json.dumps(list(headers.values()), indent=4, ensure_ascii=False))
+
+    def write_season(self, archive_name, tournaments):
+        open_archive = next(opener for extension, opener in COMPRESSIONS.values() if archive_name.endswith(extension))
+        file_path = os.path.join(self.directory, archive_name)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(file_descriptor)
+        try:
+            with open_archive(temp_path, "wt", encoding="utf-8") as file:
+                json.dump(tournaments, file, ensure_ascii=False)
+            os.replace(temp_path, file_path)
+            set_schema_version(file_path, SCHEMA_VERSIONS["tournaments"])
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def write_file(self, file_path, text):
+        # Fichier temporaire puis renommage : un lecteur ne voit jamais un index à moitié écrit
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(temp_path, file_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def archive_finished_tournaments(tournament_data_manager, archive):
+    """
+    Déplace les tournois terminés du fichier des tournois vers les archives compressées.
+
+    Les tournois sont d'abord écrits dans les archives, puis retirés du fichier des tournois (la suppression est
+    fusionnée avec les modifications éventuelles d'un autre terminal).
+
+    Args:
+        tournament_data_manager (TournamentDataManager): Le gestionnaire du fichier des tournois.
+        archive (TournamentArchive): Les archives.
+
+    Returns:
+        list: Les noms des tournois archivés.
+    """
+    tournament_data_manager.refresh()
+    tournaments_df = tournament_data_manager.get_data()
+    if tournaments_df.empty:
+        return []
+
+    is_finished = pd.Series(
+        [
+            get_tournament_status(tournament.current_round, tournament.rounds_count, tournament.rounds) == "finished"
+            for tournament in tournaments_df.itertuples(index=False)
+        ],
+        index=tournaments_df.index,
+        dtype=bool,
+    )
+    finished = tournament_data_manager.to_records(tournaments_df[is_finished])
+    if not finished:
+        return []
+
+    archive.archive_tournaments(finished)
+    tournament_data_manager.set_data(tournaments_df[~is_finished].reset_index(drop=True))
+    return [tournament["name"] for tournament in finished]
@@ -0,0 +1,115 @@
+import os
+from collections import OrderedDict
+
+from utils.metrics import metrics
+
+# Taille approximative en mémoire (octets, mesurée avec sys.getsizeof) des objets d'un tournoi chargé
+TOURNAMENT_BYTES = 2300
+PLAYER_BYTES = 300
+ROUND_BYTES = 450
+MATCH_BYTES = 280
+
+
+def estimate_size(tournament):
+    """
+    Estime la place occupée en mémoire par un tournoi chargé (objets Tournament, Player, Round et Match).
+
+    Args:
+        tournament (Tournament): Le tournoi.
+
+    Returns:
+        int: La taille estimée, en octets.
+    """
+    matches_count = sum(len(round_.matches) for round_ in tournament.rounds)
+    return (
+        TOURNAMENT_BYTES
+        + PLAYER_BYTES * len(tournament.players)
+        + ROUND_BYTES * len(tournament.rounds)
+        + MATCH_BYTES * matches_count
+    )
+
+
+class TournamentCache:
+    """
+    Cache des tournois chargés (objets Tournament), limité par un budget mémoire : les tournois utilisés le moins
+    récemment sont retirés en premier.
+
+    Chaque tournoi est gardé avec l'empreinte de son enregistrement (voir DataManager.get_record_hash) : il n'est
+    réutilisé que tant que l'enregistrement n'a pas changé, par exemple après une fusion avec les modifications
+    d'un autre terminal.
+
+    Les objets renvoyés sont partagés : ils ne doivent être modifiés que pour être aussitôt enregistrés (voir
+    TournamentController.update_tournament, qui remet le tournoi enregistré dans le cache).
+
+    Attributs:
+        max_bytes (int): Budget mémoire du cache, en octets (0 pour ne rien garder).
+        entries (OrderedDict): {nom du tournoi: (empreinte, tournoi, taille estimée)}, du moins récent au plus
+            récent.
+        size (int): Taille estimée de tous les tournois du cache.
+    """
+
+    # Budget par défaut : variable d'environnement CHESS_TOURNAMENT_CACHE_MB ou option --tournament-cache-mb
+    max_bytes = int(float(os.environ.get("CHESS_TOURNAMENT_CACHE_MB", "64")) * 1024 * 1024)
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+
+    def get(self, name, record_hash, build):
+        """
+        Retourne le tournoi du cache s'il correspond à l'enregistrement, sinon le construit et l'ajoute au cache.
+
+        Args:
+            name (str): Le nom du tournoi.
+            record_hash (int): L'empreinte actuelle de son enregistrement (None si elle est inconnue : le tournoi
+                est alors construit sans être gardé).
+            build (callable): Fonction sans paramètre construisant le tournoi (ex : Tournament.from_dict).
+
+        Returns:
+            Tournament: Le tournoi.
+        """
+        entry = self.entries.get(name)
+        if entry is not None and record_hash is not None and entry[0] == record_hash:
+            self.entries.move_to_end(name)
+            metrics.increment("tournament_cache_hits_total")
+            return entry[1]
+        metrics.increment("tournament_cache_misses_total")
+        tournament = build()
+        self.put(tournament, record_hash)
+        return tournament
+
+    def put(self, tournament, record_hash):
+        """
+        Ajoute (ou remplace) un tournoi dans le cache, puis retire les moins récents au-delà du budget mémoire.
+
+        Args:
+            tournament (Tournament): Le tournoi, tel qu'enregistré.
+            record_hash (int): L'empreinte de son enregistrement (None pour le retirer du cache).
+        """
+        self.discard(tournament.name)
+        if record_hash is None:
+            return
+        size = estimate_size(tournament)
+        if size > self.max_bytes:
+            # Un tournoi plus grand que tout le budget n'est pas gardé
+            return
+        self.entries[tournament.name] = (record_hash, tournament, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+            metrics.increment("tournament_cache_evictions_total")
+        metrics.set_gauge("tournament_cache_bytes", self.size)
+
+    def discard(self, name):
+        entry = self.entries.pop(name, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from utils.metrics import count_scan
+from utils.utils import get_tournament_status
+
+# Statuts d'un tournoi (voir utils.utils.get_tournament_status), dans l'ordre de son avancement
+STATUSES = ["not_started", "ongoing", "finished"]
+STATUS_LABELS = {"not_started": "Pas encore commencé", "ongoing": "En cours", "finished": "Terminé"}
+
+
+def get_tournament_statuses(tournaments_df):
+    """
+    Calcule le statut de chaque tournoi (une seule fois, voir TournamentIndex).
+
+    Returns:
+        list: Le statut de chaque ligne de tournaments_df ("not_started", "ongoing" ou "finished").
+    """
+    return [
+        get_tournament_status(tournament.current_round, tournament.rounds_count, tournament.rounds)
+        for tournament in tournaments_df[["current_round", "rounds_count", "rounds"]].itertuples(index=False)
+    ]
+
+
+class TournamentIndex:
+    """
+    Index des tournois par dates, lieu et statut.
+
+    Les dates de début et de fin sont triées une seule fois : une recherche par période est une recherche
+    dichotomique dans chacune d'elles. Les positions des tournois de chaque lieu et de chaque statut sont
+    regroupées d'avance. Une recherche ne parcourt donc que les tournois candidats, et non toute la table.
+
+    L'index correspond à une version de la table des tournois : il est reconstruit lorsque celle-ci est
+    remplacée (voir TournamentController.get_tournament_index).
+
+    Attributs:
+        tournaments_df (pd.DataFrame): Les tournois indexés.
+        statuses (pd.Categorical): Le statut de chaque tournoi (catégories STATUSES).
+        start_dates (np.ndarray): Les dates de début connues, triées.
+        start_order (np.ndarray): Les positions des tournois, dans l'ordre de start_dates.
+        end_dates (np.ndarray): Les dates de fin connues, triées.
+        end_order (np.ndarray): Les positions des tournois, dans l'ordre de end_dates.
+        locations (dict): Dictionnaire {lieu en minuscules: positions des tournois de ce lieu}.
+        location_names (list): Les lieux des tournois, triés.
+    """
+
+    def __init__(self, tournaments_df, statuses=None):
+        """
+        Args:
+            tournaments_df (pd.DataFrame): Les tournois (au moins les colonnes location, start_date et end_date,
+                ainsi que current_round, rounds_count et rounds si statuses n'est pas donné).
+            statuses (list): Le statut de chaque tournoi, s'il est déjà connu (ex : tournois archivés, tous
+                terminés).
+        """
+        self.tournaments_df = tournaments_df
+        # Seule la construction de l'index parcourt la table, pas les recherches
+        count_scan("tournaments", len(tournaments_df), "tournament_index")
+        if statuses is None:
+            statuses = get_tournament_statuses(tournaments_df)
+        self.statuses = pd.Categorical(statuses, categories=STATUSES)
+        self.status_positions = {
+            status: np.flatnonzero(self.statuses.codes == code) for code, status in enumerate(STATUSES)
+        }
+
+        self.start_dates, self.start_order = self.sort_dates(tournaments_df["start_date"])
+        self.end_dates, self.end_order = self.sort_dates(tournaments_df["end_date"])
+        # Rang de chaque tournoi dans l'ordre des dates de début, pour trier les résultats sans comparer de dates
+        self.start_ranks = np.full(len(tournaments_df), len(tournaments_df), dtype=np.int64)
+        self.start_ranks[self.start_order] = np.arange(len(self.start_order))
+
+        locations = tournaments_df["location"].astype(str).str.strip()
+        location_keys = locations.str.casefold().to_numpy()
+        self.locations = locations.groupby(location_keys, sort=False).indices
+        # Un seul nom par lieu, quelle que soit la casse saisie
+        self.location_names = sorted(locations.groupby(location_keys, sort=False).first(), key=str.casefold)
+
+    def __len__(self):
+        return len(self.tournaments_df)
+
+    @staticmethod
+    def sort_dates(dates):
+        # Les dates illisibles (fichier modifié à la main) ne sont pas indexées
+        dates = pd.to_datetime(dates, errors="coerce").to_numpy(dtype="datetime64[ns]")
+        known = np.flatnonzero(~np.isnat(dates))
+        order = known[np.argsort(dates[known], kind="stable")]
+        return dates[order], order
+
+    def query(self, start=None, end=None, location=None, status=None):
+        """
+        Retourne les positions des tournois qui répondent à tous les critères donnés.
+
+        Args:
+            start (str): Début de la période ('AAAA-MM-JJ') : seuls les tournois finissant ce jour-là ou après.
+            end (str): Fin de la période ('AAAA-MM-JJ', incluse) : seuls les tournois commençant au plus tard ce
+                jour-là.
+            location (str): Le lieu (sans tenir compte des majuscules).
+            status (str | list): Un statut ou une liste de statuts (voir STATUSES).
+
+        Returns:
+            np.ndarray: Les positions des tournois dans tournaments_df, triées par date de début.
+        """
+        candidates = []
+        if end is not None:
+            last = np.searchsorted(self.start_dates, np.datetime64(end, "ns"), side="right")
+            candidates.append(self.start_order[:last])
+        if start is not None:
+            first = np.searchsorted(self.end_dates, np.datetime64(start, "ns"), side="left")
+            candidates.append(self.end_order[first:])
+        if location is not None:
+            candidates.append(self.locations.get(location.strip().casefold(), np.array([], dtype=np.int64)))
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else status
+            candidates.append(np.concatenate([self.status_positions[name] for name in statuses]))
+
+        if not candidates:
+            # Tous les tournois, ceux dont la date de début est illisible en dernier
+            return np.argsort(self.start_ranks, kind="stable")
+        # On part des plus petits ensembles de candidats
+        candidates.sort(key=len)
+        positions = candidates[0]
+        for other in candidates[1:]:
+            positions = np.intersect1d(positions, other, assume_unique=True)
+        return positions[np.argsort(self.start_ranks[positions], kind="stable")]
+
+    def filter(self, **criteria):
+        """
+        Retourne les tournois qui répondent aux critères de query, triés par date de début.
+
+        Returns:
+            pd.DataFrame: Les tournois, avec leur statut dans la colonne status.
+        """
+        positions = self.query(**criteria)
+        return self.tournaments_df.iloc[positions].assign(status=np.asarray(self.statuses)[positions])
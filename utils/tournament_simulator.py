@@ -0,0 +1,326 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from models.tournament import Tournament
+
+# Nombre maximum de cases des matrices (simulations x joueurs x joueurs) traitées en une fois
+BATCH_CELLS = 2_000_000
+
+
+def build_simulation_state(tournament, ratings=None):
+    """
+    Extrait d'un tournoi en cours les tableaux NumPy nécessaires à la simulation.
+
+    Args:
+        tournament (Tournament): Le tournoi (il n'est pas modifié).
+        ratings (dict): Dictionnaire {identifiant national: force du joueur}. Par défaut, le score actuel du joueur
+            dans le tournoi (l'application ne stocke pas de classement Elo).
+
+    Returns:
+        dict: L'état initial (identifiants, scores, forces, matchs déjà joués, matchs restants du round en cours
+        et nombre de rounds à venir).
+    """
+    # On travaille sur une copie : generate_pairs trie la liste des joueurs du tournoi
+    tournament = Tournament.from_dict(tournament.to_dict())
+
+    pending_pairs = []
+    future_rounds = tournament.rounds_count - tournament.current_round
+    if tournament.rounds and tournament.rounds[-1].end_time is None:
+        played_ids = {match.player1_id for match in tournament.rounds[-1].matches}
+        pending_pairs = [
+            (player1.national_id, player2.national_id)
+            for player1, player2 in tournament.generate_round_pairs()
+            if player1.national_id not in played_ids
+        ]
+    elif not tournament.rounds:
+        future_rounds = tournament.rounds_count
+
+    national_ids = [player.national_id for player in tournament.players]
+    index = {national_id: i for i, national_id in enumerate(national_ids)}
+    scores = np.array([float(player.career_score) for player in tournament.players])
+    if ratings is None:
+        player_ratings = scores.copy()
+    else:
+        player_ratings = np.array([float(ratings.get(national_id, 0.0)) for national_id in national_ids])
+
+    played = np.zeros((len(national_ids), len(national_ids)), dtype=bool)
+    for round_ in tournament.rounds:
+        for match in round_.matches:
+            if match.player1_id in index and match.player2_id in index:
+                played[index[match.player1_id], index[match.player2_id]] = True
+                played[index[match.player2_id], index[match.player1_id]] = True
+
+    return {
+        "national_ids": national_ids,
+        "scores": scores,
+        "ratings": player_ratings,
+        "played": played,
+        "pending_pairs": np.array(
+            [(index[player1_id], index[player2_id]) for player1_id, player2_id in pending_pairs], dtype=np.int64
+        ).reshape(-1, 2),
+        "future_rounds": max(future_rounds, 0),
+    }
+
+
+def generate_pairs_batch(order, scores, played):
+    """
+    Reproduit Tournament.generate_pairs pour un lot de simulations à la fois.
+
+    Les joueurs sont triés par score décroissant (tri stable, comme list.sort) puis appariés deux par deux ; si deux
+    joueurs se sont déjà affrontés, on cherche plus bas le premier adversaire libre qui n'a pas joué contre le
+    premier joueur.
+
+    Args:
+        order (np.ndarray): Ordre actuel des joueurs de chaque simulation, de forme (simulations, joueurs).
+        scores (np.ndarray): Scores de forme (simulations, joueurs).
+        played (np.ndarray): Matchs déjà joués, de forme (simulations, joueurs, joueurs).
+
+    Returns:
+        tuple: (nouvel ordre, premiers joueurs, seconds joueurs, paires valides), les trois derniers de forme
+        (simulations, joueurs // 2).
+    """
+    simulations, players_count = order.shape
+    rows = np.arange(simulations)
+    keys = -np.take_along_axis(scores, order, axis=1)
+    order = np.take_along_axis(order, np.argsort(keys, axis=1, kind="stable"), axis=1)
+
+    pairs_count = players_count // 2
+    first_players = np.zeros((simulations, pairs_count), dtype=np.int64)
+    second_players = np.zeros((simulations, pairs_count), dtype=np.int64)
+    valid = np.zeros((simulations, pairs_count), dtype=bool)
+    used = np.zeros((simulations, players_count), dtype=bool)
+
+    for pair_index, i in enumerate(range(0, players_count - 1, 2)):
+        player1 = order[:, i]
+        player2 = order[:, i + 1]
+        direct = ~played[rows, player1, player2]
+
+        candidates = order[:, i + 2:]
+        if candidates.shape[1]:
+            available = ~used[rows[:, None], candidates] & ~played[rows[:, None], player1[:, None], candidates]
+            found = available.any(axis=1)
+            alternative = candidates[rows, available.argmax(axis=1)]
+        else:
+            found = np.zeros(simulations, dtype=bool)
+            alternative = player2
+
+        is_valid = direct | found
+        partner = np.where(direct, player2, alternative)
+        first_players[:, pair_index] = player1
+        second_players[:, pair_index] = partner
+        valid[:, pair_index] = is_valid
+        used[rows[is_valid], player1[is_valid]] = True
+        used[rows[is_valid], partner[is_valid]] = True
+
+    return order, first_players, second_players, valid
+
+
+def skip_repeated_boards(first_players, second_players, valid):
+    """
+    Invalide les échiquiers dont un joueur a déjà joué dans le round, comme le fait run_tournament.
+
+    Tournament.generate_pairs peut proposer deux fois le même joueur lorsqu'il a été choisi plus haut comme
+    adversaire de remplacement ; l'application saute alors l'échiquier (affiché "Passé" sur l'écran du round).
+    """
+    valid = valid.copy()
+    rows = np.arange(first_players.shape[0])
+    players_count = int(max(first_players.max(initial=0), second_players.max(initial=0))) + 1
+    used = np.zeros((first_players.shape[0], players_count), dtype=bool)
+    for board in range(first_players.shape[1]):
+        first, second = first_players[:, board], second_players[:, board]
+        valid[:, board] &= ~used[rows, first] & ~used[rows, second]
+        used[rows[valid[:, board]], first[valid[:, board]]] = True
+        used[rows[valid[:, board]], second[valid[:, board]]] = True
+    return valid
+
+
+def play_matches(first_players, second_players, valid, ratings, scores, played, rng, rating_scale, draw_rate):
+    """
+    Tire au hasard les résultats d'un round pour toutes les simulations et met à jour scores et matchs joués.
+
+    Les échiquiers dont un joueur a déjà joué dans le round doivent être invalidés au préalable (voir
+    skip_repeated_boards) : chaque joueur marque au plus une fois par round.
+
+    Le score attendu du premier joueur suit la formule Elo 1 / (1 + 10 ** (-(r1 - r2) / rating_scale)) ; une partie
+    de la probabilité est donnée aux nulles sans changer ce score attendu.
+
+    Args:
+        ratings (np.ndarray): Force des joueurs, de forme (simulations, joueurs).
+
+    Returns:
+        np.ndarray: Le score du premier joueur de chaque paire (0 pour les paires non valides).
+    """
+    simulations = first_players.shape[0]
+    rows = np.broadcast_to(np.arange(simulations)[:, None], first_players.shape)
+
+    first_ratings = np.take_along_axis(ratings, first_players, axis=1)
+    second_ratings = np.take_along_axis(ratings, second_players, axis=1)
+    expected = 1.0 / (1.0 + 10.0 ** (-(first_ratings - second_ratings) / rating_scale))
+    draw = draw_rate * 2.0 * np.minimum(expected, 1.0 - expected)
+    draws = rng.random(first_players.shape)
+    first_scores = np.where(draws < expected - draw / 2, 1.0, np.where(draws < expected + draw / 2, 0.5, 0.0))
+    first_scores = np.where(valid, first_scores, 0.0)
+
+    rows, first_players, second_players = rows[valid], first_players[valid], second_players[valid]
+    valid_scores = first_scores[valid]
+    np.add.at(scores, (rows, first_players), valid_scores)
+    np.add.at(scores, (rows, second_players), 1.0 - valid_scores)
+    played[rows, first_players, second_players] = True
+    played[rows, second_players, first_players] = True
+    return first_scores
+
+
+def simulate_chunk(state, simulations, seed, rating_scale=10.0, draw_rate=0.3):
+    """
+    Simule la fin du tournoi un nombre donné de fois (fonction exécutée dans un processus du pool).
+
+    Returns:
+        tuple: (nombre de fois où chaque joueur a fini à chaque place, de forme (joueurs, joueurs) ;
+        somme des scores finaux de chaque joueur).
+    """
+    rng = np.random.default_rng(seed)
+    players_count = len(state["national_ids"])
+    placements = np.zeros((players_count, players_count), dtype=np.int64)
+    score_sums = np.zeros(players_count)
+    batch_size = max(1, BATCH_CELLS // max(players_count * players_count, 1))
+    pending = state["pending_pairs"]
+    ratings = np.broadcast_to(state["ratings"], (batch_size, players_count))
+
+    done = 0
+    while done < simulations:
+        size = min(batch_size, simulations - done)
+        scores = np.repeat(state["scores"][None, :], size, axis=0)
+        played = np.repeat(state["played"][None, :, :], size, axis=0)
+        order = np.repeat(np.arange(players_count)[None, :], size, axis=0)
+
+        # Fin du round en cours : les paires restantes sont les mêmes pour toutes les simulations
+        if len(pending):
+            first_players = np.repeat(pending[None, :, 0], size, axis=0)
+            second_players = np.repeat(pending[None, :, 1], size, axis=0)
+            valid = skip_repeated_boards(first_players, second_players, np.ones((size, len(pending)), dtype=bool))
+            play_matches(
+                first_players, second_players, valid, ratings[:size], scores, played, rng, rating_scale, draw_rate,
+            )
+
+        for _ in range(state["future_rounds"]):
+            order, first_players, second_players, valid = generate_pairs_batch(order, scores, played)
+            valid = skip_repeated_boards(first_players, second_players, valid)
+            play_matches(
+                first_players, second_players, valid, ratings[:size], scores, played, rng, rating_scale, draw_rate
+            )
+
+        # Place de chaque joueur : 1 + nombre de joueurs ayant strictement plus de points (ex-aequo à la même place)
+        ranks = (scores[:, None, :] > scores[:, :, None]).sum(axis=2)
+        np.add.at(placements, (np.broadcast_to(np.arange(players_count), ranks.shape), ranks), 1)
+        score_sums += scores.sum(axis=0)
+        done += size
+
+    return placements, score_sums
+
+
+def simulate_tournament(tournament, simulations=10_000, seed=None, workers=None, ratings=None, rating_scale=10.0,
+                        draw_rate=0.3):
+    """
+    Estime par la méthode de Monte-Carlo la probabilité de chaque joueur de finir sur le podium.
+
+    Les résultats restants du round en cours puis ceux des rounds suivants sont tirés au hasard à partir de la
+    force des joueurs, et les appariements des rounds suivants sont recalculés avec la même logique que
+    Tournament.generate_pairs. Les simulations sont réparties entre plusieurs processus.
+
+    Args:
+        tournament (Tournament): Le tournoi en cours (il n'est pas modifié).
+        simulations (int): Le nombre de simulations.
+        seed (int): Graine du générateur aléatoire, pour des résultats reproductibles.
+        workers (int): Nombre de processus (par défaut le nombre de processeurs, 1 pour tout faire sur place).
+        ratings (dict): Force de chaque joueur (voir build_simulation_state).
+        rating_scale (float): Écart de force donnant 10 contre 1 au joueur le plus fort.
+        draw_rate (float): Part des parties nulles entre deux joueurs de même force.
+
+    Returns:
+        pd.DataFrame: Une ligne par joueur (national_id, current_score, expected_score, p_first, p_top3), triée par
+        probabilité de podium décroissante. La matrice des probabilités de chaque place est dans attrs["placements"].
+    """
+    state = build_simulation_state(tournament, ratings)
+    players_count = len(state["national_ids"])
+    if players_count == 0:
+        return pd.DataFrame(columns=["national_id", "current_score", "expected_score", "p_first", "p_top3"])
+
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, simulations // 1000 or 1))
+    chunks = [simulations // workers + (1 if i < simulations % workers else 0) for i in range(workers)]
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+
+    if workers == 1:
+        results = [simulate_chunk(state, chunks[0], seeds[0], rating_scale, draw_rate)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    simulate_chunk,
+                    [state] * workers, chunks, seeds, [rating_scale] * workers, [draw_rate] * workers,
+                )
+            )
+
+    placements = sum(result[0] for result in results) / simulations
+    score_sums = sum(result[1] for result in results)
+
+    summary_df = pd.DataFrame(
+        {
+            "national_id": state["national_ids"],
+            "current_score": state["scores"],
+            "expected_score": score_sums / simulations,
+            "p_first": placements[:, 0],
+            "p_top3": placements[:, :3].sum(axis=1),
+        }
+    )
+    order = np.lexsort((-summary_df["expected_score"].to_numpy(), -summary_df["p_top3"].to_numpy()))
+    summary_df = summary_df.iloc[order].reset_index(drop=True)
+    summary_df.attrs["placements"] = placements[order]
+    return summary_df
+
+
+def build_benchmark_tournament(players_count, rounds_count, seed=0):
+    """
+    Construit un tournoi fictif non commencé de players_count joueurs pour mesurer les performances.
+    """
+    rng = np.random.default_rng(seed)
+    tournament = Tournament("Benchmark", "Paris", "2024-01-01", "2024-01-02", "Tournoi fictif", rounds_count)
+    tournament_data = tournament.to_dict()
+    tournament_data["players"] = [
+        {"national_id": f"BM{i:04d}", "career_score": float(score)}
+        for i, score in enumerate(rng.integers(0, 30, players_count))
+    ]
+    return Tournament.from_dict(tournament_data)
+
+
+def benchmark(players_count=32, rounds_count=7, simulations=10_000, workers=None):
+    """
+    Mesure le nombre de simulations par seconde.
+
+    Returns:
+        float: Le nombre de simulations complètes du tournoi par seconde.
+    """
+    tournament = build_benchmark_tournament(players_count, rounds_count)
+    start = time.perf_counter()
+    simulate_tournament(tournament, simulations=simulations, seed=0, workers=workers)
+    return simulations / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesure les performances du simulateur de tournois.")
+    parser.add_argument("--players", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--simulations", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    speed = benchmark(args.players, args.rounds, args.simulations, args.workers)
+    print(
+        f"{args.simulations} simulations ({args.players} joueurs, {args.rounds} rounds) : "
+        f"{speed:,.0f} simulations/seconde"
+    )
@@ -1,5 +1,6 @@
 import os
 import re
+import time
 from datetime import datetime
 
 from unidecode import unidecode
@@ -90,6 +91,23 @@ def parse_birth_date(date_str: str) -> datetime:
         raise InvalidDateFormatError(date_str)
 
 
+def format_date(value, date_format: str = "%Y-%m-%d"):
+    """
+    Convertit une date (datetime ou pd.Timestamp) en texte, pour l'affichage ou l'enregistrement.
+
+    Args:
+        value: La date, ou une valeur déjà textuelle (renvoyée telle quelle).
+        date_format (str): Le format du texte (par défaut 'AAAA-MM-JJ').
+
+    Returns:
+        str: La date au format date_format, None pour une date manquante (pd.NaT).
+    """
+    if isinstance(value, datetime):
+        # pd.NaT est une instance de datetime différente d'elle-même
+        return value.strftime(date_format) if value == value else None
+    return value
+
+
 def sanitize(text):
     text = unidecode(text)  # Convertir les caractères Unicode en ASCII
     text = text.lower().replace(" ", "_")  # Remplacer les espaces par des underscores et convertir en minuscule
@@ -97,6 +115,27 @@ def sanitize(text):
     return text.replace("'", "")  # Supprimer les apostrophes
 
 
+def get_tournament_status(current_round, rounds_count, rounds):
+    """
+    Détermine le statut d'un tournoi à partir de son avancement.
+
+    Args:
+        current_round (int): Le round actuel du tournoi.
+        rounds_count (int): Le nombre total de rounds du tournoi.
+        rounds (list): Les rounds du tournoi (dictionnaires ou objets Round).
+
+    Returns:
+        str: "not_started", "ongoing" ou "finished".
+    """
+    if current_round == 0 or not rounds:
+        return "not_started"
+    last_round = rounds[-1]
+    end_time = last_round.get("end_time") if isinstance(last_round, dict) else last_round.end_time
+    if current_round >= rounds_count and end_time:
+        return "finished"
+    return "ongoing"
+
+
 def clear_console():
     """
     Efface la console.
@@ -121,9 +160,64 @@ def get_username():
     return username
 
 
+# Ancien format des heures de début et de fin des rounds (heure locale, à la minute)
+LEGACY_TIMESTAMP_FORMAT = "%d-%m-%Y-%H-%M"
+
+
 def get_timestamp():
-    # On utilise la fonction datetime.now() pour obtenir la date et l'heure actuelles
-    # On utilise la méthode strftime() pour formater la date et l'heure en "JJ-MM-AAAA-HH-MM-SS"
-    # On supprime la dernière partie ("SS") pour obtenir la chaîne de caractères de la forme "JJ-MM-AAAA-HH-MM"
-    # Verifier traitement x2
-    return datetime.now().strftime("%d-%m-%Y-%H-%M-%S")[:-3]
+    """
+    Retourne l'heure actuelle en secondes depuis le 1er janvier 1970 (UTC).
+
+    Contrairement à l'ancien format "JJ-MM-AAAA-HH-MM", ces entiers se trient et se comparent directement.
+    """
+    return int(time.time())
+
+
+def parse_timestamp(value):
+    """
+    Convertit une heure de round enregistrée en secondes depuis le 1er janvier 1970 (UTC).
+
+    Args:
+        value (int | float | str | None): Un timestamp, une chaîne au format "JJ-MM-AAAA-HH-MM" (heure locale,
+            fichiers enregistrés avant le passage aux timestamps) ou None.
+
+    Returns:
+        int: Le timestamp, ou None si value vaut None.
+
+    Raises:
+        ValueError: Si la chaîne n'est pas au format "JJ-MM-AAAA-HH-MM".
+
+    Exemple:
+        >>> parse_timestamp(1721891640)
+        1721891640
+        >>> parse_timestamp(None) is None
+        True
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return int(datetime.strptime(value, LEGACY_TIMESTAMP_FORMAT).timestamp())
+    return int(value)
+
+
+def format_timestamp(timestamp):
+    """
+    Formate un timestamp en heure locale "JJ-MM-AAAA HH:MM" pour l'affichage (chaîne vide si None).
+    """
+    if timestamp is None:
+        return ""
+    return datetime.fromtimestamp(timestamp).strftime("%d-%m-%Y %H:%M")
+
+
+def format_duration(seconds):
+    """
+    Formate une durée en secondes en heures et minutes.
+
+    Exemple:
+        >>> format_duration(5400)
+        '1 h 30 min'
+        >>> format_duration(600)
+        '10 min'
+    """
+    hours, minutes = divmod(int(round(seconds / 60)), 60)
+    return f"{hours} h {minutes:02d} min" if hours else f"{minutes} min"
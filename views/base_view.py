@@ -1,6 +1,19 @@
-from InquirerPy import get_style
+from math import ceil
+
+from InquirerPy import get_style, inquirer
+from InquirerPy.base.control import Choice
+from InquirerPy.separator import Separator
 from rich.console import Console
 
+from utils.utils import clear_console
+
+# Nombre de lignes affichées par page dans les listes paginées
+PAGE_SIZE = 20
+# Nombre de lignes utilisées pour estimer la largeur des colonnes
+WIDTH_SAMPLE_SIZE = 200
+# Largeur maximale d'une colonne pour ne pas déformer le tableau
+MAX_COLUMN_WIDTH = 40
+
 
 class BaseView:
     def __init__(self):
@@ -29,3 +42,150 @@ class BaseView:
                 "spinner_text": "",             # Texte du spinner pendant le chargement
             }
         )
+
+    def get_page(self, data_df, page, page_size=PAGE_SIZE):
+        """
+        Découpe un DataFrame pour ne garder que les lignes de la page demandée.
+
+        Args:
+            data_df (pd.DataFrame): Les données à paginer.
+            page (int): Le numéro de la page (commence à 0).
+            page_size (int): Le nombre de lignes par page.
+
+        Returns:
+            tuple: (DataFrame de la page, numéro de page corrigé, nombre total de pages).
+        """
+        page_count = max(1, ceil(len(data_df) / page_size))
+        page = min(max(page, 0), page_count - 1)
+        start = page * page_size
+        return data_df.iloc[start:start + page_size], page, page_count
+
+    def get_column_widths(self, data_df, columns, sample_size=WIDTH_SAMPLE_SIZE):
+        """
+        Estime la largeur des colonnes à partir d'un échantillon des données.
+
+        La largeur reste ainsi stable d'une page à l'autre sans avoir à parcourir toutes les lignes.
+
+        Args:
+            data_df (pd.DataFrame): Les données affichées.
+            columns (list): Les colonnes dont on veut la largeur.
+            sample_size (int): Le nombre de lignes de l'échantillon.
+
+        Returns:
+            dict: Dictionnaire {colonne: largeur}.
+        """
+        sample_df = data_df.head(sample_size)
+        widths = {}
+        for column in columns:
+            lengths = sample_df[column].astype(str).str.len()
+            widths[column] = min(int(lengths.max()) if not lengths.empty else 0, MAX_COLUMN_WIDTH)
+
+        # On laisse au moins la moitié du terminal aux autres colonnes
+        available_width = self.console.width // 2
+        total_width = sum(widths.values())
+        if total_width > available_width:
+            widths = {column: width * available_width // total_width for column, width in widths.items()}
+        return widths
+
+    def filter_rows(self, data_df, search_columns, query):
+        """
+        Filtre les lignes contenant le texte recherché dans au moins une des colonnes (sans tenir compte de la casse).
+
+        Args:
+            data_df (pd.DataFrame): Les données à filtrer.
+            search_columns (list): Les colonnes dans lesquelles chercher.
+            query (str): Le texte recherché.
+
+        Returns:
+            pd.DataFrame: Les lignes correspondantes.
+        """
+        query = query.strip().lower()
+        mask = None
+        for column in search_columns:
+            column_mask = data_df[column].astype(str).str.lower().str.contains(query, regex=False)
+            mask = column_mask if mask is None else mask | column_mask
+        return data_df[mask]
+
+    def ask_page_action(self, page, page_count, is_filtered=False):
+        """
+        Demande à l'utilisateur comment naviguer dans une liste paginée.
+
+        Args:
+            page (int): La page actuellement affichée (commence à 0).
+            page_count (int): Le nombre total de pages.
+            is_filtered (bool): True si une recherche est en cours.
+
+        Returns:
+            str: L'action choisie ("next", "previous", "jump", "search", "reset" ou "back").
+        """
+        choices = []
+        if page < page_count - 1:
+            choices.append(Choice(value="next", name="➡️  Page suivante"))
+        if page > 0:
+            choices.append(Choice(value="previous", name="⬅️  Page précédente"))
+        if page_count > 1:
+            choices.append(Choice(value="jump", name="🔢 Aller à la page..."))
+        choices.append(Choice(value="search", name="🔍 Rechercher"))
+        if is_filtered:
+            choices.append(Choice(value="reset", name="📋 Afficher toute la liste"))
+        choices.append(Separator(line="-" * 30))
+        choices.append(Choice(value="back", name="🔙 Retour au menu précédent"))
+
+        return inquirer.select(
+            message=f"\nPage {page + 1}/{page_count} - Que souhaitez-vous faire ?\n",
+            choices=choices,
+            pointer="❯",
+            qmark="",
+            style=self.custom_style,
+            show_cursor=False,
+        ).execute()
+
+    def browse(self, data_df, render_page, search_columns):
+        """
+        Affiche une liste page par page avec navigation, saut de page et recherche.
+
+        Seule la page visible est mise en forme, le temps d'affichage ne dépend donc pas de la taille des données.
+        Si toutes les lignes tiennent sur une seule page, la liste est affichée sans navigation.
+
+        Args:
+            data_df (pd.DataFrame): Les données à parcourir.
+            render_page (callable): Fonction (data_df, page) -> nombre de pages qui affiche une page.
+            search_columns (list): Les colonnes utilisées par la recherche.
+        """
+        current_df = data_df
+        page = 0
+        while True:
+            page_count = render_page(current_df, page)
+            if page_count <= 1 and current_df is data_df:
+                return
+
+            action = self.ask_page_action(page, page_count, is_filtered=current_df is not data_df)
+            if action == "back":
+                clear_console()
+                return
+            elif action == "next":
+                page += 1
+            elif action == "previous":
+                page -= 1
+            elif action == "jump":
+                page = int(
+                    inquirer.number(
+                        message=f"Numéro de page (1-{page_count}) :",
+                        min_allowed=1,
+                        max_allowed=page_count,
+                        default=page + 1,
+                        style=self.custom_style,
+                        qmark="",
+                        amark="",
+                    ).execute()
+                ) - 1
+            elif action == "search":
+                query = inquirer.text(
+                    message="Texte à rechercher :", style=self.custom_style, qmark="", amark=""
+                ).execute()
+                current_df = self.filter_rows(data_df, search_columns, query) if query.strip() else data_df
+                page = 0
+            elif action == "reset":
+                current_df = data_df
+                page = 0
+            clear_console()
@@ -1,6 +1,7 @@
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
+from rich.table import Table, box
 
 from views.base_view import BaseView
 
@@ -34,7 +35,7 @@ class MainView(BaseView):
         ]
 
         # Affichage du menu principal en utilisant inquirer
-        self.choice = inquirer.select(
+        prompt = inquirer.select(
             message="Menu Principal\n",
             long_instruction="\nDans le menu principal, vous avez accès à ces quatre fonctionnalités :\
             \n\n- Gestion des joueurs (ce menu vous permet de gérer l'intégralité des joueurs du programme)\
@@ -50,7 +51,14 @@ class MainView(BaseView):
             qmark="",
             style=self.custom_style,
             show_cursor=False,
-        ).execute()
+        )
+
+        # Entrée cachée : la touche "m" affiche les métriques de l'application
+        @prompt.register_kb("m")
+        def show_metrics(event):
+            event.app.exit(result="metrics")
+
+        self.choice = prompt.execute()
 
     def get_user_choice(self):
         """
@@ -68,3 +76,59 @@ class MainView(BaseView):
         """
 
         print(message)
+
+    def display_metrics(self, snapshot):
+        """
+        Affiche les métriques de l'application : compteurs et jauges, durées, puis coût moyen de chaque action.
+
+        Args:
+            snapshot (dict): Les métriques (voir MetricsRegistry.snapshot).
+        """
+        table = Table(title="Compteurs et jauges", box=box.SQUARE)
+        table.add_column("Métrique", header_style="bold cyan")
+        table.add_column("Valeur", header_style="bold cyan", justify="right")
+        for metric, value in {**snapshot["counters"], **snapshot["gauges"]}.items():
+            table.add_row(metric, f"{value:,}")
+        self.console.print(table)
+
+        table = Table(title="Durées", box=box.SQUARE)
+        for column in ("Métrique", "Appels", "Moyenne", "Maximum"):
+            table.add_column(column, header_style="bold cyan", justify="left" if column == "Métrique" else "right")
+        for metric, timer in snapshot["timers"].items():
+            average = timer["sum"] / timer["count"]
+            table.add_row(metric, str(timer["count"]), f"{average * 1000:.2f} ms", f"{timer['max'] * 1000:.2f} ms")
+        self.console.print(table)
+
+        table = Table(title="Coût moyen par action", box=box.SQUARE)
+        for column in ("Action", "Exécutions", "Métrique", "Par exécution"):
+            table.add_column(column, header_style="bold cyan")
+        for action, data in snapshot["actions"].items():
+            per_run = data["per_run"] or {"-": 0}
+            for position, (metric, value) in enumerate(per_run.items()):
+                # Le nom de l'action et son nombre d'exécutions ne sont affichés que sur sa première ligne
+                runs = str(data["runs"]) if position == 0 else ""
+                table.add_row(action if position == 0 else "", runs, metric, f"{value:,.1f}")
+        self.console.print(table)
+
+    def ask_metrics_export(self):
+        """
+        Demande le format d'export des métriques.
+
+        Returns:
+            str: "JSON", "Prometheus" ou "Retour".
+        """
+        longest_choice_length = max(len("📁 Exporter en JSON"), len("📁 Exporter au format Prometheus"))
+        return inquirer.select(
+            message="\nQue souhaitez-vous faire ?\n",
+            choices=[
+                Choice(value="JSON", name="📁 Exporter en JSON"),
+                Choice(value="Prometheus", name="📁 Exporter au format Prometheus"),
+                Separator(line="-" * (longest_choice_length + 1)),
+                Choice(value="Retour", name="🔙 Retour au menu principal"),
+            ],
+            style=self.custom_style,
+            pointer="❯",
+            amark="",
+            qmark="",
+            show_cursor=False,
+        ).execute()
@@ -448,34 +448,59 @@ class PlayerView(BaseView):
         )
         self.console.print(table)
 
-    def list_players(self, players_df):
+    def list_players(self, players_df, page=0):
         """
-        Affiche la liste de tous les joueurs sous forme de table en utilisant RichTable,
+        Affiche une page de la liste des joueurs sous forme de table en utilisant RichTable,
         avec des noms de colonnes cohérents avec ceux utilisés dans show_player.
+
+        Seules les lignes de la page demandée sont mises en forme et la largeur des colonnes
+        est estimée à partir d'un échantillon, l'affichage ne dépend donc pas du nombre de joueurs.
+
+        Args:
+            players_df (pd.DataFrame): Le DataFrame contenant les joueurs.
+            page (int): Le numéro de la page à afficher (commence à 0).
+
+        Returns:
+            int: Le nombre total de pages.
         """
+        columns = ["first_name", "last_name", "birth_date", "national_id", "career_score"]
+        page_df, page, page_count = self.get_page(players_df, page)
+        widths = self.get_column_widths(players_df, columns)
 
         # Création de la table all_players
         table_all_players = Table(title="Liste des joueurs", box=box.SQUARE, show_lines=True)
+        if page_count > 1:
+            table_all_players.caption = f"Page {page + 1}/{page_count} - {len(players_df)} joueurs"
 
         # ajout des colonnes avec les mêmes noms que dans show_player
-        table_all_players.add_column("Prénom", justify="left", header_style="bold magenta")
-        table_all_players.add_column("Nom de famille", justify="left", header_style="bold magenta")
-        table_all_players.add_column("Date de naissance", justify="left", header_style="bold magenta")
-        table_all_players.add_column("Identifiant national", justify="left", header_style="bold magenta")
-        table_all_players.add_column("Score de carrière", justify="left", header_style="bold magenta")
-
-        # Remplissage de la table avec les données des joueurs
-        for index, row in players_df.iterrows():
+        headers = ["Prénom", "Nom de famille", "Date de naissance", "Identifiant national", "Score de carrière"]
+        for column, header in zip(columns, headers):
+            table_all_players.add_column(
+                header, justify="left", header_style="bold magenta", min_width=widths[column]
+            )
+
+        # Remplissage de la table avec les données des joueurs de la page uniquement
+        for row in page_df.itertuples(index=False):
             table_all_players.add_row(
-                row["first_name"],
-                row["last_name"],
-                row["birth_date"],
-                row["national_id"],
-                str(row["career_score"])
+                row.first_name,
+                row.last_name,
+                row.birth_date,
+                row.national_id,
+                str(row.career_score)
             )
 
         # Afficher la table dans la console
         self.console.print(table_all_players)
+        return page_count
+
+    def browse_players(self, players_df):
+        """
+        Affiche la liste des joueurs page par page avec navigation et recherche (nom, prénom ou identifiant).
+
+        Args:
+            players_df (pd.DataFrame): Le DataFrame contenant les joueurs.
+        """
+        self.browse(players_df, self.list_players, ["first_name", "last_name", "national_id"])
 
     def display_error_message(self, national_id):
         """
@@ -1,10 +1,14 @@
+from datetime import datetime
+
+import pandas as pd
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
 from rich.table import Table
 
 from controllers.player_controller import PlayerController
-from utils.utils import clear_console
+from utils.tournament_index import STATUS_LABELS
+from utils.utils import clear_console, format_date, format_duration, format_timestamp
 from views.base_view import BaseView
 
 from .player_view import PlayerView
@@ -33,6 +37,11 @@ class ReportView(BaseView):
             len("📋 Nom et dates d’un tournoi donné"),
             len("📋 Liste des joueurs d'un tournoi (A-Z)"),
             len("📋 Liste de tous les tours du tournoi et de tous les matchs du tour"),
+            len("🎲 Probabilités de podium d'un tournoi en cours"),
+            len("⏱️  Rounds joués sur une période"),
+            len("🤝 Face-à-face entre deux joueurs"),
+            len("📊 Fiche statistique d'un joueur"),
+            len("🔎 Recherche de tournois (période, lieu, statut)"),
             len("🔙 Retour au menu principal"),
         )
         menu_options = [
@@ -41,8 +50,13 @@ class ReportView(BaseView):
             Choice(value="3", name="📋 Nom et dates d’un tournoi donné"),
             Choice(value="4", name="📋 Liste des joueurs d'un tournoi (A-Z)"),
             Choice(value="5", name="📋 Liste de tous les tours du tournoi et de tous les matchs du tour"),
+            Choice(value="6", name="🎲 Probabilités de podium d'un tournoi en cours"),
+            Choice(value="7", name="⏱️  Rounds joués sur une période"),
+            Choice(value="8", name="🤝 Face-à-face entre deux joueurs"),
+            Choice(value="9", name="📊 Fiche statistique d'un joueur"),
+            Choice(value="10", name="🔎 Recherche de tournois (période, lieu, statut)"),
             Separator(line="-" * (longest_choice_length + 1)),
-            Choice(value="6", name="🔙 Retour au menu principal"),
+            Choice(value="11", name="🔙 Retour au menu principal"),
         ]
         self.choice = inquirer.select(
             message="Gestion des rapports\n",
@@ -51,12 +65,17 @@ class ReportView(BaseView):
             qmark="",
             style=self.custom_style,
             show_cursor=False,
-            long_instruction="Dans le menu des rapports, vous avez accès à ces six fonctionnalités :"
+            long_instruction="Dans le menu des rapports, vous avez accès à ces onze fonctionnalités :"
             "\n\n- Liste de tous les joueurs (triés par ordre alphabétique)"
             "\n- Liste de tous les tournois (stockés dans le fichier 'datas/tournaments.json')"
             "\n- Nom et dates d’un tournoi donné (informations détaillées d'un tournoi donné)"
             "\n- Liste des joueurs d'un tournoi (triés par ordre alphabétique)"
             "\n- Liste de tous les rounds d'un tournoi et de tous les matchs d'un round"
+            "\n- Probabilités de podium (chances de chaque joueur de finir dans les 3 premiers, par simulation)"
+            "\n- Rounds joués sur une période (tous tournois confondus, avec leur durée moyenne)"
+            "\n- Face-à-face entre deux joueurs (tous leurs matchs l'un contre l'autre, tous tournois confondus)"
+            "\n- Fiche statistique d'un joueur (bilan, performance, adversaires et tournois disputés)"
+            "\n- Recherche de tournois (par période, lieu et statut, archives comprises)"
             "\n- Retour au menu principal (vous pouvez revenir au menu principal pour les autres fonctionnalités)\n"
             "\nPour chaque fonctionnalité, vous pouvez exporter les données dans différents formats."
         ).execute()
@@ -77,15 +96,15 @@ class ReportView(BaseView):
 
     def list_players(self, players_df):
         """
-        Affiche la liste des joueurs en utilisant player_view.list_players.
+        Affiche la liste des joueurs page par page en utilisant player_view.browse_players.
         """
-        self.player_view.list_players(players_df)
+        self.player_view.browse_players(players_df)
 
     def list_tournaments(self, tournaments_df):
         """
-        Affiche la liste des tournois en utilisant tournament_view.list_tournaments.
+        Affiche la liste des tournois page par page en utilisant tournament_view.browse_tournaments.
         """
-        self.tournament_view.list_tournaments(tournaments_df)
+        self.tournament_view.browse_tournaments(tournaments_df)
 
     def show_tournament_details(self, tournament_data):
         """
@@ -102,8 +121,8 @@ class ReportView(BaseView):
         table.add_row(
             tournament_data["name"],
             tournament_data["location"],
-            tournament_data["start_date"],
-            tournament_data["end_date"],
+            format_date(tournament_data["start_date"]) or "",
+            format_date(tournament_data["end_date"]) or "",
             tournament_data["description"],
         )
 
@@ -128,9 +147,21 @@ class ReportView(BaseView):
         clear_console()
         return choice
 
-    def display_rounds_and_matches(self, tournament_name, rounds, players_df):
+    def display_rounds_and_matches(self, tournament_name, rounds, matches_df):
+        """
+        Affiche les matchs de chaque round à partir de la table déjà jointe avec les joueurs.
+
+        Args:
+            tournament_name (str): Le nom du tournoi.
+            rounds (list): La liste des objets Round du tournoi.
+            matches_df (pd.DataFrame): La table des matchs jointe avec les noms des joueurs
+                (voir utils/player_lookup.py).
+        """
         self.console.print(f"[bold magenta]Tournoi : {tournament_name}[/bold magenta]\n")
 
+        # On regroupe les matchs par round une seule fois
+        matches_by_round = {name: group for name, group in matches_df.groupby("round", sort=False)}
+
         for round_ in rounds:
             table = Table(title=round_.name, show_header=True, header_style="bold magenta")
             table.add_column("Joueur 1", style="cyan")
@@ -139,35 +170,291 @@ class ReportView(BaseView):
             table.add_column("ID Joueur 2", style="green")
             table.add_column("Score", justify="center", style="yellow")
 
-            for match in round_.matches:
-                # Chercher les joueurs dans players_df pour récupérer les informations complètes
-                player1_data = players_df.loc[players_df['national_id'].str.strip() == match.player1_id.strip()]
-                player2_data = players_df.loc[players_df['national_id'].str.strip() == match.player2_id.strip()]
-
-                if player1_data.empty:
-                    player1_info = "[Joueur introuvable]"
-                    player1_id = match.player1_id
-                else:
-                    player1_info = f"{player1_data.iloc[0]['first_name']} {player1_data.iloc[0]['last_name']}"
-                    player1_id = player1_data.iloc[0]['national_id']
-
-                if player2_data.empty:
-                    player2_info = "[Joueur introuvable]"
-                    player2_id = match.player2_id
-                else:
-                    player2_info = f"{player2_data.iloc[0]['first_name']} {player2_data.iloc[0]['last_name']}"
-                    player2_id = player2_data.iloc[0]['national_id']
-
-                table.add_row(
-                    player1_info,
-                    player1_id,
-                    player2_info,
-                    player2_id,
-                    f"{match.score_player1} - {match.score_player2}"
-                )
+            round_matches = matches_by_round.get(round_.name)
+            if round_matches is not None:
+                for match in round_matches.itertuples(index=False):
+                    table.add_row(
+                        match.player1_name,
+                        match.player1_id,
+                        match.player2_name,
+                        match.player2_id,
+                        f"{match.score_player1} - {match.score_player2}"
+                    )
 
             self.console.print(table)
 
+    @staticmethod
+    def is_date(text):
+        try:
+            datetime.strptime(text, "%Y-%m-%d")
+        except ValueError:
+            return False
+        return True
+
+    def ask_period(self):
+        """
+        Demande les dates de début et de fin (incluse) d'une période.
+
+        Returns:
+            tuple: (date de début, date de fin) au format 'AAAA-MM-JJ', ou None si l'utilisateur annule.
+        """
+        dates = []
+        for message in ("Date de début de la période (YYYY-MM-DD) :", "Date de fin de la période (YYYY-MM-DD) :"):
+            date = inquirer.text(
+                message=message,
+                long_instruction="Laissez vide et appuyez sur 'Entrée' pour revenir au menu des rapports.",
+                validate=lambda text: not text or self.is_date(text),
+                invalid_message="Format de date invalide (attendu : YYYY-MM-DD).",
+                style=self.custom_style,
+                qmark="",
+                amark="",
+            ).execute()
+            if not date:
+                return None
+            dates.append(date)
+        return tuple(dates)
+
+    def ask_tournament_filters(self, locations):
+        """
+        Demande les critères de recherche des tournois : statut, lieu et période.
+
+        Args:
+            locations (list): Les lieux des tournois, proposés au choix.
+
+        Returns:
+            dict: Les critères (status, location, start et end, None pour ne pas filtrer), ou None si l'utilisateur
+            annule.
+        """
+        status_choices = [Choice(value="all", name="Tous les statuts")] + [
+            Choice(value=status, name=label) for status, label in STATUS_LABELS.items()
+        ]
+        status = inquirer.select(
+            message="Statut des tournois :\n",
+            choices=[*status_choices, Separator(line=30 * "-"), Choice(value=None, name="🔙 Annuler")],
+            pointer="❯",
+            qmark="",
+            style=self.custom_style,
+            show_cursor=False,
+        ).execute()
+        if status is None:
+            return None
+        location = inquirer.fuzzy(
+            message="Lieu des tournois :",
+            choices=[Choice(value=None, name="Tous les lieux")] + locations,
+            long_instruction="Commencez à taper pour filtrer les lieux.",
+            style=self.custom_style,
+            qmark="",
+            amark="",
+        ).execute()
+
+        dates = []
+        for message in ("Tournois en cours à partir du (YYYY-MM-DD) :", "Tournois commencés jusqu'au (YYYY-MM-DD) :"):
+            date = inquirer.text(
+                message=message,
+                long_instruction="Laissez vide et appuyez sur 'Entrée' pour ne pas limiter la période.",
+                validate=lambda text: not text or self.is_date(text),
+                invalid_message="Format de date invalide (attendu : YYYY-MM-DD).",
+                style=self.custom_style,
+                qmark="",
+                amark="",
+            ).execute()
+            dates.append(date or None)
+        return {
+            "status": None if status == "all" else status,
+            "location": location,
+            "start": dates[0],
+            "end": dates[1],
+        }
+
+    def display_rounds_by_period(self, start_date, end_date, rounds_df, average_duration):
+        """
+        Affiche les rounds commencés sur une période et leur durée moyenne.
+
+        Args:
+            start_date (str): Date de début de la période.
+            end_date (str): Date de fin de la période.
+            rounds_df (pd.DataFrame): Les rounds de la période (voir utils/round_index.py).
+            average_duration (float): Durée moyenne en secondes des rounds terminés sur la période, ou None.
+        """
+        caption = f"{len(rounds_df)} round(s)"
+        if average_duration is not None:
+            caption += f" - durée moyenne : {format_duration(average_duration)}"
+        table = Table(
+            title=f"Rounds joués du {start_date} au {end_date}",
+            caption=caption,
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Tournoi", style="cyan")
+        table.add_column("Round")
+        table.add_column("Début", style="green")
+        table.add_column("Fin", style="green")
+        table.add_column("Durée", justify="right", style="yellow")
+
+        for round_ in rounds_df.itertuples(index=False):
+            is_finished = not pd.isna(round_.end_time)
+            table.add_row(
+                round_.tournament,
+                round_.round,
+                format_timestamp(round_.start_time),
+                format_timestamp(round_.end_time) if is_finished else "En cours",
+                format_duration(round_.duration) if is_finished else "",
+            )
+
+        self.console.print(table)
+
+    def ask_players(self, messages, completer=None):
+        """
+        Demande un ou plusieurs joueurs (identifiant national ou nom), un par message.
+
+        Args:
+            messages (list): Le message de chaque saisie.
+            completer (Completer): Autocomplétion proposant les joueurs correspondant à la saisie
+                (identifiant, prénom ou nom).
+
+        Returns:
+            tuple: Les saisies, dans l'ordre des messages, ou None si l'utilisateur annule.
+        """
+        choices = []
+        for message in messages:
+            choice = inquirer.text(
+                message=message,
+                long_instruction="Laissez vide et appuyez sur 'Entrée' pour revenir au menu des rapports.",
+                completer=completer,
+                style=self.custom_style,
+                qmark="",
+                amark="",
+            ).execute()
+            if not choice.strip():
+                return None
+            choices.append(choice)
+        return tuple(choices)
+
+    def display_head_to_head(self, player_names, player_ids, meetings_df, summary):
+        """
+        Affiche tous les matchs joués entre deux joueurs et le bilan du premier contre le second.
+
+        Args:
+            player_names (list): Les noms des deux joueurs.
+            player_ids (list): Les identifiants nationaux des deux joueurs.
+            meetings_df (pd.DataFrame): Les matchs joués entre eux (voir utils/head_to_head.py).
+            summary (dict): Le bilan des rencontres (voir HeadToHeadIndex.get_summary).
+        """
+        table = Table(
+            title=f"Face-à-face : {player_names[0]} ({player_ids[0]}) - {player_names[1]} ({player_ids[1]})",
+            caption=f"{summary['matches']} match(s) : {summary['wins']} victoire(s), {summary['draws']} nul(s), "
+            f"{summary['losses']} défaite(s) - points : {summary['player1_points']:g} - "
+            f"{summary['player2_points']:g}",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Tournoi", style="cyan")
+        table.add_column("Round")
+        table.add_column("Score", justify="center", style="yellow")
+
+        for meeting in meetings_df.itertuples(index=False):
+            table.add_row(
+                meeting.tournament,
+                meeting.round,
+                f"{meeting.player1_score:g} - {meeting.player2_score:g}",
+            )
+
+        self.console.print(table)
+
+    def display_player_profile(self, player_name, national_id, profile, opponents_df, tournaments_df):
+        """
+        Affiche la fiche statistique d'un joueur : son bilan, ses adversaires et ses tournois.
+
+        Args:
+            player_name (str): Le nom du joueur.
+            national_id (str): L'identifiant national du joueur.
+            profile (dict): Le bilan du joueur (voir PlayerStats.get_profile).
+            opponents_df (pd.DataFrame): Le bilan contre chaque adversaire, avec son nom (voir
+                PlayerStats.get_opponents).
+            tournaments_df (pd.DataFrame): Les tournois disputés (voir PlayerStats.get_tournaments).
+        """
+        performance = "" if profile["performance"] is None else f"{profile['performance']:.1%}"
+        summary_table = Table(
+            title=f"Fiche de {player_name} ({national_id})",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        for column in ("Matchs", "Victoires", "Nuls", "Défaites", "Points", "Performance", "Tournois"):
+            summary_table.add_column(column, justify="center")
+        summary_table.add_column("Dernier round joué", style="green")
+        summary_table.add_row(
+            str(profile["games"]),
+            str(profile["wins"]),
+            str(profile["draws"]),
+            str(profile["losses"]),
+            f"{profile['points']:g}",
+            performance,
+            str(profile["tournaments"]),
+            format_timestamp(profile["last_played"]),
+        )
+        self.console.print(summary_table)
+
+        opponents_table = Table(title="Adversaires", show_header=True, header_style="bold magenta")
+        opponents_table.add_column("Adversaire", style="cyan")
+        opponents_table.add_column("ID", style="green")
+        opponents_table.add_column("Matchs", justify="center")
+        opponents_table.add_column("V / N / D", justify="center")
+        opponents_table.add_column("Points", justify="right", style="yellow")
+        for opponent in opponents_df.itertuples(index=False):
+            opponents_table.add_row(
+                opponent.name,
+                opponent.opponent,
+                str(opponent.games),
+                f"{opponent.wins} / {opponent.draws} / {opponent.losses}",
+                f"{opponent.points:g}",
+            )
+        self.console.print(opponents_table)
+
+        tournaments_table = Table(title="Tournois disputés", show_header=True, header_style="bold magenta")
+        tournaments_table.add_column("Tournoi", style="cyan")
+        tournaments_table.add_column("Dernier round joué", style="green")
+        for tournament in tournaments_df.itertuples(index=False):
+            is_played = not pd.isna(tournament.last_played)
+            tournaments_table.add_row(
+                tournament.tournament, format_timestamp(tournament.last_played) if is_played else "Pas encore joué"
+            )
+        self.console.print(tournaments_table)
+
+    def display_podium_probabilities(self, tournament_name, probabilities_df, simulations):
+        """
+        Affiche les chances de chaque joueur de finir premier ou sur le podium.
+
+        Args:
+            tournament_name (str): Le nom du tournoi.
+            probabilities_df (pd.DataFrame): Le résultat de la simulation, avec le nom des joueurs
+                (voir utils/tournament_simulator.py).
+            simulations (int): Le nombre de simulations effectuées.
+        """
+        table = Table(
+            title=f"Probabilités de podium - {tournament_name}",
+            caption=f"Estimation sur {simulations} simulations de la fin du tournoi",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Joueur", style="cyan")
+        table.add_column("ID", style="green")
+        table.add_column("Score actuel", justify="center")
+        table.add_column("Score final moyen", justify="center")
+        table.add_column("1re place", justify="right", style="yellow")
+        table.add_column("Podium", justify="right", style="bold yellow")
+
+        for player in probabilities_df.itertuples(index=False):
+            table.add_row(
+                player.name,
+                player.national_id,
+                f"{player.current_score:g}",
+                f"{player.expected_score:.2f}",
+                f"{player.p_first:.1%}",
+                f"{player.p_top3:.1%}",
+            )
+
+        self.console.print(table)
+
     def ask_export_choice(self):
         """
         Demande à l'utilisateur s'il souhaite exporter les données ou revenir au menu précédent.
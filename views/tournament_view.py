@@ -1,13 +1,48 @@
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table, box
+from rich.text import Text
 
-from utils.utils import clear_console
+from utils.player_lookup import get_player_records_map
+from utils.tournament_index import STATUS_LABELS
+from utils.utils import clear_console, format_date
 from views.base_view import BaseView
 
 
+# Touches de saisie directe d'un résultat sur l'écran d'un round : (score du joueur 1, score du joueur 2)
+RESULT_KEYS = {"1": (1.0, 0.0), "2": (0.0, 1.0), "0": (0.5, 0.5), "=": (0.5, 0.5)}
+
+
+class RoundScreen:
+    """
+    Écran de saisie des résultats d'un round, construit une seule fois par round.
+
+    Les tableaux du tournoi et du barème ne changent pas pendant le round. Seule la cellule "Résultat" d'un
+    échiquier est modifiée lorsqu'un résultat est saisi : le tableau des échiquiers n'est pas reconstruit.
+
+    Attributs:
+        renderable (Group): L'ensemble des tableaux à afficher.
+        result_cells (dict): Dictionnaire {numéro d'échiquier: Text de la cellule "Résultat"}.
+    """
+
+    def __init__(self, renderable, result_cells):
+        self.renderable = renderable
+        self.result_cells = result_cells
+
+    def set_result(self, board, score1, score2):
+        cell = self.result_cells[board]
+        cell.plain = f"{score1:g} - {score2:g}"
+        cell.style = "bold green"
+
+    def set_skipped(self, board):
+        # Un joueur de cet échiquier a déjà joué dans ce round (appariement en double)
+        cell = self.result_cells[board]
+        cell.plain = "Passé"
+        cell.style = "dim"
+
+
 class TournamentView(BaseView):
     def __init__(self):
         """
@@ -366,40 +401,69 @@ class TournamentView(BaseView):
                     self.show_message("Veuillez entrer un nombre valide pour les rounds.")
                     continue
 
-    def list_tournaments(self, tournaments_df):
+    def list_tournaments(self, tournaments_df, page=0):
         """
-        Affiche la liste des tournois.
+        Affiche une page de la liste des tournois.
 
         Args:
             tournaments_df (pd.DataFrame): Le DataFrame contenant les informations des tournois.
+            page (int): Le numéro de la page à afficher (commence à 0).
+
+        Returns:
+            int: Le nombre total de pages.
         """
+        page_df, page, page_count = self.get_page(tournaments_df, page)
+        widths = self.get_column_widths(tournaments_df, ["name", "location"])
 
         table = Table(title="Liste des tournois", box=box.SQUARE, show_lines=True)
-        table.add_column("Nom", header_style="bold cyan")
-        table.add_column("Lieu", header_style="bold cyan")
+        if page_count > 1:
+            table.caption = f"Page {page + 1}/{page_count} - {len(tournaments_df)} tournois"
+        table.add_column("Nom", header_style="bold cyan", min_width=widths["name"])
+        table.add_column("Lieu", header_style="bold cyan", min_width=widths["location"])
         table.add_column("Date de début", header_style="bold cyan")
         table.add_column("Date de fin", header_style="bold cyan")
         table.add_column("Description", header_style="bold cyan")
         table.add_column("Rounds", header_style="bold cyan")
         table.add_column("Joueurs", header_style="bold cyan")
-
-        for _, tournament in tournaments_df.iterrows():
+        # Statut des tournois issus d'une recherche (voir utils/tournament_index.py)
+        has_status = "status" in page_df.columns
+        if has_status:
+            table.add_column("Statut", header_style="bold cyan")
+
+        # Les en-têtes des tournois archivés n'ont pas de rounds ni de joueurs, seulement leur nombre
+        is_header = "rounds_played" in page_df.columns
+        for tournament in page_df.itertuples(index=False):
             description = (
-                tournament["description"][:30] + "..."
-                if len(tournament["description"]) > 30
-                else tournament["description"]
+                tournament.description[:30] + "..."
+                if len(tournament.description) > 30
+                else tournament.description
             )
-            table.add_row(
-                tournament["name"],
-                tournament["location"],
-                tournament["start_date"],
-                tournament["end_date"],
+            rounds_played = tournament.rounds_played if is_header else len(tournament.rounds)
+            players_count = tournament.players_count if is_header else len(tournament.players)
+            row = [
+                tournament.name,
+                tournament.location,
+                format_date(tournament.start_date) or "",
+                format_date(tournament.end_date) or "",
                 description,
-                f"{len(tournament['rounds'])} rounds",
-                f"{len(tournament['players'])} joueurs",
-            )
+                f"{rounds_played} rounds",
+                f"{players_count} joueurs",
+            ]
+            if has_status:
+                row.append(STATUS_LABELS[tournament.status])
+            table.add_row(*row)
 
         self.console.print(table)
+        return page_count
+
+    def browse_tournaments(self, tournaments_df):
+        """
+        Affiche la liste des tournois page par page avec navigation et recherche (nom ou lieu).
+
+        Args:
+            tournaments_df (pd.DataFrame): Le DataFrame contenant les informations des tournois.
+        """
+        self.browse(tournaments_df, self.list_tournaments, ["name", "location"])
 
     def select_tournament(self, action, tournaments):
         """
@@ -451,8 +515,13 @@ class TournamentView(BaseView):
             table_tournament_players.add_column("ID national", header_style="bold cyan")
             table_tournament_players.add_column("Score de carrière", header_style="bold cyan")
 
+            # On récupère en une seule passe les informations de tous les joueurs du tournoi
+            players_records = get_player_records_map(
+                [player["national_id"] for player in tournament_players_df], players_df
+            )
+
             for player in tournament_players_df:
-                player_data = players_df.loc[players_df["national_id"] == player["national_id"]].iloc[0]
+                player_data = players_records[player["national_id"].strip()]
                 table_tournament_players.add_row(
                     player_data["last_name"],
                     player_data["first_name"],
@@ -557,10 +626,14 @@ class TournamentView(BaseView):
         ).execute()
         return choice
 
-    def get_player_add_choice(self):
+    def get_player_add_choice(self, completer=None):
         """
         Affiche une invite permettant à l'utilisateur de saisir l'identifiant national d'un joueur à ajouter.
 
+        Args:
+            completer (Completer): Autocomplétion proposant les joueurs correspondant à la saisie
+                (identifiant, prénom ou nom).
+
         Returns:
             str: L'identifiant national saisi par l'utilisateur.
         """
@@ -568,62 +641,121 @@ class TournamentView(BaseView):
         choice = inquirer.text(
             message="\nVeuillez saisir l'Identifiant National du joueur à ajouter "
             "ou 'new' pour créer un nouveau joueur (entrez 'done' pour terminer) :",
+            long_instruction="Commencez à taper un identifiant, un prénom ou un nom pour afficher les suggestions.",
+            completer=completer,
             style=self.custom_style,
             qmark="",
             amark="",
         ).execute()
         return choice.lower()
 
-    def create_tournament_tables(self, tournament, pairs, round_name, match_number, player1_info, player2_info):
+    def create_round_screen(self, tournament, round_name, boards):
         """
-        Crée les tableaux d'informations pour un tournoi, y compris les joueurs, rounds et matches.
+        Crée l'écran de saisie des résultats d'un round (voir RoundScreen).
 
         Args:
             tournament (Tournament): L'objet tournoi.
-            pairs (list): La liste des paires de joueurs.
-            round_name (str): Le nom du round actuel.
-            match_number (int): Le numéro du match actuel.
-            player1_info (str): Les informations du joueur 1.
-            player2_info (str): Les informations du joueur 2.
+            round_name (str): Le nom du round.
+            boards (list): Les échiquiers du round, sous forme de tuples (informations du joueur 1,
+                informations du joueur 2), chaque joueur étant un dictionnaire avec first_name, last_name et
+                national_id.
 
         Returns:
-            Table: Le tableau principal contenant toutes les informations alignées correctement.
+            RoundScreen: L'écran du round, tous les résultats étant à saisir.
         """
-
         # Tableau pour les informations générales du tournoi
         tournament_table = Table(title=f"Tournoi : {tournament.name}", title_style="bold magenta", box=box.SQUARE)
-        tournament_table.add_column("Nombre de rounds", justify="center", style="bold cyan")
+        tournament_table.add_column("Round n°", justify="center", style="bold cyan")
         tournament_table.add_column("Nombre de matchs", justify="center", style="bold cyan")
         tournament_table.add_column("Nombre de joueurs", justify="center", style="bold cyan")
-        tournament_table.add_row(str(tournament.rounds_count), str(len(pairs)), str(len(tournament.players)))
-
-        # Tableau pour les informations sur le round et le match actuel
-        round_table = Table(box=box.SQUARE, title="Round et match actuel", title_style="bold magenta")
-        round_table.add_column("Round n°", justify="center", style="bold cyan")
-        round_table.add_column("Match n°", justify="center", style="bold cyan")
-        round_table.add_row(str(tournament.current_round), str(match_number))
-
-        # Tableau pour les informations des joueurs
-        players_table = Table(title="Match", title_style="bold magenta", box=box.SQUARE)
-        players_table.add_column("👨 Joueur 1", header_style="bold yellow", justify="center")
-        players_table.add_column("🧑 Joueur 2", header_style="bold yellow", justify="center")
-        players_table.add_row(player1_info, player2_info)
+        tournament_table.add_row(
+            f"{tournament.current_round}/{tournament.rounds_count}", str(len(boards)), str(len(tournament.players))
+        )
 
-        # Tableau pour le barème de match
+        # Tableau pour le barème de match, avec les touches de saisie directe
         scale_table = Table(title="Barème de match", title_style="bold magenta", box=box.SQUARE)
         scale_table.add_column("🥇 Gagnant", header_style="bold green", justify="center")
         scale_table.add_column("🥈 Perdant", header_style="bold red", justify="center")
         scale_table.add_column("🤝 Égalité", header_style="bold blue", justify="center")
         scale_table.add_row("1 point", "0 point", "0.5 point")
 
-        # Table principale pour tout aligner correctement
-        main_table = Table(show_edge=False, show_header=False, box=box.SIMPLE, show_lines=False)
-        main_table.add_row(tournament_table, round_table)
-        main_table.add_row(players_table, scale_table)
+        header_table = Table(show_edge=False, show_header=False, box=box.SIMPLE, show_lines=False)
+        header_table.add_row(tournament_table, scale_table)
+
+        boards_table = Table(title=round_name, title_style="bold magenta", box=box.SQUARE)
+        boards_table.add_column("Échiquier", justify="center", style="bold cyan")
+        boards_table.add_column("👨 Joueur 1", header_style="bold yellow")
+        boards_table.add_column("🧑 Joueur 2", header_style="bold yellow")
+        boards_table.add_column("Résultat", justify="center")
+        result_cells = {}
+        for board, (player1, player2) in enumerate(boards, start=1):
+            result_cells[board] = Text("à saisir", style="yellow")
+            boards_table.add_row(
+                str(board), self.format_player(player1), self.format_player(player2), result_cells[board]
+            )
+
+        return RoundScreen(Group(header_table, boards_table), result_cells)
+
+    def format_player(self, player):
+        return f"{player['first_name']} {player['last_name']} ({player['national_id']})"
+
+    def ask_board_result(self, screen, pending_boards):
+        """
+        Affiche l'écran du round et demande le résultat d'un des échiquiers restants.
+
+        Le résultat de l'échiquier sélectionné se saisit en une touche ("1" : le joueur 1 gagne, "2" : le joueur 2
+        gagne, "0" ou "=" : égalité) ; la touche Entrée ouvre la liste des résultats possibles.
+
+        Args:
+            screen (RoundScreen): L'écran du round.
+            pending_boards (list): Les échiquiers restants, sous forme de tuples (numéro, joueur 1, joueur 2).
+
+        Returns:
+            tuple: (numéro de l'échiquier, score du joueur 1, score du joueur 2).
+
+        Raises:
+            InterruptedError: Si l'utilisateur demande le retour au menu principal.
+        """
+        clear_console()
+        self.console.print(screen.renderable)
+
+        players = {board: (player1, player2) for board, player1, player2 in pending_boards}
+        choices = [
+            Choice(
+                value=board,
+                name=f"Échiquier {board} : {player1['first_name']} {player1['last_name']} - "
+                f"{player2['first_name']} {player2['last_name']}",
+            )
+            for board, player1, player2 in pending_boards
+        ]
+        choices += [Separator(), Choice(value="main_menu", name="🔙 Retour au menu principal")]
+        prompt = inquirer.select(
+            message="\nRésultat à saisir :\n",
+            choices=choices,
+            long_instruction="1 : le joueur 1 gagne, 2 : le joueur 2 gagne, 0 ou = : égalité, "
+            "Entrée : choisir le résultat dans une liste",
+            pointer="❯",
+            qmark="",
+            style=self.custom_style,
+            show_cursor=False,
+        )
+
+        def register_result_key(key, scores):
+            @prompt.register_kb(key)
+            def enter_result(event):
+                board = prompt.content_control.selection["value"]
+                if board in players:
+                    event.app.exit(result=(board, *scores))
 
-        self.console.print(main_table)
+        for key, scores in RESULT_KEYS.items():
+            register_result_key(key, scores)
 
-        return main_table
+        choice = prompt.execute()
+        if choice == "main_menu":
+            raise InterruptedError("Retour au menu principal demandé.")
+        if isinstance(choice, tuple):
+            return choice
+        return (choice, *self.get_match_result(*players[choice]))
 
     def get_match_result(self, player1, player2):
         """